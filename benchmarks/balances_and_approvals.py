@@ -0,0 +1,119 @@
+"""
+Measures balance and approval validation of 1k-item orders. Lookups through find_balance_and_approval,
+which scans the whole list, are compared against BalancesAndApprovalsIndex, and the full standard fulfill
+validation is timed with the index in place.
+
+Run with: poetry run python -m benchmarks.balances_and_approvals
+"""
+from timeit import timeit
+
+from web3 import Web3
+from web3.constants import ADDRESS_ZERO
+
+from seaport.constants import MAX_INT, ItemType
+from seaport.types import BalanceAndApproval, ConsiderationItem, OfferItem
+from seaport.utils.balance_and_approval_check import (
+    BalancesAndApprovalsIndex,
+    find_balance_and_approval,
+    validate_standard_fulfill_balances_and_approvals,
+)
+
+ITEM_COUNT = 1000
+ITERATIONS = 5
+
+erc721 = Web3.toChecksumAddress("0x5fbdb2315678afecb367f032d93f642f64180aa3")
+erc1155 = Web3.toChecksumAddress("0xe7f1725e7734ce288f8367e1bb143e90bb3f0512")
+
+
+def main():
+    offer = [
+        OfferItem(
+            itemType=ItemType.ERC721,
+            token=erc721,
+            identifierOrCriteria=identifier,
+            startAmount=1,
+            endAmount=1,
+        )
+        for identifier in range(ITEM_COUNT)
+    ]
+    consideration = [
+        ConsiderationItem(
+            itemType=ItemType.ERC1155,
+            token=erc1155,
+            identifierOrCriteria=identifier,
+            startAmount=1,
+            endAmount=1,
+            recipient=ADDRESS_ZERO,
+        )
+        for identifier in range(ITEM_COUNT)
+    ]
+
+    offerer_balances_and_approvals = [
+        BalanceAndApproval(
+            token=item.token,
+            identifier_or_criteria=item.identifierOrCriteria,
+            balance=1,
+            approved_amount=MAX_INT,
+            item_type=item.itemType,
+        )
+        for item in offer
+    ]
+    fulfiller_balances_and_approvals = [
+        BalanceAndApproval(
+            token=item.token,
+            identifier_or_criteria=item.identifierOrCriteria,
+            balance=0 if item in offer else 1,
+            approved_amount=MAX_INT,
+            item_type=item.itemType,
+        )
+        for item in [*offer, *consideration]
+    ]
+
+    keys = [
+        (item.token.lower(), item.identifierOrCriteria)
+        for item in [*offer, *consideration]
+    ]
+
+    list_lookups = timeit(
+        lambda: [
+            find_balance_and_approval(
+                balances_and_approvals=fulfiller_balances_and_approvals,
+                token=token,
+                identifier_or_criteria=identifier,
+            )
+            for token, identifier in keys
+        ],
+        number=ITERATIONS,
+    )
+    index = BalancesAndApprovalsIndex(fulfiller_balances_and_approvals)
+    index_lookups = timeit(
+        lambda: [index.get(token, identifier) for token, identifier in keys],
+        number=ITERATIONS,
+    )
+
+    print(f"{len(keys)} lookups, list scan: {list_lookups / ITERATIONS * 1000:.1f}ms")
+    print(f"{len(keys)} lookups, index: {index_lookups / ITERATIONS * 1000:.1f}ms")
+
+    validation = timeit(
+        lambda: validate_standard_fulfill_balances_and_approvals(
+            offer=offer,
+            consideration=consideration,
+            offer_criteria=[],
+            consideration_criteria=[],
+            offerer_balances_and_approvals=offerer_balances_and_approvals,
+            fulfiller_balances_and_approvals=fulfiller_balances_and_approvals,
+            time_based_item_params=None,
+            offerer_operator=ADDRESS_ZERO,
+            fulfiller_operator=ADDRESS_ZERO,
+        ),
+        number=ITERATIONS,
+    )
+
+    print(
+        f"Standard fulfill validation of {ITEM_COUNT} offer and {ITEM_COUNT} consideration items: "
+        f"{validation / ITERATIONS * 1000:.1f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
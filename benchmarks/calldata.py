@@ -0,0 +1,197 @@
+"""
+Measures calldata encoding of a 50-order fulfillAvailableAdvancedOrders sweep and of a single fulfillBasicOrder.
+Encoding through web3, which matches, validates and aligns the arguments against the ABI first as ContractFunction does,
+is compared against the direct encoders of seaport.utils.calldata, whose canonical encoding web3 decodes to the same values.
+The sweep pays a single fee per order so its fulfillments hold one component each, which web3 encodes correctly.
+
+Run with: poetry run python -m benchmarks.calldata
+"""
+from random import Random
+from timeit import timeit
+
+from web3 import Web3
+from web3._utils.abi import get_abi_input_types
+from web3.constants import ADDRESS_ZERO, HASH_ZERO
+
+from seaport.abi.Seaport import SEAPORT_ABI
+from seaport.constants import MAX_INT, ItemType, OrderType
+from seaport.types import (
+    AdditionalRecipient,
+    AdvancedOrder,
+    BasicOrderParameters,
+    ConsiderationItem,
+    OfferItem,
+    OrderParameters,
+)
+from seaport.utils.calldata import (
+    encode_fulfill_available_advanced_orders,
+    encode_fulfill_basic_order,
+)
+from seaport.utils.pydantic import parse_model_list
+
+ORDER_COUNT = 50
+ITERATIONS = 20
+
+erc721 = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+fee_recipient = Web3.toChecksumAddress("0x0000a26b00c1f0df003000390027140000faa719")
+
+contract = Web3().eth.contract(
+    address="0x00000000006c3852cbEf3e08E8dF289169EdE581", abi=SEAPORT_ABI
+)
+
+
+def decode_calldata(fn_name: str, calldata: str) -> tuple:
+    function_abi = contract.get_function_by_name(fn_name).abi
+
+    return contract.web3.codec.decode_abi(
+        get_abi_input_types(function_abi), bytes.fromhex(calldata[10:])
+    )
+
+
+def random_address(random: Random) -> str:
+    return Web3.toChecksumAddress(random.getrandbits(160).to_bytes(20, "big"))
+
+
+def make_advanced_orders() -> list[AdvancedOrder]:
+    random = Random(0)
+    advanced_orders = []
+
+    for identifier in range(ORDER_COUNT):
+        offerer = random_address(random)
+        consideration = [
+            ConsiderationItem(
+                itemType=ItemType.NATIVE,
+                token=ADDRESS_ZERO,
+                identifierOrCriteria=0,
+                startAmount=amount,
+                endAmount=amount,
+                recipient=recipient,
+            )
+            for amount, recipient in [(975, offerer), (25, fee_recipient)]
+        ]
+        advanced_orders.append(
+            AdvancedOrder(
+                parameters=OrderParameters(
+                    offerer=offerer,
+                    zone=ADDRESS_ZERO,
+                    orderType=OrderType.FULL_OPEN,
+                    startTime=0,
+                    endTime=MAX_INT,
+                    salt=random.getrandbits(256),
+                    offer=[
+                        OfferItem(
+                            itemType=ItemType.ERC721,
+                            token=erc721,
+                            identifierOrCriteria=identifier,
+                            startAmount=1,
+                            endAmount=1,
+                        )
+                    ],
+                    consideration=consideration,
+                    zoneHash=HASH_ZERO,
+                    totalOriginalConsiderationItems=len(consideration),
+                    conduitKey=HASH_ZERO,
+                ),
+                signature="0x" + random.getrandbits(512).to_bytes(64, "big").hex(),
+                numerator=1,
+                denominator=1,
+                extraData="0x",
+            )
+        )
+
+    return advanced_orders
+
+
+def make_basic_order_parameters(advanced_order: AdvancedOrder) -> BasicOrderParameters:
+    parameters = advanced_order.parameters
+    for_offerer, *for_additional_recipients = parameters.consideration
+
+    return BasicOrderParameters(
+        considerationToken=ADDRESS_ZERO,
+        considerationIdentifier=0,
+        considerationAmount=for_offerer.endAmount,
+        offerer=parameters.offerer,
+        zone=parameters.zone,
+        offerToken=erc721,
+        offerIdentifier=parameters.offer[0].identifierOrCriteria,
+        offerAmount=1,
+        basicOrderType=0,
+        startTime=parameters.startTime,
+        endTime=parameters.endTime,
+        zoneHash=parameters.zoneHash,
+        salt=parameters.salt,
+        offererConduitKey=parameters.conduitKey,
+        fulfillerConduitKey=HASH_ZERO,
+        totalOriginalAdditionalRecipients=len(for_additional_recipients),
+        additionalRecipients=[
+            AdditionalRecipient(amount=item.endAmount, recipient=item.recipient)
+            for item in for_additional_recipients
+        ],
+        signature=advanced_order.signature,
+    )
+
+
+def main():
+    advanced_orders = make_advanced_orders()
+    basic_order_parameters = make_basic_order_parameters(advanced_orders[0])
+    offer_fulfillments = [[(index, 0)] for index in range(ORDER_COUNT)]
+    consideration_fulfillments = [
+        [(index, item_index)] for index in range(ORDER_COUNT) for item_index in [0, 1]
+    ]
+    available_arguments = (
+        [],
+        offer_fulfillments,
+        consideration_fulfillments,
+        HASH_ZERO,
+        ADDRESS_ZERO,
+        ORDER_COUNT,
+    )
+
+    def encode_available_with_web3():
+        return contract.encodeABI(
+            fn_name="fulfillAvailableAdvancedOrders",
+            args=[parse_model_list(advanced_orders), *available_arguments],
+        )
+
+    def encode_basic_with_web3():
+        return contract.encodeABI(
+            fn_name="fulfillBasicOrder", args=[basic_order_parameters.dict()]
+        )
+
+    assert decode_calldata(
+        "fulfillAvailableAdvancedOrders", encode_available_with_web3()
+    ) == decode_calldata(
+        "fulfillAvailableAdvancedOrders",
+        encode_fulfill_available_advanced_orders(advanced_orders, *available_arguments),
+    )
+    assert decode_calldata(
+        "fulfillBasicOrder", encode_basic_with_web3()
+    ) == decode_calldata(
+        "fulfillBasicOrder", encode_fulfill_basic_order(basic_order_parameters)
+    )
+
+    for name, with_web3, direct in [
+        (
+            f"fulfillAvailableAdvancedOrders ({ORDER_COUNT} orders)",
+            encode_available_with_web3,
+            lambda: encode_fulfill_available_advanced_orders(
+                advanced_orders, *available_arguments
+            ),
+        ),
+        (
+            "fulfillBasicOrder",
+            encode_basic_with_web3,
+            lambda: encode_fulfill_basic_order(basic_order_parameters),
+        ),
+    ]:
+        web3_time = timeit(with_web3, number=ITERATIONS) / ITERATIONS
+        direct_time = timeit(direct, number=ITERATIONS) / ITERATIONS
+
+        print(
+            f"{name}: web3 {web3_time * 1000:.2f}ms, "
+            f"direct {direct_time * 1000:.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+Measures fulfillment aggregation of a 500-order sweep paid in ETH. Listings come from a few sellers, each paying
+a marketplace fee and a collection royalty, with addresses cased the way different APIs return them.
+The string keyed aggregation fulfill_available_orders used before is compared against plan_fulfill_orders_fulfillments,
+both in Python time and in the transfers left once items are aggregated.
+
+Run with: poetry run python -m benchmarks.fulfill_orders_fulfillments
+"""
+from itertools import chain
+from random import Random
+from timeit import timeit
+
+from web3 import Web3
+from web3.constants import ADDRESS_ZERO, HASH_ZERO
+
+from seaport.constants import MAX_INT, ItemType, OrderType
+from seaport.types import (
+    ConsiderationItem,
+    FulfillmentComponent,
+    OfferItem,
+    Order,
+    OrderParameters,
+    OrderStatus,
+)
+from seaport.utils.fulfill import (
+    FulfillOrdersMetadata,
+    plan_fulfill_orders_fulfillments,
+)
+from seaport.utils.item import get_item_index_to_criteria_map, is_erc721_item
+
+ORDER_COUNT = 500
+SELLER_COUNT = 25
+ITERATIONS = 5
+
+erc721 = "0x5fbdb2315678afecb367f032d93f642f64180aa3"
+fee_recipient = "0x0000a26b00c1f0df003000390027140000faa719"
+royalty_recipient = "0x3c44cdddb6a900fa2b585dd299e03d12fa4293bc"
+fulfiller = Web3.toChecksumAddress("0x70997970c51812dc3a010c7d01b50e0d17dc79c8")
+
+
+def legacy_generate_fulfill_orders_fulfillments(
+    orders_metadata: list[FulfillOrdersMetadata],
+) -> tuple[list[list[FulfillmentComponent]], list[list[FulfillmentComponent]]]:
+    def hash_aggregate_key(
+        source_or_destination: str, token: str, identifier: int, operator=""
+    ):
+        return f"{source_or_destination}-{operator}-{token}-{identifier}"
+
+    offer_aggregated_fulfillments: dict[str, list[FulfillmentComponent]] = {}
+    consideration_aggregated_fulfillments: dict[str, list[FulfillmentComponent]] = {}
+
+    for order_index, order_metadata in enumerate(orders_metadata):
+        item_index_to_criteria = get_item_index_to_criteria_map(
+            order_metadata.order.parameters.offer, order_metadata.offer_criteria
+        )
+
+        for item_index, item in enumerate(order_metadata.order.parameters.offer):
+            aggregate_key = hash_aggregate_key(
+                source_or_destination=order_metadata.order.parameters.offerer,
+                operator=order_metadata.offerer_operator,
+                token=item.token,
+                identifier=item_index_to_criteria[item_index].identifier
+                if item_index in item_index_to_criteria
+                else item.identifierOrCriteria,
+            ) + (str(item_index) if is_erc721_item(item.itemType) else "")
+
+            if aggregate_key not in offer_aggregated_fulfillments:
+                offer_aggregated_fulfillments[aggregate_key] = []
+
+            offer_aggregated_fulfillments[aggregate_key].append(
+                FulfillmentComponent(orderIndex=order_index, itemIndex=item_index)
+            )
+
+    for order_index, order_metadata in enumerate(orders_metadata):
+        item_index_to_criteria = get_item_index_to_criteria_map(
+            order_metadata.order.parameters.consideration,
+            order_metadata.consideration_criteria,
+        )
+
+        for item_index, item in enumerate(
+            list(
+                chain(
+                    order_metadata.order.parameters.consideration, order_metadata.tips
+                )
+            )
+        ):
+            aggregate_key = hash_aggregate_key(
+                source_or_destination=item.recipient,
+                token=item.token,
+                identifier=item_index_to_criteria[item_index].identifier
+                if item_index in item_index_to_criteria
+                else item.identifierOrCriteria,
+            ) + (str(item_index) if is_erc721_item(item.itemType) else "")
+
+            if aggregate_key not in consideration_aggregated_fulfillments:
+                consideration_aggregated_fulfillments[aggregate_key] = []
+
+            consideration_aggregated_fulfillments[aggregate_key].append(
+                FulfillmentComponent(orderIndex=order_index, itemIndex=item_index)
+            )
+
+    return (
+        list(offer_aggregated_fulfillments.values()),
+        list(consideration_aggregated_fulfillments.values()),
+    )
+
+
+def format_address(address: str, random: Random) -> str:
+    return random.choice([address, Web3.toChecksumAddress(address)])
+
+
+def make_orders_metadata() -> list[FulfillOrdersMetadata]:
+    random = Random(0)
+    sellers = [
+        "0x" + random.getrandbits(160).to_bytes(20, "big").hex()
+        for _ in range(SELLER_COUNT)
+    ]
+    orders_metadata = []
+
+    for identifier in range(ORDER_COUNT):
+        seller = format_address(random.choice(sellers), random)
+        price = Web3.toWei(random.randint(10, 1000), "milliether")
+
+        consideration = [
+            ConsiderationItem(
+                itemType=ItemType.NATIVE,
+                token=ADDRESS_ZERO,
+                identifierOrCriteria=0,
+                startAmount=amount,
+                endAmount=amount,
+                recipient=format_address(recipient, random),
+            )
+            for amount, recipient in [
+                (price * 900 // 1000, seller),
+                (price * 25 // 1000, fee_recipient),
+                (price * 75 // 1000, royalty_recipient),
+            ]
+        ]
+
+        orders_metadata.append(
+            FulfillOrdersMetadata(
+                order=Order(
+                    parameters=OrderParameters(
+                        offerer=seller,
+                        zone=ADDRESS_ZERO,
+                        orderType=OrderType.FULL_OPEN,
+                        startTime=0,
+                        endTime=MAX_INT,
+                        salt=identifier,
+                        offer=[
+                            OfferItem(
+                                itemType=ItemType.ERC721,
+                                token=format_address(erc721, random),
+                                identifierOrCriteria=identifier,
+                                startAmount=1,
+                                endAmount=1,
+                            )
+                        ],
+                        consideration=consideration,
+                        zoneHash=HASH_ZERO,
+                        totalOriginalConsiderationItems=len(consideration),
+                        conduitKey=HASH_ZERO,
+                    ),
+                    signature="0x",
+                ),
+                units_to_fill=1,
+                order_status=OrderStatus(
+                    is_validated=False, is_cancelled=False, total_filled=0, total_size=0
+                ),
+                offer_criteria=[],
+                consideration_criteria=[],
+                tips=[],
+                extra_data="0x",
+                offerer_balances_and_approvals=[],
+                offerer_operator=ADDRESS_ZERO,
+            )
+        )
+
+    return orders_metadata
+
+
+def main():
+    orders_metadata = make_orders_metadata()
+
+    legacy = timeit(
+        lambda: legacy_generate_fulfill_orders_fulfillments(orders_metadata),
+        number=ITERATIONS,
+    )
+    planned = timeit(
+        lambda: plan_fulfill_orders_fulfillments(orders_metadata, fulfiller=fulfiller),
+        number=ITERATIONS,
+    )
+
+    # Before aggregation was planned, every fulfillment was a transfer
+    legacy_offer, legacy_consideration = legacy_generate_fulfill_orders_fulfillments(
+        orders_metadata
+    )
+    plan = plan_fulfill_orders_fulfillments(orders_metadata, fulfiller=fulfiller)
+
+    print(f"{ORDER_COUNT} orders, {plan.item_count} items")
+    print(
+        f"String keys: {legacy / ITERATIONS * 1000:.1f}ms, "
+        f"{len(legacy_offer) + len(legacy_consideration)} transfers"
+    )
+    print(
+        f"Normalized tuple keys: {planned / ITERATIONS * 1000:.1f}ms, "
+        f"{plan.transfer_count} transfers"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Measures criteria MerkleTree construction, root and proof generation for 10k and 100k identifiers.
+Proofs for every identifier come from the cached layers through get_proofs, and are compared against
+rebuilding the layers for every proof on a small sample, which get_proof used to do.
+Construction is also measured with leaves hashed across a process pool.
+
+Run with: poetry run python -m benchmarks.merkle_tree
+"""
+from concurrent.futures import ProcessPoolExecutor
+from timeit import timeit
+
+from seaport.utils.merkletree import MerkleTree
+
+IDENTIFIER_COUNTS = [10_000, 100_000]
+REBUILT_PROOF_SAMPLE = 5
+WORKER_COUNT = 4
+
+
+def main():
+    for identifier_count in IDENTIFIER_COUNTS:
+        identifiers = list(range(identifier_count))
+        tree = MerkleTree(identifiers)
+
+        build = timeit(lambda: MerkleTree(identifiers), number=1)
+        with ProcessPoolExecutor(max_workers=WORKER_COUNT) as executor:
+            # Warm up the pool so process start up isn't part of the measurement
+            MerkleTree(identifiers[:WORKER_COUNT], executor=executor, chunk_size=1)
+            pool_build = timeit(
+                lambda: MerkleTree(identifiers, executor=executor), number=1
+            )
+
+        root = timeit(tree.get_root, number=1)
+        proofs = timeit(lambda: tree.get_proofs(identifiers), number=1)
+        rebuilt_proofs = timeit(
+            lambda: [
+                tree._get_proofs_elements(tree._get_layers(tree.elements), [index])
+                for index in range(REBUILT_PROOF_SAMPLE)
+            ],
+            number=1,
+        )
+
+        print(f"{identifier_count:,} identifiers")
+        print(f"  build: {build * 1000:.0f}ms")
+        print(f"  build with {WORKER_COUNT} workers: {pool_build * 1000:.0f}ms")
+        print(f"  first get_root, building the layers: {root * 1000:.0f}ms")
+        print(f"  get_proofs for every identifier: {proofs * 1000:.0f}ms")
+        print(
+            f"  rebuilding layers per proof: {rebuilt_proofs / REBUILT_PROOF_SAMPLE * 1000:.0f}ms per proof, "
+            f"{rebuilt_proofs / REBUILT_PROOF_SAMPLE * identifier_count:,.0f}s for every identifier"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Compares order hashing throughput of the precompiled hashing module against the
+previous implementation of Seaport.get_order_hash, which rebuilt the type hashes and
+went through Web3.solidityKeccak for every struct. The legacy copy below has the
+consideration type hash and missing zoneHash word corrected so both produce the same hash.
+
+Run with: poetry run python -m benchmarks.order_hash
+"""
+from timeit import timeit
+
+from web3 import Web3
+from web3.constants import ADDRESS_ZERO
+
+from seaport.constants import MAX_INT, ItemType, OrderType
+from seaport.types import ConsiderationItem, OfferItem, OrderComponents
+from seaport.utils.order_hash import get_order_hash
+
+ITERATIONS = 5000
+
+
+def legacy_get_order_hash(order_components: OrderComponents) -> str:
+    offer_item_type_string = "OfferItem(uint8 itemType,address token,uint256 identifierOrCriteria,uint256 startAmount,uint256 endAmount)"
+    consideration_item_type_string = "ConsiderationItem(uint8 itemType,address token,uint256 identifierOrCriteria,uint256 startAmount,uint256 endAmount,address recipient)"
+    order_components_partial_type_str = "OrderComponents(address offerer,address zone,OfferItem[] offer,ConsiderationItem[] consideration,uint8 orderType,uint256 startTime,uint256 endTime,bytes32 zoneHash,uint256 salt,bytes32 conduitKey,uint256 counter)"
+    order_type_str = f"{order_components_partial_type_str}{consideration_item_type_string}{offer_item_type_string}"
+    offer_item_type_hash = Web3.solidityKeccak(
+        abi_types=["bytes"], values=[offer_item_type_string.encode("utf-8")]
+    ).hex()
+    consideration_item_type_hash = Web3.solidityKeccak(
+        abi_types=["bytes"], values=[consideration_item_type_string.encode("utf-8")]
+    ).hex()
+    order_type_hash = Web3.solidityKeccak(
+        abi_types=["bytes"], values=[order_type_str.encode("utf-8")]
+    ).hex()
+
+    def hash_words(words: list[str]) -> str:
+        return Web3.solidityKeccak(
+            abi_types=["bytes"], values=["0x" + "".join(words)]
+        ).hex()
+
+    offer_hash = hash_words(
+        [
+            hash_words(
+                [
+                    offer_item_type_hash[2:],
+                    str(item.itemType.value).zfill(64),
+                    item.token[2:].zfill(64),
+                    hex(item.identifierOrCriteria)[2:].zfill(64),
+                    hex(item.startAmount)[2:].zfill(64),
+                    hex(item.endAmount)[2:].zfill(64),
+                ]
+            )[2:]
+            for item in order_components.offer
+        ]
+    )
+    consideration_hash = hash_words(
+        [
+            hash_words(
+                [
+                    consideration_item_type_hash[2:],
+                    str(item.itemType.value).zfill(64),
+                    item.token[2:].zfill(64),
+                    hex(item.identifierOrCriteria)[2:].zfill(64),
+                    hex(item.startAmount)[2:].zfill(64),
+                    hex(item.endAmount)[2:].zfill(64),
+                    item.recipient[2:].zfill(64),
+                ]
+            )[2:]
+            for item in order_components.consideration
+        ]
+    )
+
+    return hash_words(
+        [
+            order_type_hash[2:],
+            order_components.offerer[2:].zfill(64),
+            order_components.zone[2:].zfill(64),
+            offer_hash[2:],
+            consideration_hash[2:],
+            str(order_components.orderType.value).zfill(64),
+            hex(order_components.startTime)[2:].zfill(64),
+            hex(order_components.endTime)[2:].zfill(64),
+            order_components.zoneHash[2:].zfill(64),
+            hex(order_components.salt)[2:].zfill(64),
+            order_components.conduitKey[2:].zfill(64),
+            hex(order_components.counter)[2:].zfill(64),
+        ]
+    )
+
+
+def make_order_components(salt: int) -> OrderComponents:
+    offerer = "0x8ba1f109551bD432803012645Ac136ddd64DBA72"
+
+    return OrderComponents(
+        offerer=offerer,
+        zone=ADDRESS_ZERO,
+        orderType=OrderType.FULL_OPEN,
+        startTime=1650000000,
+        endTime=MAX_INT,
+        salt=salt,
+        offer=[
+            OfferItem(
+                itemType=ItemType.ERC721,
+                token="0x5FbDB2315678afecb367f032d93F642f64180aa3",
+                identifierOrCriteria=salt % 10000,
+                startAmount=1,
+                endAmount=1,
+            )
+        ],
+        consideration=[
+            ConsiderationItem(
+                itemType=ItemType.NATIVE,
+                token=ADDRESS_ZERO,
+                identifierOrCriteria=0,
+                startAmount=Web3.toWei(10, "ether"),
+                endAmount=Web3.toWei(10, "ether"),
+                recipient=offerer,
+            ),
+            ConsiderationItem(
+                itemType=ItemType.NATIVE,
+                token=ADDRESS_ZERO,
+                identifierOrCriteria=0,
+                startAmount=Web3.toWei(1, "ether"),
+                endAmount=Web3.toWei(1, "ether"),
+                recipient="0x70997970C51812dc3A010C7d01b50e0d17dc79C8",
+            ),
+        ],
+        zoneHash="0x" + "00" * 32,
+        totalOriginalConsiderationItems=2,
+        conduitKey="0x" + "00" * 32,
+        counter=0,
+    )
+
+
+def main():
+    orders = [make_order_components(salt) for salt in range(ITERATIONS)]
+
+    assert legacy_get_order_hash(orders[0]) == get_order_hash(orders[0])
+
+    for name, fn in [
+        ("legacy", legacy_get_order_hash),
+        ("precompiled", get_order_hash),
+    ]:
+        elapsed = timeit(lambda: [fn(order) for order in orders], number=1)
+        print(f"{name:>12}: {ITERATIONS / elapsed:,.0f} orders/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Measures get_order_hashes throughput with the serial path and with process pools of
+increasing size.
+
+Run with: poetry run python -m benchmarks.order_hashes
+"""
+from concurrent.futures import ProcessPoolExecutor
+from timeit import timeit
+
+from benchmarks.order_hash import make_order_components
+from seaport.utils.order_hash import get_order_hashes
+
+ORDER_COUNT = 200_000
+WORKER_COUNTS = [1, 2, 4, 8]
+
+
+def main():
+    orders = [make_order_components(salt) for salt in range(ORDER_COUNT)]
+
+    for max_workers in WORKER_COUNTS:
+        if max_workers == 1:
+            elapsed = timeit(lambda: get_order_hashes(orders), number=1)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                # Warm up the pool so process start up isn't part of the measurement
+                get_order_hashes(orders[:max_workers], executor=executor, chunk_size=1)
+                elapsed = timeit(
+                    lambda: get_order_hashes(
+                        orders, executor=executor, chunk_size=5000
+                    ),
+                    number=1,
+                )
+
+        print(f"{max_workers} worker(s): {ORDER_COUNT / elapsed:,.0f} orders/sec")
+
+
+if __name__ == "__main__":
+    main()
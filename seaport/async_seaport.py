@@ -0,0 +1,676 @@
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from inspect import isawaitable
+from itertools import chain
+from time import time
+from typing import Optional, Union, cast
+
+from web3.constants import ADDRESS_ZERO
+from web3.providers.async_base import AsyncBaseProvider
+
+from seaport.constants import MAX_INT
+from seaport.seaport import BaseSeaport
+from seaport.types import (
+    ConsiderationInputItem,
+    CreateInputItem,
+    CreateOrderAction,
+    CreateOrderInput,
+    CreateOrdersAction,
+    CreateOrdersUseCase,
+    CreateOrderUseCase,
+    Fee,
+    FulfillOrderDetails,
+    FulfillOrdersUseCase,
+    FulfillOrderUseCase,
+    InputCriteria,
+    MatchOrderDetails,
+    OrderComponents,
+    OrderParameters,
+    OrderStatus,
+    OrderWithCounter,
+    SeaportConfig,
+)
+from seaport.utils.async_web3 import async_call, get_async_web3
+from seaport.utils.balance_and_approval_check import async_get_balances_and_approvals
+from seaport.utils.criteria_registry import CriteriaRegistry
+from seaport.utils.order import generate_random_salt
+from seaport.utils.signature import verify_order_signatures
+from seaport.utils.signer import (
+    AsyncOrderSigner,
+    AsyncProviderOrderSigner,
+    BatchOrderSigner,
+    BulkOrderSigner,
+    OrderSigner,
+)
+from seaport.utils.usecase import execute_all_actions
+
+
+class AsyncSeaport(BaseSeaport):
+    """
+    Asyncio client mirroring Seaport. Reads that don't depend on each other are issued concurrently.
+    The use cases it returns hold async transaction methods, so every transaction method and
+    execute_all_actions return awaitables.
+    """
+
+    _chain_id: Optional[int] = None
+
+    def __init__(
+        self,
+        provider: AsyncBaseProvider,
+        config: SeaportConfig = SeaportConfig(),
+        signer: Optional[Union[OrderSigner, AsyncOrderSigner]] = None,
+        criteria_registry: Optional[CriteriaRegistry] = None,
+    ):
+        web3 = get_async_web3(provider)
+
+        super().__init__(
+            web3, config, signer or AsyncProviderOrderSigner(web3), criteria_registry
+        )
+
+    async def _get_account_address(self, account_address: Optional[str]) -> str:
+        return account_address or (await self.web3.eth.accounts)[0]  # type: ignore
+
+    async def create_order(
+        self,
+        *,
+        conduit_key: Optional[str] = None,
+        account_address: Optional[str] = None,
+        allow_partial_fills=False,
+        consideration: list[ConsiderationInputItem],
+        fees: list[Fee] = [],
+        counter: Optional[int] = None,
+        offer: list[CreateInputItem],
+        restricted_by_zone=False,
+        salt=generate_random_salt(),
+        start_time: int = int(time()),
+        zone: str = ADDRESS_ZERO,
+        end_time: int = MAX_INT,
+    ) -> CreateOrderUseCase:
+        """
+        Returns a use case that will create an order. See Seaport.create_order.
+        The counter, unless cached, the offerer balances and approvals and the EIP-712 domain are fetched concurrently.
+
+        Returns:
+            CreateOrderUseCase: a use case whose create_order and execute_all_actions return awaitables
+        """
+        conduit_key = conduit_key or self.default_conduit_key
+        offerer = await self._get_account_address(account_address)
+        offer_items, consideration_items = self._map_create_order_items(
+            offerer=offerer, offer=offer, consideration=consideration
+        )
+
+        operator = self.config.conduit_key_to_conduit[conduit_key]
+
+        async def get_counter() -> int:
+            if counter is not None:
+                return counter
+
+            cached_counter = self._get_cached_counter(offerer)
+
+            return (
+                cached_counter
+                if cached_counter is not None
+                else await self.get_counter(offerer=offerer)
+            )
+
+        resolved_counter, balances_and_approvals, _ = await asyncio.gather(
+            get_counter(),
+            async_get_balances_and_approvals(
+                owner=offerer,
+                items=offer_items,
+                criterias=[],
+                operator=operator,
+                web3=self.web3,
+            ),
+            self._load_domain_data(),
+        )
+
+        (
+            order_parameters,
+            approval_actions,
+        ) = self._build_order_parameters_and_approval_actions(
+            offerer=offerer,
+            conduit_key=conduit_key,
+            operator=operator,
+            offer_items=offer_items,
+            consideration_items=consideration_items,
+            fees=fees,
+            counter=resolved_counter,
+            balances_and_approvals=balances_and_approvals,
+            allow_partial_fills=allow_partial_fills,
+            restricted_by_zone=restricted_by_zone,
+            salt=salt,
+            start_time=start_time,
+            zone=zone,
+            end_time=end_time,
+        )
+
+        async def create_order_fn():
+            signature = await self.sign_order(
+                order_parameters=order_parameters,
+                counter=resolved_counter,
+                account_address=offerer,
+            )
+
+            return OrderWithCounter(
+                parameters=OrderComponents(
+                    **order_parameters.dict(), counter=resolved_counter
+                ),
+                signature=signature,
+            )
+
+        create_order_action = CreateOrderAction(
+            create_order=create_order_fn,
+            get_message_to_sign=lambda: self._get_message_to_sign(
+                order_parameters=order_parameters, counter=resolved_counter
+            ),
+        )
+
+        actions = list(chain(approval_actions, [create_order_action]))
+
+        return CreateOrderUseCase(
+            actions=actions,
+            execute_all_actions=lambda: execute_all_actions(actions, {"from": offerer}),
+        )
+
+    async def create_orders(
+        self,
+        orders: list[CreateOrderInput],
+        *,
+        conduit_key: Optional[str] = None,
+        account_address: Optional[str] = None,
+        counter: Optional[int] = None,
+        bulk: bool = False,
+    ) -> CreateOrdersUseCase:
+        """
+        Returns a use case that will create many orders of the same offerer at once. See Seaport.create_orders.
+        The counter, the balances and approvals of every offered item and the EIP-712 domain are fetched concurrently.
+
+        Returns:
+            CreateOrdersUseCase: a use case whose create_orders and execute_all_actions return awaitables
+        """
+        if bulk:
+            self._validate_bulk_order_signing()
+
+        conduit_key = conduit_key or self.default_conduit_key
+        offerer = await self._get_account_address(account_address)
+        orders_items = [
+            self._map_create_order_items(
+                offerer=offerer, offer=order.offer, consideration=order.consideration
+            )
+            for order in orders
+        ]
+
+        operator = self.config.conduit_key_to_conduit[conduit_key]
+
+        async def get_counter() -> int:
+            if counter is not None:
+                return counter
+
+            cached_counter = self._get_cached_counter(offerer)
+
+            return (
+                cached_counter
+                if cached_counter is not None
+                else await self.get_counter(offerer=offerer)
+            )
+
+        resolved_counter, balances_and_approvals, _ = await asyncio.gather(
+            get_counter(),
+            async_get_balances_and_approvals(
+                owner=offerer,
+                items=[
+                    offer_item
+                    for offer_items, _ in orders_items
+                    for offer_item in offer_items
+                ],
+                criterias=[],
+                operator=operator,
+                web3=self.web3,
+            ),
+            self._load_domain_data(),
+        )
+
+        (
+            orders_parameters,
+            approval_actions,
+        ) = self._build_orders_parameters_and_approval_actions(
+            offerer=offerer,
+            conduit_key=conduit_key,
+            operator=operator,
+            orders=orders,
+            orders_items=orders_items,
+            counter=resolved_counter,
+            balances_and_approvals=balances_and_approvals,
+        )
+
+        async def create_orders_fn():
+            sign_orders = self.sign_bulk_order if bulk else self.sign_orders
+            signatures = await sign_orders(
+                orders_parameters=orders_parameters,
+                counter=resolved_counter,
+                account_address=offerer,
+            )
+
+            return [
+                OrderWithCounter(
+                    parameters=OrderComponents(
+                        **order_parameters.dict(), counter=resolved_counter
+                    ),
+                    signature=signature,
+                )
+                for order_parameters, signature in zip(orders_parameters, signatures)
+            ]
+
+        create_orders_action = CreateOrdersAction(
+            create_orders=create_orders_fn,
+            get_messages_to_sign=lambda: self._get_messages_to_sign(
+                orders_parameters=orders_parameters,
+                counter=resolved_counter,
+                bulk=bulk,
+            ),
+        )
+
+        actions = list(chain(approval_actions, [create_orders_action]))
+
+        return CreateOrdersUseCase(
+            actions=actions,
+            execute_all_actions=lambda: execute_all_actions(actions, {"from": offerer}),
+        )
+
+    async def _load_domain_data(self) -> dict:
+        if not self._is_domain_cached():
+            self._chain_id = await self.web3.eth.chain_id  # type: ignore
+
+        return self._get_domain_data()
+
+    def _get_chain_id(self) -> int:
+        if self._chain_id is None:
+            raise ValueError("The chain id has to be loaded before building the domain")
+
+        return self._chain_id
+
+    async def sign_order(
+        self,
+        *,
+        order_parameters: OrderParameters,
+        counter: int,
+        account_address: str,
+    ) -> str:
+        """
+        Signs the order through the configured signer. Defaults to signing through the provider.
+        Both sync and async signers are supported.
+
+        Args:
+            order_parameters (OrderParameters): the parameters of the order to sign
+            counter (int): the counter of the offerer
+            account_address (str): the account to sign with. Defaults to the first account from the provider.
+
+        Returns:
+            str: the signature of the order
+        """
+        account_address, _ = await asyncio.gather(
+            self._get_account_address(account_address), self._load_domain_data()
+        )
+
+        signature = self.signer.sign_order(
+            order_components=OrderComponents(
+                **order_parameters.dict(), counter=counter
+            ),
+            account_address=account_address,
+            get_domain_separator=self._get_domain_separator,
+            get_message_to_sign=lambda: self._get_message_to_sign(
+                order_parameters=order_parameters, counter=counter
+            ),
+        )
+
+        return await signature if isawaitable(signature) else signature
+
+    async def sign_orders(
+        self,
+        *,
+        orders_parameters: list[OrderParameters],
+        counter: int,
+        account_address: str,
+    ) -> list[str]:
+        """
+        Signs many orders of the same account. See Seaport.sign_orders.
+        Orders are signed concurrently if the signer doesn't support batches.
+
+        Returns:
+            list[str]: the signature of every order, in the same order as the parameters
+        """
+        if not isinstance(self.signer, BatchOrderSigner):
+            return list(
+                await asyncio.gather(
+                    *[
+                        self.sign_order(
+                            order_parameters=order_parameters,
+                            counter=counter,
+                            account_address=account_address,
+                        )
+                        for order_parameters in orders_parameters
+                    ]
+                )
+            )
+
+        await self._load_domain_data()
+
+        signatures = self.signer.sign_orders(
+            orders_components=[
+                OrderComponents(**order_parameters.dict(), counter=counter)
+                for order_parameters in orders_parameters
+            ],
+            account_address=account_address,
+            get_domain_separator=self._get_domain_separator,
+            get_messages_to_sign=lambda: [
+                self._get_message_to_sign(
+                    order_parameters=order_parameters, counter=counter
+                )
+                for order_parameters in orders_parameters
+            ],
+        )
+
+        return await signatures if isawaitable(signatures) else signatures
+
+    async def sign_bulk_order(
+        self,
+        *,
+        orders_parameters: list[OrderParameters],
+        counter: int,
+        account_address: str,
+    ) -> list[str]:
+        """
+        Signs many orders of the same account with a single bulk order signature. See Seaport.sign_bulk_order.
+
+        Returns:
+            list[str]: the signature of every order, carrying its index and proof in the bulk order tree
+        """
+        bulk_order_tree = self._get_bulk_order_tree(
+            orders_parameters=orders_parameters, counter=counter
+        )
+
+        await self._load_domain_data()
+
+        signature = cast(BulkOrderSigner, self.signer).sign_bulk_order(
+            bulk_order_tree=bulk_order_tree,
+            account_address=account_address,
+            get_domain_separator=self._get_domain_separator,
+            get_message_to_sign=lambda: self._get_bulk_order_message_to_sign(
+                bulk_order_tree
+            ),
+        )
+
+        return bulk_order_tree.get_signatures(
+            await signature if isawaitable(signature) else signature
+        )
+
+    async def verify_order_signatures(
+        self,
+        orders: list[OrderWithCounter],
+        *,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> list[bool]:
+        """
+        Checks locally that every order was signed by its offerer. See Seaport.verify_order_signatures.
+        Verification runs in the default executor of the event loop, so the loop is never blocked.
+
+        Returns:
+            list[bool]: whether the signature of every order recovers to its offerer, in the same order as the input
+        """
+        await self._load_domain_data()
+
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            partial(
+                verify_order_signatures,
+                orders,
+                self._get_domain_separator(),
+                bulk_signatures=self._supports_bulk_orders(),
+                max_workers=max_workers,
+                executor=executor,
+            ),
+        )
+
+    async def get_order_status(self, order_hash: str) -> OrderStatus:
+        """
+        Returns the order status given an order hash
+
+        Args:
+            order_hash (str): the hash of the order
+
+        Returns:
+            OrderStatus: order status model
+        """
+        return self._to_order_status(
+            await async_call(self.contract.functions.getOrderStatus(order_hash))
+        )
+
+    async def get_order_statuses(self, order_hashes: list[str]) -> list[OrderStatus]:
+        """
+        Returns the order statuses of many order hashes, fetched concurrently
+
+        Args:
+            order_hashes (list[str]): the hashes of the orders
+
+        Returns:
+            list[OrderStatus]: order status models in the same order as the hashes
+        """
+        return list(await asyncio.gather(*map(self.get_order_status, order_hashes)))
+
+    async def get_counter(self, offerer: str) -> int:
+        """
+        Gets the counter of a given offerer from the contract and refreshes its cached counter
+
+        Args:
+            offerer (str): the offerer to get the counter of
+
+        Returns:
+            int: counter
+        """
+        counter = await async_call(self.contract.functions.getCounter(offerer))
+        self._cache_counter(offerer, counter)
+
+        return counter
+
+    async def _get_current_block_timestamp(self) -> int:
+        current_block = await self.web3.eth.get_block("latest")  # type: ignore
+
+        return current_block.get("timestamp", int(time()))
+
+    async def fulfill_order(
+        self,
+        *,
+        conduit_key: Optional[str] = None,
+        order: OrderWithCounter,
+        units_to_fill=0,
+        offer_criteria: list[InputCriteria] = [],
+        consideration_criteria: list[InputCriteria] = [],
+        tips: list[ConsiderationInputItem] = [],
+        extra_data="0x",
+        account_address: Optional[str] = None,
+        recipient_address=ADDRESS_ZERO,
+    ) -> FulfillOrderUseCase:
+        """
+        Fulfills an order through either the basic method or the standard method. See Seaport.fulfill_order.
+        Balances and approvals of both parties, the latest block and the order status are fetched concurrently.
+
+        Returns:
+            FulfillOrderUseCase: a use case whose transaction methods and execute_all_actions return awaitables
+        """
+        offer_criteria, consideration_criteria = self._resolve_fulfill_order_criterias(
+            order=order,
+            offer_criteria=offer_criteria,
+            consideration_criteria=consideration_criteria,
+        )
+        conduit_key = conduit_key or self.default_conduit_key
+        fulfiller = await self._get_account_address(account_address)
+        offerer_operator = self.config.conduit_key_to_conduit[
+            order.parameters.conduitKey
+        ]
+        fulfiller_operator = self.config.conduit_key_to_conduit[conduit_key]
+
+        (
+            offerer_balances_and_approvals,
+            fulfiller_balances_and_approvals,
+            current_block_timestamp,
+            order_status,
+        ) = await asyncio.gather(
+            async_get_balances_and_approvals(
+                owner=order.parameters.offerer,
+                items=order.parameters.offer,
+                criterias=offer_criteria,
+                operator=offerer_operator,
+                web3=self.web3,
+            ),
+            # Offer items may be received by the fulfiller for standard fulfills
+            async_get_balances_and_approvals(
+                owner=fulfiller,
+                items=list(
+                    chain(order.parameters.offer, order.parameters.consideration)
+                ),
+                criterias=list(chain(offer_criteria, consideration_criteria)),
+                operator=fulfiller_operator,
+                web3=self.web3,
+            ),
+            self._get_current_block_timestamp(),
+            self.get_order_status(self.get_order_hash(order.parameters)),
+        )
+
+        return self._build_fulfill_order_use_case(
+            conduit_key=conduit_key,
+            order=order,
+            units_to_fill=units_to_fill,
+            offer_criteria=offer_criteria,
+            consideration_criteria=consideration_criteria,
+            tips=tips,
+            extra_data=extra_data,
+            fulfiller=fulfiller,
+            recipient_address=recipient_address,
+            offerer_operator=offerer_operator,
+            fulfiller_operator=fulfiller_operator,
+            offerer_balances_and_approvals=offerer_balances_and_approvals,
+            fulfiller_balances_and_approvals=fulfiller_balances_and_approvals,
+            order_status=order_status,
+            current_block_timestamp=current_block_timestamp,
+        )
+
+    async def fulfill_orders(
+        self,
+        fulfill_order_details: list[FulfillOrderDetails],
+        account_address: Optional[str] = None,
+        conduit_key: Optional[str] = None,
+        recipient_address=ADDRESS_ZERO,
+    ) -> FulfillOrdersUseCase:
+        """
+        Fulfills many orders through fulfillAvailableAdvancedOrders. See Seaport.fulfill_orders.
+        Every order's reads are fetched concurrently.
+
+        Returns:
+            FulfillOrdersUseCase: a use case whose transaction methods and execute_all_actions return awaitables
+        """
+        fulfill_order_details = self._resolve_fulfill_orders_criterias(
+            fulfill_order_details
+        )
+        conduit_key = conduit_key or self.default_conduit_key
+        fulfiller = await self._get_account_address(account_address)
+
+        all_offerer_operators = [
+            self.config.conduit_key_to_conduit[detail.order.parameters.conduitKey]
+            for detail in fulfill_order_details
+        ]
+
+        fulfiller_operator = self.config.conduit_key_to_conduit[conduit_key]
+
+        all_items, all_criterias = self._get_fulfill_orders_items_and_criterias(
+            fulfill_order_details
+        )
+
+        (
+            all_offerer_balances_and_approvals,
+            fulfiller_balances_and_approvals,
+            order_statuses,
+            current_block_timestamp,
+        ) = await asyncio.gather(
+            asyncio.gather(
+                *[
+                    async_get_balances_and_approvals(
+                        owner=detail.order.parameters.offerer,
+                        items=detail.order.parameters.offer,
+                        criterias=detail.offer_criteria,
+                        operator=all_offerer_operators[index],
+                        web3=self.web3,
+                    )
+                    for index, detail in enumerate(fulfill_order_details)
+                ]
+            ),
+            async_get_balances_and_approvals(
+                owner=fulfiller,
+                items=all_items,
+                criterias=all_criterias,
+                operator=fulfiller_operator,
+                web3=self.web3,
+            ),
+            self.get_order_statuses(
+                [
+                    self.get_order_hash(detail.order.parameters)
+                    for detail in fulfill_order_details
+                ]
+            ),
+            self._get_current_block_timestamp(),
+        )
+
+        return self._build_fulfill_orders_use_case(
+            fulfill_order_details=fulfill_order_details,
+            conduit_key=conduit_key,
+            fulfiller=fulfiller,
+            recipient_address=recipient_address,
+            all_offerer_operators=all_offerer_operators,
+            fulfiller_operator=fulfiller_operator,
+            all_offerer_balances_and_approvals=list(all_offerer_balances_and_approvals),
+            fulfiller_balances_and_approvals=fulfiller_balances_and_approvals,
+            order_statuses=order_statuses,
+            current_block_timestamp=current_block_timestamp,
+        )
+
+    async def match_orders(
+        self,
+        orders_details: list[MatchOrderDetails],
+        account_address: Optional[str] = None,
+    ) -> FulfillOrderUseCase:
+        """
+        Matches orders against each other in a single matchAdvancedOrders transaction. See Seaport.match_orders.
+        Balances and approvals of every order of the fulfiller are fetched concurrently.
+
+        Returns:
+            FulfillOrderUseCase: a use case whose transaction methods and execute_all_actions return awaitables
+        """
+        orders_details = self._resolve_fulfill_orders_criterias(orders_details)
+        fulfiller = await self._get_account_address(account_address)
+        fulfiller_orders_details = self._get_fulfiller_orders_details(
+            orders_details, fulfiller
+        )
+
+        fulfiller_balances_and_approvals = await asyncio.gather(
+            *[
+                async_get_balances_and_approvals(
+                    owner=fulfiller,
+                    items=detail.order.parameters.offer,
+                    criterias=detail.offer_criteria,
+                    operator=self.config.conduit_key_to_conduit[
+                        detail.order.parameters.conduitKey
+                    ],
+                    web3=self.web3,
+                )
+                for detail in fulfiller_orders_details
+            ]
+        )
+
+        return self._build_match_orders_use_case(
+            orders_details=orders_details,
+            fulfiller=fulfiller,
+            fulfiller_orders_details=fulfiller_orders_details,
+            fulfiller_balances_and_approvals=list(fulfiller_balances_and_approvals),
+        )
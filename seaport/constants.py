@@ -4,6 +4,9 @@ from web3.constants import HASH_ZERO
 
 CONSIDERATION_CONTRACT_NAME = "Seaport"
 CONSIDERATION_CONTRACT_VERSION = "1.1"
+# Bulk order signatures were introduced in Seaport 1.2, and cover trees of at most 2^24 orders
+BULK_ORDER_MIN_CONTRACT_VERSION = "1.2"
+BULK_ORDER_MAX_HEIGHT = 24
 EIP_712_ORDER_TYPE = {
     "EIP712Domain": [
         {"name": "name", "type": "string"},
@@ -72,6 +75,15 @@ class BasicOrderRouteType(Enum):
     ERC1155_TO_ERC20 = 5
 
 
+# Seaport entry points orders can be fulfilled through, valued by their function name
+class FulfillRoute(Enum):
+    BASIC = "fulfillBasicOrder"
+    STANDARD = "fulfillOrder"
+    ADVANCED = "fulfillAdvancedOrder"
+    AVAILABLE = "fulfillAvailableOrders"
+    AVAILABLE_ADVANCED = "fulfillAvailableAdvancedOrders"
+
+
 class ProxyStrategy(Enum):
     IF_ZERO_APPROVALS_NEEDED = auto()
     NEVER = auto()
@@ -82,3 +94,4 @@ MAX_INT = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF
 ONE_HUNDRED_PERCENT_BP = 10000
 NO_CONDUIT_KEY = HASH_ZERO
 CROSS_CHAIN_SEAPORT_ADDRESS = "0x00000000006c3852cbef3e08e8df289169ede581"
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
@@ -1,33 +1,49 @@
 import json
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from inspect import iscoroutinefunction
 from itertools import chain
 from time import time
-from typing import Optional, cast
+from typing import Any, Optional, Sequence, TypeVar, Union, cast
 
 from web3 import Web3
 from web3.constants import ADDRESS_ZERO
-from web3.contract import Contract
+from web3.contract import Contract, ContractFunction
+from web3.exceptions import MismatchedABI
+from web3.providers.async_base import AsyncBaseProvider
 from web3.providers.base import BaseProvider
-from web3.types import RPCEndpoint
+from web3.types import BlockIdentifier, LogReceipt, TxParams
 
 from seaport.abi.Seaport import SEAPORT_ABI
 from seaport.constants import (
+    BULK_ORDER_MIN_CONTRACT_VERSION,
     CONSIDERATION_CONTRACT_NAME,
-    CONSIDERATION_CONTRACT_VERSION,
     EIP_712_ORDER_TYPE,
     MAX_INT,
     NO_CONDUIT_KEY,
+    FulfillRoute,
     OrderType,
 )
 from seaport.types import (
+    ApprovalAction,
+    BalancesAndApprovals,
     ConsiderationInputItem,
     ConsiderationItem,
     CreateInputItem,
     CreateOrderAction,
+    CreateOrderInput,
+    CreateOrdersAction,
+    CreateOrdersUseCase,
     CreateOrderUseCase,
     Fee,
     FulfillOrderDetails,
+    FulfillOrdersUseCase,
     FulfillOrderUseCase,
     InputCriteria,
+    InsufficientApproval,
+    Item,
+    MatchOrderDetails,
+    OfferItem,
     Order,
     OrderComponents,
     OrderParameters,
@@ -37,20 +53,31 @@ from seaport.types import (
     TransactionMethods,
 )
 from seaport.utils.balance_and_approval_check import (
+    BalancesAndApprovalsIndex,
+    BalancesAndApprovalsReadPlan,
     get_approval_actions,
     get_balances_and_approvals,
     validate_offer_balances_and_approvals,
 )
+from seaport.utils.criteria_registry import CriteriaRegistry
 from seaport.utils.fulfill import (
     FulfillOrdersMetadata,
     fulfill_available_orders,
     fulfill_basic_order,
     fulfill_standard_order,
-    should_use_basic_fulfill,
     validate_and_sanitize_from_order_status,
 )
+from seaport.utils.fulfill_chunks import plan_fulfill_orders_chunks
+from seaport.utils.fulfill_routes import (
+    estimate_fulfill_routes,
+    get_fulfill_order_routes,
+    get_fulfill_orders_routes,
+)
 from seaport.utils.hex_utils import bytes_to_hex
 from seaport.utils.item import TimeBasedItemParams, is_currency_item
+from seaport.utils.json_rpc_batch import batch_call
+from seaport.utils.match import match_advanced_orders
+from seaport.utils.merkletree import BulkOrderTree
 from seaport.utils.order import (
     are_all_currencies_same,
     deduct_fees,
@@ -59,22 +86,59 @@ from seaport.utils.order import (
     map_input_item_to_offer_item,
     total_items_amount,
 )
+from seaport.utils.order_hash import get_domain_separator, get_order_hash
 from seaport.utils.pydantic import dict_int_to_str, parse_model_list
+from seaport.utils.signature import verify_order_signatures
+from seaport.utils.signer import (
+    AsyncOrderSigner,
+    BatchOrderSigner,
+    BulkOrderSigner,
+    OrderSigner,
+    ProviderOrderSigner,
+)
+from seaport.utils.snapshot import ChainSnapshot
 from seaport.utils.usecase import execute_all_actions, get_transaction_methods
 
+OrderDetails = TypeVar("OrderDetails", FulfillOrderDetails, MatchOrderDetails)
+
+
+def _parse_version(version: str) -> tuple[int, ...]:
+    return tuple(map(int, version.split(".")))
+
+
+class BaseSeaport(ABC):
+    """
+    Everything the sync and async clients have in common. Methods here never read from the chain,
+    so the clients fetch what is needed and pass it into the _build_* methods.
+    """
 
-class Seaport:
     contract: Contract
     web3: Web3
     config: SeaportConfig
     default_conduit_key: str
+    signer: Union[OrderSigner, AsyncOrderSigner]
+
+    # EIP-712 domain cache, resolved on the first signature
+    _domain_provider: Optional[Union[BaseProvider, AsyncBaseProvider]] = None
+    _domain_data: Optional[dict] = None
+    _domain_separator: Optional[bytes] = None
+    _typed_data: Optional[dict] = None
+
+    # Counters of offerers keyed by lowercased address, and the provider they were read from
+    _counters: dict[str, int]
+    _counters_provider: Optional[Union[BaseProvider, AsyncBaseProvider]] = None
 
     def __init__(
         self,
-        provider: BaseProvider,
-        config: SeaportConfig = SeaportConfig(),
+        web3: Web3,
+        config: SeaportConfig,
+        signer: Union[OrderSigner, AsyncOrderSigner],
+        criteria_registry: Optional[CriteriaRegistry] = None,
     ):
-        self.web3 = Web3(provider=provider)
+        self.web3 = web3
+        self.signer = signer
+        self.criteria_registry = criteria_registry or CriteriaRegistry()
+        self._counters = {}
 
         self.contract = self.web3.eth.contract(
             address=config.overrides.contract_address
@@ -102,56 +166,20 @@ class Seaport:
             )
         return OrderType.FULL_RESTRICTED if restricted_by_zone else OrderType.FULL_OPEN
 
-    def create_order(
+    def _map_create_order_items(
         self,
         *,
-        conduit_key: Optional[str] = None,
-        account_address: Optional[str] = None,
-        allow_partial_fills=False,
-        consideration: list[ConsiderationInputItem],
-        fees: list[Fee] = [],
-        counter: Optional[int] = None,
+        offerer: str,
         offer: list[CreateInputItem],
-        restricted_by_zone=False,
-        salt=generate_random_salt(),
-        start_time: int = int(time()),
-        zone: str = ADDRESS_ZERO,
-        end_time: int = MAX_INT,
-    ) -> CreateOrderUseCase:
-        """
-        Returns a use case that will create an order.
-        The use case will contain the list of actions necessary to finish creating an order.
-        The list of actions will either be an approval if approvals are necessary
-        or a signature request that will then be supplied into the final Order struct, ready to be fulfilled.
-
-        Args:
-            conduit_key (str, optional): The conduit key to derive where to source your approvals from. Defaults to address(0) which refers to the Seaport contract.
-            offer (list[CreateInputItem]): The items you are willing to offer. This is a condensed version of the Seaport struct OfferItem for convenience
-            consideration (list[ConsiderationInputItem]): The items that will go to their respective recipients upon receiving your offer.
-            counter (Optional[int], optional): The counter from which to create the order with. Automatically fetched from the contract if not provided.
-            fees (list[Fee], optional): Convenience array to apply fees onto the order. The fees will be deducted from the
-                                        existing consideration items and then tacked on as new
-                                        consideration items. Defaults to [].
-            account_address (Optional[str], optional): Optional address for which to create the order with.
-                                                       The account will be the first account from the provider if not specified.
-            allow_partial_fills (bool, optional): Whether to allow the order to be partially filled. Defaults to False.
-            restricted_by_zone (bool, optional): Whether the order should be restricted by zone. Defaults to False.
-            salt (_type_, optional): Random salt. Defaults to a randomly generated salt.
-            zone (str, optional): The zone of the order. Defaults to ADDRESS_ZERO.
-            start_time (int, optional): The start time of the order in unix time. Defaults to the current time.
-            end_time (int, optional): The end time of the order. Defaults to "never end".
-                                      It is HIGHLY recommended to pass in an explicit end time
-
-        Returns:
-            CreateOrderUseCase: a use case containing the list of actions needed to be performed in order to create the order
-        """
-        conduit_key = conduit_key or self.default_conduit_key
-        offerer = account_address or self.web3.eth.accounts[0]
-        offer_items = list(map(map_input_item_to_offer_item, offer))
+        consideration: list[ConsiderationInputItem],
+    ) -> tuple[list[OfferItem], list[ConsiderationItem]]:
+        offer_items = [
+            map_input_item_to_offer_item(item, self.criteria_registry) for item in offer
+        ]
         consideration_items = list(
             map(
                 lambda c: ConsiderationItem(
-                    **map_input_item_to_offer_item(c).dict(),
+                    **map_input_item_to_offer_item(c, self.criteria_registry).dict(),
                     recipient=c.recipient or offerer,
                 ),
                 consideration,
@@ -163,6 +191,24 @@ class Seaport:
         ):
             raise ValueError("All currency tokens in the order must be the same token")
 
+        return offer_items, consideration_items
+
+    def _build_order_parameters(
+        self,
+        *,
+        offerer: str,
+        conduit_key: str,
+        offer_items: list[OfferItem],
+        consideration_items: list[ConsiderationItem],
+        fees: list[Fee],
+        counter: int,
+        allow_partial_fills: bool,
+        restricted_by_zone: bool,
+        salt: int,
+        start_time: int,
+        zone: str,
+        end_time: int,
+    ) -> OrderParameters:
         currencies = list(
             filter(
                 lambda item: is_currency_item(item.itemType),
@@ -174,18 +220,6 @@ class Seaport:
             currencies
         )
 
-        operator = self.config.conduit_key_to_conduit[conduit_key]
-
-        resolved_counter = counter or self.get_counter(offerer=offerer)
-
-        balances_and_approvals = get_balances_and_approvals(
-            owner=offerer,
-            items=offer_items,
-            criterias=[],
-            operator=operator,
-            web3=self.web3,
-        )
-
         order_type = self._get_order_type_from_options(
             allow_partial_fills=allow_partial_fills,
             restricted_by_zone=restricted_by_zone,
@@ -210,7 +244,7 @@ class Seaport:
             )
         )
 
-        order_parameters = OrderParameters(
+        return OrderParameters(
             offerer=offerer,
             zone=zone,
             startTime=start_time,
@@ -220,79 +254,261 @@ class Seaport:
             consideration=consideration_items_with_fees,
             totalOriginalConsiderationItems=len(consideration_items_with_fees),
             # TODO: Placeholder
-            zoneHash=bytes_to_hex(resolved_counter.to_bytes(32, "little")),
+            zoneHash=bytes_to_hex(counter.to_bytes(32, "little")),
             conduitKey=conduit_key,
             salt=salt,
         )
 
-        check_balances_and_approvals = (
-            self.config.balance_and_approval_checks_on_order_creation
-        )
-
-        insufficient_approvals = (
-            validate_offer_balances_and_approvals(
-                offer=order_parameters.offer,
+    def _get_offer_approval_actions(
+        self,
+        *,
+        offerer: str,
+        operator: str,
+        offers: list[list[OfferItem]],
+        balances_and_approvals: Union[BalancesAndApprovals, BalancesAndApprovalsIndex],
+    ) -> list[ApprovalAction]:
+        if not self.config.balance_and_approval_checks_on_order_creation:
+            return []
+
+        # Every offer is checked on its own, but each token only needs to be approved once
+        insufficient_approvals: dict[str, InsufficientApproval] = {}
+
+        for offer in offers:
+            for insufficient_approval in validate_offer_balances_and_approvals(
+                offer=offer,
                 criterias=[],
                 balances_and_approvals=balances_and_approvals,
-                throw_on_insufficient_balances=check_balances_and_approvals,
                 operator=operator,
-            )
-            if self.config.balance_and_approval_checks_on_order_creation
-            else []
+            ):
+                insufficient_approvals.setdefault(
+                    insufficient_approval.token.lower(), insufficient_approval
+                )
+
+        return get_approval_actions(
+            insufficient_approvals=list(insufficient_approvals.values()),
+            web3=self.web3,
+            account_address=offerer,
         )
 
-        approval_actions = (
-            get_approval_actions(
-                insufficient_approvals=insufficient_approvals,
-                web3=self.web3,
-                account_address=offerer,
-            )
-            if check_balances_and_approvals
-            else []
+    def _build_order_parameters_and_approval_actions(
+        self,
+        *,
+        offerer: str,
+        conduit_key: str,
+        operator: str,
+        offer_items: list[OfferItem],
+        consideration_items: list[ConsiderationItem],
+        fees: list[Fee],
+        counter: int,
+        balances_and_approvals: BalancesAndApprovals,
+        allow_partial_fills: bool,
+        restricted_by_zone: bool,
+        salt: int,
+        start_time: int,
+        zone: str,
+        end_time: int,
+    ) -> tuple[OrderParameters, list[ApprovalAction]]:
+        order_parameters = self._build_order_parameters(
+            offerer=offerer,
+            conduit_key=conduit_key,
+            offer_items=offer_items,
+            consideration_items=consideration_items,
+            fees=fees,
+            counter=counter,
+            allow_partial_fills=allow_partial_fills,
+            restricted_by_zone=restricted_by_zone,
+            salt=salt,
+            start_time=start_time,
+            zone=zone,
+            end_time=end_time,
         )
 
-        def create_order_fn():
-            signature = self.sign_order(
-                order_parameters=order_parameters,
-                counter=resolved_counter,
-                account_address=offerer,
-            )
+        approval_actions = self._get_offer_approval_actions(
+            offerer=offerer,
+            operator=operator,
+            offers=[order_parameters.offer],
+            balances_and_approvals=balances_and_approvals,
+        )
 
-            return OrderWithCounter(
-                parameters=OrderComponents(
-                    **order_parameters.dict(), counter=resolved_counter
-                ),
-                signature=signature,
+        return order_parameters, approval_actions
+
+    def _build_orders_parameters_and_approval_actions(
+        self,
+        *,
+        offerer: str,
+        conduit_key: str,
+        operator: str,
+        orders: list[CreateOrderInput],
+        orders_items: list[tuple[list[OfferItem], list[ConsiderationItem]]],
+        counter: int,
+        balances_and_approvals: BalancesAndApprovals,
+    ) -> tuple[list[OrderParameters], list[ApprovalAction]]:
+        orders_parameters: list[OrderParameters] = []
+        start_time = int(time())
+
+        for order, (offer_items, consideration_items) in zip(orders, orders_items):
+            orders_parameters.append(
+                self._build_order_parameters(
+                    offerer=offerer,
+                    conduit_key=conduit_key,
+                    offer_items=offer_items,
+                    consideration_items=consideration_items,
+                    fees=order.fees,
+                    counter=counter,
+                    allow_partial_fills=order.allow_partial_fills,
+                    restricted_by_zone=order.restricted_by_zone,
+                    salt=order.salt
+                    if order.salt is not None
+                    else generate_random_salt(),
+                    start_time=order.start_time
+                    if order.start_time is not None
+                    else start_time,
+                    zone=order.zone,
+                    end_time=order.end_time,
+                )
             )
 
-        create_order_action = CreateOrderAction(
-            create_order=create_order_fn,
-            get_message_to_sign=lambda: self._get_message_to_sign(
-                order_parameters=order_parameters, counter=resolved_counter
-            ),
+        approval_actions = self._get_offer_approval_actions(
+            offerer=offerer,
+            operator=operator,
+            offers=[order_parameters.offer for order_parameters in orders_parameters],
+            balances_and_approvals=BalancesAndApprovalsIndex(balances_and_approvals),
         )
 
-        actions = list(chain(approval_actions, [create_order_action]))
+        return orders_parameters, approval_actions
 
-        return CreateOrderUseCase(
-            actions=actions,
-            execute_all_actions=lambda: cast(
-                OrderWithCounter, execute_all_actions(actions, {"from": offerer})
-            ),
+    def set_provider(self, provider: Union[BaseProvider, AsyncBaseProvider]):
+        """
+        Swaps the provider used by the client and invalidates everything cached from the previous provider
+
+        Args:
+            provider (Union[BaseProvider, AsyncBaseProvider]): the new provider
+        """
+        self.web3.provider = provider
+        self.invalidate_domain_cache()
+        self.invalidate_counter_cache()
+
+    def invalidate_domain_cache(self):
+        """
+        Clears the cached EIP-712 domain so the chain id is fetched again on the next signature
+        """
+        self._domain_provider = None
+        self._domain_data = None
+        self._domain_separator = None
+        self._typed_data = None
+
+    def invalidate_counter_cache(self, offerer: Optional[str] = None):
+        """
+        Clears the cached counter of an offerer, or of every offerer if none is given,
+        so it is read from the contract again on its next use
+
+        Args:
+            offerer (Optional[str], optional): the offerer to clear the counter of. Defaults to every offerer.
+        """
+        if offerer is None:
+            self._counters = {}
+        else:
+            self._counters.pop(offerer.lower(), None)
+
+    def process_counter_incremented_logs(self, logs: Sequence[LogReceipt]):
+        """
+        Updates cached counters from CounterIncremented logs, i.e. from a log subscription, a log filter
+        or transaction receipts. Logs of other events or contracts are ignored.
+
+        Args:
+            logs (Sequence[LogReceipt]): the logs to process
+        """
+        counter_incremented = self.contract.events.CounterIncremented()
+
+        for log in logs:
+            if log["address"].lower() != self.contract.address.lower():
+                continue
+
+            try:
+                event = counter_incremented.processLog(log)
+            except MismatchedABI:
+                continue
+
+            self._cache_counter(event.args.offerer, event.args.newCounter)
+
+    def _get_cached_counter(self, offerer: str) -> Optional[int]:
+        # Counters read from a previous provider may be for another chain
+        if self._counters_provider is not self.web3.provider:
+            return None
+
+        return self._counters.get(offerer.lower())
+
+    def _cache_counter(self, offerer: str, counter: int):
+        if self._counters_provider is not self.web3.provider:
+            self._counters = {}
+            self._counters_provider = self.web3.provider
+
+        self._counters[offerer.lower()] = counter
+
+    def _is_domain_cached(self) -> bool:
+        # Providers can also be swapped directly on the web3 instance, so treat that as an invalidation as well
+        return (
+            self._domain_data is not None
+            and self._domain_provider is self.web3.provider
         )
 
+    @abstractmethod
+    def _get_chain_id(self) -> int:
+        """
+        Returns the chain id of the current provider, which the sync client reads on demand
+        and the async client loads ahead of building the domain
+        """
+
+    def _get_domain_data(self) -> dict:
+        if not self._is_domain_cached():
+            self.invalidate_domain_cache()
+
+            self._domain_data = {
+                "name": CONSIDERATION_CONTRACT_NAME,
+                "version": self.config.contract_version,
+                "chainId": self._get_chain_id(),
+                "verifyingContract": self.contract.address,
+            }
+            self._domain_provider = self.web3.provider
+
+        return cast(dict, self._domain_data)
+
+    def _get_domain_separator(self) -> bytes:
+        domain_data = self._get_domain_data()
+
+        if self._domain_separator is None:
+            self._domain_separator = get_domain_separator(
+                chain_id=domain_data["chainId"],
+                verifying_contract=domain_data["verifyingContract"],
+                version=domain_data["version"],
+            )
+
+        return self._domain_separator
+
     def _get_message_to_sign(
         self, *, order_parameters: OrderParameters, counter: int
     ) -> str:
-        domain_data = {
-            "name": CONSIDERATION_CONTRACT_NAME,
-            "version": CONSIDERATION_CONTRACT_VERSION,
-            "chainId": self.web3.eth.chain_id,
-            "verifyingContract": self.contract.address,
-        }
+        domain_data = self._get_domain_data()
+
+        if self._typed_data is None:
+            # Everything but the message is static per domain
+            self._typed_data = {
+                "domain": domain_data,
+                "types": EIP_712_ORDER_TYPE,
+                "primaryType": "OrderComponents",
+            }
+
+        order_components = self._get_order_components_message(
+            order_parameters=order_parameters, counter=counter
+        )
 
+        return json.dumps({**self._typed_data, "message": order_components})
+
+    def _get_order_components_message(
+        self, *, order_parameters: OrderParameters, counter: int
+    ) -> dict:
         # We need to convert ints to str when signing due to limitations of certain RPC providers
-        order_components = {
+        return {
             **dict_int_to_str(order_parameters.dict()),
             "counter": counter,
             "offer": list(
@@ -303,49 +519,84 @@ class Seaport:
             ),
         }
 
-        payload = {
-            "domain": domain_data,
-            "message": order_components,
-            "types": EIP_712_ORDER_TYPE,
-            "primaryType": "OrderComponents",
-        }
+    def _supports_bulk_orders(self) -> bool:
+        return _parse_version(self.config.contract_version) >= _parse_version(
+            BULK_ORDER_MIN_CONTRACT_VERSION
+        )
 
-        return json.dumps(payload)
+    def _validate_bulk_order_signing(self):
+        contract_version = self.config.contract_version
 
-    def sign_order(
-        self,
-        *,
-        order_parameters: OrderParameters,
-        counter: int,
-        account_address: str,
-    ):
-        payload = self._get_message_to_sign(
-            order_parameters=order_parameters, counter=counter
-        )
+        if not self._supports_bulk_orders():
+            raise ValueError(
+                f"Bulk order signatures require Seaport {BULK_ORDER_MIN_CONTRACT_VERSION} or later, "
+                f"but the configured contract version is {contract_version}"
+            )
+
+        if not isinstance(self.signer, BulkOrderSigner):
+            raise ValueError(
+                "The configured signer doesn't support bulk order signatures"
+            )
 
-        # Default to using signTypedData_v4. If that's not possible, fallback to signTypedData
-        response = self.web3.provider.make_request(
-            RPCEndpoint("eth_signTypedData_v4"),
+    def _get_bulk_order_tree(
+        self, *, orders_parameters: list[OrderParameters], counter: int
+    ) -> BulkOrderTree:
+        self._validate_bulk_order_signing()
+
+        return BulkOrderTree(
             [
-                account_address or self.web3.eth.accounts[0],
-                payload,
-            ],
+                OrderComponents(**order_parameters.dict(), counter=counter)
+                for order_parameters in orders_parameters
+            ]
         )
-        if "error" in response:
-            response = self.web3.provider.make_request(
-                RPCEndpoint("eth_signTypedData"),
-                [
-                    account_address or self.web3.eth.accounts[0],
-                    payload,
-                ],
-            )
 
-        if "result" not in response and "error" in response:
-            raise ValueError(
-                f"There was a problem generating the signature for the order: {response['error']}"
+    def _get_bulk_order_message_to_sign(self, bulk_order_tree: BulkOrderTree) -> str:
+        tree: list = [
+            self._get_order_components_message(
+                order_parameters=order_components, counter=order_components.counter
             )
+            for order_components in bulk_order_tree.get_leaf_orders_components()
+        ]
+
+        # Leaves are paired once per level, nesting them the same way as the OrderComponents[2] arrays
+        for _ in range(bulk_order_tree.height):
+            tree = [tree[index : index + 2] for index in range(0, len(tree), 2)]
+
+        return json.dumps(
+            {
+                "domain": self._get_domain_data(),
+                "types": {
+                    **EIP_712_ORDER_TYPE,
+                    "BulkOrder": [
+                        {
+                            "name": "tree",
+                            "type": f"OrderComponents{'[2]' * bulk_order_tree.height}",
+                        }
+                    ],
+                },
+                "primaryType": "BulkOrder",
+                "message": {"tree": tree[0]},
+            }
+        )
+
+    def _get_messages_to_sign(
+        self, *, orders_parameters: list[OrderParameters], counter: int, bulk: bool
+    ) -> list[str]:
+        if bulk:
+            return [
+                self._get_bulk_order_message_to_sign(
+                    self._get_bulk_order_tree(
+                        orders_parameters=orders_parameters, counter=counter
+                    )
+                )
+            ]
 
-        return response["result"]
+        return [
+            self._get_message_to_sign(
+                order_parameters=order_parameters, counter=counter
+            )
+            for order_parameters in orders_parameters
+        ]
 
     def cancel_orders(self, orders: list[OrderComponents]) -> TransactionMethods:
         """
@@ -363,12 +614,49 @@ class Seaport:
 
     def bulk_cancel_orders(self) -> TransactionMethods:
         """
-        Bulk cancels all existing orders for a given account
+        Bulk cancels all existing orders for a given account.
+        Transacting through the returned methods waits for the transaction to be mined,
+        then caches the new counter of the sender from its receipt.
 
         Returns:
             TransactionMethods: set of transaction methods that can be used
         """
-        return get_transaction_methods(self.contract.functions.incrementCounter)
+        transaction_methods = get_transaction_methods(
+            self.contract.functions.incrementCounter()
+        )
+        transact = transaction_methods.transact
+
+        # Counters read while the transaction is pending are stale, so the counter is only cached once it is mined.
+        # Until then, the counter of the sender is cleared, or of every offerer if the sender is the provider's
+        # default account
+        def invalidate_counter_cache(transaction: Optional[TxParams]):
+            self.invalidate_counter_cache((transaction or {}).get("from"))
+
+        if iscoroutinefunction(transact):
+
+            async def async_transact_and_cache_counter(
+                transaction: Optional[TxParams] = {},
+            ):
+                tx_hash = await transact(transaction)
+                invalidate_counter_cache(transaction)
+                receipt = await self.web3.eth.wait_for_transaction_receipt(tx_hash)  # type: ignore
+                self.process_counter_incremented_logs(receipt["logs"])
+
+                return tx_hash
+
+            return transaction_methods.copy(
+                update={"transact": async_transact_and_cache_counter}
+            )
+
+        def transact_and_cache_counter(transaction: Optional[TxParams] = {}):
+            tx_hash = transact(transaction)
+            invalidate_counter_cache(transaction)
+            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            self.process_counter_incremented_logs(receipt["logs"])
+
+            return tx_hash
+
+        return transaction_methods.copy(update={"transact": transact_and_cache_counter})
 
     def validate(self, orders: list[Order]) -> TransactionMethods:
         """
@@ -385,22 +673,8 @@ class Seaport:
             self.contract.functions.validate(parse_model_list(orders))
         )
 
-    def get_order_status(self, order_hash: str) -> OrderStatus:
-        """
-        Returns the order status given an order hash
-
-        Args:
-            order_hash (str): the hash of the order
-
-        Returns:
-            OrderStatus: order status model
-        """
-        (
-            is_validated,
-            is_cancelled,
-            total_filled,
-            total_size,
-        ) = self.contract.functions.getOrderStatus(order_hash).call()
+    def _to_order_status(self, result: tuple[bool, bool, int, int]) -> OrderStatus:
+        is_validated, is_cancelled, total_filled, total_size = result
 
         return OrderStatus(
             is_validated=is_validated,
@@ -409,18 +683,6 @@ class Seaport:
             total_size=total_size,
         )
 
-    def get_counter(self, offerer: str) -> int:
-        """
-        Gets the counter of a given offerer
-
-        Args:
-            offerer (str): the offerer to get the counter of
-
-        Returns:
-            int: counter
-        """
-        return self.contract.functions.getCounter(offerer).call()
-
     def get_order_hash(self, order_components: OrderComponents) -> str:
         """
         Calculates the order hash of order components so we can forgo executing a request to the contract
@@ -432,161 +694,28 @@ class Seaport:
         Returns:
             str: the order hash
         """
-        offer_item_type_string = "OfferItem(uint8 itemType,address token,uint256 identifierOrCriteria,uint256 startAmount,uint256 endAmount)"
-        consideration_item_type_string = "ConsiderationItem(uint8 itemType,address token,uint256 identifierOrCriteria,uint256 startAmount,uint256 endAmount,address recipient)"
-        order_components_partial_type_str = "OrderComponents(address offerer,address zone,OfferItem[] offer,ConsiderationItem[] consideration,uint8 orderType,uint256 startTime,uint256 endTime,bytes32 zoneHash,uint256 salt,bytes32 conduitKey,uint256 counter)"
-        order_type_str = f"{order_components_partial_type_str}{consideration_item_type_string}{offer_item_type_string}"
-        offer_item_type_hash = Web3.solidityKeccak(
-            abi_types=["bytes"], values=[offer_item_type_string.encode("utf-8")]
-        ).hex()
-        consideration_item_type_hash = Web3.solidityKeccak(
-            abi_types=["bytes"], values=[offer_item_type_string.encode("utf-8")]
-        ).hex()
-        order_type_hash = Web3.solidityKeccak(
-            abi_types=["bytes"], values=[order_type_str.encode("utf-8")]
-        ).hex()
-
-        offer_hash = Web3.solidityKeccak(
-            abi_types=["bytes"],
-            values=[
-                "0x"
-                + "".join(
-                    map(
-                        lambda item: Web3.solidityKeccak(
-                            abi_types=["bytes"],
-                            values=[
-                                "0x"
-                                + "".join(
-                                    [
-                                        offer_item_type_hash[2:],
-                                        str(item.itemType.value).zfill(64),
-                                        item.token[2:].zfill(64),
-                                        hex(item.identifierOrCriteria)[2:].zfill(64),
-                                        hex(item.startAmount)[2:].zfill(64),
-                                        hex(item.endAmount)[2:].zfill(64),
-                                    ]
-                                )
-                            ],
-                        ).hex()[2:],
-                        order_components.offer,
-                    )
-                )
-            ],
-        ).hex()
-
-        consideration_hash = Web3.solidityKeccak(
-            abi_types=["bytes"],
-            values=[
-                "0x"
-                + "".join(
-                    map(
-                        lambda item: Web3.solidityKeccak(
-                            abi_types=["bytes"],
-                            values=[
-                                "0x"
-                                + "".join(
-                                    [
-                                        consideration_item_type_hash[2:],
-                                        str(item.itemType.value).zfill(64),
-                                        item.token[2:].zfill(64),
-                                        hex(item.identifierOrCriteria)[2:].zfill(64),
-                                        hex(item.startAmount)[2:].zfill(64),
-                                        hex(item.endAmount)[2:].zfill(64),
-                                        item.recipient[2:].zfill(64),
-                                    ]
-                                )
-                            ],
-                        ).hex()[2:],
-                        order_components.consideration,
-                    )
-                )
-            ],
-        ).hex()
-
-        derived_order_hash = Web3.solidityKeccak(
-            abi_types=["bytes"],
-            values=[
-                "0x"
-                + "".join(
-                    [
-                        order_type_hash[2:],
-                        order_components.offerer[2:].zfill(64),
-                        order_components.zone[2:].zfill(64),
-                        offer_hash[2:],
-                        consideration_hash[2:],
-                        str(order_components.orderType.value).zfill(64),
-                        hex(order_components.startTime)[2:].zfill(64),
-                        hex(order_components.endTime)[2:].zfill(64),
-                        hex(order_components.salt)[2:].zfill(64),
-                        order_components.conduitKey[2:].zfill(64),
-                        hex(order_components.counter)[2:].zfill(64),
-                    ]
-                )
-            ],
-        )
-
-        return derived_order_hash.hex()
+        return get_order_hash(order_components)
 
-    def fulfill_order(
+    def _build_fulfill_order_use_case(
         self,
         *,
-        conduit_key: Optional[str] = None,
+        conduit_key: str,
         order: OrderWithCounter,
-        units_to_fill=0,
-        offer_criteria: list[InputCriteria] = [],
-        consideration_criteria: list[InputCriteria] = [],
-        tips: list[ConsiderationInputItem] = [],
-        extra_data="0x",
-        account_address: Optional[str] = None,
-        recipient_address=ADDRESS_ZERO,
+        units_to_fill: int,
+        offer_criteria: list[InputCriteria],
+        consideration_criteria: list[InputCriteria],
+        tips: list[ConsiderationInputItem],
+        extra_data: str,
+        fulfiller: str,
+        recipient_address: str,
+        offerer_operator: str,
+        fulfiller_operator: str,
+        offerer_balances_and_approvals: BalancesAndApprovals,
+        fulfiller_balances_and_approvals: BalancesAndApprovals,
+        order_status: OrderStatus,
+        current_block_timestamp: int,
     ) -> FulfillOrderUseCase:
-        """
-        Fulfills an order through either the basic method or the standard method
-        Units to fill are denominated by the max possible size of the order, which is the greatest common denominator (GCD).
-        We expose a helper to get this: getMaximumSizeForOrder
-        i.e. If the maximum size of an order is 4, supplying 2 as the units to fulfill will fill half of the order
-
-        Args:
-            conduit (str, optional): the conduitKey to source approvals from
-            order (Order): standard order struct
-            units_to_fill (Optional[int], optional): the number of units to fill for the given order. Only used if you wish to partially fill an order
-            offer_criteria (list[InputCriteria], optional): an array of criteria with length equal to the number of offer criteria items. Defaults to [].
-            consideration_criteria (list[InputCriteria], optional): an array of criteria with length equal to the number of consideration criteria items. Defaults to [].
-            tips (list[ConsiderationInputItem], optional): an array of optional condensed consideration items to be added onto a fulfillment. Defaults to [].
-            extra_data (Optional[str], optional): extra data supplied to the order. Defaults to None.
-            recipient_address (Optional[str], optional): optional recipient to forward the offer to as opposed to the fulfiller.
-                                                         Defaults to the zero address which means the offer goes to the fulfiller
-        """
-        conduit_key = conduit_key or self.default_conduit_key
-        fulfiller = account_address or self.web3.eth.accounts[0]
         offerer = order.parameters.offerer
-        offerer_operator = self.config.conduit_key_to_conduit[
-            order.parameters.conduitKey
-        ]
-        fulfiller_operator = self.config.conduit_key_to_conduit[conduit_key]
-
-        offerer_balances_and_approvals = get_balances_and_approvals(
-            owner=offerer,
-            items=order.parameters.offer,
-            criterias=offer_criteria,
-            operator=offerer_operator,
-            web3=self.web3,
-        )
-
-        # Get fulfiller balances and approvals of all items in the set, as offer items
-        # may be received by the fulfiller for standard fulfills
-        fulfiller_balances_and_approvals = get_balances_and_approvals(
-            owner=fulfiller,
-            items=list(chain(order.parameters.offer, order.parameters.consideration)),
-            criterias=list(chain(offer_criteria, consideration_criteria)),
-            operator=fulfiller_operator,
-            web3=self.web3,
-        )
-
-        current_block = self.web3.eth.get_block("latest")
-        order_status = self.get_order_status(self.get_order_hash(order.parameters))
-
-        current_block_timestamp = current_block.get("timestamp", int(time()))
         sanitized_order = validate_and_sanitize_from_order_status(order, order_status)
         time_based_item_params = TimeBasedItemParams(
             start_time=sanitized_order.parameters.startTime,
@@ -603,15 +732,27 @@ class Seaport:
                 tips,
             )
         )
-        is_recipient_self = recipient_address == ADDRESS_ZERO
+        fulfill_order_details = FulfillOrderDetails(
+            order=order.copy(update={"signature": sanitized_order.signature}),
+            units_to_fill=units_to_fill,
+            offer_criteria=offer_criteria,
+            consideration_criteria=consideration_criteria,
+            tips=tips,
+            extra_data=extra_data,
+        )
+        route_estimates = estimate_fulfill_routes(
+            get_fulfill_order_routes(
+                fulfill_order_details,
+                recipient_address=recipient_address,
+                total_filled=order_status.total_filled,
+            ),
+            [fulfill_order_details],
+            self.config.fulfill_route_cost_model,
+            self.config.fulfill_orders_cost_model,
+        )
+        route = route_estimates[0].route
 
-        if (
-            not units_to_fill
-            and is_recipient_self
-            and should_use_basic_fulfill(
-                sanitized_order.parameters, order_status.total_filled
-            )
-        ):
+        if route == FulfillRoute.BASIC:
             return fulfill_basic_order(
                 conduit_key=conduit_key,
                 order=sanitized_order,
@@ -624,7 +765,7 @@ class Seaport:
                 offerer_operator=offerer_operator,
                 fulfiller_operator=fulfiller_operator,
                 web3=self.web3,
-            )
+            ).copy(update={"route_estimates": route_estimates})
 
         return fulfill_standard_order(
             conduit_key=conduit_key,
@@ -645,25 +786,60 @@ class Seaport:
             fulfiller_operator=fulfiller_operator,
             recipient_address=recipient_address,
             web3=self.web3,
-        )
+            route=route,
+        ).copy(update={"route_estimates": route_estimates})
 
-    def fulfill_orders(
+    def _resolve_fulfill_order_criterias(
         self,
-        fulfill_order_details: list[FulfillOrderDetails],
-        account_address: Optional[str] = None,
-        conduit_key: Optional[str] = None,
-        recipient_address=ADDRESS_ZERO,
-    ) -> FulfillOrderUseCase:
-        conduit_key = conduit_key or self.default_conduit_key
-        fulfiller = account_address or self.web3.eth.accounts[0]
+        *,
+        order: OrderWithCounter,
+        offer_criteria: list[InputCriteria],
+        consideration_criteria: list[InputCriteria],
+    ) -> tuple[list[InputCriteria], list[InputCriteria]]:
+        """
+        Fills in the proofs of criterias given with only the chosen token id from the criteria registry
+        """
+        return self.criteria_registry.resolve_criterias(
+            order.parameters.offer, offer_criteria
+        ), self.criteria_registry.resolve_criterias(
+            order.parameters.consideration, consideration_criteria
+        )
 
-        all_offerer_operators = [
-            self.config.conduit_key_to_conduit[detail.order.parameters.conduitKey]
-            for detail in fulfill_order_details
-        ]
+    def _resolve_fulfill_orders_criterias(
+        self, fulfill_order_details: list[OrderDetails]
+    ) -> list[OrderDetails]:
+        resolved_fulfill_order_details = []
+
+        for detail in fulfill_order_details:
+            (
+                offer_criteria,
+                consideration_criteria,
+            ) = self._resolve_fulfill_order_criterias(
+                order=detail.order,
+                offer_criteria=detail.offer_criteria,
+                consideration_criteria=detail.consideration_criteria,
+            )
 
-        fulfiller_operator = self.config.conduit_key_to_conduit[conduit_key]
+            resolved_fulfill_order_details.append(
+                detail
+                if offer_criteria is detail.offer_criteria
+                and consideration_criteria is detail.consideration_criteria
+                else detail.copy(
+                    update={
+                        "offer_criteria": offer_criteria,
+                        "consideration_criteria": consideration_criteria,
+                    }
+                )
+            )
 
+        return resolved_fulfill_order_details
+
+    def _get_fulfill_orders_items_and_criterias(
+        self, fulfill_order_details: list[FulfillOrderDetails]
+    ) -> tuple[list[Item], list[InputCriteria]]:
+        """
+        Returns every offer item followed by every consideration item across the orders, along with their criterias
+        """
         all_offer_items = list(
             chain.from_iterable(
                 [detail.order.parameters.offer for detail in fulfill_order_details]
@@ -691,34 +867,24 @@ class Seaport:
             )
         )
 
-        all_offerer_balances_and_approvals = [
-            get_balances_and_approvals(
-                owner=detail.order.parameters.offerer,
-                items=detail.order.parameters.offer,
-                criterias=detail.offer_criteria,
-                operator=all_offerer_operators[index],
-                web3=self.web3,
-            )
-            for index, detail in enumerate(fulfill_order_details)
-        ]
-
-        fulfiller_balances_and_approvals = get_balances_and_approvals(
-            owner=fulfiller,
-            items=list(chain(all_offer_items, all_consideration_items)),
-            criterias=list(chain(all_offer_criteria, all_consideration_criteria)),
-            operator=fulfiller_operator,
-            web3=self.web3,
+        return list(chain(all_offer_items, all_consideration_items)), list(
+            chain(all_offer_criteria, all_consideration_criteria)
         )
 
-        order_statuses = [
-            self.get_order_status(self.get_order_hash(detail.order.parameters))
-            for detail in fulfill_order_details
-        ]
-
-        current_block = self.web3.eth.get_block("latest")
-
-        current_block_timestamp = current_block.get("timestamp", int(time()))
-
+    def _build_fulfill_orders_use_case(
+        self,
+        *,
+        fulfill_order_details: list[FulfillOrderDetails],
+        conduit_key: str,
+        fulfiller: str,
+        recipient_address: str,
+        all_offerer_operators: list[str],
+        fulfiller_operator: str,
+        all_offerer_balances_and_approvals: list[BalancesAndApprovals],
+        fulfiller_balances_and_approvals: BalancesAndApprovals,
+        order_statuses: list[OrderStatus],
+        current_block_timestamp: int,
+    ) -> FulfillOrdersUseCase:
         orders_metadata: list[FulfillOrdersMetadata] = [
             FulfillOrdersMetadata(
                 order=details.order,
@@ -742,6 +908,43 @@ class Seaport:
             for index, details in enumerate(fulfill_order_details)
         ]
 
+        # Validated orders are sent without their signature
+        sanitized_fulfill_order_details = [
+            detail.copy(
+                update={
+                    "order": detail.order.copy(update={"signature": "0x"})
+                    if order_status.is_validated
+                    else detail.order
+                }
+            )
+            for detail, order_status in zip(fulfill_order_details, order_statuses)
+        ]
+        route_estimates = estimate_fulfill_routes(
+            get_fulfill_orders_routes(
+                fulfill_order_details, recipient_address=recipient_address
+            ),
+            sanitized_fulfill_order_details,
+            self.config.fulfill_route_cost_model,
+            self.config.fulfill_orders_cost_model,
+        )
+        route = route_estimates[0].route
+
+        budget = self.config.fulfill_orders_budget
+        chunk_sizes = (
+            [
+                len(chunk)
+                for chunk in plan_fulfill_orders_chunks(
+                    sanitized_fulfill_order_details,
+                    budget,
+                    self.config.fulfill_orders_cost_model,
+                    route=route,
+                    route_cost_model=self.config.fulfill_route_cost_model,
+                )
+            ]
+            if budget
+            else None
+        )
+
         return fulfill_available_orders(
             orders_metadata=orders_metadata,
             seaport_contract=self.contract,
@@ -753,4 +956,795 @@ class Seaport:
             conduit_key=conduit_key,
             fulfiller_operator=fulfiller_operator,
             recipient_address=recipient_address,
+            chunk_sizes=chunk_sizes,
+            route=route,
+        ).copy(update={"route_estimates": route_estimates})
+
+    def _get_fulfiller_orders_details(
+        self, orders_details: list[MatchOrderDetails], fulfiller: str
+    ) -> list[MatchOrderDetails]:
+        """
+        Returns the matched orders offered by the fulfiller, whose offer items have to be approved by the fulfiller
+        """
+        return [
+            detail
+            for detail in orders_details
+            if detail.order.parameters.offerer.lower() == fulfiller.lower()
+        ]
+
+    def _build_match_orders_use_case(
+        self,
+        *,
+        orders_details: list[MatchOrderDetails],
+        fulfiller: str,
+        fulfiller_orders_details: list[MatchOrderDetails],
+        fulfiller_balances_and_approvals: list[BalancesAndApprovals],
+    ) -> FulfillOrderUseCase:
+        # Every order of the fulfiller is checked on its own, but each token only needs to be approved once per operator
+        insufficient_approvals: dict[tuple[str, str], InsufficientApproval] = {}
+
+        for detail, balances_and_approvals in zip(
+            fulfiller_orders_details, fulfiller_balances_and_approvals
+        ):
+            for insufficient_approval in validate_offer_balances_and_approvals(
+                offer=detail.order.parameters.offer,
+                criterias=detail.offer_criteria,
+                balances_and_approvals=balances_and_approvals,
+                operator=self.config.conduit_key_to_conduit[
+                    detail.order.parameters.conduitKey
+                ],
+            ):
+                insufficient_approvals.setdefault(
+                    (
+                        insufficient_approval.token.lower(),
+                        insufficient_approval.operator.lower(),
+                    ),
+                    insufficient_approval,
+                )
+
+        return match_advanced_orders(
+            orders_details=orders_details,
+            seaport_contract=self.contract,
+            fulfiller=fulfiller,
+            approval_actions=get_approval_actions(
+                insufficient_approvals=list(insufficient_approvals.values()),
+                web3=self.web3,
+                account_address=fulfiller,
+            ),
+        )
+
+
+class Seaport(BaseSeaport):
+    signer: OrderSigner
+
+    def __init__(
+        self,
+        provider: BaseProvider,
+        config: SeaportConfig = SeaportConfig(),
+        signer: Optional[OrderSigner] = None,
+        criteria_registry: Optional[CriteriaRegistry] = None,
+    ):
+        web3 = Web3(provider=provider)
+
+        super().__init__(
+            web3, config, signer or ProviderOrderSigner(web3), criteria_registry
+        )
+
+    def create_order(
+        self,
+        *,
+        conduit_key: Optional[str] = None,
+        account_address: Optional[str] = None,
+        allow_partial_fills=False,
+        consideration: list[ConsiderationInputItem],
+        fees: list[Fee] = [],
+        counter: Optional[int] = None,
+        offer: list[CreateInputItem],
+        restricted_by_zone=False,
+        salt=generate_random_salt(),
+        start_time: int = int(time()),
+        zone: str = ADDRESS_ZERO,
+        end_time: int = MAX_INT,
+        snapshot: Optional[ChainSnapshot] = None,
+    ) -> CreateOrderUseCase:
+        """
+        Returns a use case that will create an order.
+        The use case will contain the list of actions necessary to finish creating an order.
+        The list of actions will either be an approval if approvals are necessary
+        or a signature request that will then be supplied into the final Order struct, ready to be fulfilled.
+
+        Args:
+            conduit_key (str, optional): The conduit key to derive where to source your approvals from. Defaults to address(0) which refers to the Seaport contract.
+            offer (list[CreateInputItem]): The items you are willing to offer. This is a condensed version of the Seaport struct OfferItem for convenience
+            consideration (list[ConsiderationInputItem]): The items that will go to their respective recipients upon receiving your offer.
+            counter (Optional[int], optional): The counter from which to create the order with. Automatically fetched from the contract if not provided,
+                                               and cached until it is incremented through bulk_cancel_orders or a CounterIncremented log is processed.
+            fees (list[Fee], optional): Convenience array to apply fees onto the order. The fees will be deducted from the
+                                        existing consideration items and then tacked on as new
+                                        consideration items. Defaults to [].
+            account_address (Optional[str], optional): Optional address for which to create the order with.
+                                                       The account will be the first account from the provider if not specified.
+            allow_partial_fills (bool, optional): Whether to allow the order to be partially filled. Defaults to False.
+            restricted_by_zone (bool, optional): Whether the order should be restricted by zone. Defaults to False.
+            salt (_type_, optional): Random salt. Defaults to a randomly generated salt.
+            zone (str, optional): The zone of the order. Defaults to ADDRESS_ZERO.
+            start_time (int, optional): The start time of the order in unix time. Defaults to the current time.
+            end_time (int, optional): The end time of the order. Defaults to "never end".
+                                      It is HIGHLY recommended to pass in an explicit end time
+            snapshot (Optional[ChainSnapshot], optional): a snapshot from at_block to make every read at. Defaults to reading the latest state.
+
+        Returns:
+            CreateOrderUseCase: a use case containing the list of actions needed to be performed in order to create the order
+        """
+        conduit_key = conduit_key or self.default_conduit_key
+        offerer = account_address or self.web3.eth.accounts[0]
+        offer_items, consideration_items = self._map_create_order_items(
+            offerer=offerer, offer=offer, consideration=consideration
+        )
+
+        operator = self.config.conduit_key_to_conduit[conduit_key]
+
+        resolved_counter = (
+            counter
+            if counter is not None
+            else self._get_counter_for_order(offerer, snapshot)
+        )
+
+        balances_and_approvals = get_balances_and_approvals(
+            owner=offerer,
+            items=offer_items,
+            criterias=[],
+            operator=operator,
+            web3=self.web3,
+            multicall_address=self.config.multicall_address,
+            snapshot=snapshot,
+        )
+
+        (
+            order_parameters,
+            approval_actions,
+        ) = self._build_order_parameters_and_approval_actions(
+            offerer=offerer,
+            conduit_key=conduit_key,
+            operator=operator,
+            offer_items=offer_items,
+            consideration_items=consideration_items,
+            fees=fees,
+            counter=resolved_counter,
+            balances_and_approvals=balances_and_approvals,
+            allow_partial_fills=allow_partial_fills,
+            restricted_by_zone=restricted_by_zone,
+            salt=salt,
+            start_time=start_time,
+            zone=zone,
+            end_time=end_time,
+        )
+
+        def create_order_fn():
+            signature = self.sign_order(
+                order_parameters=order_parameters,
+                counter=resolved_counter,
+                account_address=offerer,
+            )
+
+            return OrderWithCounter(
+                parameters=OrderComponents(
+                    **order_parameters.dict(), counter=resolved_counter
+                ),
+                signature=signature,
+            )
+
+        create_order_action = CreateOrderAction(
+            create_order=create_order_fn,
+            get_message_to_sign=lambda: self._get_message_to_sign(
+                order_parameters=order_parameters, counter=resolved_counter
+            ),
+        )
+
+        actions = list(chain(approval_actions, [create_order_action]))
+
+        return CreateOrderUseCase(
+            actions=actions,
+            execute_all_actions=lambda: cast(
+                OrderWithCounter, execute_all_actions(actions, {"from": offerer})
+            ),
+        )
+
+    def create_orders(
+        self,
+        orders: list[CreateOrderInput],
+        *,
+        conduit_key: Optional[str] = None,
+        account_address: Optional[str] = None,
+        counter: Optional[int] = None,
+        bulk: bool = False,
+        snapshot: Optional[ChainSnapshot] = None,
+    ) -> CreateOrdersUseCase:
+        """
+        Returns a use case that will create many orders of the same offerer at once, i.e. to list a whole collection.
+        The counter is fetched once, the balances and approvals of every offered item are read in a single
+        deduplicated batch, and approvals needed by any of the orders are merged into one list of approval actions.
+        The orders are then signed together, in a single batch if the signer supports it.
+        With bulk enabled, a single BulkOrder signature covers a Merkle tree of every order instead,
+        and the signature of each order carries its index and proof in the tree.
+
+        Args:
+            orders (list[CreateOrderInput]): the offer, consideration, fees and options of every order. See create_order.
+            conduit_key (str, optional): The conduit key to derive where to source your approvals from. Defaults to address(0) which refers to the Seaport contract.
+            account_address (Optional[str], optional): Optional address for which to create the orders with.
+                                                       The account will be the first account from the provider if not specified.
+            counter (Optional[int], optional): The counter from which to create the orders with. Automatically fetched from the contract if not provided.
+            bulk (bool, optional): Whether to sign every order with a single bulk order signature. Requires Seaport 1.2 or later
+                                   and a signer implementing BulkOrderSigner. Defaults to False.
+            snapshot (Optional[ChainSnapshot], optional): a snapshot from at_block to make every read at.
+                                                          Defaults to a snapshot of the latest block.
+
+        Returns:
+            CreateOrdersUseCase: a use case containing the list of actions needed to be performed in order to create the orders
+        """
+        if bulk:
+            self._validate_bulk_order_signing()
+
+        conduit_key = conduit_key or self.default_conduit_key
+        offerer = account_address or self.web3.eth.accounts[0]
+        orders_items = [
+            self._map_create_order_items(
+                offerer=offerer, offer=order.offer, consideration=order.consideration
+            )
+            for order in orders
+        ]
+
+        operator = self.config.conduit_key_to_conduit[conduit_key]
+
+        resolved_counter = (
+            counter
+            if counter is not None
+            else self._get_counter_for_order(offerer, snapshot)
+        )
+
+        balances_and_approvals = get_balances_and_approvals(
+            owner=offerer,
+            items=[
+                offer_item
+                for offer_items, _ in orders_items
+                for offer_item in offer_items
+            ],
+            criterias=[],
+            operator=operator,
+            web3=self.web3,
+            snapshot=self._get_snapshot(snapshot),
+        )
+
+        (
+            orders_parameters,
+            approval_actions,
+        ) = self._build_orders_parameters_and_approval_actions(
+            offerer=offerer,
+            conduit_key=conduit_key,
+            operator=operator,
+            orders=orders,
+            orders_items=orders_items,
+            counter=resolved_counter,
+            balances_and_approvals=balances_and_approvals,
+        )
+
+        def create_orders_fn():
+            sign_orders = self.sign_bulk_order if bulk else self.sign_orders
+            signatures = sign_orders(
+                orders_parameters=orders_parameters,
+                counter=resolved_counter,
+                account_address=offerer,
+            )
+
+            return [
+                OrderWithCounter(
+                    parameters=OrderComponents(
+                        **order_parameters.dict(), counter=resolved_counter
+                    ),
+                    signature=signature,
+                )
+                for order_parameters, signature in zip(orders_parameters, signatures)
+            ]
+
+        create_orders_action = CreateOrdersAction(
+            create_orders=create_orders_fn,
+            get_messages_to_sign=lambda: self._get_messages_to_sign(
+                orders_parameters=orders_parameters,
+                counter=resolved_counter,
+                bulk=bulk,
+            ),
+        )
+
+        actions = list(chain(approval_actions, [create_orders_action]))
+
+        return CreateOrdersUseCase(
+            actions=actions,
+            execute_all_actions=lambda: cast(
+                list[OrderWithCounter],
+                execute_all_actions(actions, {"from": offerer}),
+            ),
+        )
+
+    def _get_chain_id(self) -> int:
+        return self.web3.eth.chain_id
+
+    def at_block(self, block_identifier: BlockIdentifier = "latest") -> ChainSnapshot:
+        """
+        Returns a snapshot pinning reads to a single block. Passing it to create_order, fulfill_order, fulfill_orders,
+        get_counter or the order status getters makes all of their reads at that block. Reads are memoized for
+        the lifetime of the snapshot, so use cases built for many candidate orders within the same block share
+        their balance, approval and order status reads. Use cases are built from state as of the snapshot block,
+        so the snapshot should not outlive it.
+
+        Args:
+            block_identifier (BlockIdentifier, optional): the block to pin reads to. Defaults to "latest".
+
+        Returns:
+            ChainSnapshot: the snapshot to make reads against
+        """
+        return ChainSnapshot(
+            self.web3,
+            block_identifier,
+            multicall_address=self.config.multicall_address,
+            json_rpc_batch_size=self.config.json_rpc_batch_size,
+        )
+
+    def _get_snapshot(self, snapshot: Optional[ChainSnapshot]) -> ChainSnapshot:
+        # Reads made while building a single use case always share a block, even without a snapshot
+        return snapshot or self.at_block()
+
+    def _call(
+        self, contract_fn: ContractFunction, snapshot: Optional[ChainSnapshot] = None
+    ) -> Any:
+        if not snapshot:
+            return contract_fn.call()
+
+        result = snapshot.call(contract_fn)
+
+        if result is None:
+            raise ValueError(
+                f"Failed to call {contract_fn.fn_name} at block {snapshot.block_number}"
+            )
+
+        return result
+
+    def sign_order(
+        self,
+        *,
+        order_parameters: OrderParameters,
+        counter: int,
+        account_address: str,
+    ) -> str:
+        """
+        Signs the order through the configured signer. Defaults to signing through the provider.
+
+        Args:
+            order_parameters (OrderParameters): the parameters of the order to sign
+            counter (int): the counter of the offerer
+            account_address (str): the account to sign with. Defaults to the first account from the provider.
+
+        Returns:
+            str: the signature of the order
+        """
+        return self.signer.sign_order(
+            order_components=OrderComponents(
+                **order_parameters.dict(), counter=counter
+            ),
+            account_address=account_address or self.web3.eth.accounts[0],
+            get_domain_separator=self._get_domain_separator,
+            get_message_to_sign=lambda: self._get_message_to_sign(
+                order_parameters=order_parameters, counter=counter
+            ),
+        )
+
+    def sign_orders(
+        self,
+        *,
+        orders_parameters: list[OrderParameters],
+        counter: int,
+        account_address: str,
+    ) -> list[str]:
+        """
+        Signs many orders of the same account. Signers implementing BatchOrderSigner sign them in a single call,
+        otherwise every order is signed through sign_order.
+
+        Args:
+            orders_parameters (list[OrderParameters]): the parameters of the orders to sign
+            counter (int): the counter of the offerer
+            account_address (str): the account to sign with
+
+        Returns:
+            list[str]: the signature of every order, in the same order as the parameters
+        """
+        if not isinstance(self.signer, BatchOrderSigner):
+            return [
+                self.sign_order(
+                    order_parameters=order_parameters,
+                    counter=counter,
+                    account_address=account_address,
+                )
+                for order_parameters in orders_parameters
+            ]
+
+        return cast(
+            list[str],
+            self.signer.sign_orders(
+                orders_components=[
+                    OrderComponents(**order_parameters.dict(), counter=counter)
+                    for order_parameters in orders_parameters
+                ],
+                account_address=account_address,
+                get_domain_separator=self._get_domain_separator,
+                get_messages_to_sign=lambda: [
+                    self._get_message_to_sign(
+                        order_parameters=order_parameters, counter=counter
+                    )
+                    for order_parameters in orders_parameters
+                ],
+            ),
+        )
+
+    def sign_bulk_order(
+        self,
+        *,
+        orders_parameters: list[OrderParameters],
+        counter: int,
+        account_address: str,
+    ) -> list[str]:
+        """
+        Signs many orders of the same account with a single bulk order signature. Requires Seaport 1.2 or later
+        and a signer implementing BulkOrderSigner.
+
+        Args:
+            orders_parameters (list[OrderParameters]): the parameters of the orders to sign
+            counter (int): the counter of the offerer
+            account_address (str): the account to sign with
+
+        Returns:
+            list[str]: the signature of every order, carrying its index and proof in the bulk order tree
+        """
+        bulk_order_tree = self._get_bulk_order_tree(
+            orders_parameters=orders_parameters, counter=counter
+        )
+
+        signature = cast(BulkOrderSigner, self.signer).sign_bulk_order(
+            bulk_order_tree=bulk_order_tree,
+            account_address=account_address,
+            get_domain_separator=self._get_domain_separator,
+            get_message_to_sign=lambda: self._get_bulk_order_message_to_sign(
+                bulk_order_tree
+            ),
+        )
+
+        return bulk_order_tree.get_signatures(cast(str, signature))
+
+    def verify_order_signatures(
+        self,
+        orders: list[OrderWithCounter],
+        *,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> list[bool]:
+        """
+        Checks locally that every order was signed by its offerer for this Seaport deployment,
+        so that orders received from third parties can be rejected before any RPC work.
+        Bulk order signatures are only accepted if the configured contract version supports them.
+
+        Args:
+            orders (list[OrderWithCounter]): the signed orders
+            max_workers (Optional[int], optional): number of worker processes to verify with. Defaults to verifying serially.
+            executor (Optional[Executor], optional): an existing executor to reuse instead of spawning a process pool.
+
+        Returns:
+            list[bool]: whether the signature of every order recovers to its offerer, in the same order as the input
+        """
+        return verify_order_signatures(
+            orders,
+            self._get_domain_separator(),
+            bulk_signatures=self._supports_bulk_orders(),
+            max_workers=max_workers,
+            executor=executor,
+        )
+
+    def get_order_status(
+        self, order_hash: str, snapshot: Optional[ChainSnapshot] = None
+    ) -> OrderStatus:
+        """
+        Returns the order status given an order hash
+
+        Args:
+            order_hash (str): the hash of the order
+            snapshot (Optional[ChainSnapshot], optional): a snapshot from at_block to read at. Defaults to the latest block.
+
+        Returns:
+            OrderStatus: order status model
+        """
+        return self._to_order_status(
+            self._call(self.contract.functions.getOrderStatus(order_hash), snapshot)
+        )
+
+    def get_order_statuses(
+        self, order_hashes: list[str], snapshot: Optional[ChainSnapshot] = None
+    ) -> list[OrderStatus]:
+        """
+        Returns the order statuses of many order hashes, batching the reads through multicall if configured
+        or a JSON-RPC batch request otherwise. Large inputs are split into chunks that respect provider batch limits.
+
+        Args:
+            order_hashes (list[str]): the hashes of the orders
+            snapshot (Optional[ChainSnapshot], optional): a snapshot from at_block to read at. Defaults to the latest block.
+
+        Returns:
+            list[OrderStatus]: order status models in the same order as the hashes
+        """
+        contract_fns = [
+            self.contract.functions.getOrderStatus(order_hash)
+            for order_hash in order_hashes
+        ]
+
+        results = (
+            snapshot.call_many(contract_fns)
+            if snapshot
+            else batch_call(
+                self.web3,
+                contract_fns,
+                multicall_address=self.config.multicall_address,
+                json_rpc_batch_size=self.config.json_rpc_batch_size,
+            )
+        )
+
+        order_statuses: list[OrderStatus] = []
+
+        for order_hash, result in zip(order_hashes, results):
+            if result is None:
+                raise ValueError(f"Failed to get the status of order {order_hash}")
+
+            order_statuses.append(self._to_order_status(result))
+
+        return order_statuses
+
+    def get_counter(
+        self, offerer: str, snapshot: Optional[ChainSnapshot] = None
+    ) -> int:
+        """
+        Gets the counter of a given offerer from the contract and refreshes its cached counter
+
+        Args:
+            offerer (str): the offerer to get the counter of
+            snapshot (Optional[ChainSnapshot], optional): a snapshot from at_block to read at. Defaults to the latest block.
+
+        Returns:
+            int: counter
+        """
+        counter = self._call(self.contract.functions.getCounter(offerer), snapshot)
+
+        # Counters read at a pinned block may already be outdated
+        if not snapshot:
+            self._cache_counter(offerer, counter)
+
+        return counter
+
+    def _get_counter_for_order(
+        self, offerer: str, snapshot: Optional[ChainSnapshot] = None
+    ) -> int:
+        cached_counter = self._get_cached_counter(offerer)
+
+        return (
+            cached_counter
+            if cached_counter is not None
+            else self.get_counter(offerer, snapshot)
+        )
+
+    def fulfill_order(
+        self,
+        *,
+        conduit_key: Optional[str] = None,
+        order: OrderWithCounter,
+        units_to_fill=0,
+        offer_criteria: list[InputCriteria] = [],
+        consideration_criteria: list[InputCriteria] = [],
+        tips: list[ConsiderationInputItem] = [],
+        extra_data="0x",
+        account_address: Optional[str] = None,
+        recipient_address=ADDRESS_ZERO,
+        snapshot: Optional[ChainSnapshot] = None,
+    ) -> FulfillOrderUseCase:
+        """
+        Fulfills an order through either the basic method or the standard method
+        Units to fill are denominated by the max possible size of the order, which is the greatest common denominator (GCD).
+        We expose a helper to get this: getMaximumSizeForOrder
+        i.e. If the maximum size of an order is 4, supplying 2 as the units to fulfill will fill half of the order
+
+        Args:
+            conduit (str, optional): the conduitKey to source approvals from
+            order (Order): standard order struct
+            units_to_fill (Optional[int], optional): the number of units to fill for the given order. Only used if you wish to partially fill an order
+            offer_criteria (list[InputCriteria], optional): an array of criteria with length equal to the number of offer criteria items. Defaults to [].
+                                                            Criteria without a proof are resolved from the criteria registry.
+            consideration_criteria (list[InputCriteria], optional): an array of criteria with length equal to the number of consideration criteria items. Defaults to [].
+                                                                    Criteria without a proof are resolved from the criteria registry.
+            tips (list[ConsiderationInputItem], optional): an array of optional condensed consideration items to be added onto a fulfillment. Defaults to [].
+            extra_data (Optional[str], optional): extra data supplied to the order. Defaults to None.
+            recipient_address (Optional[str], optional): optional recipient to forward the offer to as opposed to the fulfiller.
+                                                         Defaults to the zero address which means the offer goes to the fulfiller
+            snapshot (Optional[ChainSnapshot], optional): a snapshot from at_block to make every read at.
+                                                          Defaults to a snapshot of the latest block.
+        """
+        offer_criteria, consideration_criteria = self._resolve_fulfill_order_criterias(
+            order=order,
+            offer_criteria=offer_criteria,
+            consideration_criteria=consideration_criteria,
+        )
+        conduit_key = conduit_key or self.default_conduit_key
+        fulfiller = account_address or self.web3.eth.accounts[0]
+        offerer = order.parameters.offerer
+        offerer_operator = self.config.conduit_key_to_conduit[
+            order.parameters.conduitKey
+        ]
+        fulfiller_operator = self.config.conduit_key_to_conduit[conduit_key]
+
+        snapshot = self._get_snapshot(snapshot)
+        read_plan = BalancesAndApprovalsReadPlan(snapshot)
+        read_plan.add(
+            owner=offerer,
+            items=order.parameters.offer,
+            criterias=offer_criteria,
+            operator=offerer_operator,
+        )
+
+        # Get fulfiller balances and approvals of all items in the set, as offer items
+        # may be received by the fulfiller for standard fulfills
+        read_plan.add(
+            owner=fulfiller,
+            items=list(chain(order.parameters.offer, order.parameters.consideration)),
+            criterias=list(chain(offer_criteria, consideration_criteria)),
+            operator=fulfiller_operator,
+        )
+
+        (
+            offerer_balances_and_approvals,
+            fulfiller_balances_and_approvals,
+        ) = read_plan.execute()
+
+        order_status = self.get_order_status(
+            self.get_order_hash(order.parameters), snapshot
+        )
+
+        return self._build_fulfill_order_use_case(
+            conduit_key=conduit_key,
+            order=order,
+            units_to_fill=units_to_fill,
+            offer_criteria=offer_criteria,
+            consideration_criteria=consideration_criteria,
+            tips=tips,
+            extra_data=extra_data,
+            fulfiller=fulfiller,
+            recipient_address=recipient_address,
+            offerer_operator=offerer_operator,
+            fulfiller_operator=fulfiller_operator,
+            offerer_balances_and_approvals=offerer_balances_and_approvals,
+            fulfiller_balances_and_approvals=fulfiller_balances_and_approvals,
+            order_status=order_status,
+            current_block_timestamp=snapshot.timestamp,
+        )
+
+    def fulfill_orders(
+        self,
+        fulfill_order_details: list[FulfillOrderDetails],
+        account_address: Optional[str] = None,
+        conduit_key: Optional[str] = None,
+        recipient_address=ADDRESS_ZERO,
+        snapshot: Optional[ChainSnapshot] = None,
+    ) -> FulfillOrdersUseCase:
+        fulfill_order_details = self._resolve_fulfill_orders_criterias(
+            fulfill_order_details
+        )
+        conduit_key = conduit_key or self.default_conduit_key
+        fulfiller = account_address or self.web3.eth.accounts[0]
+
+        all_offerer_operators = [
+            self.config.conduit_key_to_conduit[detail.order.parameters.conduitKey]
+            for detail in fulfill_order_details
+        ]
+
+        fulfiller_operator = self.config.conduit_key_to_conduit[conduit_key]
+
+        all_items, all_criterias = self._get_fulfill_orders_items_and_criterias(
+            fulfill_order_details
+        )
+
+        snapshot = self._get_snapshot(snapshot)
+
+        # Offerers and the fulfiller share many reads, i.e. the same collection approvals
+        # or currency allowances, so they're planned together and each unique read is made once
+        read_plan = BalancesAndApprovalsReadPlan(snapshot)
+
+        for index, detail in enumerate(fulfill_order_details):
+            read_plan.add(
+                owner=detail.order.parameters.offerer,
+                items=detail.order.parameters.offer,
+                criterias=detail.offer_criteria,
+                operator=all_offerer_operators[index],
+            )
+
+        read_plan.add(
+            owner=fulfiller,
+            items=all_items,
+            criterias=all_criterias,
+            operator=fulfiller_operator,
+        )
+
+        (
+            *all_offerer_balances_and_approvals,
+            fulfiller_balances_and_approvals,
+        ) = read_plan.execute()
+
+        order_statuses = self.get_order_statuses(
+            [
+                self.get_order_hash(detail.order.parameters)
+                for detail in fulfill_order_details
+            ],
+            snapshot,
+        )
+
+        return self._build_fulfill_orders_use_case(
+            fulfill_order_details=fulfill_order_details,
+            conduit_key=conduit_key,
+            fulfiller=fulfiller,
+            recipient_address=recipient_address,
+            all_offerer_operators=all_offerer_operators,
+            fulfiller_operator=fulfiller_operator,
+            all_offerer_balances_and_approvals=all_offerer_balances_and_approvals,
+            fulfiller_balances_and_approvals=fulfiller_balances_and_approvals,
+            order_statuses=order_statuses,
+            current_block_timestamp=snapshot.timestamp,
+        )
+
+    def match_orders(
+        self,
+        orders_details: list[MatchOrderDetails],
+        account_address: Optional[str] = None,
+        snapshot: Optional[ChainSnapshot] = None,
+    ) -> FulfillOrderUseCase:
+        """
+        Matches orders against each other in a single matchAdvancedOrders transaction, i.e. an order against a counter order
+        of the fulfiller. Offer items are paired with the consideration items they pay for, and any offer item left over goes to the fulfiller.
+        Orders offered by the fulfiller don't need to be signed. Orders are matched in full.
+
+        Args:
+            orders_details (list[MatchOrderDetails]): the orders to match along with their criterias.
+                                                      Criteria without a proof are resolved from the criteria registry.
+            account_address (Optional[str], optional): the account sending the transaction. Defaults to the first account of the provider
+            snapshot (Optional[ChainSnapshot], optional): a snapshot from at_block to make every read at.
+                                                          Defaults to a snapshot of the latest block.
+
+        Returns:
+            FulfillOrderUseCase: approvals needed by the orders of the fulfiller, followed by the matchAdvancedOrders transaction
+        """
+        orders_details = self._resolve_fulfill_orders_criterias(orders_details)
+        fulfiller = account_address or self.web3.eth.accounts[0]
+        fulfiller_orders_details = self._get_fulfiller_orders_details(
+            orders_details, fulfiller
+        )
+
+        snapshot = self._get_snapshot(snapshot)
+        read_plan = BalancesAndApprovalsReadPlan(snapshot)
+
+        for detail in fulfiller_orders_details:
+            read_plan.add(
+                owner=fulfiller,
+                items=detail.order.parameters.offer,
+                criterias=detail.offer_criteria,
+                operator=self.config.conduit_key_to_conduit[
+                    detail.order.parameters.conduitKey
+                ],
+            )
+
+        fulfiller_balances_and_approvals = read_plan.execute()
+
+        return self._build_match_orders_use_case(
+            orders_details=orders_details,
+            fulfiller=fulfiller,
+            fulfiller_orders_details=fulfiller_orders_details,
+            fulfiller_balances_and_approvals=fulfiller_balances_and_approvals,
         )
@@ -7,7 +7,16 @@ from web3 import Web3
 from web3.constants import ADDRESS_ZERO
 from web3.types import TxParams
 
-from seaport.constants import NO_CONDUIT_KEY, ItemType, OrderType, Side
+from seaport.constants import (
+    CONSIDERATION_CONTRACT_VERSION,
+    MAX_INT,
+    NO_CONDUIT_KEY,
+    FulfillRoute,
+    ItemType,
+    OrderType,
+    Side,
+)
+from seaport.utils.json_rpc_batch import DEFAULT_JSON_RPC_BATCH_SIZE
 from seaport.utils.pydantic import BaseModelWithEnumValues
 
 
@@ -16,6 +25,65 @@ class ContractOverrides(BaseModel):
     default_conduit_key: Optional[str] = NO_CONDUIT_KEY
 
 
+class FulfillOrdersCostModel(BaseModel):
+    """
+    Static gas costs of transfers, criteria proofs and calldata, used along with FulfillRouteCostModel
+    to pick the route of a fulfillment and to split it into chunks.
+    Transfers are counted per item, ignoring aggregation, so estimates err on the expensive side
+    """
+
+    transaction_gas: int = 21_000
+    native_transfer_gas: int = 10_000
+    erc20_transfer_gas: int = 35_000
+    erc721_transfer_gas: int = 55_000
+    erc1155_transfer_gas: int = 60_000
+    criteria_proof_element_gas: int = 1_000
+    # Cost of a non zero calldata byte, assumed for every byte
+    calldata_byte_gas: int = 16
+
+
+class FulfillRouteCostModel(BaseModel):
+    """
+    Static gas costs of each Seaport entry point, used to pick the cheapest route for a fulfillment.
+    Transfer, proof and calldata costs come from FulfillOrdersCostModel. FulfillRouteCalibration
+    fits the fixed costs to gas estimates recorded on a local chain
+    """
+
+    # Fixed execution cost of each entry point
+    fixed_gas: dict[FulfillRoute, int] = {
+        FulfillRoute.BASIC: 5_000,
+        FulfillRoute.STANDARD: 10_000,
+        FulfillRoute.ADVANCED: 12_000,
+        FulfillRoute.AVAILABLE: 35_000,
+        FulfillRoute.AVAILABLE_ADVANCED: 40_000,
+    }
+    # Signature verification and order status update of each order
+    order_gas: dict[FulfillRoute, int] = {
+        FulfillRoute.BASIC: 5_000,
+        FulfillRoute.STANDARD: 20_000,
+        FulfillRoute.ADVANCED: 20_000,
+        FulfillRoute.AVAILABLE: 25_000,
+        FulfillRoute.AVAILABLE_ADVANCED: 30_000,
+    }
+
+
+class FulfillRouteEstimate(BaseModel):
+    route: FulfillRoute
+    # Includes the transaction and calldata gas
+    gas: int
+    calldata_bytes: int
+
+
+class FulfillOrdersBudget(BaseModel):
+    """
+    Limits of a single transaction fulfilling many orders. Limits left out aren't enforced
+    """
+
+    gas: Optional[int] = None
+    calldata_bytes: Optional[int] = None
+    max_orders: Optional[int] = None
+
+
 class SeaportConfig(BaseModel):
     # Used because fulfillments may be invalid if confirmations take too long. Default buffer is 30 minutes
     ascending_amount_fulfillment_buffer: int = 1800
@@ -26,6 +94,24 @@ class SeaportConfig(BaseModel):
     # A mapping of conduit key to conduit
     conduit_key_to_conduit: dict[str, str] = {}
 
+    # When set, balance and approval reads are aggregated into a single call through this Multicall3 deployment.
+    # Multicall3 is deployed at MULTICALL3_ADDRESS on most chains
+    multicall_address: Optional[str] = None
+
+    # Max number of reads sent in a single JSON-RPC batch request when multicall isn't configured
+    json_rpc_batch_size: int = DEFAULT_JSON_RPC_BATCH_SIZE
+
+    # Version of the Seaport deployment. Used in the EIP-712 domain and to gate features such as bulk order signatures
+    contract_version: str = CONSIDERATION_CONTRACT_VERSION
+
+    # When set, fulfill_orders splits the orders into as many fulfillAvailableAdvancedOrders transactions as needed
+    # for each of them to stay within the budget, as estimated by the cost model
+    fulfill_orders_budget: Optional[FulfillOrdersBudget] = None
+    fulfill_orders_cost_model: FulfillOrdersCostModel = FulfillOrdersCostModel()
+
+    # Used to pick the cheapest entry point among those able to fulfill the orders
+    fulfill_route_cost_model: FulfillRouteCostModel = FulfillRouteCostModel()
+
     overrides: ContractOverrides = ContractOverrides(
         contract_address=Web3.toChecksumAddress(ADDRESS_ZERO),
         default_conduit_key=NO_CONDUIT_KEY,
@@ -86,6 +172,7 @@ FulfillableOrder = Union[Order, OrderWithCounter]
 class AdvancedOrder(Order):
     numerator: int
     denominator: int
+    extraData: str
 
 
 class OfferCurrencyItem(BaseModel):
@@ -177,7 +264,8 @@ class Fee(BaseModel):
 
 class InputCriteria(BaseModel):
     identifier: int
-    proof: list[str]
+    # Left out to have the proof resolved from the criteria registry of the client
+    proof: Optional[list[str]] = None
 
 
 class OrderStatus(BaseModel):
@@ -284,9 +372,47 @@ class CreateOrderUseCase(BaseModel):
     execute_all_actions: Callable[[], OrderWithCounter]
 
 
+class CreateOrderInput(BaseModel):
+    offer: list[CreateInputItem]
+    consideration: list[ConsiderationInputItem]
+    fees: list[Fee] = []
+    allow_partial_fills: bool = False
+    restricted_by_zone: bool = False
+    # Random salt and the current time when not set
+    salt: Optional[int] = None
+    start_time: Optional[int] = None
+    zone: str = ADDRESS_ZERO
+    end_time: int = MAX_INT
+
+
+class CreateOrdersAction(BaseModel):
+    type = "create"
+    get_messages_to_sign: Callable[[], list[str]]
+    create_orders: Callable[[], list[OrderWithCounter]]
+
+
+CreateOrdersActions = list[Union[ApprovalAction, CreateOrdersAction]]
+
+
+class CreateOrdersUseCase(BaseModel):
+    actions: CreateOrdersActions
+    execute_all_actions: Callable[[], list[OrderWithCounter]]
+
+
 class FulfillOrderUseCase(BaseModel):
     actions: OrderExchangeActions
     execute_all_actions: Callable[[], HexBytes]
+    # Every route able to fulfill the orders, cheapest first. The first one is used
+    route_estimates: list[FulfillRouteEstimate] = []
+
+
+class FulfillOrdersUseCase(BaseModel):
+    # Orders fulfilled in chunks have an exchange action per transaction
+    actions: OrderExchangeActions
+    # Returns the hash of every exchange transaction, in the order they were sent
+    execute_all_actions: Callable[[], list[HexBytes]]
+    # Every route able to fulfill the orders, cheapest first. The first one is used
+    route_estimates: list[FulfillRouteEstimate] = []
 
 
 class CriteriaResolver(BaseModelWithEnumValues):
@@ -297,6 +423,32 @@ class CriteriaResolver(BaseModelWithEnumValues):
     criteriaProof: list[str]
 
 
+class AdditionalRecipient(BaseModel):
+    amount: int
+    recipient: str
+
+
+class BasicOrderParameters(BaseModel):
+    considerationToken: str
+    considerationIdentifier: int
+    considerationAmount: int
+    offerer: str
+    zone: str
+    offerToken: str
+    offerIdentifier: int
+    offerAmount: int
+    basicOrderType: int
+    startTime: int
+    endTime: int
+    zoneHash: str
+    salt: int
+    offererConduitKey: str
+    fulfillerConduitKey: str
+    totalOriginalAdditionalRecipients: int
+    additionalRecipients: list[AdditionalRecipient]
+    signature: str
+
+
 class FulfillOrderDetails(BaseModel):
     order: OrderWithCounter
     units_to_fill: int = 0
@@ -309,3 +461,15 @@ class FulfillOrderDetails(BaseModel):
 class FulfillmentComponent(BaseModel):
     orderIndex: int
     itemIndex: int
+
+
+class Fulfillment(BaseModel):
+    offerComponents: list[FulfillmentComponent]
+    considerationComponents: list[FulfillmentComponent]
+
+
+class MatchOrderDetails(BaseModel):
+    order: OrderWithCounter
+    offer_criteria: list[InputCriteria] = []
+    consideration_criteria: list[InputCriteria] = []
+    extra_data: str = "0x"
@@ -0,0 +1,117 @@
+from typing import Any, Optional, Union
+
+from web3 import Web3
+from web3._utils.utility_methods import any_in_dict
+from web3.constants import DYNAMIC_FEE_TXN_PARAMS
+from web3.contract import Contract, ContractFunction
+from web3.eth import AsyncEth
+from web3.exceptions import BadFunctionCallOutput
+from web3.providers.async_base import AsyncBaseProvider
+from web3.types import BlockIdentifier, TxParams
+
+from seaport.utils.multicall import (
+    decode_contract_function_result,
+    encode_contract_function_data,
+)
+
+
+class AsyncContractEth(AsyncEth):
+    """
+    AsyncEth with a contract factory, so contract functions can be built against an async provider.
+    web3 doesn't ship async contracts, so reads and transactions on these contract functions
+    must go through async_call and the async transaction methods instead of call and transact.
+    """
+
+    defaultContractFactory = Contract
+
+    def contract(
+        self, address: Optional[str] = None, **kwargs: Any
+    ) -> Union[type[Contract], Contract]:
+        ContractFactoryClass = kwargs.pop(
+            "ContractFactoryClass", self.defaultContractFactory
+        )
+        ContractFactory = ContractFactoryClass.factory(self.web3, **kwargs)
+
+        return ContractFactory(address) if address else ContractFactory
+
+
+def get_async_web3(provider: AsyncBaseProvider) -> Web3:
+    # The default middlewares are synchronous, so async providers have to run without them
+    return Web3(provider, middlewares=[], modules={"eth": (AsyncContractEth,)})
+
+
+def is_async_web3(web3: Web3) -> bool:
+    return isinstance(web3.eth, AsyncEth)
+
+
+async def async_call(
+    contract_fn: ContractFunction, block_identifier: BlockIdentifier = "latest"
+) -> Any:
+    """
+    Calls a contract function built on an async web3 instance
+
+    Args:
+        contract_fn (ContractFunction): the bound contract function to call
+        block_identifier (BlockIdentifier, optional): the block to read at. Defaults to "latest".
+
+    Returns:
+        Any: the decoded result
+
+    Raises:
+        BadFunctionCallOutput: if the return data can't be decoded, i.e. the contract isn't deployed,
+            the same as ContractFunction.call
+    """
+    web3 = contract_fn.web3
+    return_data = await web3.eth.call(  # type: ignore
+        {"to": contract_fn.address, "data": encode_contract_function_data(contract_fn)},
+        block_identifier,
+    )
+    result = decode_contract_function_result(web3, contract_fn, bytes(return_data))
+
+    if result is None:
+        raise BadFunctionCallOutput(
+            f"Could not decode contract function call to {contract_fn.fn_name} "
+            f"with return data: {bytes(return_data)!r}"
+        )
+
+    return result
+
+
+async def async_fill_transaction_defaults(
+    web3: Web3, transaction: TxParams
+) -> TxParams:
+    """
+    Fills the fields of a transaction it doesn't set the way buildTransaction does on a sync web3 instance:
+    the value, a gas estimate, the fees and the chain id. Fees are dynamic unless a gas price is given
+    or generated by the gas price strategy of web3
+
+    Args:
+        web3 (Web3): the async web3 instance
+        transaction (TxParams): the transaction to fill
+
+    Returns:
+        TxParams: the transaction along with its defaults
+    """
+    eth = web3.eth
+    gas_price = await eth.generate_gas_price(transaction)  # type: ignore
+    is_dynamic_fee_transaction = gas_price is None and (
+        "gasPrice" not in transaction
+        or any_in_dict(DYNAMIC_FEE_TXN_PARAMS, transaction)
+    )
+    defaults: TxParams = {"value": 0}  # type: ignore
+
+    if "gas" not in transaction:
+        defaults["gas"] = await eth.estimate_gas(transaction)  # type: ignore
+
+    if not is_dynamic_fee_transaction:
+        defaults["gasPrice"] = gas_price  # type: ignore
+    elif any(key not in transaction for key in DYNAMIC_FEE_TXN_PARAMS):
+        max_priority_fee = await eth.max_priority_fee  # type: ignore
+        latest_block = await eth.get_block("latest")  # type: ignore
+        defaults["maxPriorityFeePerGas"] = max_priority_fee
+        defaults["maxFeePerGas"] = max_priority_fee + 2 * latest_block["baseFeePerGas"]
+
+    if "chainId" not in transaction:
+        defaults["chainId"] = await eth.chain_id  # type: ignore
+
+    return defaults | transaction  # type: ignore
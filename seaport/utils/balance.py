@@ -1,51 +1,79 @@
-from typing import Optional
+from typing import Any, Optional
 
 from web3 import Web3
+from web3.contract import ContractFunction
 
-from seaport.abi.ERC20 import ERC20_ABI
-from seaport.abi.ERC721 import ERC721_ABI
-from seaport.abi.ERC1155 import ERC1155_ABI
 from seaport.constants import ItemType
 from seaport.types import InputCriteria, Item
-from seaport.utils.item import is_erc20_item, is_erc721_item, is_erc1155_item
+from seaport.utils.contract_cache import AbiKind, get_contract
+from seaport.utils.item import (
+    is_erc20_item,
+    is_erc721_item,
+    is_erc1155_item,
+    is_native_currency_item,
+)
 
 
-def balance_of(
+def get_balance_of_function(
     owner: str, item: Item, criteria: Optional[InputCriteria], web3: Web3
-) -> int:
+) -> Optional[ContractFunction]:
+    """
+    Returns the token contract read used to determine the balance of an item.
+    Native currency and ERC1155 criteria items without an identifier aren't read from a token contract,
+    in which case None is returned.
+    """
     if is_erc721_item(item.itemType):
-        contract = web3.eth.contract(
-            address=Web3.toChecksumAddress(item.token), abi=ERC721_ABI
-        )
+        contract = get_contract(web3, item.token, AbiKind.ERC721)
 
         if item.itemType == ItemType.ERC721_WITH_CRITERIA:
             if criteria:
-                owner_of: str = contract.functions.ownerOf(criteria.identifier).call()
-                return 1 if owner_of.lower() == owner.lower() else 0
+                return contract.functions.ownerOf(criteria.identifier)
 
-            return contract.functions.balanceOf(owner).call()
+            return contract.functions.balanceOf(owner)
 
-        owner_of: str = contract.functions.ownerOf(item.identifierOrCriteria).call()
-        return 1 if owner_of.lower() == owner.lower() else 0
+        return contract.functions.ownerOf(item.identifierOrCriteria)
     elif is_erc1155_item(item.itemType):
-        contract = web3.eth.contract(
-            address=Web3.toChecksumAddress(item.token), abi=ERC1155_ABI
-        )
+        contract = get_contract(web3, item.token, AbiKind.ERC1155)
 
         if item.itemType == ItemType.ERC1155_WITH_CRITERIA:
             if not criteria:
-                # We don't have a good way to determine the balance of an erc1155 criteria item unless explicit
-                # identifiers are provided, so just assume the offerer has sufficient balance
-                return max(item.startAmount, item.endAmount)
+                return None
 
-            return contract.functions.balanceOf(owner, criteria.identifier).call()
+            return contract.functions.balanceOf(owner, criteria.identifier)
 
-        return contract.functions.balanceOf(owner, item.identifierOrCriteria).call()
+        return contract.functions.balanceOf(owner, item.identifierOrCriteria)
 
     if is_erc20_item(item.itemType):
-        contract = web3.eth.contract(
-            address=Web3.toChecksumAddress(item.token), abi=ERC20_ABI
-        )
-        return contract.functions.balanceOf(owner).call()
+        contract = get_contract(web3, item.token, AbiKind.ERC20)
+        return contract.functions.balanceOf(owner)
+
+    return None
+
+
+def parse_balance_of_result(
+    owner: str, contract_fn: ContractFunction, result: Any
+) -> int:
+    if contract_fn.fn_name == "ownerOf":
+        return 1 if result.lower() == owner.lower() else 0
+
+    return result
+
+
+def get_assumed_balance(item: Item) -> int:
+    # We don't have a good way to determine the balance of an erc1155 criteria item unless explicit
+    # identifiers are provided, so just assume the offerer has sufficient balance
+    return max(item.startAmount, item.endAmount)
+
+
+def balance_of(
+    owner: str, item: Item, criteria: Optional[InputCriteria], web3: Web3
+) -> int:
+    if is_native_currency_item(item.itemType):
+        return web3.eth.get_balance(owner)
+
+    contract_fn = get_balance_of_function(owner, item, criteria, web3)
+
+    if contract_fn is None:
+        return get_assumed_balance(item)
 
-    return web3.eth.get_balance(owner)
+    return parse_balance_of_result(owner, contract_fn, contract_fn.call())
@@ -1,10 +1,10 @@
-from typing import Literal, Optional, Sequence, Union
+import asyncio
+from typing import Any, Optional, Sequence, Union
 
 from pydantic import BaseModel
 from web3 import Web3
+from web3.contract import ContractFunction
 
-from seaport.abi.ERC20 import ERC20_ABI
-from seaport.abi.ERC721 import ERC721_ABI
 from seaport.constants import MAX_INT
 from seaport.types import (
     ApprovalAction,
@@ -19,7 +19,14 @@ from seaport.types import (
     Item,
     OfferItem,
 )
-from seaport.utils.balance import balance_of
+from seaport.utils.async_web3 import async_call
+from seaport.utils.balance import (
+    balance_of,
+    get_assumed_balance,
+    get_balance_of_function,
+    parse_balance_of_result,
+)
+from seaport.utils.contract_cache import AbiKind, get_contract
 from seaport.utils.item import (
     TimeBasedItemParams,
     TokenAndIdentifierAmounts,
@@ -30,29 +37,45 @@ from seaport.utils.item import (
     is_erc1155_item,
     is_native_currency_item,
 )
+from seaport.utils.multicall import Multicall
+from seaport.utils.snapshot import ChainSnapshot
 from seaport.utils.usecase import get_transaction_methods
 
 
-def approved_item_amount(owner: str, item: Item, operator: str, web3: Web3) -> int:
+def get_approved_item_amount_function(
+    owner: str, item: Item, operator: str, web3: Web3
+) -> Optional[ContractFunction]:
+    """
+    Returns the token contract read used to determine the approved amount of an item.
+    Native tokens don't need approvals, in which case None is returned.
+    """
     if is_erc721_item(item.itemType) or is_erc1155_item(item.itemType):
-        contract = web3.eth.contract(
-            address=web3.toChecksumAddress(item.token), abi=ERC721_ABI
-        )
+        contract = get_contract(web3, item.token, AbiKind.ERC721)
 
-        is_approved_for_all = contract.functions.isApprovedForAll(
-            owner, operator
-        ).call()
-
-        return MAX_INT if is_approved_for_all else 0
+        return contract.functions.isApprovedForAll(owner, operator)
     elif is_erc20_item(item.itemType):
-        contract = web3.eth.contract(
-            address=web3.toChecksumAddress(item.token), abi=ERC20_ABI
-        )
+        contract = get_contract(web3, item.token, AbiKind.ERC20)
+
+        return contract.functions.allowance(owner, operator)
 
-        return contract.functions.allowance(owner, operator).call()
+    return None
+
+
+def parse_approved_item_amount_result(contract_fn: ContractFunction, result: Any):
+    if contract_fn.fn_name == "isApprovedForAll":
+        return MAX_INT if result else 0
+
+    return result
+
+
+def approved_item_amount(owner: str, item: Item, operator: str, web3: Web3) -> int:
+    contract_fn = get_approved_item_amount_function(owner, item, operator, web3)
 
     # We don't need to check approvals for native tokens
-    return MAX_INT
+    if contract_fn is None:
+        return MAX_INT
+
+    return parse_approved_item_amount_result(contract_fn, contract_fn.call())
 
 
 def get_approval_actions(
@@ -78,20 +101,14 @@ def get_approval_actions(
             insufficient_approval.item_type
         ):
             # setApprovalForAllCheck is the same for both ERC721 and ERC1155, defaulting to ERC721
-            contract = web3.eth.contract(
-                address=Web3.toChecksumAddress(insufficient_approval.token),
-                abi=ERC721_ABI,
-            )
+            contract = get_contract(web3, insufficient_approval.token, AbiKind.ERC721)
 
             contract_fn = contract.functions.setApprovalForAll(
                 insufficient_approval.operator, True
             )
 
         else:
-            contract = web3.eth.contract(
-                address=Web3.toChecksumAddress(insufficient_approval.token),
-                abi=ERC20_ABI,
-            )
+            contract = get_contract(web3, insufficient_approval.token, AbiKind.ERC20)
 
             contract_fn = contract.functions.approve(
                 insufficient_approval.operator, MAX_INT
@@ -125,6 +142,84 @@ def find_balance_and_approval(
     raise ValueError("Balances and approvals didn't contain all tokens and identifiers")
 
 
+class BalancesAndApprovalsIndex:
+    """
+    Balances and approvals indexed by normalized (token, identifier) for constant time lookups.
+    If the same token and identifier appear more than once, the first entry is used, same as find_balance_and_approval.
+    Overlays created by with_received_amounts only hold the entries they change and fall back to their base,
+    so simulating the fulfiller receiving offered items doesn't copy every entry.
+    """
+
+    def __init__(
+        self,
+        balances_and_approvals: BalancesAndApprovals = [],
+        *,
+        base: Optional["BalancesAndApprovalsIndex"] = None,
+    ):
+        self._base = base
+        self._entries: dict[tuple[str, int], BalanceAndApproval] = {}
+
+        for balance_and_approval in balances_and_approvals:
+            self._entries.setdefault(
+                (
+                    balance_and_approval.token.lower(),
+                    balance_and_approval.identifier_or_criteria,
+                ),
+                balance_and_approval,
+            )
+
+    def get(self, token: str, identifier_or_criteria: int) -> BalanceAndApproval:
+        key = (token.lower(), identifier_or_criteria)
+        index: Optional[BalancesAndApprovalsIndex] = self
+
+        while index is not None:
+            balance_and_approval = index._entries.get(key)
+
+            if balance_and_approval is not None:
+                return balance_and_approval
+
+            index = index._base
+
+        raise ValueError(
+            "Balances and approvals didn't contain all tokens and identifiers"
+        )
+
+    def with_received_amounts(
+        self, token_and_identifier_amounts: TokenAndIdentifierAmounts
+    ) -> "BalancesAndApprovalsIndex":
+        """
+        Returns an overlay with the amounts added to the balances. The index itself isn't modified.
+
+        Args:
+            token_and_identifier_amounts (TokenAndIdentifierAmounts): the amounts received per token and identifier
+
+        Returns:
+            BalancesAndApprovalsIndex: the balances and approvals after receiving the amounts
+        """
+        overlay = BalancesAndApprovalsIndex(base=self)
+
+        for token, identifier_to_amount in token_and_identifier_amounts.items():
+            for identifier_or_criteria, amount in identifier_to_amount.items():
+                balance_and_approval = overlay.get(token, identifier_or_criteria)
+
+                overlay._entries[
+                    (token.lower(), identifier_or_criteria)
+                ] = balance_and_approval.copy(
+                    update={"balance": balance_and_approval.balance + amount}
+                )
+
+        return overlay
+
+
+def to_balances_and_approvals_index(
+    balances_and_approvals: Union[BalancesAndApprovals, BalancesAndApprovalsIndex]
+) -> BalancesAndApprovalsIndex:
+    if isinstance(balances_and_approvals, BalancesAndApprovalsIndex):
+        return balances_and_approvals
+
+    return BalancesAndApprovalsIndex(balances_and_approvals)
+
+
 def get_balances_and_approvals(
     *,
     owner: str,
@@ -132,7 +227,28 @@ def get_balances_and_approvals(
     criterias: list[InputCriteria],
     operator: str,
     web3: Web3,
-):
+    multicall_address: Optional[str] = None,
+    snapshot: Optional[ChainSnapshot] = None,
+) -> BalancesAndApprovals:
+    if snapshot:
+        return get_balances_and_approvals_at_snapshot(
+            owner=owner,
+            items=items,
+            criterias=criterias,
+            operator=operator,
+            snapshot=snapshot,
+        )
+
+    if multicall_address:
+        return get_balances_and_approvals_with_multicall(
+            owner=owner,
+            items=items,
+            criterias=criterias,
+            operator=operator,
+            web3=web3,
+            multicall_address=multicall_address,
+        )
+
     item_index_to_criteria = get_item_index_to_criteria_map(
         items=items, criterias=criterias
     )
@@ -170,96 +286,363 @@ def get_balances_and_approvals(
     return list(map(map_item_to_balances_and_approval, enumerate(items)))
 
 
-class InsufficientBalanceAndApprovalAmounts(BaseModel):
-    insufficient_balances: InsufficientBalances
-    insufficient_approvals: InsufficientApprovals
-
-
-def get_insufficient_balance_and_approval_amounts(
+def get_balances_and_approvals_with_multicall(
     *,
-    balances_and_approvals: BalancesAndApprovals,
-    token_and_identifier_amounts: TokenAndIdentifierAmounts,
+    owner: str,
+    items: Sequence[Item],
+    criterias: list[InputCriteria],
     operator: str,
-):
-    token_and_identifier_and_amount_needed_list: list[tuple[str, int, int]] = []
+    web3: Web3,
+    multicall_address: str,
+) -> BalancesAndApprovals:
+    """
+    Same as get_balances_and_approvals, but every balance and approval read is aggregated into a single
+    Multicall3 call. Reads that fail (i.e. ownerOf on a token that doesn't exist) resolve to a zero balance
+    or approval instead of raising.
+    """
+    item_index_to_criteria = get_item_index_to_criteria_map(
+        items=items, criterias=criterias
+    )
+    multicall = Multicall(web3, multicall_address)
 
-    for token, identifier_to_amount in token_and_identifier_amounts.items():
-        for identifier_or_criteria, amount_needed in identifier_to_amount.items():
-            token_and_identifier_and_amount_needed_list.append(
-                (token, identifier_or_criteria, amount_needed)
+    # Index of the balance and approval read of each item in the multicall, if a read is needed
+    read_indices: list[tuple[Optional[int], Optional[int]]] = []
+
+    for index, item in enumerate(items):
+        balance_fn = (
+            multicall.get_eth_balance_function(owner)
+            if is_native_currency_item(item.itemType)
+            else get_balance_of_function(
+                owner, item, item_index_to_criteria.get(index), web3
             )
+        )
+        approval_fn = get_approved_item_amount_function(owner, item, operator, web3)
 
-    def filter_balances_or_approvals(
-        filter_key: Union[
-            Literal["balance"],
-            Literal["approved_amount"],
-        ]
-    ):
-        def filter_balance_or_approval(
-            token_and_identifier_and_amount_needed: tuple[str, int, int]
-        ):
-            (
-                token,
-                identifier_or_criteria,
-                amount_needed,
-            ) = token_and_identifier_and_amount_needed
-
-            amount: int = find_balance_and_approval(
-                balances_and_approvals=balances_and_approvals,
-                token=token,
-                identifier_or_criteria=identifier_or_criteria,
-            ).dict()[filter_key]
-
-            return amount < amount_needed
-
-        def map_to_balance(
-            token_and_identifier_and_amount_needed: tuple[str, int, int]
-        ) -> InsufficientBalance:
+        read_indices.append(
             (
-                token,
-                identifier_or_criteria,
-                amount_needed,
-            ) = token_and_identifier_and_amount_needed
-
-            balance_and_approval = find_balance_and_approval(
-                balances_and_approvals=balances_and_approvals,
-                token=token,
-                identifier_or_criteria=identifier_or_criteria,
+                multicall.add(balance_fn) if balance_fn is not None else None,
+                multicall.add(approval_fn) if approval_fn is not None else None,
             )
+        )
+
+    results = multicall.execute()
+
+    def map_item_to_balances_and_approval(index_and_item: tuple[int, Item]):
+        index, item = index_and_item
+        balance_index, approval_index = read_indices[index]
 
-            return InsufficientBalance(
-                token=token,
-                identifier_or_criteria=identifier_or_criteria,
-                required_amount=amount_needed,
-                amount_have=balance_and_approval.dict()[filter_key],
-                item_type=balance_and_approval.item_type,
+        if balance_index is None:
+            balance = get_assumed_balance(item)
+        else:
+            result = results[balance_index]
+            balance = (
+                parse_balance_of_result(owner, multicall.calls[balance_index], result)
+                if result is not None
+                else 0
+            )
+
+        if approval_index is None:
+            # We don't need to check approvals for native tokens
+            approved_amount = MAX_INT
+        else:
+            result = results[approval_index]
+            approved_amount = (
+                parse_approved_item_amount_result(
+                    multicall.calls[approval_index], result
+                )
+                if result is not None
+                else 0
             )
 
-        return list(
-            map(
-                map_to_balance,
-                filter(
-                    filter_balance_or_approval,
-                    token_and_identifier_and_amount_needed_list,
+        return BalanceAndApproval(
+            token=item.token,
+            identifier_or_criteria=item_index_to_criteria[index].identifier
+            if index in item_index_to_criteria
+            else item.identifierOrCriteria,
+            balance=balance,
+            approved_amount=approved_amount,
+            item_type=item.itemType,
+        )
+
+    return list(map(map_item_to_balances_and_approval, enumerate(items)))
+
+
+# An item of a planned request: the item, its identifier and the index of its unique balance and approval reads
+# in the plan, if a read is needed
+PlannedItem = tuple[Item, int, Optional[int], Optional[int]]
+
+
+class BalancesAndApprovalsReadPlan:
+    """
+    Plans the balance and approval reads of many (owner, items, operator) requests, i.e. every offerer
+    and the fulfiller of a fulfill_orders call. Reads are collapsed to unique (owner, token, identifier, operator)
+    keys, so a WETH allowance needed by 50 consideration items or the isApprovedForAll of a collection needed
+    by many token ids is read once. All unique reads are made together at the snapshot block,
+    and their results fanned back out into one BalancesAndApprovals per request. Native balances are
+    read along with them if the snapshot has a multicall address, or through eth_getBalance otherwise.
+    """
+
+    snapshot: ChainSnapshot
+    reads: list[ContractFunction]
+
+    def __init__(self, snapshot: ChainSnapshot):
+        self.snapshot = snapshot
+        self.reads = []
+        self._read_indices: dict[tuple, int] = {}
+        # The owner and planned items of every request
+        self._requests: list[tuple[str, list[PlannedItem]]] = []
+
+    def _add_read(self, contract_fn: Optional[ContractFunction]) -> Optional[int]:
+        if contract_fn is None:
+            return None
+
+        # The arguments are one of (owner), (identifier), (owner, identifier) or (owner, operator).
+        # ownerOf doesn't depend on the owner, so the same token id of different owners is read once too
+        key = (
+            contract_fn.address,
+            contract_fn.fn_name,
+            *(arg.lower() if isinstance(arg, str) else arg for arg in contract_fn.args),
+        )
+
+        if key not in self._read_indices:
+            self._read_indices[key] = len(self.reads)
+            self.reads.append(contract_fn)
+
+        return self._read_indices[key]
+
+    def add(
+        self,
+        *,
+        owner: str,
+        items: Sequence[Item],
+        criterias: list[InputCriteria],
+        operator: str,
+    ) -> int:
+        """
+        Queues the balance and approval reads of the items of an owner
+
+        Args:
+            owner (str): the owner of the items
+            items (Sequence[Item]): the items to read the balances and approvals of
+            criterias (list[InputCriteria]): the criterias of the criteria based items
+            operator (str): the operator approvals are checked for
+
+        Returns:
+            int: the index of the request's balances and approvals in the list returned by execute
+        """
+        web3 = self.snapshot.web3
+        item_index_to_criteria = get_item_index_to_criteria_map(
+            items=items, criterias=criterias
+        )
+
+        planned_items: list[PlannedItem] = [
+            (
+                item,
+                item_index_to_criteria[index].identifier
+                if index in item_index_to_criteria
+                else item.identifierOrCriteria,
+                # Native balances are only planned if the snapshot can read them through Multicall3
+                self._add_read(
+                    self.snapshot.get_eth_balance_function(owner)
+                    if is_native_currency_item(item.itemType)
+                    else get_balance_of_function(
+                        owner, item, item_index_to_criteria.get(index), web3
+                    )
                 ),
+                self._add_read(
+                    get_approved_item_amount_function(owner, item, operator, web3)
+                ),
+            )
+            for index, item in enumerate(items)
+        ]
+
+        self._requests.append((owner, planned_items))
+
+        return len(self._requests) - 1
+
+    def execute(self) -> list[BalancesAndApprovals]:
+        """
+        Makes every unique read at the snapshot block. Raises if any of the reads fails,
+        the same as reading each balance and approval separately.
+
+        Returns:
+            list[BalancesAndApprovals]: the balances and approvals of every request, in the order they were added
+        """
+        results = self.snapshot.call_many(self.reads)
+
+        def get_result(read: int) -> Any:
+            if results[read] is None:
+                contract_fn = self.reads[read]
+
+                raise ValueError(
+                    f"Failed to call {contract_fn.fn_name} on {contract_fn.address} "
+                    f"at block {self.snapshot.block_number}"
+                )
+
+            return results[read]
+
+        def get_balance(owner: str, item: Item, balance_read: Optional[int]) -> int:
+            if balance_read is None:
+                return (
+                    self.snapshot.get_balance(owner)
+                    if is_native_currency_item(item.itemType)
+                    else get_assumed_balance(item)
+                )
+
+            return parse_balance_of_result(
+                owner, self.reads[balance_read], get_result(balance_read)
+            )
+
+        def get_approved_amount(approval_read: Optional[int]) -> int:
+            # We don't need to check approvals for native tokens
+            if approval_read is None:
+                return MAX_INT
+
+            return parse_approved_item_amount_result(
+                self.reads[approval_read], get_result(approval_read)
             )
+
+        return [
+            [
+                BalanceAndApproval(
+                    token=item.token,
+                    identifier_or_criteria=identifier_or_criteria,
+                    balance=get_balance(owner, item, balance_read),
+                    approved_amount=get_approved_amount(approval_read),
+                    item_type=item.itemType,
+                )
+                for item, identifier_or_criteria, balance_read, approval_read in planned_items
+            ]
+            for owner, planned_items in self._requests
+        ]
+
+
+def get_balances_and_approvals_at_snapshot(
+    *,
+    owner: str,
+    items: Sequence[Item],
+    criterias: list[InputCriteria],
+    operator: str,
+    snapshot: ChainSnapshot,
+) -> BalancesAndApprovals:
+    """
+    Same as get_balances_and_approvals, but every read is made at the snapshot block and memoized by the snapshot.
+    Raises if any of the reads fails.
+    """
+    plan = BalancesAndApprovalsReadPlan(snapshot)
+    plan.add(owner=owner, items=items, criterias=criterias, operator=operator)
+
+    return plan.execute()[0]
+
+
+async def async_get_balances_and_approvals(
+    *,
+    owner: str,
+    items: Sequence[Item],
+    criterias: list[InputCriteria],
+    operator: str,
+    web3: Web3,
+) -> BalancesAndApprovals:
+    """
+    Same as get_balances_and_approvals, but for an async web3 instance.
+    Every balance and approval read is issued concurrently.
+    """
+    item_index_to_criteria = get_item_index_to_criteria_map(
+        items=items, criterias=criterias
+    )
+
+    async def get_balance(index: int, item: Item) -> int:
+        if is_native_currency_item(item.itemType):
+            return await web3.eth.get_balance(owner)  # type: ignore
+
+        contract_fn = get_balance_of_function(
+            owner, item, item_index_to_criteria.get(index), web3
         )
 
-    def map_to_approval(insufficient_balance: InsufficientBalance):
-        return InsufficientApproval(
-            token=insufficient_balance.token,
-            identifier_or_criteria=insufficient_balance.identifier_or_criteria,
-            approved_amount=insufficient_balance.amount_have,
-            required_approved_amount=insufficient_balance.required_amount,
-            item_type=insufficient_balance.item_type,
-            operator=operator,
+        if contract_fn is None:
+            return get_assumed_balance(item)
+
+        return parse_balance_of_result(
+            owner, contract_fn, await async_call(contract_fn)
+        )
+
+    async def get_approved_amount(item: Item) -> int:
+        contract_fn = get_approved_item_amount_function(owner, item, operator, web3)
+
+        # We don't need to check approvals for native tokens
+        if contract_fn is None:
+            return MAX_INT
+
+        return parse_approved_item_amount_result(
+            contract_fn, await async_call(contract_fn)
         )
 
-    (insufficient_balances, insufficient_approvals,) = (
-        filter_balances_or_approvals("balance"),
-        list(map(map_to_approval, filter_balances_or_approvals("approved_amount"))),
+    balances, approved_amounts = await asyncio.gather(
+        asyncio.gather(*[get_balance(index, item) for index, item in enumerate(items)]),
+        asyncio.gather(*[get_approved_amount(item) for item in items]),
     )
 
+    return [
+        BalanceAndApproval(
+            token=item.token,
+            identifier_or_criteria=item_index_to_criteria[index].identifier
+            if index in item_index_to_criteria
+            else item.identifierOrCriteria,
+            balance=balances[index],
+            approved_amount=approved_amounts[index],
+            item_type=item.itemType,
+        )
+        for index, item in enumerate(items)
+    ]
+
+
+class InsufficientBalanceAndApprovalAmounts(BaseModel):
+    insufficient_balances: InsufficientBalances
+    insufficient_approvals: InsufficientApprovals
+
+
+def get_insufficient_balance_and_approval_amounts(
+    *,
+    balances_and_approvals: Union[BalancesAndApprovals, BalancesAndApprovalsIndex],
+    token_and_identifier_amounts: TokenAndIdentifierAmounts,
+    operator: str,
+):
+    balances_and_approvals_index = to_balances_and_approvals_index(
+        balances_and_approvals
+    )
+
+    insufficient_balances: InsufficientBalances = []
+    insufficient_approvals: InsufficientApprovals = []
+
+    for token, identifier_to_amount in token_and_identifier_amounts.items():
+        for identifier_or_criteria, amount_needed in identifier_to_amount.items():
+            balance_and_approval = balances_and_approvals_index.get(
+                token, identifier_or_criteria
+            )
+
+            if balance_and_approval.balance < amount_needed:
+                insufficient_balances.append(
+                    InsufficientBalance(
+                        token=token,
+                        identifier_or_criteria=identifier_or_criteria,
+                        required_amount=amount_needed,
+                        amount_have=balance_and_approval.balance,
+                        item_type=balance_and_approval.item_type,
+                    )
+                )
+
+            if balance_and_approval.approved_amount < amount_needed:
+                insufficient_approvals.append(
+                    InsufficientApproval(
+                        token=token,
+                        identifier_or_criteria=identifier_or_criteria,
+                        approved_amount=balance_and_approval.approved_amount,
+                        required_approved_amount=amount_needed,
+                        item_type=balance_and_approval.item_type,
+                        operator=operator,
+                    )
+                )
+
     return InsufficientBalanceAndApprovalAmounts(
         insufficient_balances=insufficient_balances,
         insufficient_approvals=insufficient_approvals,
@@ -272,7 +655,7 @@ def validate_offer_balances_and_approvals(
     *,
     offer: list[OfferItem],
     criterias: list[InputCriteria],
-    balances_and_approvals: BalancesAndApprovals,
+    balances_and_approvals: Union[BalancesAndApprovals, BalancesAndApprovalsIndex],
     time_based_item_params: Optional[TimeBasedItemParams] = None,
     throw_on_insufficient_balances=True,
     throw_on_insufficient_approvals=False,
@@ -329,8 +712,12 @@ def validate_basic_fulfill_balances_and_approvals(
     *,
     offer: list[OfferItem],
     consideration: list[ConsiderationItem],
-    offerer_balances_and_approvals: BalancesAndApprovals,
-    fulfiller_balances_and_approvals: BalancesAndApprovals,
+    offerer_balances_and_approvals: Union[
+        BalancesAndApprovals, BalancesAndApprovalsIndex
+    ],
+    fulfiller_balances_and_approvals: Union[
+        BalancesAndApprovals, BalancesAndApprovalsIndex
+    ],
     time_based_item_params: Optional[TimeBasedItemParams],
     offerer_operator: str,
     fulfiller_operator: str,
@@ -388,8 +775,12 @@ def validate_standard_fulfill_balances_and_approvals(
     consideration: list[ConsiderationItem],
     offer_criteria: list[InputCriteria],
     consideration_criteria: list[InputCriteria],
-    offerer_balances_and_approvals: BalancesAndApprovals,
-    fulfiller_balances_and_approvals: BalancesAndApprovals,
+    offerer_balances_and_approvals: Union[
+        BalancesAndApprovals, BalancesAndApprovalsIndex
+    ],
+    fulfiller_balances_and_approvals: Union[
+        BalancesAndApprovals, BalancesAndApprovalsIndex
+    ],
     time_based_item_params: Optional[TimeBasedItemParams],
     offerer_operator: str,
     fulfiller_operator: str,
@@ -413,29 +804,12 @@ def validate_standard_fulfill_balances_and_approvals(
         else None,
     )
 
-    # Deep clone existing balances
-    fulfiller_balances_and_approvals_after_receiving_offered_items = list(
-        map(lambda x: x.copy(), fulfiller_balances_and_approvals)
+    fulfiller_balances_and_approvals_after_receiving_offered_items = (
+        to_balances_and_approvals_index(
+            fulfiller_balances_and_approvals
+        ).with_received_amounts(summed_offer_amounts)
     )
 
-    for token, identifier_or_criteria_to_amount in summed_offer_amounts.items():
-        for identifier_or_criteria, amount in identifier_or_criteria_to_amount.items():
-            balance_and_approval = find_balance_and_approval(
-                balances_and_approvals=fulfiller_balances_and_approvals_after_receiving_offered_items,
-                token=token,
-                identifier_or_criteria=identifier_or_criteria,
-            )
-
-            balance_and_approval_index = (
-                fulfiller_balances_and_approvals_after_receiving_offered_items.index(
-                    balance_and_approval
-                )
-            )
-
-            fulfiller_balances_and_approvals_after_receiving_offered_items[
-                balance_and_approval_index
-            ].balance += amount
-
     insufficient_balance_and_approval_amounts = get_insufficient_balance_and_approval_amounts(
         balances_and_approvals=fulfiller_balances_and_approvals_after_receiving_offered_items,
         token_and_identifier_amounts=get_summed_token_and_identifier_amounts(
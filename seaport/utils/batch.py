@@ -0,0 +1,64 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    """
+    Lazily splits an iterable into lists of at most `size` elements
+    """
+    if size <= 0:
+        raise ValueError("Chunk size must be greater than 0")
+
+    iterator = iter(iterable)
+
+    while True:
+        chunk = list(islice(iterator, size))
+
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def map_chunks(
+    fn: Callable[[list[T]], list[R]],
+    iterable: Iterable[T],
+    *,
+    max_workers: Optional[int] = None,
+    chunk_size: int,
+    executor: Optional[Executor] = None,
+) -> list[R]:
+    """
+    Applies a function to chunks of an iterable and flattens the results. Everything runs serially in the current
+    process unless an executor or more than one worker is requested, in which case chunks are mapped across processes.
+    As it runs inside worker processes, the function must be picklable, i.e. a module level function or a partial of one.
+
+    Args:
+        fn (Callable[[list[T]], list[R]]): maps a chunk of elements to one result per element
+        iterable (Iterable[T]): the elements to map
+        max_workers (Optional[int], optional): number of worker processes to spawn. Defaults to running serially.
+        chunk_size (int): number of elements sent to a worker at a time
+        executor (Optional[Executor], optional): an existing executor to reuse instead of spawning a process pool.
+
+    Returns:
+        list[R]: the result of every element, in the same order as the input
+    """
+    if executor is None and (max_workers is None or max_workers <= 1):
+        return fn(list(iterable))
+
+    def map_in(executor: Executor) -> list[R]:
+        return [
+            result
+            for results in executor.map(fn, chunked(iterable, chunk_size))
+            for result in results
+        ]
+
+    if executor is not None:
+        return map_in(executor)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as process_pool:
+        return map_in(process_pool)
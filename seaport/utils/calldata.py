@@ -0,0 +1,308 @@
+from typing import Sequence
+
+from hexbytes import HexBytes
+
+from seaport.types import (
+    AdvancedOrder,
+    BasicOrderParameters,
+    ConsiderationItem,
+    CriteriaResolver,
+    OfferItem,
+    Order,
+    OrderParameters,
+)
+from seaport.utils.order_hash import WORD_SIZE, hex_to_word, to_word
+
+# Selectors of the Seaport entry points, the first 4 bytes of the keccak hash of their signature
+FULFILL_BASIC_ORDER_SELECTOR = bytes.fromhex("fb0f3ee1")
+FULFILL_ORDER_SELECTOR = bytes.fromhex("b3a34c4c")
+FULFILL_ADVANCED_ORDER_SELECTOR = bytes.fromhex("e7acab24")
+FULFILL_AVAILABLE_ORDERS_SELECTOR = bytes.fromhex("ed98a574")
+FULFILL_AVAILABLE_ADVANCED_ORDERS_SELECTOR = bytes.fromhex("87201b41")
+
+# (order index, item index) of an item aggregated into a fulfillment
+FulfillmentComponentTuple = tuple[int, int]
+
+# An encoded value along with whether it is dynamic, in which case it is referenced by an offset
+EncodedValue = tuple[bytes, bool]
+
+
+def encode_bytes(hex_data: str) -> bytes:
+    data = bytes(HexBytes(hex_data))
+    padded_size = -(-len(data) // WORD_SIZE) * WORD_SIZE
+
+    return to_word(len(data)) + data.ljust(padded_size, b"\0")
+
+
+def encode_tuple(values: Sequence[EncodedValue]) -> bytes:
+    """
+    Encodes the values of a tuple, or the arguments of a function, as a head of static values and offsets
+    followed by the dynamic values
+    """
+    head: list[bytes] = []
+    tail: list[bytes] = []
+    offset = sum(WORD_SIZE if is_dynamic else len(data) for data, is_dynamic in values)
+
+    for data, is_dynamic in values:
+        if is_dynamic:
+            head.append(to_word(offset))
+            tail.append(data)
+            offset += len(data)
+        else:
+            head.append(data)
+
+    return b"".join(head + tail)
+
+
+def encode_static_array(elements: Sequence[bytes]) -> bytes:
+    return to_word(len(elements)) + b"".join(elements)
+
+
+def encode_dynamic_array(elements: Sequence[bytes]) -> bytes:
+    return to_word(len(elements)) + encode_tuple(
+        [(element, True) for element in elements]
+    )
+
+
+def encode_offer_item(item: OfferItem) -> bytes:
+    return b"".join(
+        [
+            to_word(item.itemType.value),
+            hex_to_word(item.token),
+            to_word(item.identifierOrCriteria),
+            to_word(item.startAmount),
+            to_word(item.endAmount),
+        ]
+    )
+
+
+def encode_consideration_item(item: ConsiderationItem) -> bytes:
+    return encode_offer_item(item) + hex_to_word(item.recipient)
+
+
+def encode_order_parameters(parameters: OrderParameters) -> bytes:
+    return encode_tuple(
+        [
+            (hex_to_word(parameters.offerer), False),
+            (hex_to_word(parameters.zone), False),
+            (encode_static_array(list(map(encode_offer_item, parameters.offer))), True),
+            (
+                encode_static_array(
+                    list(map(encode_consideration_item, parameters.consideration))
+                ),
+                True,
+            ),
+            (to_word(parameters.orderType.value), False),
+            (to_word(parameters.startTime), False),
+            (to_word(parameters.endTime), False),
+            (hex_to_word(parameters.zoneHash), False),
+            (to_word(parameters.salt), False),
+            (hex_to_word(parameters.conduitKey), False),
+            (to_word(parameters.totalOriginalConsiderationItems), False),
+        ]
+    )
+
+
+def encode_order(order: Order) -> bytes:
+    return encode_tuple(
+        [
+            (encode_order_parameters(order.parameters), True),
+            (encode_bytes(order.signature), True),
+        ]
+    )
+
+
+def encode_advanced_order(advanced_order: AdvancedOrder) -> bytes:
+    return encode_tuple(
+        [
+            (encode_order_parameters(advanced_order.parameters), True),
+            (to_word(advanced_order.numerator), False),
+            (to_word(advanced_order.denominator), False),
+            (encode_bytes(advanced_order.signature), True),
+            (encode_bytes(advanced_order.extraData), True),
+        ]
+    )
+
+
+def encode_criteria_resolver(criteria_resolver: CriteriaResolver) -> bytes:
+    return encode_tuple(
+        [
+            (to_word(criteria_resolver.orderIndex), False),
+            (to_word(criteria_resolver.side.value), False),
+            (to_word(criteria_resolver.index), False),
+            (to_word(criteria_resolver.identifier), False),
+            (
+                encode_static_array(
+                    list(map(hex_to_word, criteria_resolver.criteriaProof))
+                ),
+                True,
+            ),
+        ]
+    )
+
+
+def encode_fulfillments(
+    fulfillments: Sequence[Sequence[FulfillmentComponentTuple]],
+) -> bytes:
+    return encode_dynamic_array(
+        [
+            encode_static_array(
+                [
+                    to_word(order_index) + to_word(item_index)
+                    for order_index, item_index in fulfillment
+                ]
+            )
+            for fulfillment in fulfillments
+        ]
+    )
+
+
+def encode_basic_order_parameters(parameters: BasicOrderParameters) -> bytes:
+    return encode_tuple(
+        [
+            (hex_to_word(parameters.considerationToken), False),
+            (to_word(parameters.considerationIdentifier), False),
+            (to_word(parameters.considerationAmount), False),
+            (hex_to_word(parameters.offerer), False),
+            (hex_to_word(parameters.zone), False),
+            (hex_to_word(parameters.offerToken), False),
+            (to_word(parameters.offerIdentifier), False),
+            (to_word(parameters.offerAmount), False),
+            (to_word(parameters.basicOrderType), False),
+            (to_word(parameters.startTime), False),
+            (to_word(parameters.endTime), False),
+            (hex_to_word(parameters.zoneHash), False),
+            (to_word(parameters.salt), False),
+            (hex_to_word(parameters.offererConduitKey), False),
+            (hex_to_word(parameters.fulfillerConduitKey), False),
+            (to_word(parameters.totalOriginalAdditionalRecipients), False),
+            (
+                encode_static_array(
+                    [
+                        to_word(recipient.amount) + hex_to_word(recipient.recipient)
+                        for recipient in parameters.additionalRecipients
+                    ]
+                ),
+                True,
+            ),
+            (encode_bytes(parameters.signature), True),
+        ]
+    )
+
+
+def to_calldata(selector: bytes, arguments: Sequence[EncodedValue]) -> str:
+    return "0x" + (selector + encode_tuple(arguments)).hex()
+
+
+def get_calldata_size(calldata: str) -> int:
+    """
+    Returns the size in bytes of hex encoded calldata
+    """
+    return (len(calldata) - 2) // 2
+
+
+def encode_fulfill_basic_order(parameters: BasicOrderParameters) -> str:
+    """
+    Encodes fulfillBasicOrder calldata straight from the parameters, in the canonical ABI encoding
+
+    Args:
+        parameters (BasicOrderParameters): the basic order parameters
+
+    Returns:
+        str: the hex encoded calldata
+    """
+    return to_calldata(
+        FULFILL_BASIC_ORDER_SELECTOR,
+        [(encode_basic_order_parameters(parameters), True)],
+    )
+
+
+def encode_fulfill_order(order: Order, fulfiller_conduit_key: str) -> str:
+    return to_calldata(
+        FULFILL_ORDER_SELECTOR,
+        [(encode_order(order), True), (hex_to_word(fulfiller_conduit_key), False)],
+    )
+
+
+def encode_fulfill_advanced_order(
+    advanced_order: AdvancedOrder,
+    criteria_resolvers: Sequence[CriteriaResolver],
+    fulfiller_conduit_key: str,
+    recipient: str,
+) -> str:
+    """
+    Encodes fulfillAdvancedOrder calldata straight from the order and criteria resolvers, in the canonical ABI encoding
+
+    Args:
+        advanced_order (AdvancedOrder): the order along with the fraction to fill and its extra data
+        criteria_resolvers (Sequence[CriteriaResolver]): the identifiers chosen for criteria items
+        fulfiller_conduit_key (str): the conduit key the fulfiller approved its items to
+        recipient (str): where offer items go, the zero address meaning the fulfiller
+
+    Returns:
+        str: the hex encoded calldata
+    """
+    return to_calldata(
+        FULFILL_ADVANCED_ORDER_SELECTOR,
+        [
+            (encode_advanced_order(advanced_order), True),
+            (
+                encode_dynamic_array(
+                    list(map(encode_criteria_resolver, criteria_resolvers))
+                ),
+                True,
+            ),
+            (hex_to_word(fulfiller_conduit_key), False),
+            (hex_to_word(recipient), False),
+        ],
+    )
+
+
+def encode_fulfill_available_orders(
+    orders: Sequence[Order],
+    offer_fulfillments: Sequence[Sequence[FulfillmentComponentTuple]],
+    consideration_fulfillments: Sequence[Sequence[FulfillmentComponentTuple]],
+    fulfiller_conduit_key: str,
+    maximum_fulfilled: int,
+) -> str:
+    return to_calldata(
+        FULFILL_AVAILABLE_ORDERS_SELECTOR,
+        [
+            (encode_dynamic_array(list(map(encode_order, orders))), True),
+            (encode_fulfillments(offer_fulfillments), True),
+            (encode_fulfillments(consideration_fulfillments), True),
+            (hex_to_word(fulfiller_conduit_key), False),
+            (to_word(maximum_fulfilled), False),
+        ],
+    )
+
+
+def encode_fulfill_available_advanced_orders(
+    advanced_orders: Sequence[AdvancedOrder],
+    criteria_resolvers: Sequence[CriteriaResolver],
+    offer_fulfillments: Sequence[Sequence[FulfillmentComponentTuple]],
+    consideration_fulfillments: Sequence[Sequence[FulfillmentComponentTuple]],
+    fulfiller_conduit_key: str,
+    recipient: str,
+    maximum_fulfilled: int,
+) -> str:
+    return to_calldata(
+        FULFILL_AVAILABLE_ADVANCED_ORDERS_SELECTOR,
+        [
+            (
+                encode_dynamic_array(list(map(encode_advanced_order, advanced_orders))),
+                True,
+            ),
+            (
+                encode_dynamic_array(
+                    list(map(encode_criteria_resolver, criteria_resolvers))
+                ),
+                True,
+            ),
+            (encode_fulfillments(offer_fulfillments), True),
+            (encode_fulfillments(consideration_fulfillments), True),
+            (hex_to_word(fulfiller_conduit_key), False),
+            (hex_to_word(recipient), False),
+            (to_word(maximum_fulfilled), False),
+        ],
+    )
@@ -0,0 +1,123 @@
+from collections import OrderedDict
+from enum import Enum, auto
+from functools import lru_cache
+from threading import Lock
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from eth_typing import ChecksumAddress
+from eth_utils import function_abi_to_4byte_selector
+from web3 import Web3
+from web3._utils.abi import abi_to_signature
+from web3.contract import Contract
+
+from seaport.abi.ERC20 import ERC20_ABI
+from seaport.abi.ERC721 import ERC721_ABI
+from seaport.abi.ERC1155 import ERC1155_ABI
+from seaport.abi.Multicall3 import MULTICALL3_ABI
+from seaport.abi.Seaport import SEAPORT_ABI
+
+DEFAULT_MAX_CONTRACTS = 1024
+
+
+class AbiKind(Enum):
+    ERC20 = auto()
+    ERC721 = auto()
+    ERC1155 = auto()
+    MULTICALL3 = auto()
+    SEAPORT = auto()
+
+
+ABIS: dict[AbiKind, list[dict[str, Any]]] = {
+    AbiKind.ERC20: ERC20_ABI,
+    AbiKind.ERC721: ERC721_ABI,
+    AbiKind.ERC1155: ERC1155_ABI,
+    AbiKind.MULTICALL3: MULTICALL3_ABI,
+    AbiKind.SEAPORT: SEAPORT_ABI,
+}
+
+# Function selectors of every known ABI keyed by function signature, i.e. "balanceOf(address)"
+SELECTORS: dict[str, str] = {
+    abi_to_signature(fn_abi): "0x" + function_abi_to_4byte_selector(fn_abi).hex()
+    for abi in ABIS.values()
+    for fn_abi in abi
+    if fn_abi.get("type") == "function"
+}
+
+
+@lru_cache(maxsize=4096)
+def to_checksum_address(address: str) -> ChecksumAddress:
+    return Web3.toChecksumAddress(address)
+
+
+def get_function_selector(fn_abi: dict[str, Any]) -> str:
+    signature = abi_to_signature(fn_abi)
+    selector = SELECTORS.get(signature)
+
+    if selector is None:
+        selector = "0x" + function_abi_to_4byte_selector(fn_abi).hex()
+        SELECTORS[signature] = selector
+
+    return selector
+
+
+class ContractCache:
+    """
+    Bounded LRU cache of contract objects keyed by (checksum address, ABI kind).
+    Building a contract parses its ABI and creates a function object per ABI entry,
+    which adds up when the same tokens are read for every item of every order.
+    Contracts are bound to a web3 instance, so each instance gets its own cache
+    which goes away together with the instance.
+    """
+
+    max_contracts: int
+
+    def __init__(self, max_contracts: int = DEFAULT_MAX_CONTRACTS):
+        self.max_contracts = max_contracts
+        self._contracts: WeakKeyDictionary[
+            Web3, OrderedDict[tuple[ChecksumAddress, AbiKind], Contract]
+        ] = WeakKeyDictionary()
+        self._lock = Lock()
+
+    def get(self, web3: Web3, address: str, abi_kind: AbiKind) -> Contract:
+        key = (to_checksum_address(address), abi_kind)
+
+        with self._lock:
+            contracts = self._contracts.setdefault(web3, OrderedDict())
+            contract = contracts.get(key)
+
+            if contract is not None:
+                contracts.move_to_end(key)
+                return contract
+
+        contract = web3.eth.contract(address=key[0], abi=ABIS[abi_kind])
+
+        with self._lock:
+            contracts[key] = contract
+
+            if len(contracts) > self.max_contracts:
+                contracts.popitem(last=False)
+
+        return contract
+
+    def clear(self):
+        with self._lock:
+            self._contracts.clear()
+
+
+contract_cache = ContractCache()
+
+
+def get_contract(web3: Web3, address: str, abi_kind: AbiKind) -> Contract:
+    """
+    Returns the cached contract object for the address and ABI kind, building it on first use
+
+    Args:
+        web3 (Web3): web3 instance the contract is bound to
+        address (str): address of the contract, in any casing
+        abi_kind (AbiKind): which ABI to use
+
+    Returns:
+        Contract: the contract object
+    """
+    return contract_cache.get(web3, address, abi_kind)
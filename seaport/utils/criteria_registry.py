@@ -0,0 +1,191 @@
+from collections import OrderedDict
+from typing import Optional, Sequence, Union
+
+from seaport.types import InputCriteria, Item
+from seaport.utils.hex_utils import bytes_to_hex
+from seaport.utils.item import is_criteria_item
+from seaport.utils.merkle_proof_index import (
+    MerkleProofIndex,
+    PathLike,
+    get_merkle_tree_path,
+)
+from seaport.utils.merkletree import MerkleTree, hash_identifier
+
+DEFAULT_MAX_TREES = 128
+
+CriteriaTree = Union[MerkleTree, MerkleProofIndex]
+
+
+def close_tree(tree: CriteriaTree):
+    if isinstance(tree, MerkleProofIndex):
+        tree.close()
+
+
+class CriteriaRegistry:
+    """
+    Caches criteria trees by their root, which is the identifierOrCriteria of criteria items,
+    so criteria for a fill can be resolved from the chosen token ids alone instead of rebuilding the tree.
+    The least recently used trees are evicted once more than max_trees are cached, closing the ones that are memory mapped.
+    When a directory populated by write_merkle_tree is given, trees that aren't cached are memory mapped from it.
+
+    Trees are keyed by the root they had when added, so trees updated afterwards have to be added again.
+    """
+
+    max_trees: int
+    directory: Optional[PathLike]
+
+    def __init__(
+        self,
+        max_trees: int = DEFAULT_MAX_TREES,
+        directory: Optional[PathLike] = None,
+    ):
+        if max_trees < 1:
+            raise ValueError("The registry has to be able to hold at least one tree")
+
+        self.max_trees = max_trees
+        self.directory = directory
+        self._trees: OrderedDict[int, CriteriaTree] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._trees)
+
+    def __contains__(self, root: int) -> bool:
+        return root in self._trees
+
+    def register(self, identifiers: Sequence[int]) -> int:
+        """
+        Builds and caches the criteria tree of the given identifiers
+
+        Args:
+            identifiers (Sequence[int]): the token ids the criteria allows
+
+        Returns:
+            int: the root of the tree, to be used as the identifierOrCriteria of criteria items
+        """
+        return self.add(MerkleTree(list(identifiers)))
+
+    def add(self, tree: CriteriaTree) -> int:
+        """
+        Caches an already built or stored criteria tree and returns its root
+        """
+        root = tree.get_root_as_int()
+        replaced_tree = self._trees.get(root)
+
+        if replaced_tree is not None and replaced_tree is not tree:
+            close_tree(replaced_tree)
+
+        self._trees[root] = tree
+        self._trees.move_to_end(root)
+
+        while len(self._trees) > self.max_trees:
+            _, evicted_tree = self._trees.popitem(last=False)
+            close_tree(evicted_tree)
+
+        return root
+
+    def get_tree(self, root: int) -> Optional[CriteriaTree]:
+        """
+        Returns the tree with the given root, or None if it was never added or has been evicted
+        and isn't stored in the registry directory
+        """
+        tree = self._trees.get(root)
+
+        if tree is not None:
+            self._trees.move_to_end(root)
+            return tree
+
+        if self.directory is None:
+            return None
+
+        path = get_merkle_tree_path(self.directory, root)
+
+        if not path.exists():
+            return None
+
+        tree = MerkleProofIndex(path)
+        self.add(tree)
+
+        return tree
+
+    def get_criteria(self, root: int, identifier: int) -> InputCriteria:
+        """
+        Returns the criteria proving that an identifier is part of the criteria with the given root.
+        A root of 0 allows any identifier of the collection, so no proof is needed.
+
+        Args:
+            root (int): the identifierOrCriteria of the criteria item
+            identifier (int): the chosen token id
+
+        Returns:
+            InputCriteria: the identifier along with its proof
+        """
+        if root == 0:
+            return InputCriteria(identifier=identifier, proof=[])
+
+        tree = self.get_tree(root)
+
+        if tree is None:
+            raise ValueError(f"No criteria tree is registered for root {hex(root)}")
+
+        proof_bytes = tree.get_proof_bytes(identifier)
+
+        # Trees with a single identifier have the hashed identifier as root and an empty proof
+        if not proof_bytes and tree.get_root() != hash_identifier(identifier):
+            raise ValueError(
+                f"Identifier {identifier} is not part of the criteria {hex(root)}"
+            )
+
+        return InputCriteria(
+            identifier=identifier, proof=list(map(bytes_to_hex, proof_bytes))
+        )
+
+    def get_criterias(
+        self, items: Sequence[Item], identifiers: Sequence[int]
+    ) -> list[InputCriteria]:
+        """
+        Returns the criterias of the criteria items among the given items, in order,
+        for the token ids chosen for each of them
+
+        Args:
+            items (Sequence[Item]): the offer or consideration items of an order
+            identifiers (Sequence[int]): one chosen token id per criteria item
+
+        Returns:
+            list[InputCriteria]: the criterias to fulfill the order with
+        """
+        criteria_items = [item for item in items if is_criteria_item(item.itemType)]
+
+        if len(criteria_items) != len(identifiers):
+            raise ValueError(
+                f"Expected {len(criteria_items)} identifiers, one per criteria item, got {len(identifiers)}"
+            )
+
+        return [
+            self.get_criteria(item.identifierOrCriteria, identifier)
+            for item, identifier in zip(criteria_items, identifiers)
+        ]
+
+    def resolve_criterias(
+        self, items: Sequence[Item], criterias: list[InputCriteria]
+    ) -> list[InputCriteria]:
+        """
+        Fills in the proofs of criterias given without one, pairing criterias with criteria items in order
+        """
+        if all(criteria.proof is not None for criteria in criterias):
+            return criterias
+
+        criteria_items = [item for item in items if is_criteria_item(item.itemType)]
+
+        if len(criterias) > len(criteria_items):
+            raise ValueError(
+                f"Got {len(criterias)} criterias for {len(criteria_items)} criteria items"
+            )
+
+        return [
+            criteria
+            if criteria.proof is not None
+            else self.get_criteria(
+                criteria_items[index].identifierOrCriteria, criteria.identifier
+            )
+            for index, criteria in enumerate(criterias)
+        ]
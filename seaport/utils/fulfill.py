@@ -1,5 +1,5 @@
 from itertools import chain
-from typing import cast
+from typing import Optional, cast
 
 from brownie import Wei
 from hexbytes import HexBytes
@@ -9,12 +9,16 @@ from web3.constants import ADDRESS_ZERO
 from web3.contract import Contract
 from web3.types import TxParams
 
-from seaport.constants import BasicOrderRouteType, ItemType
+from seaport.constants import BasicOrderRouteType, FulfillRoute, ItemType
 from seaport.types import (
+    AdditionalRecipient,
+    AdvancedOrder,
     BalancesAndApprovals,
+    BasicOrderParameters,
     ConsiderationItem,
     ExchangeAction,
     FulfillmentComponent,
+    FulfillOrdersUseCase,
     FulfillOrderUseCase,
     InputCriteria,
     InsufficientApprovals,
@@ -23,17 +27,28 @@ from seaport.types import (
     OrderStatus,
 )
 from seaport.utils.balance_and_approval_check import (
+    BalancesAndApprovalsIndex,
     get_approval_actions,
     validate_basic_fulfill_balances_and_approvals,
     validate_standard_fulfill_balances_and_approvals,
 )
+from seaport.utils.calldata import (
+    FulfillmentComponentTuple,
+    encode_fulfill_advanced_order,
+    encode_fulfill_available_advanced_orders,
+    encode_fulfill_available_orders,
+    encode_fulfill_basic_order,
+    encode_fulfill_order,
+)
 from seaport.utils.gcd import gcd
 from seaport.utils.item import (
     TimeBasedItemParams,
+    TransferKey,
     generate_criteria_resolvers,
     get_item_index_to_criteria_map,
     get_maximum_size_for_order,
     get_summed_token_and_identifier_amounts,
+    get_transfer_key,
     is_criteria_item,
     is_currency_item,
     is_erc20_item,
@@ -46,8 +61,11 @@ from seaport.utils.order import (
     map_order_amounts_from_units_to_fill,
     total_items_amount,
 )
-from seaport.utils.pydantic import parse_model_list
-from seaport.utils.usecase import execute_all_actions, get_transaction_methods
+from seaport.utils.usecase import (
+    execute_all_actions,
+    execute_all_exchange_actions,
+    get_transaction_methods,
+)
 
 
 def should_use_basic_fulfill(
@@ -239,7 +257,9 @@ def fulfill_basic_order(
 
     additional_recipients = list(
         map(
-            lambda item: {"amount": item.startAmount, "recipient": item.recipient},
+            lambda item: AdditionalRecipient(
+                amount=item.startAmount, recipient=item.recipient
+            ),
             for_additional_recipients,
         )
     )
@@ -273,31 +293,31 @@ def fulfill_basic_order(
         fulfiller_operator=fulfiller_operator,
     )
 
-    basic_order_parameters = {
-        "offerer": order.parameters.offerer,
-        "offererConduitKey": order.parameters.conduitKey,
-        "zone": order.parameters.zone,
+    basic_order_parameters = BasicOrderParameters(
+        offerer=order.parameters.offerer,
+        offererConduitKey=order.parameters.conduitKey,
+        zone=order.parameters.zone,
         # Note the use of a "basicOrderType" enum;
         # this represents both the usual order type as well as the "route"
         # of the basic order (a simple derivation function for the basic order
         # type is `basicOrderType = orderType + (4 * basicOrderRoute)`.)
-        "basicOrderType": order.parameters.orderType.value
+        basicOrderType=order.parameters.orderType.value
         + (4 * basic_order_route_type.value),
-        "offerToken": offer_item.token,
-        "offerIdentifier": offer_item.identifierOrCriteria,
-        "offerAmount": offer_item.endAmount,
-        "considerationToken": for_offerer.token,
-        "considerationIdentifier": for_offerer.identifierOrCriteria,
-        "considerationAmount": for_offerer.endAmount,
-        "startTime": order.parameters.startTime,
-        "endTime": order.parameters.endTime,
-        "salt": order.parameters.salt,
-        "totalOriginalAdditionalRecipients": len(order.parameters.consideration) - 1,
-        "signature": order.signature,
-        "fulfillerConduitKey": conduit_key,
-        "additionalRecipients": additional_recipients,
-        "zoneHash": order.parameters.zoneHash,
-    }
+        offerToken=offer_item.token,
+        offerIdentifier=offer_item.identifierOrCriteria,
+        offerAmount=offer_item.endAmount,
+        considerationToken=for_offerer.token,
+        considerationIdentifier=for_offerer.identifierOrCriteria,
+        considerationAmount=for_offerer.endAmount,
+        startTime=order.parameters.startTime,
+        endTime=order.parameters.endTime,
+        salt=order.parameters.salt,
+        totalOriginalAdditionalRecipients=len(order.parameters.consideration) - 1,
+        signature=order.signature,
+        fulfillerConduitKey=conduit_key,
+        additionalRecipients=additional_recipients,
+        zoneHash=order.parameters.zoneHash,
+    )
 
     payable_overrides: TxParams = {"value": Wei(total_native_amount), "from": fulfiller}
     approval_actions = get_approval_actions(
@@ -307,8 +327,9 @@ def fulfill_basic_order(
     )
     exchange_action = ExchangeAction(
         transaction_methods=get_transaction_methods(
-            seaport_contract.functions.fulfillBasicOrder(basic_order_parameters),
+            seaport_contract.get_function_by_name(FulfillRoute.BASIC.value),
             payable_overrides,
+            data=encode_fulfill_basic_order(basic_order_parameters),
         ),
     )
 
@@ -340,6 +361,7 @@ def fulfill_standard_order(
     fulfiller: str,
     recipient_address: str,
     web3: Web3,
+    route: Optional[FulfillRoute] = None,
 ):
     # If we are supplying units to fill, we adjust the order by the minimum of the amount to fill and
     # the remaining order left to be fulfilled
@@ -415,7 +437,11 @@ def fulfill_standard_order(
 
     is_gift = recipient_address != ADDRESS_ZERO
 
-    use_advanced = bool(units_to_fill) or has_criteria_items or is_gift
+    use_advanced = (
+        route == FulfillRoute.ADVANCED
+        if route
+        else bool(units_to_fill) or has_criteria_items or is_gift
+    )
 
     # Used for advanced order cases
     max_units = get_maximum_size_for_order(order)
@@ -442,35 +468,36 @@ def fulfill_standard_order(
         "from": fulfiller,
     }
 
+    advanced_order = AdvancedOrder(
+        parameters=order_accounting_for_tips.parameters,
+        signature=order_accounting_for_tips.signature,
+        numerator=numerator,
+        denominator=denominator,
+        extraData=extra_data,
+    )
+    criteria_resolvers = (
+        generate_criteria_resolvers(
+            orders=[order],
+            offer_criterias=[offer_criteria],
+            consideration_criterias=[consideration_criteria],
+        )
+        if has_criteria_items
+        else []
+    )
+
     exchange_action = ExchangeAction(
         transaction_methods=get_transaction_methods(
-            seaport_contract.functions.fulfillAdvancedOrder(
-                {
-                    **order_accounting_for_tips.dict(),
-                    "numerator": numerator,
-                    "denominator": denominator,
-                    "extraData": extra_data,
-                },
-                parse_model_list(
-                    generate_criteria_resolvers(
-                        orders=[order],
-                        offer_criterias=[offer_criteria],
-                        consideration_criterias=[consideration_criteria],
-                    )
-                )
-                if has_criteria_items
-                else [],
-                conduit_key,
-                recipient_address,
-            ),
+            seaport_contract.get_function_by_name(FulfillRoute.ADVANCED.value),
             payable_overrides,
+            data=encode_fulfill_advanced_order(
+                advanced_order, criteria_resolvers, conduit_key, recipient_address
+            ),
         )
         if use_advanced
         else get_transaction_methods(
-            seaport_contract.functions.fulfillOrder(
-                order_accounting_for_tips.dict(), conduit_key
-            ),
+            seaport_contract.get_function_by_name(FulfillRoute.STANDARD.value),
             payable_overrides,
+            data=encode_fulfill_order(order_accounting_for_tips, conduit_key),
         )
     )
 
@@ -505,7 +532,15 @@ def fulfill_available_orders(
     fulfiller_operator: str,
     recipient_address: str,
     web3: Web3,
-):
+    chunk_sizes: Optional[list[int]] = None,
+    route: FulfillRoute = FulfillRoute.AVAILABLE_ADVANCED,
+) -> FulfillOrdersUseCase:
+    """
+    Fulfills the orders through fulfillAvailableAdvancedOrders, or fulfillAvailableOrders when that route is given.
+    When chunk sizes are given, consecutive chunks of that many orders are each fulfilled in their own transaction,
+    with fulfillments aggregated within each chunk. Balances and approvals are validated across all of the orders,
+    so approvals are only needed once. Executing all actions returns the hash of every exchange transaction.
+    """
     sanitized_orders_metadata = list(
         map(
             lambda order_metadata: order_metadata.copy(
@@ -541,9 +576,13 @@ def fulfill_available_orders(
         )
     )
 
-    total_native_amount = 0
+    orders_native_amounts: list[int] = []
     total_insufficient_approvals: InsufficientApprovals = []
-    has_criteria_items = False
+
+    # Indexed once, as every order is validated against the same fulfiller balances and approvals
+    fulfiller_balances_and_approvals_index = BalancesAndApprovalsIndex(
+        fulfiller_balances_and_approvals
+    )
 
     def add_approval_if_needed(
         order_insufficient_approvals: InsufficientApprovals,
@@ -568,7 +607,7 @@ def fulfill_available_orders(
             is_consideration_item=True,
         )
 
-        total_native_amount += (
+        orders_native_amounts.append(
             get_summed_token_and_identifier_amounts(
                 items=consideration_including_tips,
                 criterias=order_metadata.consideration_criteria,
@@ -584,7 +623,7 @@ def fulfill_available_orders(
             offer_criteria=order_metadata.offer_criteria,
             consideration_criteria=order_metadata.consideration_criteria,
             offerer_balances_and_approvals=order_metadata.offerer_balances_and_approvals,
-            fulfiller_balances_and_approvals=fulfiller_balances_and_approvals,
+            fulfiller_balances_and_approvals=fulfiller_balances_and_approvals_index,
             time_based_item_params=time_based_item_params,
             offerer_operator=order_metadata.offerer_operator,
             fulfiller_operator=fulfiller_operator,
@@ -615,8 +654,6 @@ def fulfill_available_orders(
             insufficient_approvals,
         )
 
-    payable_overrides: TxParams = {"value": Wei(total_native_amount), "from": fulfiller}
-
     approval_actions = get_approval_actions(
         insufficient_approvals=total_insufficient_approvals,
         web3=web3,
@@ -632,153 +669,254 @@ def fulfill_available_orders(
             chain(order_metadata.order.parameters.consideration, order_metadata.tips)
         )
 
-        return {
-            **order_metadata.order.copy(
+        return AdvancedOrder(
+            parameters=order_metadata.order.parameters.copy(
                 update={
-                    "parameters": order_metadata.order.parameters.copy(
-                        update={
-                            "consideration": consideration_including_tips,
-                            "totalOriginalConsiderationItems": len(
-                                order_metadata.order.parameters.consideration
-                            ),
-                        }
-                    )
+                    "consideration": consideration_including_tips,
+                    "totalOriginalConsiderationItems": len(
+                        order_metadata.order.parameters.consideration
+                    ),
                 }
-            ).dict(),
-            "numerator": numerator,
-            "denominator": denominator,
-            "extraData": order_metadata.extra_data,
-        }
+            ),
+            signature=order_metadata.order.signature,
+            numerator=numerator,
+            denominator=denominator,
+            extraData=order_metadata.extra_data,
+        )
 
     advanced_orders_with_tips = list(
         map(map_to_advanced_order_with_tip, sanitized_orders_metadata)
     )
 
-    (
-        offer_fulfillments,
-        consideration_fulfillments,
-    ) = generate_fulfill_orders_fulfillments(orders_metadata)
+    def get_exchange_action(start: int, end: int) -> ExchangeAction:
+        chunk_orders_metadata = orders_metadata[start:end]
+        chunk_advanced_orders_with_tips = advanced_orders_with_tips[start:end]
+        # Criterias were validated against the criteria items of each order, so they are present exactly
+        # when the chunk holds criteria items
+        chunk_has_criteria_items = any(
+            order_metadata.offer_criteria or order_metadata.consideration_criteria
+            for order_metadata in chunk_orders_metadata
+        )
 
-    exchange_action = ExchangeAction(
-        transaction_methods=get_transaction_methods(
-            seaport_contract.functions.fulfillAvailableAdvancedOrders(
-                advanced_orders_with_tips,
-                generate_criteria_resolvers(
-                    orders=[order_metadata.order for order_metadata in orders_metadata],
-                    offer_criterias=[
-                        order_metadata.offer_criteria
-                        for order_metadata in orders_metadata
-                    ],
-                    consideration_criterias=[
-                        order_metadata.consideration_criteria
-                        for order_metadata in orders_metadata
-                    ],
+        fulfillments_plan = plan_fulfill_orders_fulfillments(
+            chunk_orders_metadata,
+            fulfiller=fulfiller,
+            recipient_address=recipient_address,
+        )
+
+        payable_overrides: TxParams = {
+            "value": Wei(sum(orders_native_amounts[start:end])),
+            "from": fulfiller,
+        }
+
+        if route == FulfillRoute.AVAILABLE:
+            return ExchangeAction(
+                transaction_methods=get_transaction_methods(
+                    seaport_contract.get_function_by_name(FulfillRoute.AVAILABLE.value),
+                    payable_overrides,
+                    data=encode_fulfill_available_orders(
+                        chunk_advanced_orders_with_tips,
+                        fulfillments_plan.offer_fulfillments,
+                        fulfillments_plan.consideration_fulfillments,
+                        conduit_key,
+                        len(chunk_advanced_orders_with_tips),
+                    ),
                 )
-                if has_criteria_items
-                else [],
-                tuple(
-                    [
-                        tuple([(f.orderIndex, f.itemIndex) for f in fulfillment])
-                        for fulfillment in offer_fulfillments
-                    ]
+            )
+
+        criteria_resolvers = (
+            generate_criteria_resolvers(
+                orders=[
+                    order_metadata.order for order_metadata in chunk_orders_metadata
+                ],
+                offer_criterias=[
+                    order_metadata.offer_criteria
+                    for order_metadata in chunk_orders_metadata
+                ],
+                consideration_criterias=[
+                    order_metadata.consideration_criteria
+                    for order_metadata in chunk_orders_metadata
+                ],
+            )
+            if chunk_has_criteria_items
+            else []
+        )
+
+        return ExchangeAction(
+            transaction_methods=get_transaction_methods(
+                seaport_contract.get_function_by_name(
+                    FulfillRoute.AVAILABLE_ADVANCED.value
                 ),
-                tuple(
-                    [
-                        tuple([(f.orderIndex, f.itemIndex) for f in fulfillment])
-                        for fulfillment in consideration_fulfillments
-                    ]
+                payable_overrides,
+                data=encode_fulfill_available_advanced_orders(
+                    chunk_advanced_orders_with_tips,
+                    criteria_resolvers,
+                    fulfillments_plan.offer_fulfillments,
+                    fulfillments_plan.consideration_fulfillments,
+                    conduit_key,
+                    recipient_address,
+                    len(chunk_advanced_orders_with_tips),
                 ),
-                conduit_key,
-                recipient_address,
-                len(advanced_orders_with_tips),
-            ),
-            payable_overrides,
+            )
         )
-    )
 
-    actions = list(chain(approval_actions, [exchange_action]))
+    exchange_actions: list[ExchangeAction] = []
+    start = 0
 
-    return FulfillOrderUseCase(
+    for chunk_size in chunk_sizes or [len(orders_metadata)]:
+        exchange_actions.append(get_exchange_action(start, start + chunk_size))
+        start += chunk_size
+
+    actions = list(chain(approval_actions, exchange_actions))
+
+    return FulfillOrdersUseCase(
         actions=actions,
-        execute_all_actions=lambda: cast(HexBytes, execute_all_actions(actions)),
+        execute_all_actions=lambda: cast(
+            list[HexBytes], execute_all_exchange_actions(actions)
+        ),
     )
 
 
-def generate_fulfill_orders_fulfillments(
+class FulfillOrdersFulfillmentsPlan(BaseModel):
+    """
+    The offer and consideration fulfillments of a fulfillAvailableAdvancedOrders call. Each fulfillment lists
+    the (order index, item index) of the items Seaport aggregates into a single transfer.
+    """
+
+    offer_fulfillments: list[list[FulfillmentComponentTuple]]
+    consideration_fulfillments: list[list[FulfillmentComponentTuple]]
+    # Transfers left once items are aggregated, compared to one transfer per item
+    transfer_count: int
+    item_count: int
+
+
+def plan_fulfill_orders_fulfillments(
     orders_metadata: list[FulfillOrdersMetadata],
-) -> tuple[list[list[FulfillmentComponent]], list[list[FulfillmentComponent]]]:
-    def hash_aggregate_key(
-        source_or_destination: str, token: str, identifier: int, operator=""
-    ):
-        return f"{source_or_destination}-{operator}-{token}-{identifier}"
+    *,
+    fulfiller: Optional[str] = None,
+    recipient_address: str = ADDRESS_ZERO,
+) -> FulfillOrdersFulfillmentsPlan:
+    """
+    Groups the items of the orders into as few transfers as Seaport allows. Offer items are aggregated per offerer and conduit key,
+    and consideration items, including tips, per recipient, so currency paid to the same recipient by many orders is a single transfer.
+    Addresses are compared case insensitively and criteria items by the identifier they resolve to. ERC721 items are never aggregated.
 
-    offer_aggregated_fulfillments: dict[str, list[FulfillmentComponent]] = {}
-    consideration_aggregated_fulfillments: dict[str, list[FulfillmentComponent]] = {}
+    Args:
+        orders_metadata (list[FulfillOrdersMetadata]): the orders to fulfill
+        fulfiller (Optional[str], optional): the account fulfilling the orders. When given, its transfers to itself aren't counted
+        recipient_address (str, optional): where offer items go. Defaults to the zero address which means the fulfiller
+
+    Returns:
+        FulfillOrdersFulfillmentsPlan: the fulfillments along with the predicted number of transfers
+    """
+    offer_aggregated_fulfillments: dict[
+        tuple[TransferKey, str, str, Optional[FulfillmentComponentTuple]],
+        list[FulfillmentComponentTuple],
+    ] = {}
+    consideration_aggregated_fulfillments: dict[
+        tuple[TransferKey, str, Optional[FulfillmentComponentTuple]],
+        list[FulfillmentComponentTuple],
+    ] = {}
+    # The source or destination of every aggregated transfer, to leave out transfers Seaport skips
+    offer_sources: list[str] = []
+    consideration_destinations: list[str] = []
+    item_count = 0
 
     for order_index, order_metadata in enumerate(orders_metadata):
-        item_index_to_criteria = get_item_index_to_criteria_map(
-            order_metadata.order.parameters.offer, order_metadata.offer_criteria
+        parameters = order_metadata.order.parameters
+        offerer = parameters.offerer.lower()
+        conduit_key = parameters.conduitKey.lower()
+        offer_item_index_to_criteria = get_item_index_to_criteria_map(
+            parameters.offer, order_metadata.offer_criteria
+        )
+        consideration_item_index_to_criteria = get_item_index_to_criteria_map(
+            parameters.consideration, order_metadata.consideration_criteria
         )
 
-        for item_index, item in enumerate(order_metadata.order.parameters.offer):
+        for item_index, item in enumerate(parameters.offer):
             aggregate_key = (
-                hash_aggregate_key(
-                    source_or_destination=order_metadata.order.parameters.offerer,
-                    operator=order_metadata.offerer_operator,
-                    token=item.token,
-                    identifier=item_index_to_criteria[item_index].identifier
-                    if item_index in item_index_to_criteria
-                    else item.identifierOrCriteria,
-                )
-                # We tack on the index to ensure that erc721s can never be aggregated and instead must be in separate arrays
-                + (str(item_index) if is_erc721_item(item.itemType) else "")
+                get_transfer_key(item, offer_item_index_to_criteria.get(item_index)),
+                offerer,
+                conduit_key,
+                # Each ERC721 is transferred on its own
+                (order_index, item_index) if is_erc721_item(item.itemType) else None,
             )
 
             if aggregate_key not in offer_aggregated_fulfillments:
                 offer_aggregated_fulfillments[aggregate_key] = []
+                offer_sources.append(offerer)
 
             offer_aggregated_fulfillments[aggregate_key].append(
-                FulfillmentComponent(orderIndex=order_index, itemIndex=item_index)
+                (order_index, item_index)
             )
 
-    for order_index, order_metadata in enumerate(orders_metadata):
-        item_index_to_criteria = get_item_index_to_criteria_map(
-            order_metadata.order.parameters.consideration,
-            order_metadata.consideration_criteria,
-        )
-
         for item_index, item in enumerate(
-            list(
-                chain(
-                    order_metadata.order.parameters.consideration, order_metadata.tips
-                )
-            )
+            chain(parameters.consideration, order_metadata.tips)
         ):
+            recipient = item.recipient.lower()
             aggregate_key = (
-                hash_aggregate_key(
-                    source_or_destination=item.recipient,
-                    token=item.token,
-                    identifier=item_index_to_criteria[item_index].identifier
-                    if item_index in item_index_to_criteria
-                    else item.identifierOrCriteria,
-                )
-                # We tack on the index to ensure that erc721s can never be aggregated and instead must be in separate arrays
-                + (str(item_index) if is_erc721_item(item.itemType) else "")
+                get_transfer_key(
+                    item, consideration_item_index_to_criteria.get(item_index)
+                ),
+                recipient,
+                (order_index, item_index) if is_erc721_item(item.itemType) else None,
             )
 
             if aggregate_key not in consideration_aggregated_fulfillments:
                 consideration_aggregated_fulfillments[aggregate_key] = []
+                consideration_destinations.append(recipient)
 
             consideration_aggregated_fulfillments[aggregate_key].append(
-                FulfillmentComponent(orderIndex=order_index, itemIndex=item_index)
+                (order_index, item_index)
             )
 
-    return (
-        list(offer_aggregated_fulfillments.values()),
-        list(consideration_aggregated_fulfillments.values()),
+        item_count += (
+            len(parameters.offer)
+            + len(parameters.consideration)
+            + len(order_metadata.tips)
+        )
+
+    # Seaport skips transfers whose source and destination are the same
+    offer_destination = (
+        recipient_address if recipient_address != ADDRESS_ZERO else fulfiller
+    )
+    transfer_count = sum(
+        offer_destination is None or source != offer_destination.lower()
+        for source in offer_sources
+    ) + sum(
+        fulfiller is None or destination != fulfiller.lower()
+        for destination in consideration_destinations
+    )
+
+    return FulfillOrdersFulfillmentsPlan(
+        offer_fulfillments=list(offer_aggregated_fulfillments.values()),
+        consideration_fulfillments=list(consideration_aggregated_fulfillments.values()),
+        transfer_count=transfer_count,
+        item_count=item_count,
     )
 
 
+def generate_fulfill_orders_fulfillments(
+    orders_metadata: list[FulfillOrdersMetadata],
+) -> tuple[list[list[FulfillmentComponent]], list[list[FulfillmentComponent]]]:
+    plan = plan_fulfill_orders_fulfillments(orders_metadata)
+
+    def to_fulfillment_components(
+        fulfillments: list[list[FulfillmentComponentTuple]],
+    ) -> list[list[FulfillmentComponent]]:
+        return [
+            [
+                FulfillmentComponent(orderIndex=order_index, itemIndex=item_index)
+                for order_index, item_index in fulfillment
+            ]
+            for fulfillment in fulfillments
+        ]
+
+    return to_fulfillment_components(
+        plan.offer_fulfillments
+    ), to_fulfillment_components(plan.consideration_fulfillments)
+
+
 def validate_and_sanitize_from_order_status(
     order: Order, order_status: OrderStatus
 ) -> Order:
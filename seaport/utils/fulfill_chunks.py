@@ -0,0 +1,65 @@
+from seaport.constants import FulfillRoute
+from seaport.types import (
+    FulfillOrderDetails,
+    FulfillOrdersBudget,
+    FulfillOrdersCostModel,
+    FulfillRouteCostModel,
+)
+from seaport.utils.fulfill_cost import (
+    estimate_fulfill_order_cost,
+    get_fulfill_orders_base_cost,
+)
+
+
+def plan_fulfill_orders_chunks(
+    fulfill_order_details: list[FulfillOrderDetails],
+    budget: FulfillOrdersBudget,
+    cost_model: FulfillOrdersCostModel = FulfillOrdersCostModel(),
+    *,
+    route: FulfillRoute = FulfillRoute.AVAILABLE_ADVANCED,
+    route_cost_model: FulfillRouteCostModel = FulfillRouteCostModel(),
+) -> list[list[FulfillOrderDetails]]:
+    """
+    Splits orders into consecutive chunks, each fulfillable in a single transaction through the route
+    within the budget. Orders keep their order, so earlier orders are fulfilled first.
+
+    Args:
+        fulfill_order_details (list[FulfillOrderDetails]): the orders to fulfill
+        budget (FulfillOrdersBudget): the limits every transaction has to stay within
+        cost_model (FulfillOrdersCostModel, optional): the gas of transfers, criteria proofs and calldata
+        route (FulfillRoute, optional): the route every chunk is fulfilled through. Defaults to fulfillAvailableAdvancedOrders
+        route_cost_model (FulfillRouteCostModel, optional): the fixed and per order gas of each route
+
+    Returns:
+        list[list[FulfillOrderDetails]]: the orders to fulfill in each transaction
+    """
+    base_cost = get_fulfill_orders_base_cost(route, route_cost_model, cost_model)
+    chunks: list[list[FulfillOrderDetails]] = []
+    chunk: list[FulfillOrderDetails] = []
+    chunk_cost = base_cost
+
+    for index, detail in enumerate(fulfill_order_details):
+        order_cost = estimate_fulfill_order_cost(
+            route, detail, route_cost_model, cost_model
+        )
+
+        if not (base_cost + order_cost).is_within(budget):
+            raise ValueError(
+                f"Order at index {index} can't be fulfilled within the budget on its own"
+            )
+
+        if chunk and (
+            not (chunk_cost + order_cost).is_within(budget)
+            or (budget.max_orders is not None and len(chunk) >= budget.max_orders)
+        ):
+            chunks.append(chunk)
+            chunk = []
+            chunk_cost = base_cost
+
+        chunk.append(detail)
+        chunk_cost += order_cost
+
+    if chunk:
+        chunks.append(chunk)
+
+    return chunks
@@ -0,0 +1,286 @@
+from itertools import chain
+
+from pydantic import BaseModel
+from web3.constants import ADDRESS_ZERO, HASH_ZERO
+
+from seaport.constants import FulfillRoute, ItemType, Side
+from seaport.types import (
+    AdditionalRecipient,
+    AdvancedOrder,
+    BasicOrderParameters,
+    ConsiderationItem,
+    CriteriaResolver,
+    FulfillOrderDetails,
+    FulfillOrdersBudget,
+    FulfillOrdersCostModel,
+    FulfillRouteCostModel,
+)
+from seaport.utils.calldata import (
+    encode_advanced_order,
+    encode_criteria_resolver,
+    encode_fulfill_advanced_order,
+    encode_fulfill_available_advanced_orders,
+    encode_fulfill_available_orders,
+    encode_fulfill_basic_order,
+    encode_fulfill_order,
+    encode_fulfillments,
+    encode_order,
+    get_calldata_size,
+)
+from seaport.utils.order import map_input_item_to_offer_item
+from seaport.utils.order_hash import WORD_SIZE
+
+# Calldata of the routes fulfilling many orders without any order: the selector, the head of the arguments
+# and the lengths of the arrays. Orders add to it, along with their offset within the orders array
+EMPTY_FULFILL_ORDERS_CALLDATA_SIZE = {
+    FulfillRoute.AVAILABLE: get_calldata_size(
+        encode_fulfill_available_orders([], [], [], HASH_ZERO, 0)
+    ),
+    FulfillRoute.AVAILABLE_ADVANCED: get_calldata_size(
+        encode_fulfill_available_advanced_orders(
+            [], [], [], [], HASH_ZERO, ADDRESS_ZERO, 0
+        )
+    ),
+}
+# Assumes every item is its own fulfillment: its offset, length and a single component
+FULFILLMENT_SIZE = len(encode_fulfillments([[(0, 0)]])) - len(encode_fulfillments([]))
+
+
+class FulfillOrdersCost(BaseModel):
+    gas: int = 0
+    calldata_bytes: int = 0
+
+    def __add__(self, other: "FulfillOrdersCost") -> "FulfillOrdersCost":
+        return FulfillOrdersCost(
+            gas=self.gas + other.gas,
+            calldata_bytes=self.calldata_bytes + other.calldata_bytes,
+        )
+
+    def is_within(self, budget: FulfillOrdersBudget) -> bool:
+        return (budget.gas is None or self.gas <= budget.gas) and (
+            budget.calldata_bytes is None
+            or self.calldata_bytes <= budget.calldata_bytes
+        )
+
+
+def get_transfer_gas(item_type: ItemType, cost_model: FulfillOrdersCostModel) -> int:
+    if item_type == ItemType.NATIVE:
+        return cost_model.native_transfer_gas
+
+    if item_type == ItemType.ERC20:
+        return cost_model.erc20_transfer_gas
+
+    if item_type in [ItemType.ERC721, ItemType.ERC721_WITH_CRITERIA]:
+        return cost_model.erc721_transfer_gas
+
+    return cost_model.erc1155_transfer_gas
+
+
+def to_advanced_order(fulfill_order_details: FulfillOrderDetails) -> AdvancedOrder:
+    """
+    Returns the order as it is sent to Seaport, with its tips appended to its consideration
+    """
+    order = fulfill_order_details.order
+    tips = [
+        ConsiderationItem(
+            **map_input_item_to_offer_item(tip).dict(),
+            recipient=tip.recipient or order.parameters.offerer,
+        )
+        for tip in fulfill_order_details.tips
+    ]
+
+    return AdvancedOrder(
+        parameters=order.parameters.copy(
+            update={"consideration": list(chain(order.parameters.consideration, tips))}
+        ),
+        numerator=1,
+        denominator=1,
+        signature=order.signature,
+        extraData=fulfill_order_details.extra_data,
+    )
+
+
+def to_criteria_resolvers(
+    fulfill_order_details: FulfillOrderDetails,
+) -> list[CriteriaResolver]:
+    return [
+        CriteriaResolver(
+            orderIndex=0,
+            side=side,
+            index=index,
+            identifier=criteria.identifier,
+            criteriaProof=criteria.proof or [],
+        )
+        for side, criterias in [
+            (Side.OFFER, fulfill_order_details.offer_criteria),
+            (Side.CONSIDERATION, fulfill_order_details.consideration_criteria),
+        ]
+        for index, criteria in enumerate(criterias)
+    ]
+
+
+def to_basic_order_parameters(advanced_order: AdvancedOrder) -> BasicOrderParameters:
+    """
+    Returns basic order parameters laid out like the ones the order is fulfilled with through fulfillBasicOrder.
+    Only their size is meaningful, fields that don't affect it are left out as zeros
+    """
+    parameters = advanced_order.parameters
+    offer_item = parameters.offer[0]
+    for_offerer, *for_additional_recipients = parameters.consideration
+
+    return BasicOrderParameters(
+        considerationToken=for_offerer.token,
+        considerationIdentifier=for_offerer.identifierOrCriteria,
+        considerationAmount=for_offerer.endAmount,
+        offerer=parameters.offerer,
+        zone=parameters.zone,
+        offerToken=offer_item.token,
+        offerIdentifier=offer_item.identifierOrCriteria,
+        offerAmount=offer_item.endAmount,
+        basicOrderType=0,
+        startTime=parameters.startTime,
+        endTime=parameters.endTime,
+        zoneHash=parameters.zoneHash,
+        salt=parameters.salt,
+        offererConduitKey=parameters.conduitKey,
+        fulfillerConduitKey=HASH_ZERO,
+        totalOriginalAdditionalRecipients=len(for_additional_recipients),
+        additionalRecipients=[
+            AdditionalRecipient(amount=item.endAmount, recipient=item.recipient)
+            for item in for_additional_recipients
+        ],
+        signature=advanced_order.signature,
+    )
+
+
+def get_order_calldata_size(
+    route: FulfillRoute, fulfill_order_details: FulfillOrderDetails
+) -> int:
+    """
+    Returns how much fulfilling the order through the route adds to the calldata, measured from its encoding.
+    Routes fulfilling a single order are measured whole. Routes fulfilling many orders grow by the order
+    and its criteria resolvers, each along with its offset, and by a fulfillment per item
+    """
+    advanced_order = to_advanced_order(fulfill_order_details)
+    criteria_resolvers = to_criteria_resolvers(fulfill_order_details)
+    parameters = advanced_order.parameters
+    fulfillments_size = (
+        len(parameters.offer) + len(parameters.consideration)
+    ) * FULFILLMENT_SIZE
+
+    if route == FulfillRoute.BASIC:
+        return get_calldata_size(
+            encode_fulfill_basic_order(to_basic_order_parameters(advanced_order))
+        )
+
+    if route == FulfillRoute.STANDARD:
+        return get_calldata_size(encode_fulfill_order(advanced_order, HASH_ZERO))
+
+    if route == FulfillRoute.ADVANCED:
+        return get_calldata_size(
+            encode_fulfill_advanced_order(
+                advanced_order, criteria_resolvers, HASH_ZERO, ADDRESS_ZERO
+            )
+        )
+
+    if route == FulfillRoute.AVAILABLE:
+        return WORD_SIZE + len(encode_order(advanced_order)) + fulfillments_size
+
+    return (
+        WORD_SIZE
+        + len(encode_advanced_order(advanced_order))
+        + sum(
+            WORD_SIZE + len(encode_criteria_resolver(criteria_resolver))
+            for criteria_resolver in criteria_resolvers
+        )
+        + fulfillments_size
+    )
+
+
+def get_route_calldata_size(
+    route: FulfillRoute, fulfill_order_details: list[FulfillOrderDetails]
+) -> int:
+    """
+    Returns the size of the calldata of the route fulfilling the orders.
+    Fulfillments of the routes fulfilling many orders are assumed to hold a single item each.
+    """
+    return EMPTY_FULFILL_ORDERS_CALLDATA_SIZE.get(route, 0) + sum(
+        get_order_calldata_size(route, detail) for detail in fulfill_order_details
+    )
+
+
+def get_fulfill_orders_base_cost(
+    route: FulfillRoute,
+    route_cost_model: FulfillRouteCostModel,
+    cost_model: FulfillOrdersCostModel,
+) -> FulfillOrdersCost:
+    """
+    Returns the cost of a transaction through the route without any order
+    """
+    calldata_bytes = EMPTY_FULFILL_ORDERS_CALLDATA_SIZE.get(route, 0)
+
+    return FulfillOrdersCost(
+        gas=cost_model.transaction_gas
+        + route_cost_model.fixed_gas[route]
+        + calldata_bytes * cost_model.calldata_byte_gas,
+        calldata_bytes=calldata_bytes,
+    )
+
+
+def estimate_fulfill_order_cost(
+    route: FulfillRoute,
+    fulfill_order_details: FulfillOrderDetails,
+    route_cost_model: FulfillRouteCostModel,
+    cost_model: FulfillOrdersCostModel,
+) -> FulfillOrdersCost:
+    """
+    Estimates what fulfilling an order through the route adds to the cost of the transaction
+
+    Args:
+        route (FulfillRoute): the Seaport entry point to fulfill through
+        fulfill_order_details (FulfillOrderDetails): the order to fulfill along with its criterias and tips
+        route_cost_model (FulfillRouteCostModel): the fixed and per order gas of each route
+        cost_model (FulfillOrdersCostModel): the gas of transfers, criteria proofs and calldata
+
+    Returns:
+        FulfillOrdersCost: the estimated gas, including calldata gas, and calldata size
+    """
+    parameters = fulfill_order_details.order.parameters
+    tips = [map_input_item_to_offer_item(tip) for tip in fulfill_order_details.tips]
+    items = list(chain(parameters.offer, parameters.consideration, tips))
+    criterias = list(
+        chain(
+            fulfill_order_details.offer_criteria,
+            fulfill_order_details.consideration_criteria,
+        )
+    )
+    proof_elements_count = sum(len(criteria.proof or []) for criteria in criterias)
+    calldata_bytes = get_order_calldata_size(route, fulfill_order_details)
+
+    gas = (
+        route_cost_model.order_gas[route]
+        + sum(get_transfer_gas(item.itemType, cost_model) for item in items)
+        + proof_elements_count * cost_model.criteria_proof_element_gas
+        + calldata_bytes * cost_model.calldata_byte_gas
+    )
+
+    return FulfillOrdersCost(gas=gas, calldata_bytes=calldata_bytes)
+
+
+def estimate_fulfill_orders_cost(
+    fulfill_order_details: list[FulfillOrderDetails],
+    cost_model: FulfillOrdersCostModel = FulfillOrdersCostModel(),
+    *,
+    route: FulfillRoute = FulfillRoute.AVAILABLE_ADVANCED,
+    route_cost_model: FulfillRouteCostModel = FulfillRouteCostModel(),
+) -> FulfillOrdersCost:
+    """
+    Estimates the cost of fulfilling all of the orders in a single transaction through the route
+    """
+    return sum(
+        (
+            estimate_fulfill_order_cost(route, detail, route_cost_model, cost_model)
+            for detail in fulfill_order_details
+        ),
+        get_fulfill_orders_base_cost(route, route_cost_model, cost_model),
+    )
@@ -0,0 +1,202 @@
+from itertools import chain
+
+from web3.constants import ADDRESS_ZERO
+from web3.types import TxParams
+
+from seaport.constants import FulfillRoute
+from seaport.types import (
+    FulfillOrderDetails,
+    FulfillOrdersCostModel,
+    FulfillRouteCostModel,
+    FulfillRouteEstimate,
+    TransactionMethods,
+)
+from seaport.utils.fulfill import should_use_basic_fulfill
+from seaport.utils.fulfill_cost import estimate_fulfill_orders_cost
+from seaport.utils.item import is_criteria_item
+
+# Routes fulfilling a single order, which revert when the order can't be fulfilled
+FULFILL_ORDER_ROUTES = [
+    FulfillRoute.BASIC,
+    FulfillRoute.STANDARD,
+    FulfillRoute.ADVANCED,
+]
+# Routes fulfilling many orders, which skip the orders that can't be fulfilled
+FULFILL_ORDERS_ROUTES = [FulfillRoute.AVAILABLE, FulfillRoute.AVAILABLE_ADVANCED]
+
+
+def has_criteria_items(fulfill_order_details: FulfillOrderDetails) -> bool:
+    parameters = fulfill_order_details.order.parameters
+
+    return any(
+        is_criteria_item(item.itemType)
+        for item in chain(parameters.offer, parameters.consideration)
+    )
+
+
+def requires_advanced_fulfill(
+    fulfill_order_details: FulfillOrderDetails, recipient_address: str = ADDRESS_ZERO
+) -> bool:
+    """
+    Returns whether the order can only be fulfilled through an advanced route, which supports partial fills,
+    criteria items, extra data and a recipient other than the fulfiller
+    """
+    return (
+        bool(fulfill_order_details.units_to_fill)
+        or has_criteria_items(fulfill_order_details)
+        or fulfill_order_details.extra_data not in ["", "0x"]
+        or recipient_address != ADDRESS_ZERO
+    )
+
+
+def get_fulfill_order_routes(
+    fulfill_order_details: FulfillOrderDetails,
+    *,
+    recipient_address: str = ADDRESS_ZERO,
+    total_filled: int = 0,
+) -> list[FulfillRoute]:
+    """
+    Returns the routes able to fulfill a single order
+
+    Args:
+        fulfill_order_details (FulfillOrderDetails): the order to fulfill along with its criterias and tips
+        recipient_address (str, optional): where offer items go. Defaults to the zero address which means the fulfiller
+        total_filled (int, optional): how much of the order was already filled
+
+    Returns:
+        list[FulfillRoute]: the valid routes, from the most to the least specialized
+    """
+    if requires_advanced_fulfill(fulfill_order_details, recipient_address):
+        return [FulfillRoute.ADVANCED]
+
+    if should_use_basic_fulfill(fulfill_order_details.order.parameters, total_filled):
+        return list(FULFILL_ORDER_ROUTES)
+
+    return [FulfillRoute.STANDARD, FulfillRoute.ADVANCED]
+
+
+def get_fulfill_orders_routes(
+    fulfill_order_details: list[FulfillOrderDetails],
+    *,
+    recipient_address: str = ADDRESS_ZERO,
+) -> list[FulfillRoute]:
+    """
+    Returns the routes able to fulfill all of the orders in a single transaction.
+    fulfillAvailableOrders is only valid when no order is partially filled or has criteria items.
+    """
+    if any(
+        requires_advanced_fulfill(detail, recipient_address)
+        for detail in fulfill_order_details
+    ):
+        return [FulfillRoute.AVAILABLE_ADVANCED]
+
+    return list(FULFILL_ORDERS_ROUTES)
+
+
+def estimate_fulfill_route(
+    route: FulfillRoute,
+    fulfill_order_details: list[FulfillOrderDetails],
+    route_cost_model: FulfillRouteCostModel = FulfillRouteCostModel(),
+    cost_model: FulfillOrdersCostModel = FulfillOrdersCostModel(),
+) -> FulfillRouteEstimate:
+    """
+    Estimates the cost of fulfilling the orders through the route, without reaching out to the chain.
+    Chunks of orders are planned with the same estimates, see plan_fulfill_orders_chunks
+
+    Args:
+        route (FulfillRoute): the Seaport entry point to fulfill through
+        fulfill_order_details (list[FulfillOrderDetails]): the orders to fulfill along with their criterias and tips
+        route_cost_model (FulfillRouteCostModel, optional): the fixed and per order gas of each route
+        cost_model (FulfillOrdersCostModel, optional): the gas of transfers, criteria proofs and calldata
+
+    Returns:
+        FulfillRouteEstimate: the estimated gas, including calldata gas, and calldata size
+    """
+    cost = estimate_fulfill_orders_cost(
+        fulfill_order_details,
+        cost_model,
+        route=route,
+        route_cost_model=route_cost_model,
+    )
+
+    return FulfillRouteEstimate(
+        route=route, gas=cost.gas, calldata_bytes=cost.calldata_bytes
+    )
+
+
+def estimate_fulfill_routes(
+    routes: list[FulfillRoute],
+    fulfill_order_details: list[FulfillOrderDetails],
+    route_cost_model: FulfillRouteCostModel = FulfillRouteCostModel(),
+    cost_model: FulfillOrdersCostModel = FulfillOrdersCostModel(),
+) -> list[FulfillRouteEstimate]:
+    """
+    Estimates every route, cheapest first. Routes estimated at the same gas keep their order
+    """
+    return sorted(
+        (
+            estimate_fulfill_route(
+                route, fulfill_order_details, route_cost_model, cost_model
+            )
+            for route in routes
+        ),
+        key=lambda estimate: estimate.gas,
+    )
+
+
+class FulfillRouteCalibration:
+    """
+    Gas of fulfillments recorded on a local chain, used to calibrate the static route cost model.
+    The fixed gas of each route is shifted by the average difference between what was recorded and estimated.
+    """
+
+    def __init__(
+        self,
+        route_cost_model: FulfillRouteCostModel = FulfillRouteCostModel(),
+        cost_model: FulfillOrdersCostModel = FulfillOrdersCostModel(),
+    ):
+        self.route_cost_model = route_cost_model
+        self.cost_model = cost_model
+        self._differences: dict[FulfillRoute, list[int]] = {}
+
+    def record(
+        self,
+        route: FulfillRoute,
+        fulfill_order_details: list[FulfillOrderDetails],
+        gas: int,
+    ):
+        estimate = estimate_fulfill_route(
+            route, fulfill_order_details, self.route_cost_model, self.cost_model
+        )
+        self._differences.setdefault(route, []).append(gas - estimate.gas)
+
+    def record_estimate_gas(
+        self,
+        route: FulfillRoute,
+        fulfill_order_details: list[FulfillOrderDetails],
+        transaction_methods: TransactionMethods,
+        transaction: TxParams = {},
+    ) -> int:
+        """
+        Records the gas the node estimates for the transaction fulfilling the orders through the route
+
+        Returns:
+            int: the estimated gas
+        """
+        gas = transaction_methods.estimate_gas(transaction)
+        self.record(route, fulfill_order_details, gas)
+
+        return gas
+
+    def get_route_cost_model(self) -> FulfillRouteCostModel:
+        fixed_gas = {
+            route: gas
+            + (
+                round(sum(self._differences[route]) / len(self._differences[route]))
+                if route in self._differences
+                else 0
+            )
+            for route, gas in self.route_cost_model.fixed_gas.items()
+        }
+
+        return self.route_cost_model.copy(update={"fixed_gas": fixed_gas})
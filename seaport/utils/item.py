@@ -191,13 +191,20 @@ def generate_criteria_resolvers(
         for i, (order_index, item, index, side) in enumerate(criteria_items):
             merkle_root = item.identifierOrCriteria or 0
             input_criteria = criterias[order_index][i]
+            criteria_proof = [] if merkle_root == 0 else input_criteria.proof
+
+            if criteria_proof is None:
+                raise ValueError(
+                    f"The criteria of identifier {input_criteria.identifier} has no proof for {hex(merkle_root)}"
+                )
+
             criteria_resolvers.append(
                 CriteriaResolver(
                     orderIndex=order_index,
                     side=side,
                     index=index,
                     identifier=input_criteria.identifier,
-                    criteriaProof=[] if merkle_root == 0 else input_criteria.proof,
+                    criteriaProof=criteria_proof,
                 )
             )
 
@@ -212,6 +219,29 @@ def generate_criteria_resolvers(
     return criteria_resolvers
 
 
+# Item type, lowercased token and identifier items are transferred by
+TransferKey = tuple[ItemType, str, int]
+
+
+def get_transfer_key(item: Item, criteria: Optional[InputCriteria]) -> TransferKey:
+    """
+    Returns what an item transfers, which items aggregated into a single transfer have to share.
+    Criteria items transfer the identifier they resolve to, as the item type they resolve to.
+    """
+    item_type = item.itemType
+
+    if item_type == ItemType.ERC721_WITH_CRITERIA:
+        item_type = ItemType.ERC721
+    elif item_type == ItemType.ERC1155_WITH_CRITERIA:
+        item_type = ItemType.ERC1155
+
+    return (
+        item_type,
+        item.token.lower(),
+        criteria.identifier if criteria else item.identifierOrCriteria,
+    )
+
+
 def get_item_index_to_criteria_map(
     items: Sequence[Item], criterias: list[InputCriteria]
 ):
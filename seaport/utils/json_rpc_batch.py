@@ -0,0 +1,179 @@
+import json
+from typing import Any, Optional, cast
+
+from web3 import HTTPProvider, Web3
+from web3._utils.request import make_post_request
+from web3.contract import ContractFunction
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+from web3.types import BlockIdentifier
+
+from seaport.utils.batch import chunked
+from seaport.utils.hex_utils import bytes_to_hex
+from seaport.utils.multicall import (
+    Multicall,
+    decode_contract_function_result,
+    encode_contract_function_data,
+)
+
+# Most hosted providers cap batches somewhere between 100 and 1000 requests
+DEFAULT_JSON_RPC_BATCH_SIZE = 100
+
+
+def to_block_param(block_identifier: BlockIdentifier) -> Any:
+    if isinstance(block_identifier, int):
+        return hex(block_identifier)
+
+    if isinstance(block_identifier, bytes):
+        return {"blockHash": bytes_to_hex(block_identifier)}
+
+    return block_identifier
+
+
+class JsonRpcBatch:
+    """
+    Sends contract reads as JSON-RPC batch requests so many eth_calls share a single HTTP round trip.
+    Reads that error resolve to None instead of failing the whole batch.
+    """
+
+    web3: Web3
+    calls: list[ContractFunction]
+    batch_size: int
+
+    def __init__(self, web3: Web3, batch_size: int = DEFAULT_JSON_RPC_BATCH_SIZE):
+        if not isinstance(web3.provider, HTTPProvider):
+            raise TypeError("JSON-RPC batch requests require an HTTPProvider")
+
+        self.web3 = web3
+        self.calls = []
+        self.batch_size = batch_size
+
+    def add(self, contract_fn: ContractFunction) -> int:
+        """
+        Queues a contract read
+
+        Args:
+            contract_fn (ContractFunction): the bound contract function to call
+
+        Returns:
+            int: the index of the result in the list returned by execute
+        """
+        self.calls.append(contract_fn)
+
+        return len(self.calls) - 1
+
+    def execute(
+        self, block_identifier: BlockIdentifier = "latest"
+    ) -> list[Optional[Any]]:
+        """
+        Executes all queued reads, sending one batch request per chunk of batch_size reads
+
+        Args:
+            block_identifier (BlockIdentifier, optional): the block to read at. Defaults to "latest".
+
+        Returns:
+            list[Optional[Any]]: the decoded result of every queued read, or None if the read failed
+        """
+        block_param = to_block_param(block_identifier)
+        results: list[Optional[Any]] = []
+
+        for calls in chunked(self.calls, self.batch_size):
+            responses = self._send(
+                [
+                    {
+                        "jsonrpc": "2.0",
+                        "id": request_id,
+                        "method": "eth_call",
+                        "params": [
+                            {
+                                "to": contract_fn.address,
+                                "data": encode_contract_function_data(contract_fn),
+                            },
+                            block_param,
+                        ],
+                    }
+                    for request_id, contract_fn in enumerate(calls)
+                ]
+            )
+
+            for request_id, contract_fn in enumerate(calls):
+                response = responses.get(request_id)
+
+                if response is None or "result" not in response:
+                    results.append(None)
+                    continue
+
+                results.append(
+                    decode_contract_function_result(
+                        self.web3,
+                        contract_fn,
+                        bytes.fromhex(response["result"][2:]),
+                    )
+                )
+
+        return results
+
+    def _send(self, requests: list[dict]) -> dict[int, dict]:
+        provider = cast(HTTPProvider, self.web3.provider)
+
+        raw_response = make_post_request(
+            provider.endpoint_uri,
+            json.dumps(requests).encode("utf-8"),
+            **dict(provider.get_request_kwargs()),
+        )
+        response = json.loads(raw_response)
+
+        # Providers without batch support answer with a single error object
+        if not isinstance(response, list):
+            raise ValueError(
+                f"The provider rejected the JSON-RPC batch request: {response.get('error', response)}"
+            )
+
+        # Batch responses may come back in any order
+        return {item["id"]: item for item in response}
+
+
+def batch_call(
+    web3: Web3,
+    contract_fns: list[ContractFunction],
+    *,
+    multicall_address: Optional[str] = None,
+    json_rpc_batch_size: int = DEFAULT_JSON_RPC_BATCH_SIZE,
+    block_identifier: BlockIdentifier = "latest",
+) -> list[Optional[Any]]:
+    """
+    Executes many contract reads with as few round trips as the provider allows.
+    Reads are aggregated through Multicall3 if a multicall address is given, otherwise sent as
+    JSON-RPC batches over HTTP, falling back to one eth_call per read for other providers.
+
+    Args:
+        web3 (Web3): web3 instance
+        contract_fns (list[ContractFunction]): the bound contract functions to call
+        multicall_address (Optional[str], optional): Multicall3 deployment to aggregate reads through. Defaults to None.
+        json_rpc_batch_size (int, optional): max number of reads per JSON-RPC batch. Defaults to 100.
+        block_identifier (BlockIdentifier, optional): the block to read at. Defaults to "latest".
+
+    Returns:
+        list[Optional[Any]]: the decoded result of every read in order, or None if the read failed
+    """
+    if not contract_fns:
+        return []
+
+    if multicall_address:
+        batch: Any = Multicall(web3, multicall_address)
+    elif isinstance(web3.provider, HTTPProvider):
+        batch = JsonRpcBatch(web3, json_rpc_batch_size)
+    else:
+        results: list[Optional[Any]] = []
+
+        for contract_fn in contract_fns:
+            try:
+                results.append(contract_fn.call(block_identifier=block_identifier))
+            except (BadFunctionCallOutput, ContractLogicError, ValueError):
+                results.append(None)
+
+        return results
+
+    for contract_fn in contract_fns:
+        batch.add(contract_fn)
+
+    return batch.execute(block_identifier)
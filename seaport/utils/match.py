@@ -0,0 +1,243 @@
+from itertools import chain
+from typing import Sequence, cast
+
+from hexbytes import HexBytes
+from web3.contract import Contract
+from web3.types import TxParams, Wei
+
+from seaport.constants import Side
+from seaport.types import (
+    ApprovalAction,
+    CriteriaResolver,
+    ExchangeAction,
+    Fulfillment,
+    FulfillmentComponent,
+    FulfillOrderUseCase,
+    MatchOrderDetails,
+)
+from seaport.utils.item import (
+    TransferKey,
+    get_item_index_to_criteria_map,
+    get_transfer_key,
+    is_criteria_item,
+    is_native_currency_item,
+)
+from seaport.utils.usecase import execute_all_actions, get_transaction_methods
+
+
+class _AggregatedItems:
+    """
+    Items transferred together by a fulfillment, along with the amount left to transfer.
+    Once aggregated items are used, Seaport zeroes them and writes what is left back to the first one,
+    so later fulfillments only need to reference that first component.
+    """
+
+    def __init__(self):
+        self.components: list[FulfillmentComponent] = []
+        self.amount = 0
+        self._used = False
+
+    def add(self, component: FulfillmentComponent, amount: int):
+        self.components.append(component)
+        self.amount += amount
+
+    def use(self) -> list[FulfillmentComponent]:
+        components = self.components[:1] if self._used else self.components
+        self._used = True
+
+        return components
+
+
+def generate_match_orders_fulfillments(
+    orders_details: Sequence[MatchOrderDetails],
+) -> list[Fulfillment]:
+    """
+    Pairs offer items with the consideration items they can pay for, aggregating offer items of the same offerer and conduit
+    and consideration items of the same recipient. Items are indexed by what they transfer, so matching is linear in the number of items.
+    Offer items are counted at their lowest and consideration items at their highest amount, so ascending and descending amounts
+    stay matched whenever the transaction lands. Offer items left over go to the caller.
+
+    Args:
+        orders_details (Sequence[MatchOrderDetails]): the orders to match along with their criterias
+
+    Returns:
+        list[Fulfillment]: the fulfillments to pass to matchOrders or matchAdvancedOrders
+    """
+    offers_by_key: dict[TransferKey, list[_AggregatedItems]] = {}
+    offers_by_source: dict[tuple[TransferKey, str, str], _AggregatedItems] = {}
+    considerations_by_destination: dict[tuple[TransferKey, str], _AggregatedItems] = {}
+
+    for order_index, detail in enumerate(orders_details):
+        parameters = detail.order.parameters
+        offer_item_index_to_criteria = get_item_index_to_criteria_map(
+            parameters.offer, detail.offer_criteria
+        )
+        consideration_item_index_to_criteria = get_item_index_to_criteria_map(
+            parameters.consideration, detail.consideration_criteria
+        )
+
+        for item_index, item in enumerate(parameters.offer):
+            key = get_transfer_key(item, offer_item_index_to_criteria.get(item_index))
+            source = (key, parameters.offerer.lower(), parameters.conduitKey.lower())
+
+            if source not in offers_by_source:
+                offers_by_source[source] = _AggregatedItems()
+                offers_by_key.setdefault(key, []).append(offers_by_source[source])
+
+            offers_by_source[source].add(
+                FulfillmentComponent(orderIndex=order_index, itemIndex=item_index),
+                min(item.startAmount, item.endAmount),
+            )
+
+        for item_index, item in enumerate(parameters.consideration):
+            destination = (
+                get_transfer_key(
+                    item, consideration_item_index_to_criteria.get(item_index)
+                ),
+                item.recipient.lower(),
+            )
+
+            considerations_by_destination.setdefault(
+                destination, _AggregatedItems()
+            ).add(
+                FulfillmentComponent(orderIndex=order_index, itemIndex=item_index),
+                max(item.startAmount, item.endAmount),
+            )
+
+    fulfillments: list[Fulfillment] = []
+    # Offers of a key are used up in order, so exhausted ones are only skipped once
+    offer_cursors: dict[TransferKey, int] = {}
+
+    for (key, _), considerations in considerations_by_destination.items():
+        offers = offers_by_key.get(key, [])
+
+        while considerations.amount > 0:
+            cursor = offer_cursors.get(key, 0)
+
+            while cursor < len(offers) and offers[cursor].amount == 0:
+                cursor += 1
+
+            offer_cursors[key] = cursor
+
+            if cursor == len(offers):
+                component = considerations.components[0]
+                raise ValueError(
+                    f"Consideration item {component.itemIndex} of order {component.orderIndex} can't be met by the offers of the orders"
+                )
+
+            offer = offers[cursor]
+            amount = min(offer.amount, considerations.amount)
+
+            fulfillments.append(
+                Fulfillment(
+                    offerComponents=offer.use(),
+                    considerationComponents=considerations.use(),
+                )
+            )
+
+            offer.amount -= amount
+            considerations.amount -= amount
+
+    return fulfillments
+
+
+def get_match_orders_criteria_resolvers(
+    orders_details: Sequence[MatchOrderDetails],
+) -> list[CriteriaResolver]:
+    criteria_resolvers: list[CriteriaResolver] = []
+
+    for order_index, detail in enumerate(orders_details):
+        for side, items, criterias in (
+            (Side.OFFER, detail.order.parameters.offer, detail.offer_criteria),
+            (
+                Side.CONSIDERATION,
+                detail.order.parameters.consideration,
+                detail.consideration_criteria,
+            ),
+        ):
+            item_index_to_criteria = get_item_index_to_criteria_map(items, criterias)
+
+            if len(item_index_to_criteria) != sum(
+                is_criteria_item(item.itemType) for item in items
+            ):
+                raise ValueError(
+                    "You must supply the appropriate criterias for criteria based items"
+                )
+
+            for item_index, criteria in item_index_to_criteria.items():
+                criteria_resolvers.append(
+                    CriteriaResolver(
+                        orderIndex=order_index,
+                        side=side,
+                        index=item_index,
+                        identifier=criteria.identifier,
+                        # Collection wide criteria don't need a proof
+                        criteriaProof=[]
+                        if items[item_index].identifierOrCriteria == 0
+                        else criteria.proof or [],
+                    )
+                )
+
+    return criteria_resolvers
+
+
+def match_advanced_orders(
+    *,
+    orders_details: Sequence[MatchOrderDetails],
+    seaport_contract: Contract,
+    fulfiller: str,
+    approval_actions: list[ApprovalAction],
+) -> FulfillOrderUseCase:
+    """
+    Matches the orders against each other in a single matchAdvancedOrders transaction.
+    Orders offered by the fulfiller don't need to be signed, and their native offer items are paid with the transaction value.
+    """
+    fulfillments = generate_match_orders_fulfillments(orders_details)
+    criteria_resolvers = get_match_orders_criteria_resolvers(orders_details)
+
+    advanced_orders = [
+        {
+            **detail.order.dict(),
+            "numerator": 1,
+            "denominator": 1,
+            "extraData": detail.extra_data,
+        }
+        for detail in orders_details
+    ]
+
+    native_amount = sum(
+        max(item.startAmount, item.endAmount)
+        for detail in orders_details
+        if detail.order.parameters.offerer.lower() == fulfiller.lower()
+        for item in detail.order.parameters.offer
+        if is_native_currency_item(item.itemType)
+    )
+
+    payable_overrides: TxParams = {"value": Wei(native_amount), "from": fulfiller}
+
+    exchange_action = ExchangeAction(
+        transaction_methods=get_transaction_methods(
+            seaport_contract.functions.matchAdvancedOrders(
+                advanced_orders,
+                [resolver.dict() for resolver in criteria_resolvers],
+                [
+                    (
+                        [(c.orderIndex, c.itemIndex) for c in f.offerComponents],
+                        [
+                            (c.orderIndex, c.itemIndex)
+                            for c in f.considerationComponents
+                        ],
+                    )
+                    for f in fulfillments
+                ],
+            ),
+            payable_overrides,
+        )
+    )
+
+    actions = list(chain(approval_actions, [exchange_action]))
+
+    return FulfillOrderUseCase(
+        actions=actions,
+        execute_all_actions=lambda: cast(HexBytes, execute_all_actions(actions)),
+    )
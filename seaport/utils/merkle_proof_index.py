@@ -0,0 +1,207 @@
+import mmap
+import os
+import struct
+import tempfile
+from bisect import bisect_left
+from pathlib import Path
+from typing import Union
+
+from seaport.utils.hex_utils import bytes_to_hex
+from seaport.utils.merkletree import WORD_SIZE, MerkleTree, hash_identifier
+
+MAGIC = b"SPMT"
+FORMAT_VERSION = 1
+# Magic, format version and leaf count
+HEADER = struct.Struct(">4sIQ")
+FILE_EXTENSION = ".merkle"
+# mkstemp creates files only readable by their owner, stored trees are readable by everyone like any other file
+FILE_MODE = 0o644
+
+PathLike = Union[str, os.PathLike]
+
+
+def get_layer_sizes(leaf_count: int) -> list[int]:
+    """
+    Returns the number of nodes of every layer of a criteria tree, from the leaves up to the root.
+    Odd layers carry their last node over, so every layer is half of the previous one rounded up.
+    """
+    layer_sizes = [leaf_count]
+
+    while layer_sizes[-1] > 1:
+        layer_sizes.append((layer_sizes[-1] + 1) // 2)
+
+    return layer_sizes
+
+
+def get_merkle_tree_path(directory: PathLike, root: Union[bytes, int]) -> Path:
+    """
+    Returns where the tree with the given root is stored within a directory
+    """
+    root_bytes = root.to_bytes(WORD_SIZE, "big") if isinstance(root, int) else root
+
+    return Path(directory) / f"{root_bytes.hex()}{FILE_EXTENSION}"
+
+
+def write_merkle_tree(tree: MerkleTree, directory: PathLike) -> Path:
+    """
+    Stores every layer of a criteria tree contiguously in a file named after its root, so that
+    proofs can later be read through a MerkleProofIndex without rebuilding the tree.
+    The file is written to a temporary path first and then moved into place, so readers never see a partial tree.
+
+    Args:
+        tree (MerkleTree): the criteria tree to store
+        directory (PathLike): the directory to store the tree in
+
+    Returns:
+        Path: the path of the stored tree
+    """
+    if not tree.elements:
+        raise ValueError("Can't store a tree without any identifiers")
+
+    path = get_merkle_tree_path(directory, tree.get_root())
+    file_descriptor, temporary_path = tempfile.mkstemp(
+        dir=directory, suffix=FILE_EXTENSION
+    )
+
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(tree.elements)))
+
+            for layer in tree.get_layers():
+                file.write(b"".join(layer))
+
+        os.chmod(temporary_path, FILE_MODE)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+    return path
+
+
+class _Leaves:
+    """
+    Read only sequence over the sorted leaves of a mapped tree, so they can be binary searched in place
+    """
+
+    def __init__(self, buffer: mmap.mmap, leaf_count: int):
+        self.buffer = buffer
+        self.leaf_count = leaf_count
+
+    def __len__(self) -> int:
+        return self.leaf_count
+
+    def __getitem__(self, index: int) -> bytes:
+        offset = HEADER.size + index * WORD_SIZE
+
+        return self.buffer[offset : offset + WORD_SIZE]
+
+
+class MerkleProofIndex:
+    """
+    Criteria tree stored by write_merkle_tree and memory mapped read only. Proofs are O(log n) slice reads:
+    the leaf is found by binary search over the sorted leaves, then one sibling is read per layer.
+    Pages of the file are shared through the OS page cache, so many worker processes can map the same tree,
+    and indexes pickle by path so they can be sent to process pools.
+    """
+
+    path: Path
+    leaf_count: int
+    layer_offsets: list[int]
+    layer_sizes: list[int]
+
+    def __init__(self, path: PathLike):
+        self.path = Path(path)
+
+        with open(self.path, "rb") as file:
+            self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._read_layout()
+        except BaseException:
+            self._buffer.close()
+            raise
+
+        self._leaves = _Leaves(self._buffer, self.leaf_count)
+
+    def _read_layout(self):
+        if len(self._buffer) < HEADER.size:
+            raise ValueError(f"{self.path} is not a stored Merkle tree")
+
+        magic, format_version, leaf_count = HEADER.unpack_from(self._buffer)
+
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            raise ValueError(f"{self.path} is not a stored Merkle tree")
+
+        self.leaf_count = leaf_count
+        self.layer_sizes = get_layer_sizes(leaf_count)
+        self.layer_offsets = []
+
+        offset = HEADER.size
+        for layer_size in self.layer_sizes:
+            self.layer_offsets.append(offset)
+            offset += layer_size * WORD_SIZE
+
+        if len(self._buffer) != offset:
+            raise ValueError(f"{self.path} is truncated")
+
+    @classmethod
+    def open(cls, directory: PathLike, root: Union[bytes, int]) -> "MerkleProofIndex":
+        """
+        Opens the tree with the given root from a directory populated by write_merkle_tree
+        """
+        return cls(get_merkle_tree_path(directory, root))
+
+    def __reduce__(self):
+        return (self.__class__, (self.path,))
+
+    def __enter__(self) -> "MerkleProofIndex":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        self._buffer.close()
+
+    def _read_node(self, layer: int, index: int) -> bytes:
+        offset = self.layer_offsets[layer] + index * WORD_SIZE
+
+        return self._buffer[offset : offset + WORD_SIZE]
+
+    def get_root(self) -> bytes:
+        return self._read_node(len(self.layer_sizes) - 1, 0)
+
+    def get_root_as_int(self) -> int:
+        return int.from_bytes(self.get_root(), "big")
+
+    def get_proof(self, identifier: int) -> list[str]:
+        return list(map(bytes_to_hex, self.get_proof_bytes(identifier)))
+
+    def get_proof_bytes(self, identifier: int) -> list[bytes]:
+        """
+        Same as get_proof, but returns the raw 32 byte proof elements
+        """
+        leaf = hash_identifier(identifier)
+        index = bisect_left(self._leaves, leaf)
+
+        if index == self.leaf_count or self._leaves[index] != leaf:
+            return []
+
+        proof = []
+
+        for layer, layer_size in enumerate(self.layer_sizes):
+            pair_index = index ^ 1
+
+            if pair_index < layer_size:
+                proof.append(self._read_node(layer, pair_index))
+
+            index >>= 1
+
+        return proof
+
+    def get_proofs(self, identifiers: list[int]) -> list[list[str]]:
+        """
+        Returns the hex encoded proofs of many identifiers, empty for identifiers not in the tree
+        """
+        return list(map(self.get_proof, identifiers))
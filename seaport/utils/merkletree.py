@@ -1,25 +1,123 @@
-from web3 import Web3
+from bisect import bisect_left
+from concurrent.futures import Executor
+from itertools import chain
+from typing import Iterable, Optional
+
+from eth_hash.auto import keccak
+from web3.constants import ADDRESS_ZERO, HASH_ZERO
+
+from seaport.constants import BULK_ORDER_MAX_HEIGHT, OrderType
+from seaport.types import OrderComponents
+from seaport.utils.batch import map_chunks
+from seaport.utils.hex_utils import bytes_to_hex
+from seaport.utils.order_hash import get_bulk_order_type_hash, hash_order_components
+from seaport.utils.signature import BULK_ORDER_INDEX_LENGTH, to_compact_signature
+
+# Bulk order trees are padded with the EIP-712 default value of OrderComponents
+EMPTY_ORDER_COMPONENTS = OrderComponents(
+    offerer=ADDRESS_ZERO,
+    zone=ADDRESS_ZERO,
+    orderType=OrderType.FULL_OPEN,
+    startTime=0,
+    endTime=0,
+    salt=0,
+    offer=[],
+    consideration=[],
+    zoneHash=HASH_ZERO,
+    totalOriginalConsiderationItems=0,
+    conduitKey=HASH_ZERO,
+    counter=0,
+)
+EMPTY_ORDER_HASH = hash_order_components(EMPTY_ORDER_COMPONENTS)
+
+WORD_SIZE = 32
+DEFAULT_CHUNK_SIZE = 10_000
+DEFAULT_REBUILD_THRESHOLD = 0.5
+
+
+def hash_identifier(identifier: int) -> bytes:
+    """
+    Hashes a token identifier into a criteria tree leaf, the keccak of the identifier as a 32 byte word
+    """
+    return keccak(identifier.to_bytes(WORD_SIZE, "big"))
+
+
+def hash_identifiers(identifiers: list[int]) -> list[bytes]:
+    # Runs inside worker processes, so it must stay a picklable module level function
+    return list(map(hash_identifier, identifiers))
+
+
+def hash_identifiers_in_chunks(
+    identifiers: Iterable[int],
+    *,
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+) -> list[bytes]:
+    """
+    Hashes many token identifiers into criteria tree leaves. Hashing happens serially in the current process
+    unless an executor or more than one worker is requested, in which case identifiers are hashed across processes in chunks.
+
+    Args:
+        identifiers (Iterable[int]): the token identifiers to hash
+        max_workers (Optional[int], optional): number of worker processes to spawn. Defaults to hashing serially.
+        chunk_size (int, optional): number of identifiers sent to a worker at a time. Defaults to 10000.
+        executor (Optional[Executor], optional): an existing executor to reuse instead of spawning a process pool.
+
+    Returns:
+        list[bytes]: the 32 byte leaves, in the same order as the input
+    """
+    return map_chunks(
+        hash_identifiers,
+        identifiers,
+        max_workers=max_workers,
+        chunk_size=chunk_size,
+        executor=executor,
+    )
+
+
+def hash_sorted_pair(first: bytes, second: bytes) -> bytes:
+    """
+    Hashes two nodes of a criteria tree in sorted order, the same way the contract verifies proofs
+    """
+    return keccak(first + second) if first <= second else keccak(second + first)
 
 
 class MerkleTree:
     elements: list[bytes]
     element_to_index: dict[bytes, int]
+    _layers: Optional[list[list[bytes]]] = None
 
-    def __init__(self, identifiers: list[int]):
+    def __init__(
+        self,
+        identifiers: list[int],
+        *,
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Builds a criteria tree out of token identifiers. Leaves are hashed serially unless an executor
+        or more than one worker is requested, in which case they are hashed across processes in chunks.
+
+        Args:
+            identifiers (list[int]): the token identifiers of the tree
+            max_workers (Optional[int], optional): number of worker processes to hash leaves with. Defaults to hashing serially.
+            chunk_size (int, optional): number of identifiers sent to a worker at a time. Defaults to 10000.
+            executor (Optional[Executor], optional): an existing executor to reuse instead of spawning a process pool.
+        """
         self.identifiers = identifiers
-        sorted_identifiers = sorted(
-            map(
-                lambda identifier: self._hash_identifier(identifier),
-                identifiers,
+        elements = sorted(
+            set(
+                hash_identifiers_in_chunks(
+                    identifiers,
+                    max_workers=max_workers,
+                    chunk_size=chunk_size,
+                    executor=executor,
+                )
             )
         )
 
-        elements = [
-            identifier
-            for index, identifier in enumerate(sorted_identifiers)
-            if index == 0 or sorted_identifiers[index - 1] != identifier
-        ]
-
         self.element_to_index = {
             element: index for index, element in enumerate(elements)
         }
@@ -27,16 +125,137 @@ class MerkleTree:
         self.elements = elements
 
     def _hash_identifier(self, identifier: int) -> bytes:
-        return Web3.solidityKeccak(
-            abi_types=["bytes"], values=[bytes.fromhex(hex(identifier)[2:].zfill(64))]
-        )
+        return hash_identifier(identifier)
 
     def get_identifiers(self) -> list[int]:
         return self.identifiers
 
+    def get_layers(self) -> list[list[bytes]]:
+        """
+        Returns every layer of the tree, from the sorted leaves up to the root.
+        Layers are built on first use and cached. Updates keep them in sync, see update.
+        """
+        if self._layers is None:
+            self._layers = self._get_layers(self.elements)
+
+        return self._layers
+
+    def insert(self, identifiers: Iterable[int]):
+        """
+        Adds identifiers to the tree. See update.
+        """
+        self.update(insert=identifiers)
+
+    def remove(self, identifiers: Iterable[int]):
+        """
+        Removes identifiers from the tree. See update.
+        """
+        self.update(remove=identifiers)
+
+    def update(
+        self,
+        *,
+        insert: Iterable[int] = (),
+        remove: Iterable[int] = (),
+        rebuild_threshold: float = DEFAULT_REBUILD_THRESHOLD,
+    ):
+        """
+        Inserts and removes identifiers, leaving the tree identical to a fresh build of the resulting identifiers.
+        Leaves stay sorted, so every leaf after the first changed position shifts, and only the nodes covering
+        shifted leaves are recomputed. If more than rebuild_threshold of the leaves shift, the cached layers are
+        dropped instead and rebuilt on the next read, so a burst of large updates only pays for one rebuild.
+
+        Args:
+            insert (Iterable[int], optional): identifiers to add. Identifiers already in the tree are ignored.
+            remove (Iterable[int], optional): identifiers to remove. Identifiers not in the tree are ignored.
+            rebuild_threshold (float, optional): fraction of shifted leaves above which layers are rebuilt. Defaults to 0.5.
+        """
+        # Removals apply first, so identifiers that are both removed and inserted stay in the tree
+        inserted_identifiers = {
+            identifier: self._hash_identifier(identifier) for identifier in insert
+        }
+        removed_identifiers = set(remove) - inserted_identifiers.keys()
+
+        removed_elements = {
+            element
+            for element in map(self._hash_identifier, removed_identifiers)
+            if element in self.element_to_index
+        }
+        new_identifiers = [
+            identifier
+            for identifier, element in inserted_identifiers.items()
+            if element not in self.element_to_index
+        ]
+        inserted_elements = {
+            inserted_identifiers[identifier] for identifier in new_identifiers
+        }
+
+        self.identifiers = [
+            identifier
+            for identifier in self.identifiers
+            if identifier not in removed_identifiers
+        ] + new_identifiers
+
+        if not inserted_elements and not removed_elements:
+            return
+
+        elements = self.elements
+        first_changed_index = min(
+            chain(
+                (bisect_left(elements, element) for element in inserted_elements),
+                (self.element_to_index[element] for element in removed_elements),
+            )
+        )
+        shifted_elements = sorted(
+            chain(
+                (
+                    element
+                    for element in elements[first_changed_index:]
+                    if element not in removed_elements
+                ),
+                inserted_elements,
+            )
+        )
+
+        for element in removed_elements:
+            del self.element_to_index[element]
+        for index, element in enumerate(shifted_elements, first_changed_index):
+            self.element_to_index[element] = index
+
+        self.elements = elements[:first_changed_index] + shifted_elements
+
+        if self._layers is None:
+            return
+
+        if len(shifted_elements) > rebuild_threshold * len(self.elements):
+            self._layers = None
+            return
+
+        self._layers = self._get_updated_layers(self._layers, first_changed_index)
+
+    def _get_updated_layers(
+        self, layers: list[list[bytes]], first_changed_index: int
+    ) -> list[list[bytes]]:
+        updated_layers = [self.elements[:]]
+        level = 0
+
+        while len(updated_layers[-1]) > 1:
+            level += 1
+            # Nodes before the first changed one only cover unchanged leaves, so they are reused
+            first_changed_node = first_changed_index >> level
+            reused_nodes = (
+                layers[level][:first_changed_node] if level < len(layers) else []
+            )
+
+            updated_layers.append(
+                reused_nodes
+                + self._get_next_layer(updated_layers[-1][first_changed_node * 2 :])
+            )
+
+        return updated_layers
+
     def get_root(self) -> bytes:
-        layers = self._get_layers(self.elements)
-        layer = layers[-1]
+        layer = self.get_layers()[-1]
 
         return layer[0] if layer else bytes()
 
@@ -44,45 +263,72 @@ class MerkleTree:
         return int.from_bytes(self.get_root(), "big")
 
     def get_proof(self, identifier: int) -> list[str]:
-        proofs = []
-        element = self._hash_identifier(identifier)
+        return list(map(bytes_to_hex, self.get_proof_bytes(identifier)))
 
-        if element not in self.element_to_index:
-            return proofs
+    def get_proof_bytes(self, identifier: int) -> list[bytes]:
+        """
+        Same as get_proof, but returns the raw 32 byte proof elements
+        """
+        return self.get_proofs_bytes([identifier])[0]
 
-        layers = self._get_layers(self.elements)
+    def get_proofs(self, identifiers: list[int]) -> list[list[str]]:
+        """
+        Returns the proofs of many identifiers, walking the cached layers once for all of them
 
-        index_of_element = self.element_to_index[element]
+        Args:
+            identifiers (list[int]): the identifiers to prove
+
+        Returns:
+            list[list[str]]: the hex encoded proof of every identifier, empty for identifiers not in the tree
+        """
+        return [
+            list(map(bytes_to_hex, proof))
+            for proof in self.get_proofs_bytes(identifiers)
+        ]
+
+    def get_proofs_bytes(self, identifiers: list[int]) -> list[list[bytes]]:
+        """
+        Same as get_proofs, but returns the raw 32 byte proof elements
+        """
+        indexes = [
+            self.element_to_index.get(self._hash_identifier(identifier))
+            for identifier in identifiers
+        ]
+
+        return self._get_proofs_elements(self.get_layers(), indexes)
+
+    def _get_proofs_elements(
+        self, layers: list[list[bytes]], indexes: list[Optional[int]]
+    ) -> list[list[bytes]]:
+        proofs: list[list[bytes]] = [[] for _ in indexes]
+        # Identifiers that aren't in the tree keep an empty proof
+        active = [
+            (proof, index) for proof, index in zip(proofs, indexes) if index is not None
+        ]
 
         for layer in layers:
-            pair_index = (
-                index_of_element + 1
-                if index_of_element % 2 == 0
-                else index_of_element - 1
-            )
-            pair_element = layer[pair_index] if pair_index < len(layer) else None
+            layer_length = len(layer)
+            next_active = []
 
-            if pair_element:
-                proofs.append(pair_element)
+            for proof, index in active:
+                pair_index = index ^ 1
 
-            index_of_element = index_of_element // 2
+                if pair_index < layer_length:
+                    proof.append(layer[pair_index])
 
-        str_proofs = []
-        for proof in proofs:
-            proof = proof.hex()
-            if not str(proof).startswith("0x"):
-                proof = "0x" + str(proof)
-            str_proofs.append(proof)
-        return str_proofs
+                next_active.append((proof, index >> 1))
+
+            active = next_active
+
+        return proofs
 
     def _get_next_layer(self, elements: list[bytes]) -> list[bytes]:
-        layer = []
-        for index, element in enumerate(elements):
-            if index % 2 == 0:
-                if index + 1 < len(elements):
-                    layer.append(self._combined_hash(element, elements[index + 1]))
-                else:
-                    layer.append(element)
+        layer = list(map(self._combined_hash, elements[::2], elements[1::2]))
+
+        # The last element of an odd layer is carried over to the next one
+        if len(elements) % 2:
+            layer.append(elements[-1])
+
         return layer
 
     def _get_layers(self, elements: list[bytes]) -> list[list[bytes]]:
@@ -98,8 +344,98 @@ class MerkleTree:
         if not second:
             return first
 
-        sorted_values = sorted([first, second])
+        return hash_sorted_pair(first, second)
+
 
-        return Web3.solidityKeccak(
-            abi_types=["bytes"], values=[sorted_values[0] + sorted_values[1]]
+class BulkOrderTree(MerkleTree):
+    """
+    Tree of the orders covered by a single bulk order signature. Unlike criteria trees, the leaves are the order hashes
+    kept in their original position, padded with empty orders to a power of two, and pairs are hashed in order.
+    This matches the EIP-712 encoding of the nested OrderComponents[2] arrays of a BulkOrder.
+    """
+
+    orders_components: list[OrderComponents]
+    height: int
+
+    def __init__(self, orders_components: list[OrderComponents]):
+        if not orders_components:
+            raise ValueError("A bulk order needs at least one order")
+
+        height = max((len(orders_components) - 1).bit_length(), 1)
+
+        if height > BULK_ORDER_MAX_HEIGHT:
+            raise ValueError(
+                f"A bulk order can contain at most {2 ** BULK_ORDER_MAX_HEIGHT} orders"
+            )
+
+        # Leaves are identified by the position of their order
+        self.identifiers = list(range(len(orders_components)))
+        self.orders_components = orders_components
+        self.height = height
+        self.elements = list(map(hash_order_components, orders_components)) + [
+            EMPTY_ORDER_HASH
+        ] * (2**height - len(orders_components))
+        self.element_to_index = {}
+
+    def get_proofs_bytes_by_index(self, indexes: list[int]) -> list[list[bytes]]:
+        """
+        Returns the raw 32 byte proof elements of the leaves at the given positions
+
+        Args:
+            indexes (list[int]): the positions of the orders in the tree
+
+        Returns:
+            list[list[bytes]]: the proof of every leaf
+        """
+        return self._get_proofs_elements(self.get_layers(), indexes)
+
+    def update(self, **_):
+        raise ValueError("Bulk order trees can't be updated, as leaves are positional")
+
+    def get_leaf_orders_components(self) -> list[OrderComponents]:
+        """
+        Returns the orders of every leaf, including the empty orders padding the tree
+        """
+        return self.orders_components + [EMPTY_ORDER_COMPONENTS] * (
+            2**self.height - len(self.orders_components)
         )
+
+    def get_struct_hash(self) -> bytes:
+        """
+        Returns the EIP-712 struct hash of the BulkOrder, which is signed under the Seaport domain
+        """
+        return keccak(get_bulk_order_type_hash(self.height) + self.get_root())
+
+    def get_signature(self, index: int, signature: str) -> str:
+        """
+        Builds the signature of a single order out of the bulk order signature
+
+        Args:
+            index (int): the position of the order in the tree
+            signature (str): the signature of the bulk order
+
+        Returns:
+            str: the compact bulk order signature, followed by the 3 byte index of the order and its proof
+        """
+        return (
+            to_compact_signature(signature)
+            + index.to_bytes(BULK_ORDER_INDEX_LENGTH, "big").hex()
+            + b"".join(self.get_proofs_bytes_by_index([index])[0]).hex()
+        )
+
+    def get_signatures(self, signature: str) -> list[str]:
+        """
+        Builds the signature of every order out of the bulk order signature. See get_signature.
+        """
+        compact_signature = to_compact_signature(signature)
+        indexes = list(range(len(self.orders_components)))
+
+        return [
+            compact_signature
+            + index.to_bytes(BULK_ORDER_INDEX_LENGTH, "big").hex()
+            + b"".join(proof).hex()
+            for index, proof in zip(indexes, self.get_proofs_bytes_by_index(indexes))
+        ]
+
+    def _combined_hash(self, first: bytes, second: bytes) -> bytes:
+        return keccak(first + second)
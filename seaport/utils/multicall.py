@@ -0,0 +1,132 @@
+from typing import Any, Optional
+
+from eth_abi.exceptions import DecodingError
+from web3 import Web3
+from web3._utils.abi import get_abi_output_types, get_aligned_abi_inputs
+from web3._utils.contracts import encode_abi
+from web3.contract import Contract, ContractFunction
+from web3.types import BlockIdentifier
+
+from seaport.utils.batch import chunked
+from seaport.utils.contract_cache import AbiKind, get_contract, get_function_selector
+
+# Keeps a single aggregate call well under the gas cap nodes apply to eth_call
+DEFAULT_MAX_CALLS_PER_BATCH = 500
+
+
+class Multicall:
+    """
+    Batches contract reads into Multicall3 aggregate3 eth_calls.
+    Every call is allowed to fail on its own, in which case its result resolves to None
+    instead of reverting the whole batch.
+    """
+
+    contract: Contract
+    calls: list[ContractFunction]
+    max_calls_per_batch: int
+
+    def __init__(
+        self,
+        web3: Web3,
+        multicall_address: str,
+        max_calls_per_batch: int = DEFAULT_MAX_CALLS_PER_BATCH,
+    ):
+        self.web3 = web3
+        self.contract = get_contract(web3, multicall_address, AbiKind.MULTICALL3)
+        self.calls = []
+        self.max_calls_per_batch = max_calls_per_batch
+
+    def get_eth_balance_function(self, owner: str) -> ContractFunction:
+        return self.contract.functions.getEthBalance(owner)
+
+    def add(self, contract_fn: ContractFunction) -> int:
+        """
+        Queues a contract read
+
+        Args:
+            contract_fn (ContractFunction): the bound contract function to call
+
+        Returns:
+            int: the index of the result in the list returned by execute
+        """
+        self.calls.append(contract_fn)
+
+        return len(self.calls) - 1
+
+    def execute(
+        self, block_identifier: BlockIdentifier = "latest"
+    ) -> list[Optional[Any]]:
+        """
+        Executes all queued reads
+
+        Args:
+            block_identifier (BlockIdentifier, optional): the block to read at. Defaults to "latest".
+
+        Returns:
+            list[Optional[Any]]: the decoded result of every queued read, or None if the read failed
+        """
+        results: list[Optional[Any]] = []
+
+        for calls in chunked(self.calls, self.max_calls_per_batch):
+            aggregate_results = self.contract.functions.aggregate3(
+                [
+                    (
+                        contract_fn.address,
+                        True,
+                        encode_contract_function_data(contract_fn),
+                    )
+                    for contract_fn in calls
+                ]
+            ).call(block_identifier=block_identifier)
+
+            results.extend(
+                decode_contract_function_result(self.web3, contract_fn, return_data)
+                if success
+                else None
+                for contract_fn, (success, return_data) in zip(calls, aggregate_results)
+            )
+
+        return results
+
+
+def encode_contract_function_data(contract_fn: ContractFunction) -> str:
+    """
+    Encodes the calldata of a contract function. Unlike ContractFunction._encode_transaction_data,
+    struct arguments may be passed as dicts, the same as for call and transact.
+    """
+    # The function ABI is resolved when the function is bound, so it is not matched again
+    _, aligned_arguments = get_aligned_abi_inputs(
+        contract_fn.abi, contract_fn.arguments
+    )
+
+    return encode_abi(
+        contract_fn.web3,
+        contract_fn.abi,
+        aligned_arguments,
+        get_function_selector(contract_fn.abi),
+    )
+
+
+def decode_contract_function_result(
+    web3: Web3, contract_fn: ContractFunction, return_data: bytes
+) -> Optional[Any]:
+    """
+    Decodes the raw return data of a contract read the same way ContractFunction.call would
+
+    Args:
+        web3 (Web3): web3 instance used for its codec
+        contract_fn (ContractFunction): the contract function that was called
+        return_data (bytes): the raw return data
+
+    Returns:
+        Optional[Any]: the decoded result, or None if the return data could not be decoded
+    """
+    output_types = get_abi_output_types(contract_fn.abi)
+
+    try:
+        decoded = web3.codec.decode_abi(output_types, return_data)
+    except DecodingError:
+        # i.e. the target has no code and returned nothing
+        return None
+
+    return decoded[0] if len(decoded) == 1 else decoded
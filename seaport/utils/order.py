@@ -1,6 +1,6 @@
 from itertools import chain
 from secrets import token_hex
-from typing import Sequence
+from typing import Optional, Sequence
 
 from web3.constants import ADDRESS_ZERO
 
@@ -18,6 +18,7 @@ from seaport.types import (
     OfferItem,
     Order,
 )
+from seaport.utils.criteria_registry import CriteriaRegistry
 from seaport.utils.item import get_maximum_size_for_order, is_currency_item
 from seaport.utils.merkletree import MerkleTree
 
@@ -64,7 +65,9 @@ def deduct_fees(consideration: list[ConsiderationItem], fees: list[Fee] = []):
     )
 
 
-def map_input_item_to_offer_item(item: CreateInputItem) -> OfferItem:
+def map_input_item_to_offer_item(
+    item: CreateInputItem, criteria_registry: Optional[CriteriaRegistry] = None
+) -> OfferItem:
     # Item is an NFT
     if not isinstance(item, OfferCurrencyItem):
         # Item is a criteria based item
@@ -72,13 +75,18 @@ def map_input_item_to_offer_item(item: CreateInputItem) -> OfferItem:
             item, OfferErc1155ItemWithCriteria
         ):
             leaves = item.identifiers or []
-            tree = MerkleTree(leaves)
+            # Registered trees are kept so criteria of later fills can be resolved without rebuilding them
+            root = (
+                criteria_registry.register(leaves)
+                if criteria_registry is not None and leaves
+                else MerkleTree(leaves).get_root_as_int()
+            )
             # Convert this into a criteria based item
 
             return OfferItem(
                 itemType=item.item_type,
                 token=item.token,
-                identifierOrCriteria=int.from_bytes(tree.get_root(), "big"),
+                identifierOrCriteria=root,
                 startAmount=item.amount or 1,
                 endAmount=item.end_amount or item.amount or 1,
             )
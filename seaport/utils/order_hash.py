@@ -0,0 +1,308 @@
+import threading
+from concurrent.futures import Executor
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from eth_hash.auto import keccak
+
+from seaport.constants import (
+    CONSIDERATION_CONTRACT_NAME,
+    CONSIDERATION_CONTRACT_VERSION,
+)
+from seaport.types import ConsiderationItem, OfferItem, OrderComponents
+from seaport.utils.batch import map_chunks
+
+EIP_712_DOMAIN_TYPE_STRING = (
+    "EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"
+)
+OFFER_ITEM_TYPE_STRING = "OfferItem(uint8 itemType,address token,uint256 identifierOrCriteria,uint256 startAmount,uint256 endAmount)"
+CONSIDERATION_ITEM_TYPE_STRING = "ConsiderationItem(uint8 itemType,address token,uint256 identifierOrCriteria,uint256 startAmount,uint256 endAmount,address recipient)"
+ORDER_COMPONENTS_PARTIAL_TYPE_STRING = "OrderComponents(address offerer,address zone,OfferItem[] offer,ConsiderationItem[] consideration,uint8 orderType,uint256 startTime,uint256 endTime,bytes32 zoneHash,uint256 salt,bytes32 conduitKey,uint256 counter)"
+# EIP-712 appends referenced struct types sorted by name
+ORDER_TYPE_STRING = f"{ORDER_COMPONENTS_PARTIAL_TYPE_STRING}{CONSIDERATION_ITEM_TYPE_STRING}{OFFER_ITEM_TYPE_STRING}"
+
+EIP_712_DOMAIN_TYPE_HASH = keccak(EIP_712_DOMAIN_TYPE_STRING.encode("utf-8"))
+OFFER_ITEM_TYPE_HASH = keccak(OFFER_ITEM_TYPE_STRING.encode("utf-8"))
+CONSIDERATION_ITEM_TYPE_HASH = keccak(CONSIDERATION_ITEM_TYPE_STRING.encode("utf-8"))
+ORDER_TYPE_HASH = keccak(ORDER_TYPE_STRING.encode("utf-8"))
+
+WORD_SIZE = 32
+DEFAULT_CHUNK_SIZE = 1000
+
+# Compact, picklable representations of the structs in their EIP-712 member order
+OfferItemTuple = tuple[int, str, int, int, int]
+ConsiderationItemTuple = tuple[int, str, int, int, int, str]
+OrderComponentsTuple = tuple[
+    str,
+    str,
+    tuple[OfferItemTuple, ...],
+    tuple[ConsiderationItemTuple, ...],
+    int,
+    int,
+    int,
+    str,
+    int,
+    str,
+    int,
+]
+
+
+class _HashBuffers(threading.local):
+    """
+    Preallocated buffers for the encoded structs. The type hash occupies the first word
+    and never changes, so only the member words are overwritten on every hash.
+    Buffers are thread local so concurrent hashing never shares a buffer.
+    """
+
+    def __init__(self):
+        self.offer_item = bytearray(OFFER_ITEM_TYPE_HASH + bytes(WORD_SIZE * 5))
+        self.consideration_item = bytearray(
+            CONSIDERATION_ITEM_TYPE_HASH + bytes(WORD_SIZE * 6)
+        )
+        self.order = bytearray(ORDER_TYPE_HASH + bytes(WORD_SIZE * 11))
+
+
+_buffers = _HashBuffers()
+
+
+def to_word(value: int) -> bytes:
+    return value.to_bytes(WORD_SIZE, "big")
+
+
+def hex_to_word(value: str) -> bytes:
+    """
+    Left pads a hex encoded address or bytes32 value into a 32 byte word
+    """
+    return int(value, 16).to_bytes(WORD_SIZE, "big")
+
+
+def to_offer_item_tuple(item: OfferItem) -> OfferItemTuple:
+    return (
+        item.itemType.value,
+        item.token,
+        item.identifierOrCriteria,
+        item.startAmount,
+        item.endAmount,
+    )
+
+
+def to_consideration_item_tuple(item: ConsiderationItem) -> ConsiderationItemTuple:
+    return (
+        item.itemType.value,
+        item.token,
+        item.identifierOrCriteria,
+        item.startAmount,
+        item.endAmount,
+        item.recipient,
+    )
+
+
+def to_order_components_tuple(
+    order_components: OrderComponents,
+) -> OrderComponentsTuple:
+    return (
+        order_components.offerer,
+        order_components.zone,
+        tuple(map(to_offer_item_tuple, order_components.offer)),
+        tuple(map(to_consideration_item_tuple, order_components.consideration)),
+        order_components.orderType.value,
+        order_components.startTime,
+        order_components.endTime,
+        order_components.zoneHash,
+        order_components.salt,
+        order_components.conduitKey,
+        order_components.counter,
+    )
+
+
+def hash_offer_item_tuple(item: OfferItemTuple) -> bytes:
+    item_type, token, identifier_or_criteria, start_amount, end_amount = item
+
+    buffer = _buffers.offer_item
+    buffer[32:64] = to_word(item_type)
+    buffer[64:96] = hex_to_word(token)
+    buffer[96:128] = to_word(identifier_or_criteria)
+    buffer[128:160] = to_word(start_amount)
+    buffer[160:192] = to_word(end_amount)
+
+    return keccak(buffer)
+
+
+def hash_consideration_item_tuple(item: ConsiderationItemTuple) -> bytes:
+    (
+        item_type,
+        token,
+        identifier_or_criteria,
+        start_amount,
+        end_amount,
+        recipient,
+    ) = item
+
+    buffer = _buffers.consideration_item
+    buffer[32:64] = to_word(item_type)
+    buffer[64:96] = hex_to_word(token)
+    buffer[96:128] = to_word(identifier_or_criteria)
+    buffer[128:160] = to_word(start_amount)
+    buffer[160:192] = to_word(end_amount)
+    buffer[192:224] = hex_to_word(recipient)
+
+    return keccak(buffer)
+
+
+def hash_order_components_tuple(order_components: OrderComponentsTuple) -> bytes:
+    (
+        offerer,
+        zone,
+        offer,
+        consideration,
+        order_type,
+        start_time,
+        end_time,
+        zone_hash,
+        salt,
+        conduit_key,
+        counter,
+    ) = order_components
+
+    offer_hash = keccak(b"".join(map(hash_offer_item_tuple, offer)))
+    consideration_hash = keccak(
+        b"".join(map(hash_consideration_item_tuple, consideration))
+    )
+
+    buffer = _buffers.order
+    buffer[32:64] = hex_to_word(offerer)
+    buffer[64:96] = hex_to_word(zone)
+    buffer[96:128] = offer_hash
+    buffer[128:160] = consideration_hash
+    buffer[160:192] = to_word(order_type)
+    buffer[192:224] = to_word(start_time)
+    buffer[224:256] = to_word(end_time)
+    buffer[256:288] = hex_to_word(zone_hash)
+    buffer[288:320] = to_word(salt)
+    buffer[320:352] = hex_to_word(conduit_key)
+    buffer[352:384] = to_word(counter)
+
+    return keccak(buffer)
+
+
+def hash_order_components(order_components: OrderComponents) -> bytes:
+    """
+    Calculates the EIP-712 struct hash of the order components, which is also the order hash
+
+    Args:
+        order_components (OrderComponents): order components model
+
+    Returns:
+        bytes: the 32 byte order hash
+    """
+    return hash_order_components_tuple(to_order_components_tuple(order_components))
+
+
+def get_order_hash(order_components: OrderComponents) -> str:
+    """
+    Calculates the order hash of order components locally, matching the contract's getOrderHash
+
+    Args:
+        order_components (OrderComponents): order components model
+
+    Returns:
+        str: the 0x prefixed order hash
+    """
+    return "0x" + hash_order_components(order_components).hex()
+
+
+def get_domain_separator(
+    chain_id: int,
+    verifying_contract: str,
+    name: str = CONSIDERATION_CONTRACT_NAME,
+    version: str = CONSIDERATION_CONTRACT_VERSION,
+) -> bytes:
+    """
+    Calculates the EIP-712 domain separator of a Seaport deployment
+
+    Args:
+        chain_id (int): the chain id the contract is deployed on
+        verifying_contract (str): the address of the Seaport contract
+        name (str, optional): the contract name. Defaults to CONSIDERATION_CONTRACT_NAME.
+        version (str, optional): the contract version. Defaults to CONSIDERATION_CONTRACT_VERSION.
+
+    Returns:
+        bytes: the 32 byte domain separator
+    """
+    return keccak(
+        b"".join(
+            [
+                EIP_712_DOMAIN_TYPE_HASH,
+                keccak(name.encode("utf-8")),
+                keccak(version.encode("utf-8")),
+                to_word(chain_id),
+                hex_to_word(verifying_contract),
+            ]
+        )
+    )
+
+
+def get_digest(domain_separator: bytes, struct_hash: bytes) -> bytes:
+    """
+    Calculates the EIP-712 digest that gets signed for a struct hash under the given domain
+    """
+    return keccak(b"\x19\x01" + domain_separator + struct_hash)
+
+
+@lru_cache(maxsize=None)
+def get_bulk_order_type_hash(height: int) -> bytes:
+    """
+    Calculates the EIP-712 type hash of a BulkOrder, whose tree is nested as OrderComponents[2] arrays once per level
+
+    Args:
+        height (int): the height of the bulk order tree
+
+    Returns:
+        bytes: the 32 byte type hash
+    """
+    # Referenced struct types are sorted by name, so OrderComponents comes last here
+    bulk_order_type_string = (
+        f"BulkOrder(OrderComponents{'[2]' * height} tree)"
+        f"{CONSIDERATION_ITEM_TYPE_STRING}{OFFER_ITEM_TYPE_STRING}{ORDER_COMPONENTS_PARTIAL_TYPE_STRING}"
+    )
+
+    return keccak(bulk_order_type_string.encode("utf-8"))
+
+
+def _hash_order_components_tuples(
+    order_components: list[OrderComponentsTuple],
+) -> list[bytes]:
+    # Runs inside worker processes, so it must stay a picklable module level function
+    return list(map(hash_order_components_tuple, order_components))
+
+
+def get_order_hashes(
+    order_components: Iterable[OrderComponents],
+    *,
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+) -> list[str]:
+    """
+    Calculates the order hashes of many order components without needing a provider.
+    Hashing happens serially in the current process unless an executor or more than one worker is requested,
+    in which case the orders are converted into compact tuples and hashed across processes in chunks.
+
+    Args:
+        order_components (Iterable[OrderComponents]): order components to hash
+        max_workers (Optional[int], optional): number of worker processes to spawn. Defaults to hashing serially.
+        chunk_size (int, optional): number of orders sent to a worker at a time. Defaults to 1000.
+        executor (Optional[Executor], optional): an existing executor to reuse instead of spawning a process pool.
+
+    Returns:
+        list[str]: the 0x prefixed order hashes, in the same order as the input
+    """
+    order_hashes = map_chunks(
+        _hash_order_components_tuples,
+        map(to_order_components_tuple, order_components),
+        max_workers=max_workers,
+        chunk_size=chunk_size,
+        executor=executor,
+    )
+
+    return ["0x" + order_hash.hex() for order_hash in order_hashes]
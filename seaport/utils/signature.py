@@ -0,0 +1,224 @@
+from concurrent.futures import Executor
+from functools import partial
+from typing import Iterable, Optional
+
+from eth_hash.auto import keccak
+from eth_keys import KeyAPI
+from eth_keys.exceptions import BadSignature, ValidationError
+from hexbytes import HexBytes
+
+from seaport.constants import BULK_ORDER_MAX_HEIGHT
+from seaport.types import OrderWithCounter
+from seaport.utils.batch import map_chunks
+from seaport.utils.hex_utils import bytes_to_hex
+from seaport.utils.order_hash import (
+    DEFAULT_CHUNK_SIZE,
+    OrderComponentsTuple,
+    get_bulk_order_type_hash,
+    get_digest,
+    hash_order_components_tuple,
+    to_order_components_tuple,
+)
+
+SIGNATURE_LENGTH = 65
+COMPACT_SIGNATURE_LENGTH = 64
+BULK_ORDER_INDEX_LENGTH = 3
+
+
+def to_compact_signature(signature: str) -> str:
+    """
+    Converts a 65 byte signature into its 64 byte EIP-2098 representation, which folds the recovery id into the
+    highest bit of s. Signatures that are already compact are returned as is.
+
+    Args:
+        signature (str): the hex encoded signature
+
+    Returns:
+        str: the 0x prefixed compact signature
+    """
+    signature_bytes = bytes(HexBytes(signature))
+
+    if len(signature_bytes) == COMPACT_SIGNATURE_LENGTH:
+        return bytes_to_hex(signature_bytes)
+
+    if len(signature_bytes) != SIGNATURE_LENGTH:
+        raise ValueError(f"Invalid signature length {len(signature_bytes)}")
+
+    r, s, v = signature_bytes[:32], signature_bytes[32:64], signature_bytes[64]
+    y_parity = v - 27 if v >= 27 else v
+
+    if y_parity not in (0, 1):
+        raise ValueError(f"Invalid signature recovery id {v}")
+
+    y_parity_and_s = (y_parity << 255) | int.from_bytes(s, "big")
+
+    return bytes_to_hex(r + y_parity_and_s.to_bytes(32, "big"))
+
+
+def recover_signer(digest: bytes, signature: bytes) -> Optional[str]:
+    """
+    Recovers the address that signed a digest, following the contract's rules for EOA signatures.
+    65 byte signatures need a v of 27 or 28, and 64 byte signatures are EIP-2098 compact signatures.
+    Recovery goes through eth_keys, which uses coincurve when it is installed.
+
+    Args:
+        digest (bytes): the 32 byte digest that was signed
+        signature (bytes): the 64 or 65 byte signature
+
+    Returns:
+        Optional[str]: the checksummed address of the signer, or None if the signature is malformed
+    """
+    if len(signature) == COMPACT_SIGNATURE_LENGTH:
+        y_parity_and_s = int.from_bytes(signature[32:64], "big")
+        y_parity = y_parity_and_s >> 255
+        s = y_parity_and_s & ((1 << 255) - 1)
+    elif len(signature) == SIGNATURE_LENGTH:
+        y_parity = signature[64] - 27
+        s = int.from_bytes(signature[32:64], "big")
+
+        if y_parity not in (0, 1):
+            return None
+    else:
+        return None
+
+    try:
+        public_key = KeyAPI.Signature(
+            vrs=(y_parity, int.from_bytes(signature[:32], "big"), s)
+        ).recover_public_key_from_msg_hash(digest)
+    except (BadSignature, ValidationError):
+        return None
+
+    return public_key.to_checksum_address()
+
+
+def _get_signed_struct_hash_and_signature(
+    order_hash: bytes, signature: bytes, bulk_signatures: bool
+) -> Optional[tuple[bytes, bytes]]:
+    if len(signature) in (COMPACT_SIGNATURE_LENGTH, SIGNATURE_LENGTH):
+        return order_hash, signature
+
+    if not bulk_signatures:
+        return None
+
+    # Bulk order signatures are followed by the 3 byte index of the order and one 32 byte proof element per level
+    signature_length = (
+        COMPACT_SIGNATURE_LENGTH if len(signature) % 32 == 3 else SIGNATURE_LENGTH
+    )
+    proof_length = len(signature) - signature_length - BULK_ORDER_INDEX_LENGTH
+    height = proof_length // 32
+
+    if proof_length % 32 or not 1 <= height <= BULK_ORDER_MAX_HEIGHT:
+        return None
+
+    index_end = signature_length + BULK_ORDER_INDEX_LENGTH
+    index = int.from_bytes(signature[signature_length:index_end], "big")
+    root = order_hash
+
+    for level in range(height):
+        proof_element = signature[index_end + level * 32 : index_end + (level + 1) * 32]
+        root = (
+            keccak(proof_element + root)
+            if (index >> level) & 1
+            else keccak(root + proof_element)
+        )
+
+    return (
+        keccak(get_bulk_order_type_hash(height) + root),
+        signature[:signature_length],
+    )
+
+
+def _verify_order_signature_tuple(
+    domain_separator: bytes,
+    bulk_signatures: bool,
+    order: tuple[OrderComponentsTuple, bytes],
+) -> bool:
+    order_components, signature = order
+
+    signed = _get_signed_struct_hash_and_signature(
+        hash_order_components_tuple(order_components), signature, bulk_signatures
+    )
+
+    if not signed:
+        return False
+
+    struct_hash, signature = signed
+    signer = recover_signer(get_digest(domain_separator, struct_hash), signature)
+    offerer = order_components[0]
+
+    return signer is not None and signer.lower() == offerer.lower()
+
+
+def _verify_order_signature_tuples(
+    domain_separator: bytes,
+    bulk_signatures: bool,
+    orders: list[tuple[OrderComponentsTuple, bytes]],
+) -> list[bool]:
+    # Runs inside worker processes, so it must stay a picklable module level function
+    return [
+        _verify_order_signature_tuple(domain_separator, bulk_signatures, order)
+        for order in orders
+    ]
+
+
+def _to_order_signature_tuple(
+    order: OrderWithCounter,
+) -> tuple[OrderComponentsTuple, bytes]:
+    return to_order_components_tuple(order.parameters), bytes(HexBytes(order.signature))
+
+
+def verify_order_signature(
+    order: OrderWithCounter, domain_separator: bytes, *, bulk_signatures: bool = True
+) -> bool:
+    """
+    Checks that the order was signed by its offerer without needing a provider.
+    Signatures of contract offerers are validated on chain through EIP-1271, so they never pass this check.
+
+    Args:
+        order (OrderWithCounter): the signed order
+        domain_separator (bytes): the EIP-712 domain separator of the Seaport deployment the order was signed for
+        bulk_signatures (bool, optional): whether bulk order signatures are accepted. Defaults to True.
+        max_workers (Optional[int], optional): number of worker processes to spawn. Defaults to verifying serially.
+        chunk_size (int, optional): number of orders sent to a worker at a time. Defaults to 1000.
+        executor (Optional[Executor], optional): an existing executor to reuse instead of spawning a process pool.
+
+    Returns:
+        bool: whether the signature recovers to the offerer
+    """
+    return _verify_order_signature_tuple(
+        domain_separator, bulk_signatures, _to_order_signature_tuple(order)
+    )
+
+
+def verify_order_signatures(
+    orders: Iterable[OrderWithCounter],
+    domain_separator: bytes,
+    *,
+    bulk_signatures: bool = True,
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+) -> list[bool]:
+    """
+    Checks the signatures of many orders without needing a provider, i.e. to reject bad orders before any RPC work.
+    Verification happens serially in the current process unless an executor or more than one worker is requested,
+    in which case the orders are converted into compact tuples and verified across processes in chunks.
+
+    Args:
+        orders (Iterable[OrderWithCounter]): the signed orders
+        domain_separator (bytes): the EIP-712 domain separator of the Seaport deployment the orders were signed for
+        bulk_signatures (bool, optional): whether bulk order signatures are accepted. Defaults to True.
+        max_workers (Optional[int], optional): number of worker processes to spawn. Defaults to verifying serially.
+        chunk_size (int, optional): number of orders sent to a worker at a time. Defaults to 1000.
+        executor (Optional[Executor], optional): an existing executor to reuse instead of spawning a process pool.
+
+    Returns:
+        list[bool]: whether the signature of every order recovers to its offerer, in the same order as the input
+    """
+    return map_chunks(
+        partial(_verify_order_signature_tuples, domain_separator, bulk_signatures),
+        map(_to_order_signature_tuple, orders),
+        max_workers=max_workers,
+        chunk_size=chunk_size,
+        executor=executor,
+    )
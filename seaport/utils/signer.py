@@ -0,0 +1,261 @@
+from typing import Awaitable, Callable, Protocol, Union, runtime_checkable
+
+from eth_account import Account
+from eth_account.signers.local import LocalAccount
+from web3 import Web3
+from web3.types import RPCEndpoint
+
+from seaport.types import OrderComponents
+from seaport.utils.hex_utils import bytes_to_hex
+from seaport.utils.merkletree import BulkOrderTree
+from seaport.utils.order_hash import get_digest, hash_order_components
+
+
+@runtime_checkable
+class OrderSigner(Protocol):
+    def sign_order(
+        self,
+        *,
+        order_components: OrderComponents,
+        account_address: str,
+        get_domain_separator: Callable[[], bytes],
+        get_message_to_sign: Callable[[], str],
+    ) -> str:
+        """
+        Signs the order components on behalf of the account.
+        Signers only pull the inputs they need, i.e. provider signers serialize the typed data message
+        while local signers only need the domain separator to build the digest.
+        """
+        ...
+
+
+@runtime_checkable
+class AsyncOrderSigner(Protocol):
+    def sign_order(
+        self,
+        *,
+        order_components: OrderComponents,
+        account_address: str,
+        get_domain_separator: Callable[[], bytes],
+        get_message_to_sign: Callable[[], str],
+    ) -> Awaitable[str]:
+        """
+        Same as OrderSigner.sign_order, but resolves the signature asynchronously
+        """
+        ...
+
+
+@runtime_checkable
+class BatchOrderSigner(Protocol):
+    def sign_orders(
+        self,
+        *,
+        orders_components: list[OrderComponents],
+        account_address: str,
+        get_domain_separator: Callable[[], bytes],
+        get_messages_to_sign: Callable[[], list[str]],
+    ) -> Union[list[str], Awaitable[list[str]]]:
+        """
+        Signs many order components of the same account at once. Signers that implement it are used
+        by create_orders instead of signing every order through sign_order.
+        """
+        ...
+
+
+@runtime_checkable
+class BulkOrderSigner(Protocol):
+    def sign_bulk_order(
+        self,
+        *,
+        bulk_order_tree: BulkOrderTree,
+        account_address: str,
+        get_domain_separator: Callable[[], bytes],
+        get_message_to_sign: Callable[[], str],
+    ) -> Union[str, Awaitable[str]]:
+        """
+        Signs the BulkOrder typed data covering every order of the tree with a single signature.
+        Per order signatures are then derived from it through BulkOrderTree.get_signatures.
+        """
+        ...
+
+
+class ProviderOrderSigner:
+    """
+    Signs orders through the provider using eth_signTypedData_v4, falling back to eth_signTypedData
+    """
+
+    web3: Web3
+
+    def __init__(self, web3: Web3):
+        self.web3 = web3
+
+    def sign_order(
+        self,
+        *,
+        order_components: OrderComponents,
+        account_address: str,
+        get_domain_separator: Callable[[], bytes],
+        get_message_to_sign: Callable[[], str],
+    ) -> str:
+        return self._sign_typed_data(account_address, get_message_to_sign())
+
+    def sign_bulk_order(
+        self,
+        *,
+        bulk_order_tree: BulkOrderTree,
+        account_address: str,
+        get_domain_separator: Callable[[], bytes],
+        get_message_to_sign: Callable[[], str],
+    ) -> str:
+        return self._sign_typed_data(account_address, get_message_to_sign())
+
+    def _sign_typed_data(self, account_address: str, payload: str) -> str:
+        # Default to using signTypedData_v4. If that's not possible, fallback to signTypedData
+        response = self.web3.provider.make_request(
+            RPCEndpoint("eth_signTypedData_v4"),
+            [account_address, payload],
+        )
+        if "error" in response:
+            response = self.web3.provider.make_request(
+                RPCEndpoint("eth_signTypedData"),
+                [account_address, payload],
+            )
+
+        if "result" not in response and "error" in response:
+            raise ValueError(
+                f"There was a problem generating the signature for the order: {response['error']}"
+            )
+
+        return response["result"]
+
+
+class AsyncProviderOrderSigner:
+    """
+    Same as ProviderOrderSigner, but signs through an async provider
+    """
+
+    web3: Web3
+
+    def __init__(self, web3: Web3):
+        self.web3 = web3
+
+    async def sign_order(
+        self,
+        *,
+        order_components: OrderComponents,
+        account_address: str,
+        get_domain_separator: Callable[[], bytes],
+        get_message_to_sign: Callable[[], str],
+    ) -> str:
+        return await self._sign_typed_data(account_address, get_message_to_sign())
+
+    async def sign_bulk_order(
+        self,
+        *,
+        bulk_order_tree: BulkOrderTree,
+        account_address: str,
+        get_domain_separator: Callable[[], bytes],
+        get_message_to_sign: Callable[[], str],
+    ) -> str:
+        return await self._sign_typed_data(account_address, get_message_to_sign())
+
+    async def _sign_typed_data(self, account_address: str, payload: str) -> str:
+        # Default to using signTypedData_v4. If that's not possible, fallback to signTypedData
+        response = await self.web3.provider.make_request(  # type: ignore
+            RPCEndpoint("eth_signTypedData_v4"),
+            [account_address, payload],
+        )
+        if "error" in response:
+            response = await self.web3.provider.make_request(  # type: ignore
+                RPCEndpoint("eth_signTypedData"),
+                [account_address, payload],
+            )
+
+        if "result" not in response and "error" in response:
+            raise ValueError(
+                f"There was a problem generating the signature for the order: {response['error']}"
+            )
+
+        return response["result"]
+
+
+class LocalAccountOrderSigner:
+    """
+    Signs orders in process with locally held private keys, computing the EIP-712 digest
+    without any RPC round trips
+    """
+
+    accounts: dict[str, LocalAccount]
+
+    def __init__(self, *private_keys: str):
+        local_accounts: list[LocalAccount] = [
+            Account.from_key(private_key) for private_key in private_keys
+        ]
+        self.accounts = {account.address.lower(): account for account in local_accounts}
+
+    def sign_order(
+        self,
+        *,
+        order_components: OrderComponents,
+        account_address: str,
+        get_domain_separator: Callable[[], bytes],
+        get_message_to_sign: Callable[[], str],
+    ) -> str:
+        return self.sign_orders(
+            orders_components=[order_components],
+            account_address=account_address,
+            get_domain_separator=get_domain_separator,
+            get_messages_to_sign=lambda: [get_message_to_sign()],
+        )[0]
+
+    def sign_orders(
+        self,
+        *,
+        orders_components: list[OrderComponents],
+        account_address: str,
+        get_domain_separator: Callable[[], bytes],
+        get_messages_to_sign: Callable[[], list[str]],
+    ) -> list[str]:
+        account = self._get_account(account_address)
+        domain_separator = get_domain_separator()
+
+        return [
+            bytes_to_hex(
+                bytes(
+                    account.signHash(
+                        get_digest(
+                            domain_separator, hash_order_components(order_components)
+                        )
+                    ).signature
+                )
+            )
+            for order_components in orders_components
+        ]
+
+    def sign_bulk_order(
+        self,
+        *,
+        bulk_order_tree: BulkOrderTree,
+        account_address: str,
+        get_domain_separator: Callable[[], bytes],
+        get_message_to_sign: Callable[[], str],
+    ) -> str:
+        account = self._get_account(account_address)
+
+        return bytes_to_hex(
+            bytes(
+                account.signHash(
+                    get_digest(
+                        get_domain_separator(), bulk_order_tree.get_struct_hash()
+                    )
+                ).signature
+            )
+        )
+
+    def _get_account(self, account_address: str) -> LocalAccount:
+        account = self.accounts.get(account_address.lower())
+
+        if not account:
+            raise ValueError(f"No private key available for account {account_address}")
+
+        return account
@@ -0,0 +1,140 @@
+from time import time
+from typing import Any, Optional
+
+from web3 import Web3
+from web3.contract import ContractFunction
+from web3.types import BlockIdentifier
+
+from seaport.utils.contract_cache import AbiKind, get_contract
+from seaport.utils.json_rpc_batch import DEFAULT_JSON_RPC_BATCH_SIZE, batch_call
+from seaport.utils.multicall import encode_contract_function_data
+
+
+class ChainSnapshot:
+    """
+    Pins contract reads to a single block and memoizes them. State can't change within a block,
+    so every read of the same (contract, calldata) pair, i.e. the same (token, owner, identifier),
+    is only sent to the node once, no matter how many use cases are built from the snapshot.
+    Reads that fail resolve to None, the same as with batch_call.
+    """
+
+    web3: Web3
+    block_number: int
+    timestamp: int
+    multicall_address: Optional[str]
+    json_rpc_batch_size: int
+
+    def __init__(
+        self,
+        web3: Web3,
+        block_identifier: BlockIdentifier = "latest",
+        *,
+        multicall_address: Optional[str] = None,
+        json_rpc_batch_size: int = DEFAULT_JSON_RPC_BATCH_SIZE,
+    ):
+        block = web3.eth.get_block(block_identifier)
+
+        self.web3 = web3
+        self.block_number = block["number"]
+        self.timestamp = block.get("timestamp", int(time()))
+        self.multicall_address = multicall_address
+        self.json_rpc_batch_size = json_rpc_batch_size
+        self._results: dict[tuple[str, str], Optional[Any]] = {}
+        self._eth_balances: dict[str, int] = {}
+
+    def call(self, contract_fn: ContractFunction) -> Optional[Any]:
+        """
+        Calls a contract function at the snapshot block
+
+        Args:
+            contract_fn (ContractFunction): the bound contract function to call
+
+        Returns:
+            Optional[Any]: the decoded result, or None if the read failed
+        """
+        return self.call_many([contract_fn])[0]
+
+    def call_many(self, contract_fns: list[ContractFunction]) -> list[Optional[Any]]:
+        """
+        Calls many contract functions at the snapshot block. Only reads that weren't made before are sent,
+        batched the same way as batch_call.
+
+        Args:
+            contract_fns (list[ContractFunction]): the bound contract functions to call
+
+        Returns:
+            list[Optional[Any]]: the decoded result of every read in order, or None if the read failed
+        """
+        keys = [
+            (contract_fn.address, encode_contract_function_data(contract_fn))
+            for contract_fn in contract_fns
+        ]
+
+        missing: dict[tuple[str, str], ContractFunction] = {}
+
+        for key, contract_fn in zip(keys, contract_fns):
+            if key not in self._results:
+                missing.setdefault(key, contract_fn)
+
+        results = batch_call(
+            self.web3,
+            list(missing.values()),
+            multicall_address=self.multicall_address,
+            json_rpc_batch_size=self.json_rpc_batch_size,
+            block_identifier=self.block_number,
+        )
+
+        self._results.update(zip(missing.keys(), results))
+
+        return [self._results[key] for key in keys]
+
+    def get_eth_balance_function(self, owner: str) -> Optional[ContractFunction]:
+        """
+        Returns the Multicall3 read of the native token balance of an account, so it can be made along with
+        the other reads of the snapshot. Without a multicall address, native balances can only be read
+        through get_balance.
+
+        Args:
+            owner (str): the account
+
+        Returns:
+            Optional[ContractFunction]: the getEthBalance read, or None if the snapshot has no multicall address
+        """
+        if self.multicall_address is None:
+            return None
+
+        return get_contract(
+            self.web3, self.multicall_address, AbiKind.MULTICALL3
+        ).functions.getEthBalance(owner)
+
+    def get_balance(self, owner: str) -> int:
+        """
+        Returns the native token balance of an account at the snapshot block.
+        It is read through Multicall3 if the snapshot has a multicall address.
+
+        Args:
+            owner (str): the account
+
+        Returns:
+            int: the balance in wei
+        """
+        eth_balance_function = self.get_eth_balance_function(owner)
+
+        if eth_balance_function is not None:
+            balance = self.call(eth_balance_function)
+
+            if balance is None:
+                raise ValueError(
+                    f"Failed to read the balance of {owner} at block {self.block_number}"
+                )
+
+            return balance
+
+        key = owner.lower()
+
+        if key not in self._eth_balances:
+            self._eth_balances[key] = self.web3.eth.get_balance(
+                Web3.toChecksumAddress(owner), self.block_number
+            )
+
+        return self._eth_balances[key]
@@ -1,5 +1,8 @@
+from inspect import iscoroutinefunction
 from typing import Optional, Union
 
+from hexbytes import HexBytes
+from web3._utils.transactions import fill_transaction_defaults
 from web3.contract import ContractFunction
 from web3.types import TxParams
 
@@ -7,31 +10,142 @@ from seaport.types import (
     ApprovalAction,
     CreateOrderAction,
     CreateOrderActions,
+    CreateOrdersAction,
+    CreateOrdersActions,
+    ExchangeAction,
     OrderExchangeActions,
     TransactionMethods,
 )
+from seaport.utils.async_web3 import async_fill_transaction_defaults, is_async_web3
+from seaport.utils.multicall import (
+    decode_contract_function_result,
+    encode_contract_function_data,
+)
 
 
 def execute_all_actions(
-    actions: Union[CreateOrderActions, OrderExchangeActions],
+    actions: Union[CreateOrderActions, CreateOrdersActions, OrderExchangeActions],
     initial_tx_params: TxParams = {},
 ):
-    for action in actions[:-1]:
+    """
+    Sends the approvals, then creates the orders or sends the exchange transactions.
+    Use cases of the async client get an awaitable back.
+
+    Returns:
+        the created order or orders, or the hash of the last exchange transaction.
+        See execute_all_exchange_actions for the hash of every exchange transaction.
+    """
+    if is_async_action(actions[-1]):
+        # Actions built by the async client must be awaited
+        return async_execute_all_actions(actions, initial_tx_params)
+
+    final_action = actions[-1]
+
+    if isinstance(final_action, CreateOrderAction):
+        send_approvals(actions, initial_tx_params)
+        return final_action.create_order()
+
+    if isinstance(final_action, CreateOrdersAction):
+        send_approvals(actions, initial_tx_params)
+        return final_action.create_orders()
+
+    return execute_all_exchange_actions(actions, initial_tx_params)[-1]
+
+
+async def async_execute_all_actions(
+    actions: Union[CreateOrderActions, CreateOrdersActions, OrderExchangeActions],
+    initial_tx_params: TxParams = {},
+):
+    final_action = actions[-1]
+
+    if isinstance(final_action, CreateOrderAction):
+        await async_send_approvals(actions, initial_tx_params)
+        return await final_action.create_order()
+
+    if isinstance(final_action, CreateOrdersAction):
+        await async_send_approvals(actions, initial_tx_params)
+        return await final_action.create_orders()
+
+    return (await async_execute_all_exchange_actions(actions, initial_tx_params))[-1]
+
+
+def execute_all_exchange_actions(
+    actions: OrderExchangeActions, initial_tx_params: TxParams = {}
+):
+    """
+    Sends the approvals, then every exchange transaction in order, i.e. one per chunk of orders fulfilled in chunks.
+    Use cases of the async client get an awaitable back.
+
+    Returns:
+        list[HexBytes]: the hash of every exchange transaction, in the order they were sent
+    """
+    if is_async_action(actions[-1]):
+        return async_execute_all_exchange_actions(actions, initial_tx_params)
+
+    send_approvals(actions, initial_tx_params)
+
+    return [
+        action.transaction_methods.transact(initial_tx_params)
+        for action in actions
+        if isinstance(action, ExchangeAction)
+    ]
+
+
+async def async_execute_all_exchange_actions(
+    actions: OrderExchangeActions, initial_tx_params: TxParams = {}
+) -> list[HexBytes]:
+    await async_send_approvals(actions, initial_tx_params)
+
+    return [
+        await action.transaction_methods.transact(initial_tx_params)
+        for action in actions
+        if isinstance(action, ExchangeAction)
+    ]
+
+
+def send_approvals(
+    actions: Union[CreateOrderActions, CreateOrdersActions, OrderExchangeActions],
+    initial_tx_params: TxParams,
+):
+    for action in actions:
         if isinstance(action, ApprovalAction):
             action.transaction_methods.transact(initial_tx_params)
 
-    final_action = actions[-1]
 
-    return (
-        final_action.create_order()
-        if isinstance(final_action, CreateOrderAction)
-        else final_action.transaction_methods.transact(initial_tx_params)
-    )
+async def async_send_approvals(
+    actions: Union[CreateOrderActions, CreateOrdersActions, OrderExchangeActions],
+    initial_tx_params: TxParams,
+):
+    for action in actions:
+        if isinstance(action, ApprovalAction):
+            await action.transaction_methods.transact(initial_tx_params)
+
+
+def is_async_action(
+    action: Union[ApprovalAction, CreateOrderAction, CreateOrdersAction, ExchangeAction]
+):
+    if isinstance(action, CreateOrderAction):
+        return iscoroutinefunction(action.create_order)
+
+    if isinstance(action, CreateOrdersAction):
+        return iscoroutinefunction(action.create_orders)
+
+    return iscoroutinefunction(action.transaction_methods.transact)
 
 
 def get_transaction_methods(
-    contract_fn: ContractFunction, initial_tx_params: TxParams = {}
+    contract_fn: ContractFunction,
+    initial_tx_params: TxParams = {},
+    data: Optional[str] = None,
 ) -> TransactionMethods:
+    """
+    Builds the transaction methods of a contract function. Calldata encoded ahead of time can be passed as data,
+    in which case it is sent as is instead of being validated and encoded again by web3, and the contract
+    function is only used for its address and to decode the result of static calls.
+    """
+    if data is not None or is_async_web3(contract_fn.web3):
+        return get_encoded_transaction_methods(contract_fn, initial_tx_params, data)
+
     def estimate_gas(transaction: Optional[TxParams] = {}):
         transaction = transaction or {}
         return contract_fn.estimateGas(initial_tx_params | transaction)
@@ -55,3 +169,79 @@ def get_transaction_methods(
         transact=transact,
         build_transaction=build_transaction,
     )
+
+
+def get_encoded_transaction_methods(
+    contract_fn: ContractFunction,
+    initial_tx_params: TxParams = {},
+    data: Optional[str] = None,
+) -> TransactionMethods:
+    """
+    Same as get_transaction_methods, but sends the calldata through web3.eth directly. Contract functions built on
+    an async web3 instance get transaction methods that return awaitables. Built transactions are filled with
+    the value, gas, fees and chain id they don't set, like buildTransaction does.
+
+    Args:
+        contract_fn (ContractFunction): the contract function, used for its address and to decode static call results
+        initial_tx_params (TxParams, optional): transaction parameters every method starts from. Defaults to {}.
+        data (Optional[str], optional): the calldata to send. Defaults to encoding the arguments of contract_fn.
+
+    Returns:
+        TransactionMethods: the transaction methods
+    """
+    web3 = contract_fn.web3
+    calldata = encode_contract_function_data(contract_fn) if data is None else data
+
+    def to_transaction(transaction: Optional[TxParams]) -> TxParams:
+        return (
+            initial_tx_params
+            | (transaction or {})
+            | {"to": contract_fn.address, "data": calldata}  # type: ignore
+        )
+
+    def decode_result(return_data: bytes):
+        return decode_contract_function_result(web3, contract_fn, return_data)
+
+    if is_async_web3(web3):
+
+        async def async_estimate_gas(transaction: Optional[TxParams] = {}):
+            return await web3.eth.estimate_gas(to_transaction(transaction))  # type: ignore
+
+        async def async_call_static(transaction: Optional[TxParams] = {}):
+            return_data = await web3.eth.call(to_transaction(transaction))  # type: ignore
+
+            return decode_result(bytes(return_data))
+
+        async def async_transact(transaction: Optional[TxParams] = {}):
+            return await web3.eth.send_transaction(to_transaction(transaction))  # type: ignore
+
+        async def async_build_transaction(transaction: Optional[TxParams] = {}):
+            return await async_fill_transaction_defaults(
+                web3, to_transaction(transaction)
+            )
+
+        return TransactionMethods(
+            estimate_gas=async_estimate_gas,
+            call_static=async_call_static,
+            transact=async_transact,
+            build_transaction=async_build_transaction,
+        )
+
+    def estimate_gas(transaction: Optional[TxParams] = {}):
+        return web3.eth.estimate_gas(to_transaction(transaction))
+
+    def call_static(transaction: Optional[TxParams] = {}):
+        return decode_result(bytes(web3.eth.call(to_transaction(transaction))))
+
+    def transact(transaction: Optional[TxParams] = {}):
+        return web3.eth.send_transaction(to_transaction(transaction))
+
+    def build_transaction(transaction: Optional[TxParams] = {}):
+        return fill_transaction_defaults(web3, to_transaction(transaction))
+
+    return TransactionMethods(
+        estimate_gas=estimate_gas,
+        call_static=call_static,
+        transact=transact,
+        build_transaction=build_transaction,
+    )
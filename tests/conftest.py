@@ -6,6 +6,7 @@ import pytest
 from brownie.network.account import Accounts, _PrivateKeyAccount
 from web3 import Web3
 
+from seaport.async_seaport import AsyncSeaport
 from seaport.seaport import Seaport
 from seaport.types import ContractOverrides, SeaportConfig
 
@@ -47,6 +48,38 @@ def seaport(
     )
 
 
+@pytest.fixture(scope="module")
+def async_seaport(
+    seaport_contract,
+):
+    return AsyncSeaport(
+        provider=Web3.AsyncHTTPProvider("http://127.0.0.1:8545"),
+        config=SeaportConfig(
+            overrides=ContractOverrides(
+                contract_address=seaport_contract.address,
+            )
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def multicall(TestMulticall3, accounts: Accounts):
+    return TestMulticall3.deploy({"from": accounts[0]})
+
+
+@pytest.fixture(scope="module")
+def multicall_seaport(seaport_contract, multicall):
+    return Seaport(
+        provider=Web3.HTTPProvider("http://127.0.0.1:8545"),
+        config=SeaportConfig(
+            overrides=ContractOverrides(
+                contract_address=seaport_contract.address,
+            ),
+            multicall_address=multicall.address,
+        ),
+    )
+
+
 @pytest.fixture(scope="module")
 def erc20(TestERC20, accounts: Accounts):
     return TestERC20.deploy({"from": accounts[0]})
@@ -0,0 +1,145 @@
+from random import Random
+from typing import Optional
+
+from web3 import Web3
+from web3.constants import ADDRESS_ZERO, HASH_ZERO
+
+from seaport.constants import MAX_INT, ItemType, OrderType
+from seaport.types import (
+    ConsiderationCurrencyItem,
+    ConsiderationItem,
+    FulfillOrderDetails,
+    OfferItem,
+    OrderComponents,
+    OrderParameters,
+    OrderWithCounter,
+)
+
+offerer = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+fee_recipient = "0x3C44CdDdB6a900fa2b585dd299e03d12FA4293BC"
+erc721 = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+
+
+def create_consideration_item(
+    item_type: ItemType, token: str, identifier: int, amount: int, recipient: str
+) -> ConsiderationItem:
+    return ConsiderationItem(
+        itemType=item_type,
+        token=token,
+        identifierOrCriteria=identifier,
+        startAmount=amount,
+        endAmount=amount,
+        recipient=recipient,
+    )
+
+
+def create_order_parameters(
+    offerer: str,
+    offer: Optional[list[OfferItem]] = None,
+    consideration: Optional[list[ConsiderationItem]] = None,
+    *,
+    token: str = erc721,
+    nft_id: int = 0,
+    price: int = Web3.toWei(1, "ether"),
+    salt: int = 0,
+) -> OrderParameters:
+    """
+    Builds the parameters of a full open order without a zone or conduit. Unless its items are given,
+    the order lists the ERC721 nft_id of token for price in native currency paid to the offerer
+    """
+    offer = (
+        [
+            OfferItem(
+                itemType=ItemType.ERC721,
+                token=token,
+                identifierOrCriteria=nft_id,
+                startAmount=1,
+                endAmount=1,
+            )
+        ]
+        if offer is None
+        else offer
+    )
+    consideration = (
+        [create_consideration_item(ItemType.NATIVE, ADDRESS_ZERO, 0, price, offerer)]
+        if consideration is None
+        else consideration
+    )
+
+    return OrderParameters(
+        offerer=offerer,
+        zone=ADDRESS_ZERO,
+        orderType=OrderType.FULL_OPEN,
+        startTime=0,
+        endTime=MAX_INT,
+        salt=salt,
+        offer=offer,
+        consideration=consideration,
+        zoneHash=HASH_ZERO,
+        totalOriginalConsiderationItems=len(consideration),
+        conduitKey=HASH_ZERO,
+    )
+
+
+def create_order_components(
+    offerer: str,
+    offer: Optional[list[OfferItem]] = None,
+    consideration: Optional[list[ConsiderationItem]] = None,
+    *,
+    token: str = erc721,
+    nft_id: int = 0,
+    price: int = Web3.toWei(1, "ether"),
+    salt: int = 0,
+    counter: int = 0,
+) -> OrderComponents:
+    """
+    Same as create_order_parameters, along with the counter of the offerer
+    """
+    parameters = create_order_parameters(
+        offerer,
+        offer,
+        consideration,
+        token=token,
+        nft_id=nft_id,
+        price=price,
+        salt=salt,
+    )
+
+    return OrderComponents(**parameters.dict(), counter=counter)
+
+
+def create_listing(
+    random: Random, item_type: ItemType = ItemType.ERC721, nft_count: int = 1
+) -> FulfillOrderDetails:
+    """
+    Random listing of NFTs paid in native currency to the offerer and possibly a fee recipient, with up to two tips
+    """
+    consideration = [
+        create_consideration_item(ItemType.NATIVE, ADDRESS_ZERO, 0, amount, recipient)
+        for amount, recipient in [(950, offerer), (50, fee_recipient)][
+            : random.randint(1, 2)
+        ]
+    ]
+    offer = [
+        OfferItem(
+            itemType=item_type,
+            token=erc721,
+            identifierOrCriteria=random.getrandbits(256),
+            startAmount=1,
+            endAmount=1,
+        )
+        for _ in range(nft_count)
+    ]
+
+    return FulfillOrderDetails(
+        order=OrderWithCounter(
+            parameters=create_order_components(
+                offerer, offer, consideration, salt=random.getrandbits(256)
+            ),
+            signature="0x" + "ab" * random.choice([64, 65]),
+        ),
+        tips=[
+            ConsiderationCurrencyItem(amount=1, recipient=fee_recipient)
+            for _ in range(random.randint(0, 2))
+        ],
+    )
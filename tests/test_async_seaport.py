@@ -0,0 +1,165 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+import pytest
+from aiohttp import ClientSession
+from web3 import Web3
+from web3.exceptions import BadFunctionCallOutput
+
+from seaport.async_seaport import AsyncSeaport
+from seaport.seaport import Seaport
+from seaport.types import (
+    ConsiderationCurrencyItem,
+    FulfillOrderDetails,
+    OfferErc721Item,
+)
+from seaport.utils.async_web3 import async_call
+from seaport.utils.contract_cache import AbiKind, get_contract
+
+nft_id = 1
+nft_id2 = 2
+
+
+def run(async_seaport: AsyncSeaport, fn: Callable[[], Awaitable[Any]]):
+    # aiohttp sessions are bound to an event loop, so every test gets a fresh one
+    async def main():
+        async with ClientSession() as session:
+            await async_seaport.web3.provider.cache_async_session(session)  # type: ignore
+            return await fn()
+
+    return asyncio.run(main())
+
+
+def test_async_reads_match_sync_reads(
+    seaport: Seaport, async_seaport: AsyncSeaport, offerer
+):
+    seaport.bulk_cancel_orders().transact({"from": offerer.address})
+    order_hash = "0x" + "12" * 32
+
+    async def reads():
+        return await asyncio.gather(
+            async_seaport.get_counter(offerer.address),
+            async_seaport.get_order_status(order_hash),
+        )
+
+    counter, order_status = run(async_seaport, reads)
+
+    assert counter == seaport.get_counter(offerer.address) == 1
+    assert order_status == seaport.get_order_status(order_hash)
+
+
+def test_async_call_raises_if_the_contract_is_not_deployed(
+    async_seaport: AsyncSeaport,
+):
+    # No contract is deployed at the address, so the call returns no data
+    contract = get_contract(async_seaport.web3, "0x" + "12" * 20, AbiKind.ERC721)
+
+    with pytest.raises(BadFunctionCallOutput):
+        run(async_seaport, lambda: async_call(contract.functions.ownerOf(nft_id)))
+
+
+def test_async_erc721_buy_now(
+    async_seaport: AsyncSeaport, erc721, offerer, zone, fulfiller
+):
+    erc721.mint(offerer, nft_id)
+
+    async def buy_now():
+        use_case = await async_seaport.create_order(
+            account_address=offerer.address,
+            offer=[OfferErc721Item(token=erc721.address, identifier=nft_id)],
+            consideration=[
+                ConsiderationCurrencyItem(
+                    amount=Web3.toWei(10, "ether"), recipient=offerer.address
+                ),
+                ConsiderationCurrencyItem(
+                    amount=Web3.toWei(1, "ether"), recipient=zone.address
+                ),
+            ],
+        )
+
+        order = await use_case.execute_all_actions()
+
+        fulfill_order_use_case = await async_seaport.fulfill_order(
+            order=order, account_address=fulfiller.address
+        )
+
+        return await fulfill_order_use_case.execute_all_actions()
+
+    run(async_seaport, buy_now)
+
+    assert erc721.ownerOf(nft_id) == fulfiller
+
+
+def test_async_fulfill_orders(
+    async_seaport: AsyncSeaport, erc721, offerer, zone, fulfiller
+):
+    erc721.mint(offerer, nft_id)
+    erc721.mint(offerer, nft_id2)
+
+    async def sweep():
+        orders = []
+
+        for identifier in [nft_id, nft_id2]:
+            use_case = await async_seaport.create_order(
+                account_address=offerer.address,
+                offer=[OfferErc721Item(token=erc721.address, identifier=identifier)],
+                consideration=[
+                    ConsiderationCurrencyItem(
+                        amount=Web3.toWei(10, "ether"), recipient=offerer.address
+                    ),
+                ],
+            )
+            orders.append(await use_case.execute_all_actions())
+
+        fulfill_orders_use_case = await async_seaport.fulfill_orders(
+            fulfill_order_details=[
+                FulfillOrderDetails(order=order) for order in orders
+            ],
+            account_address=fulfiller.address,
+        )
+
+        return await fulfill_orders_use_case.execute_all_actions()
+
+    run(async_seaport, sweep)
+
+    assert erc721.ownerOf(nft_id) == fulfiller
+    assert erc721.ownerOf(nft_id2) == fulfiller
+
+
+def test_async_built_transactions_are_filled_like_sync_ones(
+    seaport: Seaport, async_seaport: AsyncSeaport, erc721, offerer, fulfiller
+):
+    erc721.mint(offerer, nft_id)
+    order = seaport.create_order(
+        account_address=offerer.address,
+        offer=[OfferErc721Item(token=erc721.address, identifier=nft_id)],
+        consideration=[
+            ConsiderationCurrencyItem(
+                amount=Web3.toWei(10, "ether"), recipient=offerer.address
+            ),
+        ],
+    ).execute_all_actions()
+
+    async def build_transaction():
+        fulfill_order_use_case = await async_seaport.fulfill_order(
+            order=order, account_address=fulfiller.address
+        )
+
+        return await fulfill_order_use_case.actions[
+            -1
+        ].transaction_methods.build_transaction()
+
+    async_transaction = run(async_seaport, build_transaction)
+    transaction = (
+        seaport.fulfill_order(order=order, account_address=fulfiller.address)
+        .actions[-1]
+        .transaction_methods.build_transaction()
+    )
+
+    for built_transaction in [transaction, async_transaction]:
+        assert built_transaction["value"] == Web3.toWei(10, "ether")
+        assert built_transaction["chainId"] == seaport.web3.eth.chain_id
+        assert built_transaction["gas"] > 0
+        assert {"maxFeePerGas", "maxPriorityFeePerGas"} <= built_transaction.keys()
+
+    assert async_transaction.keys() == transaction.keys()
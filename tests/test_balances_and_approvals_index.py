@@ -0,0 +1,108 @@
+import pytest
+from web3.constants import ADDRESS_ZERO
+
+from seaport.constants import MAX_INT, ItemType
+from seaport.types import BalanceAndApproval, ConsiderationItem, OfferItem
+from seaport.utils.balance_and_approval_check import (
+    BalancesAndApprovalsIndex,
+    validate_standard_fulfill_balances_and_approvals,
+)
+
+erc20 = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+erc721 = "0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512"
+
+
+def create_balance_and_approval(
+    token: str, identifier_or_criteria: int, balance: int, item_type: ItemType
+) -> BalanceAndApproval:
+    return BalanceAndApproval(
+        token=token,
+        identifier_or_criteria=identifier_or_criteria,
+        balance=balance,
+        approved_amount=MAX_INT,
+        item_type=item_type,
+    )
+
+
+def test_lookups_are_case_insensitive_and_return_the_first_entry():
+    first = create_balance_and_approval(erc721, 1, 1, ItemType.ERC721)
+    index = BalancesAndApprovalsIndex(
+        [first, create_balance_and_approval(erc721.lower(), 1, 0, ItemType.ERC721)]
+    )
+
+    assert index.get(erc721.lower(), 1) is first
+
+    with pytest.raises(ValueError):
+        index.get(erc721, 2)
+
+
+def test_received_amounts_overlay_leaves_the_base_unchanged():
+    erc20_balance = create_balance_and_approval(erc20, 0, 5, ItemType.ERC20)
+    erc721_balance = create_balance_and_approval(erc721, 1, 0, ItemType.ERC721)
+    index = BalancesAndApprovalsIndex([erc20_balance, erc721_balance])
+
+    overlay = index.with_received_amounts({erc721: {1: 1}, erc721.lower(): {1: 1}})
+
+    assert overlay.get(erc721, 1).balance == 2
+    assert overlay.get(erc20, 0) is erc20_balance
+    assert index.get(erc721, 1).balance == 0
+
+
+def test_standard_fulfill_counts_received_offer_items():
+    offer = [
+        OfferItem(
+            itemType=ItemType.ERC20,
+            token=erc20,
+            identifierOrCriteria=0,
+            startAmount=10,
+            endAmount=10,
+        )
+    ]
+    consideration = [
+        ConsiderationItem(
+            itemType=ItemType.ERC20,
+            token=erc20,
+            identifierOrCriteria=0,
+            startAmount=12,
+            endAmount=12,
+            recipient=ADDRESS_ZERO,
+        )
+    ]
+    fulfiller_balances_and_approvals = [
+        create_balance_and_approval(erc20, 0, 2, ItemType.ERC20)
+    ]
+
+    assert (
+        validate_standard_fulfill_balances_and_approvals(
+            offer=offer,
+            consideration=consideration,
+            offer_criteria=[],
+            consideration_criteria=[],
+            offerer_balances_and_approvals=[
+                create_balance_and_approval(erc20, 0, 10, ItemType.ERC20)
+            ],
+            fulfiller_balances_and_approvals=fulfiller_balances_and_approvals,
+            time_based_item_params=None,
+            offerer_operator=ADDRESS_ZERO,
+            fulfiller_operator=ADDRESS_ZERO,
+        )
+        == []
+    )
+    assert fulfiller_balances_and_approvals[0].balance == 2
+
+    fulfiller_balances_and_approvals[0].balance = 1
+
+    with pytest.raises(ValueError):
+        validate_standard_fulfill_balances_and_approvals(
+            offer=offer,
+            consideration=consideration,
+            offer_criteria=[],
+            consideration_criteria=[],
+            offerer_balances_and_approvals=[
+                create_balance_and_approval(erc20, 0, 10, ItemType.ERC20)
+            ],
+            fulfiller_balances_and_approvals=fulfiller_balances_and_approvals,
+            time_based_item_params=None,
+            offerer_operator=ADDRESS_ZERO,
+            fulfiller_operator=ADDRESS_ZERO,
+        )
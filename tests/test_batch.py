@@ -0,0 +1,29 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from seaport.utils.batch import chunked, map_chunks
+
+
+def square_all(values: list[int]) -> list[int]:
+    return [value * value for value in values]
+
+
+def test_chunked():
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+    with pytest.raises(ValueError):
+        list(chunked(range(5), 0))
+
+
+def test_map_chunks_matches_serial_mapping():
+    expected = square_all(list(range(11)))
+
+    assert map_chunks(square_all, range(11), chunk_size=3) == expected
+    assert map_chunks(square_all, range(11), max_workers=2, chunk_size=3) == expected
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert (
+            map_chunks(square_all, iter(range(11)), chunk_size=3, executor=executor)
+            == expected
+        )
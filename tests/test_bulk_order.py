@@ -0,0 +1,213 @@
+import json
+
+import pytest
+from eth_account import Account
+from eth_hash.auto import keccak
+from eth_keys import KeyAPI
+from web3 import Web3
+from web3.constants import ADDRESS_ZERO, HASH_ZERO
+
+from seaport.constants import EIP_712_ORDER_TYPE
+from seaport.seaport import Seaport
+from seaport.types import ContractOverrides, SeaportConfig
+from seaport.utils.merkletree import EMPTY_ORDER_HASH, BulkOrderTree
+from seaport.utils.order_hash import get_bulk_order_type_hash
+from seaport.utils.signer import LocalAccountOrderSigner
+from tests.helpers import create_order_components, create_order_parameters
+
+account = Account.from_key("0x" + "11" * 32)
+seaport_address = "0x00000000000001ad428e4906aE43D8F9852d0dD6"
+
+
+# Straightforward EIP-712 implementation used as the reference, independent of the tree and hashing code
+def get_dependencies(primary_type: str, types: dict) -> set[str]:
+    dependencies = {primary_type}
+
+    for field in types[primary_type]:
+        field_type = field["type"].split("[")[0]
+
+        if field_type in types and field_type not in dependencies:
+            dependencies |= get_dependencies(field_type, types)
+
+    return dependencies
+
+
+def encode_type(primary_type: str, types: dict) -> str:
+    dependencies = sorted(get_dependencies(primary_type, types) - {primary_type})
+
+    return "".join(
+        f"{name}({','.join(field['type'] + ' ' + field['name'] for field in types[name])})"
+        for name in [primary_type, *dependencies]
+    )
+
+
+def encode_value(value_type: str, value, types: dict) -> bytes:
+    if value_type.endswith("]"):
+        item_type = value_type[: value_type.rindex("[")]
+
+        return keccak(b"".join(encode_value(item_type, item, types) for item in value))
+
+    if value_type in types:
+        return hash_struct(value_type, types, value)
+
+    if value_type == "string":
+        return keccak(value.encode("utf-8"))
+
+    if value_type in ("address", "bytes32"):
+        return int(value, 16).to_bytes(32, "big")
+
+    return int(value).to_bytes(32, "big")
+
+
+def hash_struct(primary_type: str, types: dict, data: dict) -> bytes:
+    return keccak(
+        keccak(encode_type(primary_type, types).encode("utf-8"))
+        + b"".join(
+            encode_value(field["type"], data[field["name"]], types)
+            for field in types[primary_type]
+        )
+    )
+
+
+def create_offline_seaport(monkeypatch, contract_version: str = "1.4") -> Seaport:
+    seaport = Seaport(
+        provider=Web3.HTTPProvider("http://127.0.0.1:8545"),
+        config=SeaportConfig(
+            overrides=ContractOverrides(contract_address=seaport_address),
+            contract_version=contract_version,
+        ),
+        signer=LocalAccountOrderSigner(account.key.hex()),
+    )
+    monkeypatch.setattr(seaport, "_get_chain_id", lambda: 1)
+
+    return seaport
+
+
+@pytest.mark.parametrize("order_count, height", [(1, 1), (2, 1), (3, 2), (5, 3)])
+def test_bulk_order_signatures_match_the_reference_digest(
+    monkeypatch, order_count, height
+):
+    seaport = create_offline_seaport(monkeypatch)
+    orders_parameters = [
+        create_order_parameters(account.address, nft_id=nft_id, salt=nft_id)
+        for nft_id in range(order_count)
+    ]
+
+    typed_data = json.loads(
+        seaport._get_messages_to_sign(
+            orders_parameters=orders_parameters, counter=0, bulk=True
+        )[0]
+    )
+    types = typed_data["types"]
+    digest = keccak(
+        b"\x19\x01"
+        + hash_struct("EIP712Domain", types, typed_data["domain"])
+        + hash_struct("BulkOrder", types, typed_data["message"])
+    )
+
+    signatures = seaport.sign_bulk_order(
+        orders_parameters=orders_parameters, counter=0, account_address=account.address
+    )
+
+    assert len(signatures) == order_count
+
+    for index, (order_parameters, signature) in enumerate(
+        zip(orders_parameters, signatures)
+    ):
+        signature_bytes = bytes.fromhex(signature[2:])
+
+        # Compact signature, 3 byte order index, then one proof element per level
+        assert len(signature_bytes) == 64 + 3 + 32 * height
+        assert int.from_bytes(signature_bytes[64:67], "big") == index
+
+        # Walk the proof the same way the contract does, from the order hash up to the root
+        node = hash_struct(
+            "OrderComponents",
+            types,
+            {**json.loads(order_parameters.json()), "counter": 0},
+        )
+        for level in range(height):
+            proof_element = signature_bytes[67 + 32 * level : 99 + 32 * level]
+            node = (
+                keccak(proof_element + node)
+                if (index >> level) & 1
+                else keccak(node + proof_element)
+            )
+
+        assert (
+            keccak(
+                b"\x19\x01"
+                + seaport._get_domain_separator()
+                + keccak(get_bulk_order_type_hash(height) + node)
+            )
+            == digest
+        )
+
+        y_parity_and_s = int.from_bytes(signature_bytes[32:64], "big")
+        recovered = KeyAPI.Signature(
+            vrs=(
+                y_parity_and_s >> 255,
+                int.from_bytes(signature_bytes[:32], "big"),
+                y_parity_and_s & ((1 << 255) - 1),
+            )
+        ).recover_public_key_from_msg_hash(digest)
+
+        assert recovered.to_checksum_address() == account.address
+
+
+def test_bulk_order_tree_is_padded_with_empty_orders():
+    empty_order = {
+        "offerer": ADDRESS_ZERO,
+        "zone": ADDRESS_ZERO,
+        "offer": [],
+        "consideration": [],
+        "orderType": 0,
+        "startTime": 0,
+        "endTime": 0,
+        "zoneHash": HASH_ZERO,
+        "salt": 0,
+        "conduitKey": HASH_ZERO,
+        "counter": 0,
+    }
+
+    assert EMPTY_ORDER_HASH == hash_struct(
+        "OrderComponents", EIP_712_ORDER_TYPE, empty_order
+    )
+
+    tree = BulkOrderTree(
+        [
+            create_order_components(account.address, nft_id=nft_id, salt=nft_id)
+            for nft_id in range(3)
+        ]
+    )
+
+    assert tree.elements[3] == EMPTY_ORDER_HASH
+    assert len(tree.get_leaf_orders_components()) == 4
+
+
+def test_bulk_order_proofs_are_looked_up_by_index():
+    tree = BulkOrderTree(
+        [
+            create_order_components(account.address, nft_id=nft_id, salt=nft_id)
+            for nft_id in range(3)
+        ]
+    )
+    signature = "0x" + "11" * 64 + "1b"
+    proofs = tree.get_proofs_bytes_by_index([0, 1, 2])
+
+    assert proofs[2] == [EMPTY_ORDER_HASH, keccak(tree.elements[0] + tree.elements[1])]
+    assert tree.get_signatures(signature) == [
+        tree.get_signature(index, signature) for index in range(3)
+    ]
+    assert tree.get_signature(2, signature).endswith(b"".join(proofs[2]).hex())
+
+
+def test_bulk_orders_are_gated_on_the_contract_version(monkeypatch):
+    seaport = create_offline_seaport(monkeypatch, contract_version="1.1")
+
+    with pytest.raises(ValueError):
+        seaport.sign_bulk_order(
+            orders_parameters=[create_order_parameters(account.address)],
+            counter=0,
+            account_address=account.address,
+        )
@@ -0,0 +1,320 @@
+from random import Random
+
+import pytest
+from eth_utils import function_abi_to_4byte_selector
+from web3 import Web3
+from web3._utils.abi import get_abi_input_types
+from web3.constants import ADDRESS_ZERO, HASH_ZERO
+
+from seaport.abi.Seaport import SEAPORT_ABI
+from seaport.constants import MAX_INT, ItemType, OrderType, Side
+from seaport.types import (
+    AdditionalRecipient,
+    AdvancedOrder,
+    BasicOrderParameters,
+    ConsiderationItem,
+    CriteriaResolver,
+    OfferItem,
+    OrderParameters,
+)
+from seaport.utils.calldata import (
+    FULFILL_ADVANCED_ORDER_SELECTOR,
+    FULFILL_AVAILABLE_ADVANCED_ORDERS_SELECTOR,
+    FULFILL_AVAILABLE_ORDERS_SELECTOR,
+    FULFILL_BASIC_ORDER_SELECTOR,
+    FULFILL_ORDER_SELECTOR,
+    encode_fulfill_advanced_order,
+    encode_fulfill_available_advanced_orders,
+    encode_fulfill_available_orders,
+    encode_fulfill_basic_order,
+    encode_fulfill_order,
+    encode_fulfillments,
+)
+from seaport.utils.pydantic import parse_model_list
+
+contract = Web3().eth.contract(abi=SEAPORT_ABI)
+
+
+def get_function_abi(name: str) -> dict:
+    (function_abi,) = [
+        abi
+        for abi in SEAPORT_ABI
+        if abi.get("name") == name and abi["type"] == "function"
+    ]
+
+    return function_abi
+
+
+def decode_calldata(name: str, calldata: str) -> tuple:
+    data = bytes.fromhex(calldata[2:])
+
+    assert data[:4] == function_abi_to_4byte_selector(get_function_abi(name))
+
+    return Web3().codec.decode_abi(
+        get_abi_input_types(get_function_abi(name)), data[4:]
+    )
+
+
+def assert_decodes_like_web3(name: str, calldata: str, args: list):
+    assert decode_calldata(name, calldata) == decode_calldata(
+        name, contract.encodeABI(fn_name=name, args=args)
+    )
+
+
+def random_address(random: Random) -> str:
+    return Web3.toChecksumAddress(random.getrandbits(160).to_bytes(20, "big"))
+
+
+def random_hex(random: Random, size: int) -> str:
+    return (
+        "0x" + random.getrandbits(8 * size).to_bytes(size, "big").hex()
+        if size
+        else "0x"
+    )
+
+
+def create_advanced_order(random: Random) -> AdvancedOrder:
+    consideration = [
+        ConsiderationItem(
+            itemType=random.choice(list(ItemType)),
+            token=random_address(random),
+            identifierOrCriteria=random.getrandbits(256),
+            startAmount=random.getrandbits(128),
+            endAmount=random.getrandbits(128),
+            recipient=random_address(random),
+        )
+        for _ in range(random.randint(0, 4))
+    ]
+
+    return AdvancedOrder(
+        parameters=OrderParameters(
+            offerer=random_address(random),
+            zone=random_address(random),
+            orderType=random.choice(list(OrderType)),
+            startTime=random.getrandbits(32),
+            endTime=random.choice([random.getrandbits(32), MAX_INT]),
+            salt=random.getrandbits(256),
+            offer=[
+                OfferItem(
+                    itemType=random.choice(list(ItemType)),
+                    token=random_address(random),
+                    identifierOrCriteria=random.getrandbits(256),
+                    startAmount=random.getrandbits(128),
+                    endAmount=random.getrandbits(128),
+                )
+                for _ in range(random.randint(0, 3))
+            ],
+            consideration=consideration,
+            zoneHash=random_hex(random, 32),
+            totalOriginalConsiderationItems=len(consideration),
+            conduitKey=random.choice([HASH_ZERO, random_hex(random, 32)]),
+        ),
+        signature=random_hex(random, random.choice([0, 64, 65, 64 + 3 + 32 * 4])),
+        numerator=random.getrandbits(120),
+        denominator=random.getrandbits(120),
+        extraData=random_hex(random, random.choice([0, 1, 32, 40])),
+    )
+
+
+def create_criteria_resolvers(random: Random) -> list[CriteriaResolver]:
+    return [
+        CriteriaResolver(
+            orderIndex=random.getrandbits(8),
+            side=random.choice(list(Side)),
+            index=random.getrandbits(8),
+            identifier=random.getrandbits(256),
+            criteriaProof=[random_hex(random, 32) for _ in range(random.randint(0, 5))],
+        )
+        for _ in range(random.randint(0, 3))
+    ]
+
+
+def create_fulfillments(
+    random: Random, max_components: int = 2
+) -> list[list[tuple[int, int]]]:
+    return [
+        [
+            (random.getrandbits(8), random.getrandbits(8))
+            for _ in range(random.randint(1, max_components))
+        ]
+        for _ in range(random.randint(0, 4))
+    ]
+
+
+@pytest.mark.parametrize(
+    "name,selector",
+    [
+        ("fulfillBasicOrder", FULFILL_BASIC_ORDER_SELECTOR),
+        ("fulfillOrder", FULFILL_ORDER_SELECTOR),
+        ("fulfillAdvancedOrder", FULFILL_ADVANCED_ORDER_SELECTOR),
+        ("fulfillAvailableOrders", FULFILL_AVAILABLE_ORDERS_SELECTOR),
+        ("fulfillAvailableAdvancedOrders", FULFILL_AVAILABLE_ADVANCED_ORDERS_SELECTOR),
+    ],
+)
+def test_selectors_match_the_abi(name: str, selector: bytes):
+    assert function_abi_to_4byte_selector(get_function_abi(name)) == selector
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_fulfill_basic_order_calldata_decodes_like_web3(seed: int):
+    random = Random(seed)
+    additional_recipients = [
+        AdditionalRecipient(
+            amount=random.getrandbits(128), recipient=random_address(random)
+        )
+        for _ in range(random.randint(0, 4))
+    ]
+    parameters = BasicOrderParameters(
+        considerationToken=random_address(random),
+        considerationIdentifier=random.getrandbits(256),
+        considerationAmount=random.getrandbits(128),
+        offerer=random_address(random),
+        zone=random_address(random),
+        offerToken=random_address(random),
+        offerIdentifier=random.getrandbits(256),
+        offerAmount=random.getrandbits(128),
+        basicOrderType=random.randint(0, 23),
+        startTime=random.getrandbits(32),
+        endTime=MAX_INT,
+        zoneHash=random_hex(random, 32),
+        salt=random.getrandbits(256),
+        offererConduitKey=random_hex(random, 32),
+        fulfillerConduitKey=HASH_ZERO,
+        totalOriginalAdditionalRecipients=len(additional_recipients),
+        additionalRecipients=additional_recipients,
+        signature=random_hex(random, random.choice([0, 64, 65])),
+    )
+
+    assert_decodes_like_web3(
+        "fulfillBasicOrder",
+        encode_fulfill_basic_order(parameters),
+        [parameters.dict()],
+    )
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_fulfill_order_calldata_decodes_like_web3(seed: int):
+    random = Random(seed)
+    advanced_order = create_advanced_order(random)
+    order = {
+        "parameters": advanced_order.parameters.dict(),
+        "signature": advanced_order.signature,
+    }
+
+    assert_decodes_like_web3(
+        "fulfillOrder",
+        encode_fulfill_order(advanced_order, HASH_ZERO),
+        [order, HASH_ZERO],
+    )
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_fulfill_advanced_order_calldata_decodes_like_web3(seed: int):
+    random = Random(seed)
+    advanced_order = create_advanced_order(random)
+    criteria_resolvers = create_criteria_resolvers(random)
+    conduit_key = random_hex(random, 32)
+    recipient = random.choice([ADDRESS_ZERO, random_address(random)])
+
+    assert_decodes_like_web3(
+        "fulfillAdvancedOrder",
+        encode_fulfill_advanced_order(
+            advanced_order, criteria_resolvers, conduit_key, recipient
+        ),
+        [
+            advanced_order.dict(),
+            parse_model_list(criteria_resolvers),
+            conduit_key,
+            recipient,
+        ],
+    )
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_fulfill_available_orders_calldata_decodes_like_web3(seed: int):
+    random = Random(seed)
+    advanced_orders = [
+        create_advanced_order(random) for _ in range(random.randint(0, 4))
+    ]
+    offer_fulfillments = create_fulfillments(random)
+    consideration_fulfillments = create_fulfillments(random)
+    orders = [
+        {"parameters": order.parameters.dict(), "signature": order.signature}
+        for order in advanced_orders
+    ]
+
+    assert_decodes_like_web3(
+        "fulfillAvailableOrders",
+        encode_fulfill_available_orders(
+            advanced_orders,
+            offer_fulfillments,
+            consideration_fulfillments,
+            HASH_ZERO,
+            len(advanced_orders),
+        ),
+        [
+            orders,
+            offer_fulfillments,
+            consideration_fulfillments,
+            HASH_ZERO,
+            len(advanced_orders),
+        ],
+    )
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_fulfill_available_advanced_orders_calldata_decodes_like_web3(seed: int):
+    random = Random(seed)
+    advanced_orders = [
+        create_advanced_order(random) for _ in range(random.randint(0, 4))
+    ]
+    criteria_resolvers = create_criteria_resolvers(random)
+    offer_fulfillments = create_fulfillments(random)
+    consideration_fulfillments = create_fulfillments(random)
+    recipient = random.choice([ADDRESS_ZERO, random_address(random)])
+    maximum_fulfilled = random.getrandbits(8)
+
+    assert_decodes_like_web3(
+        "fulfillAvailableAdvancedOrders",
+        encode_fulfill_available_advanced_orders(
+            advanced_orders,
+            criteria_resolvers,
+            offer_fulfillments,
+            consideration_fulfillments,
+            HASH_ZERO,
+            recipient,
+            maximum_fulfilled,
+        ),
+        [
+            parse_model_list(advanced_orders),
+            parse_model_list(criteria_resolvers),
+            offer_fulfillments,
+            consideration_fulfillments,
+            HASH_ZERO,
+            recipient,
+            maximum_fulfilled,
+        ],
+    )
+
+
+def test_fulfillments_with_many_components_are_fully_encoded():
+    # ContractFunction aligns each fulfillment of a tuple[][] argument as a single tuple,
+    # which truncates them to their first two components
+    fulfillments = create_fulfillments(Random(0), max_components=6)
+
+    assert Web3().codec.decode_single(
+        "(uint256,uint256)[][]", encode_fulfillments(fulfillments)
+    ) == tuple(map(tuple, fulfillments))
+
+
+def test_empty_values_are_canonically_encoded():
+    # eth-abi pads empty bytes and empty arrays of dynamic elements with an extra zero word
+    calldata = encode_fulfill_available_orders([], [], [], HASH_ZERO, 0)
+
+    # Offsets of the three arrays, the conduit key, maximumFulfilled and the length of every array
+    assert len(calldata) == 2 + 2 * (4 + 8 * 32)
+    assert len(calldata) < len(
+        contract.encodeABI(
+            fn_name="fulfillAvailableOrders", args=[[], [], [], HASH_ZERO, 0]
+        )
+    )
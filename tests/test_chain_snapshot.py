@@ -0,0 +1,76 @@
+from seaport.constants import ItemType
+from seaport.seaport import Seaport
+from seaport.types import OfferItem
+from seaport.utils.balance_and_approval_check import get_balances_and_approvals
+from seaport.utils.order import generate_random_salt
+from tests.helpers import create_order_components
+
+erc20_amount = 1000
+
+
+def test_reads_are_pinned_to_the_snapshot_block(seaport: Seaport, erc20, offerer, zone):
+    erc20.mint(offerer, erc20_amount)
+    block_number = seaport.web3.eth.block_number
+
+    order = create_order_components(
+        offerer.address,
+        [
+            OfferItem(
+                itemType=ItemType.ERC20,
+                token=erc20.address,
+                identifierOrCriteria=0,
+                startAmount=erc20_amount,
+                endAmount=erc20_amount,
+            )
+        ],
+        price=1,
+        salt=generate_random_salt(),
+        counter=seaport.get_counter(offerer.address),
+    )
+    order_hash = seaport.get_order_hash(order)
+
+    erc20.mint(offerer, erc20_amount)
+    erc20.approve(seaport.contract.address, erc20_amount, {"from": offerer})
+    seaport.cancel_orders([order]).transact({"from": offerer.address})
+
+    snapshot = seaport.at_block(block_number)
+
+    assert snapshot.block_number == block_number
+
+    balances_and_approvals = get_balances_and_approvals(
+        owner=offerer.address,
+        items=order.offer,
+        criterias=[],
+        operator=seaport.contract.address,
+        web3=seaport.web3,
+        snapshot=snapshot,
+    )
+
+    assert balances_and_approvals[0].balance == erc20_amount
+    assert balances_and_approvals[0].approved_amount == 0
+    assert not seaport.get_order_status(order_hash, snapshot).is_cancelled
+    assert not seaport.get_order_statuses([order_hash], snapshot)[0].is_cancelled
+
+    # Reads without a snapshot are made at the latest block
+    assert seaport.get_order_status(order_hash).is_cancelled
+    assert erc20.balanceOf(offerer) == erc20_amount * 2
+
+
+def test_snapshot_memoizes_reads(seaport: Seaport, erc20, offerer):
+    erc20.mint(offerer, erc20_amount)
+
+    snapshot = seaport.at_block()
+    balance_of = seaport.web3.eth.contract(
+        address=erc20.address, abi=erc20.abi
+    ).functions.balanceOf(offerer.address)
+
+    assert snapshot.call(balance_of) == erc20_amount
+
+    # Already read at this block, so the new balance isn't fetched
+    erc20.mint(offerer, erc20_amount)
+
+    assert snapshot.call_many([balance_of, balance_of]) == [
+        erc20_amount,
+        erc20_amount,
+    ]
+    assert seaport.at_block().call(balance_of) == erc20_amount * 2
@@ -0,0 +1,47 @@
+from web3 import Web3
+
+from seaport.utils.contract_cache import (
+    AbiKind,
+    ContractCache,
+    get_contract,
+    get_function_selector,
+)
+from seaport.utils.multicall import encode_contract_function_data
+
+token = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+token2 = "0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512"
+
+
+def test_contracts_are_cached_by_checksum_address_and_abi_kind():
+    web3 = Web3()
+    contract = get_contract(web3, token.lower(), AbiKind.ERC20)
+
+    assert contract.address == token
+    assert get_contract(web3, token, AbiKind.ERC20) is contract
+    assert get_contract(web3, token, AbiKind.ERC721) is not contract
+    # Contracts are bound to their web3 instance
+    assert get_contract(Web3(), token, AbiKind.ERC20) is not contract
+
+
+def test_least_recently_used_contract_is_evicted():
+    web3 = Web3()
+    contract_cache = ContractCache(max_contracts=2)
+
+    contract = contract_cache.get(web3, token, AbiKind.ERC20)
+    evicted_contract = contract_cache.get(web3, token, AbiKind.ERC721)
+    contract_cache.get(web3, token, AbiKind.ERC20)
+    contract_cache.get(web3, token2, AbiKind.ERC20)
+
+    assert contract_cache.get(web3, token, AbiKind.ERC20) is contract
+    assert contract_cache.get(web3, token, AbiKind.ERC721) is not evicted_contract
+
+
+def test_precomputed_selectors_match_web3():
+    contract = get_contract(Web3(), token, AbiKind.ERC1155)
+    balance_of = contract.functions.balanceOf(token2, 1)
+
+    assert get_function_selector(balance_of.abi) == balance_of.selector
+    assert (
+        encode_contract_function_data(balance_of)
+        == balance_of._encode_transaction_data()
+    )
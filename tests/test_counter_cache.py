@@ -0,0 +1,97 @@
+from web3 import Web3
+
+from seaport.constants import ItemType
+from seaport.seaport import Seaport
+from seaport.types import (
+    ConsiderationCurrencyItem,
+    ContractOverrides,
+    OfferErc721Item,
+    SeaportConfig,
+)
+
+nft_id = 1
+
+
+def create_seaport(seaport_contract) -> Seaport:
+    # Each test gets its own client, as the chain is rewound between tests but cached counters aren't
+    return Seaport(
+        provider=Web3.HTTPProvider("http://127.0.0.1:8545"),
+        config=SeaportConfig(
+            overrides=ContractOverrides(contract_address=seaport_contract.address)
+        ),
+    )
+
+
+def create_order_counter(seaport: Seaport, offerer, token: str, **kwargs) -> int:
+    use_case = seaport.create_order(
+        offer=[
+            OfferErc721Item(itemType=ItemType.ERC721, token=token, identifier=nft_id)
+        ],
+        consideration=[
+            ConsiderationCurrencyItem(
+                amount=Web3.toWei(10, "ether"), recipient=offerer.address
+            )
+        ],
+        account_address=offerer.address,
+        **kwargs,
+    )
+
+    return use_case.actions[-1].create_order().parameters.counter
+
+
+def test_counter_is_cached_until_bulk_cancelled(seaport_contract, erc721, offerer):
+    seaport = create_seaport(seaport_contract)
+    erc721.mint(offerer, nft_id)
+
+    assert create_order_counter(seaport, offerer, erc721.address) == 0
+
+    # Incremented outside of the client, so the cached counter is still used
+    seaport_contract.incrementCounter({"from": offerer})
+
+    assert create_order_counter(seaport, offerer, erc721.address) == 0
+
+    seaport.bulk_cancel_orders().transact({"from": offerer.address})
+
+    assert create_order_counter(seaport, offerer, erc721.address) == 2
+
+
+def test_counter_is_cached_from_the_bulk_cancel_receipt(
+    seaport_contract, erc721, offerer
+):
+    seaport = create_seaport(seaport_contract)
+    erc721.mint(offerer, nft_id)
+
+    seaport.bulk_cancel_orders().transact({"from": offerer.address})
+    # Incremented outside of the client, so the counter cached once the bulk cancel was mined is still used
+    seaport_contract.incrementCounter({"from": offerer})
+
+    assert create_order_counter(seaport, offerer, erc721.address) == 1
+
+
+def test_counter_is_updated_from_counter_incremented_logs(
+    seaport_contract, erc721, offerer
+):
+    seaport = create_seaport(seaport_contract)
+    erc721.mint(offerer, nft_id)
+
+    assert seaport.get_counter(offerer.address) == 0
+
+    tx = seaport_contract.incrementCounter({"from": offerer})
+    receipt = seaport.web3.eth.get_transaction_receipt(tx.txid)
+    seaport.process_counter_incremented_logs(receipt["logs"])
+
+    assert create_order_counter(seaport, offerer, erc721.address) == 1
+
+
+def test_zero_counter_is_not_refetched(seaport_contract, erc721, offerer):
+    seaport = create_seaport(seaport_contract)
+    erc721.mint(offerer, nft_id)
+    seaport_contract.incrementCounter({"from": offerer})
+
+    assert create_order_counter(seaport, offerer, erc721.address, counter=0) == 0
+    assert create_order_counter(seaport, offerer, erc721.address) == 1
+
+    seaport.invalidate_counter_cache(offerer.address)
+    seaport_contract.incrementCounter({"from": offerer})
+
+    assert create_order_counter(seaport, offerer, erc721.address) == 2
@@ -0,0 +1,76 @@
+from web3 import Web3
+
+from seaport.seaport import Seaport
+from seaport.types import (
+    ApprovalAction,
+    ConsiderationCurrencyItem,
+    CreateOrderInput,
+    CreateOrdersAction,
+    FulfillOrderDetails,
+    OfferErc721Item,
+)
+
+nft_ids = [1, 2, 3]
+start_time = 0
+
+
+def create_order_input(token: str, nft_id: int, recipient: str) -> CreateOrderInput:
+    return CreateOrderInput(
+        offer=[OfferErc721Item(token=token, identifier=nft_id)],
+        consideration=[
+            ConsiderationCurrencyItem(
+                amount=Web3.toWei(1, "ether"), recipient=recipient
+            )
+        ],
+        salt=nft_id,
+        start_time=start_time,
+    )
+
+
+def test_create_orders_matches_create_order(
+    seaport: Seaport, erc721, offerer, fulfiller
+):
+    for nft_id in nft_ids:
+        erc721.mint(offerer, nft_id)
+
+    use_case = seaport.create_orders(
+        [
+            create_order_input(erc721.address, nft_id, offerer.address)
+            for nft_id in nft_ids
+        ],
+        account_address=offerer.address,
+    )
+
+    # A single approval covers every order offering the collection
+    approval_action, create_orders_action = use_case.actions
+
+    assert isinstance(approval_action, ApprovalAction)
+    assert approval_action.token == erc721.address
+    assert isinstance(create_orders_action, CreateOrdersAction)
+
+    orders = use_case.execute_all_actions()
+
+    assert orders == [
+        seaport.create_order(
+            offer=[OfferErc721Item(token=erc721.address, identifier=nft_id)],
+            consideration=[
+                ConsiderationCurrencyItem(
+                    amount=Web3.toWei(1, "ether"), recipient=offerer.address
+                )
+            ],
+            account_address=offerer.address,
+            salt=nft_id,
+            start_time=start_time,
+        )
+        .actions[-1]
+        .create_order()
+        for nft_id in nft_ids
+    ]
+
+    seaport.fulfill_orders(
+        [FulfillOrderDetails(order=order) for order in orders],
+        account_address=fulfiller.address,
+    ).execute_all_actions()
+
+    for nft_id in nft_ids:
+        assert erc721.ownerOf(nft_id) == fulfiller
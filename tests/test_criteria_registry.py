@@ -0,0 +1,162 @@
+import pytest
+from web3 import Web3
+from web3.constants import ADDRESS_ZERO
+
+from seaport.constants import ItemType
+from seaport.seaport import Seaport
+from seaport.types import (
+    InputCriteria,
+    OfferErc721ItemWithCriteria,
+    OfferItem,
+    OrderWithCounter,
+)
+from seaport.utils.criteria_registry import CriteriaRegistry
+from seaport.utils.item import generate_criteria_resolvers
+from seaport.utils.merkle_proof_index import MerkleProofIndex, write_merkle_tree
+from seaport.utils.merkletree import MerkleTree
+from tests.helpers import (
+    create_consideration_item,
+    create_order_components,
+    erc721,
+    offerer,
+)
+
+identifiers = [1, 5, 9, 42]
+
+
+def create_criteria_order(offer_root: int, consideration_root: int) -> OrderWithCounter:
+    return OrderWithCounter(
+        parameters=create_order_components(
+            offerer,
+            [
+                OfferItem(
+                    itemType=ItemType.ERC721_WITH_CRITERIA,
+                    token=erc721,
+                    identifierOrCriteria=offer_root,
+                    startAmount=1,
+                    endAmount=1,
+                )
+            ],
+            [
+                create_consideration_item(ItemType.NATIVE, ADDRESS_ZERO, 0, 1, offerer),
+                create_consideration_item(
+                    ItemType.ERC721_WITH_CRITERIA,
+                    erc721,
+                    consideration_root,
+                    1,
+                    offerer,
+                ),
+            ],
+        ),
+        signature="0x",
+    )
+
+
+def test_criterias_are_resolved_from_the_chosen_identifiers():
+    registry = CriteriaRegistry()
+    tree = MerkleTree(identifiers)
+    root = registry.register(identifiers)
+    order = create_criteria_order(root, 0)
+
+    assert root == tree.get_root_as_int()
+    assert registry.get_criterias(order.parameters.offer, [42]) == [
+        InputCriteria(identifier=42, proof=tree.get_proof(42))
+    ]
+    # A root of 0 allows any identifier
+    assert registry.get_criterias(order.parameters.consideration, [7]) == [
+        InputCriteria(identifier=7, proof=[])
+    ]
+
+    with pytest.raises(ValueError):
+        registry.get_criterias(order.parameters.offer, [2])
+
+    with pytest.raises(ValueError):
+        registry.get_criterias(order.parameters.offer, [])
+
+
+def test_single_identifier_trees_have_empty_proofs():
+    registry = CriteriaRegistry()
+    root = registry.register([3])
+
+    assert registry.get_criteria(root, 3) == InputCriteria(identifier=3, proof=[])
+
+    with pytest.raises(ValueError):
+        registry.get_criteria(root, 4)
+
+
+def test_least_recently_used_trees_are_evicted():
+    registry = CriteriaRegistry(max_trees=2)
+    first_root = registry.register([1, 2])
+    second_root = registry.register([3, 4])
+
+    registry.get_tree(first_root)
+    third_root = registry.register([5, 6])
+
+    assert first_root in registry
+    assert second_root not in registry
+    assert third_root in registry
+
+    with pytest.raises(ValueError):
+        registry.get_criteria(second_root, 3)
+
+
+def test_evicted_trees_are_mapped_from_the_directory(tmp_path):
+    tree = MerkleTree(identifiers)
+    write_merkle_tree(tree, tmp_path)
+    registry = CriteriaRegistry(max_trees=1, directory=tmp_path)
+
+    registry.register([1, 2])
+
+    mapped_tree = registry.get_tree(tree.get_root_as_int())
+
+    assert registry.get_criteria(tree.get_root_as_int(), 9) == InputCriteria(
+        identifier=9, proof=tree.get_proof(9)
+    )
+    assert len(registry) == 1
+    assert isinstance(mapped_tree, MerkleProofIndex)
+
+    # Evicting the mapped tree releases its mapping
+    registry.register([1, 2])
+
+    assert mapped_tree._buffer.closed
+
+
+def test_criterias_without_proofs_must_match_criteria_items():
+    registry = CriteriaRegistry()
+    root = registry.register(identifiers)
+    order = create_criteria_order(root, 0)
+
+    with pytest.raises(ValueError):
+        registry.resolve_criterias(
+            order.parameters.offer,
+            [InputCriteria(identifier=5), InputCriteria(identifier=9)],
+        )
+
+    with pytest.raises(ValueError):
+        generate_criteria_resolvers(
+            orders=[order],
+            offer_criterias=[[InputCriteria(identifier=5)]],
+            consideration_criterias=[[InputCriteria(identifier=8)]],
+        )
+
+
+def test_seaport_resolves_criterias_of_orders_it_created():
+    seaport = Seaport(provider=Web3.HTTPProvider("http://127.0.0.1:8545"))
+    tree = MerkleTree(identifiers)
+
+    (offer_item,), _ = seaport._map_create_order_items(
+        offerer=offerer,
+        offer=[OfferErc721ItemWithCriteria(token=erc721, identifiers=identifiers)],
+        consideration=[],
+    )
+    order = create_criteria_order(offer_item.identifierOrCriteria, 0)
+
+    offer_criteria, consideration_criteria = seaport._resolve_fulfill_order_criterias(
+        order=order,
+        offer_criteria=[InputCriteria(identifier=5)],
+        consideration_criteria=[InputCriteria(identifier=8, proof=[])],
+    )
+
+    assert offer_item.identifierOrCriteria == tree.get_root_as_int()
+    assert offer_criteria == [InputCriteria(identifier=5, proof=tree.get_proof(5))]
+    assert consideration_criteria == [InputCriteria(identifier=8, proof=[])]
@@ -0,0 +1,211 @@
+from random import Random
+
+import pytest
+from web3.constants import ADDRESS_ZERO, HASH_ZERO
+
+from seaport.constants import FulfillRoute, ItemType, Side
+from seaport.types import (
+    AdvancedOrder,
+    ConsiderationItem,
+    CriteriaResolver,
+    FulfillOrderDetails,
+    FulfillOrdersBudget,
+    FulfillOrdersCostModel,
+    InputCriteria,
+)
+from seaport.utils.calldata import (
+    encode_fulfill_available_advanced_orders,
+    get_calldata_size,
+)
+from seaport.utils.fulfill_chunks import plan_fulfill_orders_chunks
+from seaport.utils.fulfill_cost import estimate_fulfill_orders_cost
+from tests.helpers import create_listing
+
+cost_model = FulfillOrdersCostModel()
+
+
+def create_fulfill_order_details(random: Random) -> FulfillOrderDetails:
+    """
+    Random listing, with criteria items a third of the time, extra data and signatures up to bulk signature size
+    """
+    nft_count = random.randint(1, 3)
+    criteria = random.random() < 0.3
+    detail = create_listing(
+        random,
+        ItemType.ERC721_WITH_CRITERIA if criteria else ItemType.ERC721,
+        nft_count,
+    )
+
+    return detail.copy(
+        update={
+            "order": detail.order.copy(
+                update={
+                    "signature": "0x" + "ab" * random.choice([64, 65, 64 + 3 + 32 * 4])
+                }
+            ),
+            "offer_criteria": [
+                InputCriteria(
+                    identifier=index, proof=[HASH_ZERO] * random.randint(0, 12)
+                )
+                for index in range(nft_count)
+            ]
+            if criteria
+            else [],
+            "extra_data": "0x" + "00" * random.randint(0, 40),
+        }
+    )
+
+
+def get_fulfill_orders_calldata_size(
+    fulfill_order_details: list[FulfillOrderDetails],
+) -> int:
+    # Encodes what fulfill_available_orders sends, with a resolver per criteria item and a fulfillment per item
+    advanced_orders = []
+    criteria_resolvers = []
+    offer_fulfillments = []
+    consideration_fulfillments = []
+
+    for order_index, detail in enumerate(fulfill_order_details):
+        consideration = detail.order.parameters.consideration + [
+            ConsiderationItem(
+                itemType=ItemType.NATIVE,
+                token=ADDRESS_ZERO,
+                identifierOrCriteria=0,
+                startAmount=tip.amount,
+                endAmount=tip.amount,
+                recipient=tip.recipient,
+            )
+            for tip in detail.tips
+        ]
+        advanced_orders.append(
+            AdvancedOrder(
+                parameters=detail.order.parameters.copy(
+                    update={"consideration": consideration}
+                ),
+                signature=detail.order.signature,
+                numerator=1,
+                denominator=1,
+                extraData=detail.extra_data,
+            )
+        )
+        criteria_resolvers += [
+            CriteriaResolver(
+                orderIndex=order_index,
+                side=Side.OFFER,
+                index=index,
+                identifier=criteria.identifier,
+                criteriaProof=criteria.proof,
+            )
+            for index, criteria in enumerate(detail.offer_criteria)
+        ]
+        offer_fulfillments += [
+            [(order_index, index)]
+            for index in range(len(detail.order.parameters.offer))
+        ]
+        consideration_fulfillments += [
+            [(order_index, index)] for index in range(len(consideration))
+        ]
+
+    return get_calldata_size(
+        encode_fulfill_available_advanced_orders(
+            advanced_orders,
+            criteria_resolvers,
+            offer_fulfillments,
+            consideration_fulfillments,
+            HASH_ZERO,
+            ADDRESS_ZERO,
+            len(advanced_orders),
+        )
+    )
+
+
+def test_calldata_estimates_match_the_abi_encoding():
+    random = Random(0)
+
+    for _ in range(5):
+        fulfill_order_details = [
+            create_fulfill_order_details(random) for _ in range(random.randint(1, 10))
+        ]
+
+        assert estimate_fulfill_orders_cost(
+            fulfill_order_details, cost_model
+        ).calldata_bytes == get_fulfill_orders_calldata_size(fulfill_order_details)
+
+
+def test_calldata_estimates_match_the_abi_encoding_without_criteria():
+    random = Random(3)
+    fulfill_order_details = [
+        detail.copy(update={"offer_criteria": []})
+        for detail in (create_fulfill_order_details(random) for _ in range(5))
+    ]
+
+    assert estimate_fulfill_orders_cost(
+        fulfill_order_details, cost_model
+    ).calldata_bytes == get_fulfill_orders_calldata_size(fulfill_order_details)
+
+
+@pytest.mark.parametrize(
+    "budget",
+    [
+        FulfillOrdersBudget(gas=1_000_000),
+        FulfillOrdersBudget(calldata_bytes=8_000),
+        FulfillOrdersBudget(gas=2_000_000, calldata_bytes=12_000, max_orders=5),
+    ],
+)
+def test_chunks_stay_within_the_budget(budget: FulfillOrdersBudget):
+    random = Random(1)
+    fulfill_order_details = [create_fulfill_order_details(random) for _ in range(100)]
+
+    chunks = plan_fulfill_orders_chunks(fulfill_order_details, budget, cost_model)
+
+    assert [detail for chunk in chunks for detail in chunk] == fulfill_order_details
+    assert len(chunks) > 1
+
+    for chunk, next_chunk in zip(chunks, chunks[1:] + [[]]):
+        assert estimate_fulfill_orders_cost(chunk, cost_model).is_within(budget)
+        assert budget.max_orders is None or len(chunk) <= budget.max_orders
+
+        # Chunks are only split when the next order doesn't fit
+        if next_chunk and (budget.max_orders is None or len(chunk) < budget.max_orders):
+            assert not estimate_fulfill_orders_cost(
+                chunk + next_chunk[:1], cost_model
+            ).is_within(budget)
+
+
+def test_orders_over_the_budget_on_their_own_are_rejected():
+    fulfill_order_details = [create_fulfill_order_details(Random(2))]
+    cost = estimate_fulfill_orders_cost(fulfill_order_details, cost_model)
+
+    assert plan_fulfill_orders_chunks(
+        fulfill_order_details, FulfillOrdersBudget(gas=cost.gas), cost_model
+    ) == [fulfill_order_details]
+
+    with pytest.raises(ValueError):
+        plan_fulfill_orders_chunks(
+            fulfill_order_details, FulfillOrdersBudget(gas=cost.gas - 1), cost_model
+        )
+
+
+def test_chunks_are_costed_for_the_route_they_are_fulfilled_through():
+    random = Random(4)
+    fulfill_order_details = [
+        detail.copy(update={"offer_criteria": [], "extra_data": "0x"})
+        for detail in (create_fulfill_order_details(random) for _ in range(40))
+    ]
+    budget = FulfillOrdersBudget(calldata_bytes=10_000)
+
+    chunks = plan_fulfill_orders_chunks(
+        fulfill_order_details, budget, cost_model, route=FulfillRoute.AVAILABLE
+    )
+
+    for chunk in chunks:
+        assert estimate_fulfill_orders_cost(
+            chunk, cost_model, route=FulfillRoute.AVAILABLE
+        ).is_within(budget)
+
+    # Orders sent through fulfillAvailableOrders leave out the numerator, denominator and extra data,
+    # so chunks packed for it can be over the budget of fulfillAvailableAdvancedOrders
+    assert any(
+        not estimate_fulfill_orders_cost(chunk, cost_model).is_within(budget)
+        for chunk in chunks
+    )
@@ -2,13 +2,20 @@ import pytest
 from brownie.network.account import Accounts, _PrivateKeyAccount
 from web3 import Web3
 
-from seaport.constants import ItemType
+from seaport.constants import FulfillRoute, ItemType
 from seaport.seaport import Seaport
 from seaport.types import (
     ConsiderationCurrencyItem,
+    ContractOverrides,
+    ExchangeAction,
     FulfillOrderDetails,
+    FulfillOrdersBudget,
+    InputCriteria,
     OfferErc721Item,
+    OfferErc721ItemWithCriteria,
+    SeaportConfig,
 )
+from seaport.utils.fulfill_routes import FulfillRouteCalibration, estimate_fulfill_route
 
 
 @pytest.fixture(scope="module")
@@ -104,4 +111,160 @@ def test_multiple_orders_erc721_buy_now(
     assert second_erc721.ownerOf(nft_id) == fulfiller
 
 
+def test_multiple_orders_fulfilled_in_chunks(
+    seaport_contract,
+    seaport: Seaport,
+    erc721,
+    offerer,
+    fulfiller,
+):
+    chunked_seaport = Seaport(
+        provider=Web3.HTTPProvider("http://127.0.0.1:8545"),
+        config=SeaportConfig(
+            overrides=ContractOverrides(contract_address=seaport_contract.address),
+            fulfill_orders_budget=FulfillOrdersBudget(max_orders=2),
+        ),
+    )
+    nft_ids = [nft_id, nft_id2, 3]
+    orders = []
+
+    for identifier in nft_ids:
+        erc721.mint(offerer, identifier)
+
+        orders.append(
+            seaport.create_order(
+                account_address=offerer.address,
+                offer=[OfferErc721Item(token=erc721.address, identifier=identifier)],
+                consideration=[
+                    ConsiderationCurrencyItem(
+                        amount=Web3.toWei(10, "ether"), recipient=offerer.address
+                    ),
+                ],
+            ).execute_all_actions()
+        )
+
+    fulfill_orders_use_case = chunked_seaport.fulfill_orders(
+        fulfill_order_details=[FulfillOrderDetails(order=order) for order in orders],
+        account_address=fulfiller.address,
+    )
+
+    assert [type(action) for action in fulfill_orders_use_case.actions] == [
+        ExchangeAction,
+        ExchangeAction,
+    ]
+
+    # Every chunk is its own transaction
+    assert len(fulfill_orders_use_case.execute_all_actions()) == 2
+
+    for identifier in nft_ids:
+        assert erc721.ownerOf(identifier) == fulfiller
+
+
+def test_multiple_orders_fulfilled_through_the_cheapest_route(
+    seaport: Seaport,
+    erc721,
+    offerer,
+    fulfiller,
+):
+    nft_ids = [4, 5]
+    fulfill_order_details = []
+
+    for identifier in nft_ids:
+        erc721.mint(offerer, identifier)
+
+        fulfill_order_details.append(
+            FulfillOrderDetails(
+                order=seaport.create_order(
+                    account_address=offerer.address,
+                    offer=[
+                        OfferErc721Item(token=erc721.address, identifier=identifier)
+                    ],
+                    consideration=[
+                        ConsiderationCurrencyItem(
+                            amount=Web3.toWei(10, "ether"), recipient=offerer.address
+                        ),
+                    ],
+                ).execute_all_actions()
+            )
+        )
+
+    fulfill_orders_use_case = seaport.fulfill_orders(
+        fulfill_order_details=fulfill_order_details,
+        account_address=fulfiller.address,
+    )
+
+    # Without partial fills or criteria, fulfillAvailableOrders is cheaper than its advanced counterpart
+    assert [estimate.route for estimate in fulfill_orders_use_case.route_estimates] == [
+        FulfillRoute.AVAILABLE,
+        FulfillRoute.AVAILABLE_ADVANCED,
+    ]
+
+    (exchange_action,) = fulfill_orders_use_case.actions
+    calibration = FulfillRouteCalibration()
+    gas = calibration.record_estimate_gas(
+        FulfillRoute.AVAILABLE,
+        fulfill_order_details,
+        exchange_action.transaction_methods,
+    )
+
+    assert (
+        estimate_fulfill_route(
+            FulfillRoute.AVAILABLE,
+            fulfill_order_details,
+            calibration.get_route_cost_model(),
+        ).gas
+        == gas
+    )
+
+    fulfill_orders_use_case.execute_all_actions()
+
+    for identifier in nft_ids:
+        assert erc721.ownerOf(identifier) == fulfiller
+
+
+def test_multiple_criteria_orders_with_resolved_proofs(
+    seaport: Seaport,
+    erc721,
+    offerer,
+    fulfiller,
+):
+    identifiers_per_order = [[6, 8], [7, 9]]
+    fulfill_order_details = []
+
+    for identifiers in identifiers_per_order:
+        for identifier in identifiers:
+            erc721.mint(offerer, identifier)
+
+        fulfill_order_details.append(
+            FulfillOrderDetails(
+                order=seaport.create_order(
+                    account_address=offerer.address,
+                    offer=[
+                        OfferErc721ItemWithCriteria(
+                            token=erc721.address, identifiers=identifiers
+                        )
+                    ],
+                    consideration=[
+                        ConsiderationCurrencyItem(
+                            amount=Web3.toWei(10, "ether"), recipient=offerer.address
+                        ),
+                    ],
+                ).execute_all_actions(),
+                # The proofs are resolved from the trees registered when the orders were created
+                offer_criteria=[InputCriteria(identifier=identifiers[0])],
+            )
+        )
+
+    fulfill_orders_use_case = seaport.fulfill_orders(
+        fulfill_order_details=fulfill_order_details,
+        account_address=fulfiller.address,
+    )
+
+    fulfill_orders_use_case.execute_all_actions()
+
+    for identifiers in identifiers_per_order:
+        assert erc721.ownerOf(identifiers[0]) == fulfiller
+        assert erc721.ownerOf(identifiers[1]) == offerer
+
+
 # TODO ADD TESTS
@@ -0,0 +1,184 @@
+from web3 import Web3
+from web3.constants import ADDRESS_ZERO
+
+from seaport.constants import ItemType
+from seaport.types import (
+    ConsiderationItem,
+    FulfillmentComponent,
+    InputCriteria,
+    OfferItem,
+    Order,
+    OrderParameters,
+    OrderStatus,
+)
+from seaport.utils.fulfill import (
+    FulfillOrdersMetadata,
+    generate_fulfill_orders_fulfillments,
+    plan_fulfill_orders_fulfillments,
+)
+from tests.helpers import create_consideration_item, create_order_parameters
+
+erc20 = "0xe7f1725e7734ce288f8367e1bb143e90bb3f0512"
+erc721 = "0x5fbdb2315678afecb367f032d93f642f64180aa3"
+seller = "0x3c44cdddb6a900fa2b585dd299e03d12fa4293bc"
+fee_recipient = "0x0000a26b00c1f0df003000390027140000faa719"
+fulfiller = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+
+
+def create_orders_metadata(
+    parameters: OrderParameters,
+    tips: list[ConsiderationItem] = [],
+    offer_criteria: list[InputCriteria] = [],
+) -> FulfillOrdersMetadata:
+    return FulfillOrdersMetadata(
+        order=Order(parameters=parameters, signature="0x"),
+        units_to_fill=1,
+        order_status=OrderStatus(
+            is_validated=False, is_cancelled=False, total_filled=0, total_size=0
+        ),
+        offer_criteria=offer_criteria,
+        consideration_criteria=[],
+        tips=tips,
+        extra_data="0x",
+        offerer_balances_and_approvals=[],
+        offerer_operator=ADDRESS_ZERO,
+    )
+
+
+def create_listing_metadata(
+    offerer: str, identifier: int, tips: list[ConsiderationItem] = []
+) -> FulfillOrdersMetadata:
+    return create_orders_metadata(
+        create_order_parameters(
+            offerer,
+            consideration=[
+                create_consideration_item(
+                    ItemType.NATIVE, ADDRESS_ZERO, 0, 95, offerer
+                ),
+                create_consideration_item(
+                    ItemType.NATIVE, ADDRESS_ZERO, 0, 5, fee_recipient
+                ),
+            ],
+            token=erc721,
+            nft_id=identifier,
+        ),
+        tips,
+    )
+
+
+def test_currency_paid_to_the_same_recipient_is_aggregated_across_orders():
+    tip = create_consideration_item(
+        ItemType.NATIVE, ADDRESS_ZERO, 0, 1, Web3.toChecksumAddress(fee_recipient)
+    )
+    orders_metadata = [
+        create_listing_metadata(seller, 1),
+        create_listing_metadata(Web3.toChecksumAddress(seller), 2, [tip]),
+        create_listing_metadata(seller.upper().replace("0X", "0x"), 3),
+    ]
+
+    plan = plan_fulfill_orders_fulfillments(orders_metadata, fulfiller=fulfiller)
+
+    # Each NFT is transferred on its own, while payments to the seller and the fee recipient, tip included, are merged
+    assert plan.offer_fulfillments == [[(0, 0)], [(1, 0)], [(2, 0)]]
+    assert plan.consideration_fulfillments == [
+        [(0, 0), (1, 0), (2, 0)],
+        [(0, 1), (1, 1), (1, 2), (2, 1)],
+    ]
+    assert (plan.transfer_count, plan.item_count) == (5, 10)
+
+
+def test_items_only_merge_when_they_transfer_the_same_thing():
+    orders_metadata = [
+        create_orders_metadata(
+            create_order_parameters(
+                seller,
+                [
+                    OfferItem(
+                        itemType=ItemType.ERC721_WITH_CRITERIA,
+                        token=erc721,
+                        identifierOrCriteria=0,
+                        startAmount=1,
+                        endAmount=1,
+                    ),
+                    OfferItem(
+                        itemType=ItemType.ERC1155,
+                        token=erc721,
+                        identifierOrCriteria=7,
+                        startAmount=2,
+                        endAmount=2,
+                    ),
+                ],
+                [
+                    create_consideration_item(ItemType.ERC20, erc20, 0, 10, seller),
+                    create_consideration_item(
+                        ItemType.NATIVE, ADDRESS_ZERO, 0, 10, seller
+                    ),
+                ],
+            ),
+            offer_criteria=[InputCriteria(identifier=7)],
+        ),
+        create_orders_metadata(
+            create_order_parameters(
+                seller,
+                [
+                    OfferItem(
+                        itemType=ItemType.ERC721,
+                        token=erc721,
+                        identifierOrCriteria=7,
+                        startAmount=1,
+                        endAmount=1,
+                    ),
+                    OfferItem(
+                        itemType=ItemType.ERC1155,
+                        token=erc721.upper().replace("0X", "0x"),
+                        identifierOrCriteria=7,
+                        startAmount=3,
+                        endAmount=3,
+                    ),
+                ],
+                [
+                    create_consideration_item(
+                        ItemType.ERC20, erc20.upper().replace("0X", "0x"), 0, 5, seller
+                    )
+                ],
+            ),
+        ),
+    ]
+
+    (
+        offer_fulfillments,
+        consideration_fulfillments,
+    ) = generate_fulfill_orders_fulfillments(orders_metadata)
+
+    assert offer_fulfillments == [
+        [FulfillmentComponent(orderIndex=0, itemIndex=0)],
+        [
+            FulfillmentComponent(orderIndex=0, itemIndex=1),
+            FulfillmentComponent(orderIndex=1, itemIndex=1),
+        ],
+        [FulfillmentComponent(orderIndex=1, itemIndex=0)],
+    ]
+    assert consideration_fulfillments == [
+        [
+            FulfillmentComponent(orderIndex=0, itemIndex=0),
+            FulfillmentComponent(orderIndex=1, itemIndex=0),
+        ],
+        [FulfillmentComponent(orderIndex=0, itemIndex=1)],
+    ]
+
+
+def test_transfers_to_the_same_account_are_not_counted():
+    orders_metadata = [
+        create_listing_metadata(fulfiller, 1),
+        create_listing_metadata(seller, 2),
+    ]
+
+    # The fulfiller is paid for its own listing and receives its own NFT
+    assert plan_fulfill_orders_fulfillments(
+        orders_metadata, fulfiller=fulfiller
+    ).transfer_count == (1 + 2)
+    # Gifted NFTs are transferred, except to their own offerer
+    assert plan_fulfill_orders_fulfillments(
+        orders_metadata, fulfiller=fulfiller, recipient_address=seller
+    ).transfer_count == (1 + 2)
+    assert plan_fulfill_orders_fulfillments(orders_metadata).transfer_count == 5
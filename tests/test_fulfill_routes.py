@@ -0,0 +1,245 @@
+from random import Random
+
+import pytest
+from web3.constants import ADDRESS_ZERO, HASH_ZERO
+
+from seaport.constants import MAX_INT, FulfillRoute, ItemType, Side
+from seaport.types import (
+    AdditionalRecipient,
+    AdvancedOrder,
+    BasicOrderParameters,
+    ConsiderationItem,
+    CriteriaResolver,
+    FulfillOrderDetails,
+    InputCriteria,
+)
+from seaport.utils.calldata import (
+    encode_fulfill_advanced_order,
+    encode_fulfill_available_advanced_orders,
+    encode_fulfill_available_orders,
+    encode_fulfill_basic_order,
+    encode_fulfill_order,
+    get_calldata_size,
+)
+from seaport.utils.fulfill_cost import get_route_calldata_size
+from seaport.utils.fulfill_routes import (
+    FulfillRouteCalibration,
+    estimate_fulfill_route,
+    estimate_fulfill_routes,
+    get_fulfill_order_routes,
+    get_fulfill_orders_routes,
+)
+from tests.helpers import create_listing, fee_recipient
+
+
+def encode_route(route: FulfillRoute, details: list[FulfillOrderDetails]) -> str:
+    """
+    Encodes the calldata the route is called with, a fulfillment per item for the available routes
+    """
+    advanced_orders = []
+    criteria_resolvers = []
+    offer_fulfillments = []
+    consideration_fulfillments = []
+
+    for order_index, detail in enumerate(details):
+        parameters = detail.order.parameters
+        consideration = parameters.consideration + [
+            ConsiderationItem(
+                itemType=ItemType.NATIVE,
+                token=ADDRESS_ZERO,
+                identifierOrCriteria=0,
+                startAmount=tip.amount,
+                endAmount=tip.amount,
+                recipient=tip.recipient,
+            )
+            for tip in detail.tips
+        ]
+
+        advanced_orders.append(
+            AdvancedOrder(
+                parameters=parameters.copy(update={"consideration": consideration}),
+                signature=detail.order.signature,
+                numerator=1,
+                denominator=1,
+                extraData=detail.extra_data,
+            )
+        )
+        criteria_resolvers += [
+            CriteriaResolver(
+                orderIndex=order_index,
+                side=Side.OFFER,
+                index=index,
+                identifier=criteria.identifier,
+                criteriaProof=criteria.proof,
+            )
+            for index, criteria in enumerate(detail.offer_criteria)
+        ]
+        offer_fulfillments += [
+            [(order_index, index)] for index in range(len(parameters.offer))
+        ]
+        consideration_fulfillments += [
+            [(order_index, index)] for index in range(len(consideration))
+        ]
+
+    if route == FulfillRoute.BASIC:
+        (advanced_order,) = advanced_orders
+        offer_item = advanced_order.parameters.offer[0]
+        (
+            for_offerer,
+            *for_additional_recipients,
+        ) = advanced_order.parameters.consideration
+
+        return encode_fulfill_basic_order(
+            BasicOrderParameters(
+                considerationToken=for_offerer.token,
+                considerationIdentifier=0,
+                considerationAmount=for_offerer.endAmount,
+                offerer=advanced_order.parameters.offerer,
+                zone=ADDRESS_ZERO,
+                offerToken=offer_item.token,
+                offerIdentifier=offer_item.identifierOrCriteria,
+                offerAmount=1,
+                basicOrderType=0,
+                startTime=0,
+                endTime=MAX_INT,
+                zoneHash=HASH_ZERO,
+                salt=advanced_order.parameters.salt,
+                offererConduitKey=HASH_ZERO,
+                fulfillerConduitKey=HASH_ZERO,
+                totalOriginalAdditionalRecipients=0,
+                additionalRecipients=[
+                    AdditionalRecipient(amount=item.endAmount, recipient=item.recipient)
+                    for item in for_additional_recipients
+                ],
+                signature=advanced_order.signature,
+            )
+        )
+
+    if route == FulfillRoute.STANDARD:
+        return encode_fulfill_order(advanced_orders[0], HASH_ZERO)
+
+    if route == FulfillRoute.ADVANCED:
+        return encode_fulfill_advanced_order(
+            advanced_orders[0], criteria_resolvers, HASH_ZERO, ADDRESS_ZERO
+        )
+
+    if route == FulfillRoute.AVAILABLE:
+        return encode_fulfill_available_orders(
+            advanced_orders,
+            offer_fulfillments,
+            consideration_fulfillments,
+            HASH_ZERO,
+            len(advanced_orders),
+        )
+
+    return encode_fulfill_available_advanced_orders(
+        advanced_orders,
+        criteria_resolvers,
+        offer_fulfillments,
+        consideration_fulfillments,
+        HASH_ZERO,
+        ADDRESS_ZERO,
+        len(advanced_orders),
+    )
+
+
+@pytest.mark.parametrize("route", list(FulfillRoute))
+def test_calldata_sizes_match_the_encoded_calldata(route: FulfillRoute):
+    random = Random(route.value)
+
+    for _ in range(5):
+        details = [
+            create_listing(random)
+            for _ in range(
+                random.randint(1, 5)
+                if route in [FulfillRoute.AVAILABLE, FulfillRoute.AVAILABLE_ADVANCED]
+                else 1
+            )
+        ]
+
+        assert get_route_calldata_size(route, details) == get_calldata_size(
+            encode_route(route, details)
+        )
+
+
+def test_criteria_resolvers_are_part_of_the_advanced_calldata():
+    detail = create_listing(Random(0), ItemType.ERC721_WITH_CRITERIA).copy(
+        update={
+            "offer_criteria": [InputCriteria(identifier=3, proof=[HASH_ZERO] * 4)],
+            "extra_data": "0x" + "00" * 40,
+        }
+    )
+
+    for route in [FulfillRoute.ADVANCED, FulfillRoute.AVAILABLE_ADVANCED]:
+        assert get_route_calldata_size(route, [detail]) == get_calldata_size(
+            encode_route(route, [detail])
+        )
+
+
+def test_the_cheapest_valid_route_is_picked():
+    random = Random(1)
+    listing = create_listing(random)
+
+    assert get_fulfill_order_routes(listing) == [
+        FulfillRoute.BASIC,
+        FulfillRoute.STANDARD,
+        FulfillRoute.ADVANCED,
+    ]
+    assert [
+        estimate.route
+        for estimate in estimate_fulfill_routes(
+            get_fulfill_order_routes(listing), [listing]
+        )
+    ] == [FulfillRoute.BASIC, FulfillRoute.STANDARD, FulfillRoute.ADVANCED]
+
+    # Partially filled orders can't go through the basic route, and gifts need an advanced one
+    assert get_fulfill_order_routes(listing, total_filled=1) == [
+        FulfillRoute.STANDARD,
+        FulfillRoute.ADVANCED,
+    ]
+    assert get_fulfill_order_routes(listing, recipient_address=fee_recipient) == [
+        FulfillRoute.ADVANCED
+    ]
+
+    listings = [create_listing(random) for _ in range(3)]
+    (cheapest, *_) = estimate_fulfill_routes(
+        get_fulfill_orders_routes(listings), listings
+    )
+
+    assert cheapest.route == FulfillRoute.AVAILABLE
+    assert get_fulfill_orders_routes(
+        listings + [listing.copy(update={"units_to_fill": 1})]
+    ) == [FulfillRoute.AVAILABLE_ADVANCED]
+    assert get_fulfill_orders_routes(
+        listings + [create_listing(random, ItemType.ERC721_WITH_CRITERIA)]
+    ) == [FulfillRoute.AVAILABLE_ADVANCED]
+
+
+def test_calibration_fits_the_fixed_gas_to_recorded_gas():
+    random = Random(2)
+    listings = [create_listing(random) for _ in range(4)]
+    calibration = FulfillRouteCalibration()
+
+    for listing in listings:
+        estimate = estimate_fulfill_route(FulfillRoute.STANDARD, [listing])
+        calibration.record(FulfillRoute.STANDARD, [listing], estimate.gas - 4_000)
+
+    route_cost_model = calibration.get_route_cost_model()
+
+    assert route_cost_model.fixed_gas[FulfillRoute.STANDARD] == (
+        calibration.route_cost_model.fixed_gas[FulfillRoute.STANDARD] - 4_000
+    )
+    assert (
+        route_cost_model.fixed_gas[FulfillRoute.BASIC]
+        == calibration.route_cost_model.fixed_gas[FulfillRoute.BASIC]
+    )
+
+    # Once calibrated, the fulfillOrder route wins over the basic one
+    route_cost_model.fixed_gas[FulfillRoute.STANDARD] -= 100_000
+
+    assert (
+        estimate_fulfill_routes(
+            get_fulfill_order_routes(listings[0]), [listings[0]], route_cost_model
+        )[0].route
+        == FulfillRoute.STANDARD
+    )
@@ -0,0 +1,279 @@
+from random import Random
+
+import pytest
+
+from seaport.constants import ItemType, Side
+from seaport.types import (
+    ConsiderationItem,
+    Fulfillment,
+    InputCriteria,
+    MatchOrderDetails,
+    OfferItem,
+    OrderWithCounter,
+)
+from seaport.utils.item import get_transfer_key
+from seaport.utils.match import (
+    generate_match_orders_fulfillments,
+    get_match_orders_criteria_resolvers,
+)
+from tests.helpers import create_order_components, erc721, fee_recipient
+
+erc20 = "0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512"
+buyer = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+
+
+def randomize_case(address: str, random: Random) -> str:
+    return "0x" + "".join(
+        character.upper() if random.random() < 0.5 else character.lower()
+        for character in address[2:]
+    )
+
+
+def create_order(
+    offerer: str, offer: list[OfferItem], consideration: list[ConsiderationItem]
+) -> MatchOrderDetails:
+    return MatchOrderDetails(
+        order=OrderWithCounter(
+            parameters=create_order_components(offerer, offer, consideration),
+            signature="0x",
+        )
+    )
+
+
+def create_sweep(random: Random, order_count: int) -> list[MatchOrderDetails]:
+    """
+    Listings of single NFTs paid in ERC20 to their seller and a fee recipient, and a counter order of the buyer paying for all of them
+    """
+    orders_details = []
+    total_price = 0
+
+    for nft_id in range(order_count):
+        seller = "0x" + random.getrandbits(160).to_bytes(20, "big").hex()
+        price = random.randint(100, 10_000)
+        fee = price // 40
+        total_price += price
+
+        orders_details.append(
+            create_order(
+                seller,
+                [
+                    OfferItem(
+                        itemType=ItemType.ERC721,
+                        token=randomize_case(erc721, random),
+                        identifierOrCriteria=nft_id,
+                        startAmount=1,
+                        endAmount=1,
+                    )
+                ],
+                [
+                    ConsiderationItem(
+                        itemType=ItemType.ERC20,
+                        token=randomize_case(erc20, random),
+                        identifierOrCriteria=0,
+                        startAmount=price - fee,
+                        endAmount=price - fee,
+                        recipient=seller,
+                    ),
+                    ConsiderationItem(
+                        itemType=ItemType.ERC20,
+                        token=randomize_case(erc20, random),
+                        identifierOrCriteria=0,
+                        startAmount=fee,
+                        endAmount=fee,
+                        recipient=randomize_case(fee_recipient, random),
+                    ),
+                ],
+            )
+        )
+
+    # The buyer pays with two ERC20 items, so offers have to be split across considerations
+    orders_details.append(
+        create_order(
+            buyer,
+            [
+                OfferItem(
+                    itemType=ItemType.ERC20,
+                    token=erc20,
+                    identifierOrCriteria=0,
+                    startAmount=amount,
+                    endAmount=amount,
+                )
+                for amount in [total_price // 3, total_price - total_price // 3]
+            ],
+            [
+                ConsiderationItem(
+                    itemType=ItemType.ERC721,
+                    token=erc721,
+                    identifierOrCriteria=nft_id,
+                    startAmount=1,
+                    endAmount=1,
+                    recipient=buyer,
+                )
+                for nft_id in range(order_count)
+            ],
+        )
+    )
+
+    return orders_details
+
+
+def apply_fulfillments(
+    orders_details: list[MatchOrderDetails], fulfillments: list[Fulfillment]
+) -> dict[tuple, int]:
+    """
+    Applies fulfillments the way matchAdvancedOrders does: the items of each side are aggregated and zeroed,
+    the smaller side is transferred and what is left of the larger side is written back to its first component.
+    Returns the amounts received per (recipient, item) after checking every consideration item was met.
+    """
+    offers = [
+        [
+            [get_transfer_key(item, None), min(item.startAmount, item.endAmount)]
+            for item in detail.order.parameters.offer
+        ]
+        for detail in orders_details
+    ]
+    considerations = [
+        [
+            [
+                get_transfer_key(item, None),
+                max(item.startAmount, item.endAmount),
+                item.recipient.lower(),
+            ]
+            for item in detail.order.parameters.consideration
+        ]
+        for detail in orders_details
+    ]
+    received: dict[tuple, int] = {}
+
+    for fulfillment in fulfillments:
+        offer_items = [
+            offers[c.orderIndex][c.itemIndex] for c in fulfillment.offerComponents
+        ]
+        consideration_items = [
+            considerations[c.orderIndex][c.itemIndex]
+            for c in fulfillment.considerationComponents
+        ]
+        offerers = {
+            orders_details[c.orderIndex].order.parameters.offerer.lower()
+            for c in fulfillment.offerComponents
+        }
+
+        assert len(offerers) == 1
+        assert len({item[0] for item in offer_items + consideration_items}) == 1
+        assert len({item[2] for item in consideration_items}) == 1
+
+        offer_amount = sum(item[1] for item in offer_items)
+        consideration_amount = sum(item[1] for item in consideration_items)
+
+        for item in offer_items + consideration_items:
+            item[1] = 0
+
+        amount = min(offer_amount, consideration_amount)
+        offer_items[0][1] = offer_amount - amount
+        consideration_items[0][1] = consideration_amount - amount
+
+        key = (consideration_items[0][2], consideration_items[0][0])
+        received[key] = received.get(key, 0) + amount
+
+    for order_considerations in considerations:
+        assert all(item[1] == 0 for item in order_considerations)
+
+    return received
+
+
+@pytest.mark.parametrize("order_count", [1, 5, 300])
+def test_sweeps_are_fully_matched(order_count):
+    random = Random(order_count)
+    orders_details = create_sweep(random, order_count)
+
+    fulfillments = generate_match_orders_fulfillments(orders_details)
+    received = apply_fulfillments(orders_details, fulfillments)
+
+    for nft_id in range(order_count):
+        assert received[(buyer.lower(), (ItemType.ERC721, erc721.lower(), nft_id))] == 1
+
+    # Fees of every order are aggregated despite differently cased addresses, and paid with at most one transfer per buyer offer item
+    fee_fulfillments = []
+
+    for fulfillment in fulfillments:
+        component = fulfillment.considerationComponents[0]
+        parameters = orders_details[component.orderIndex].order.parameters
+
+        if (
+            parameters.consideration[component.itemIndex].recipient.lower()
+            == fee_recipient.lower()
+        ):
+            fee_fulfillments.append(fulfillment)
+
+    assert 1 <= len(fee_fulfillments) <= 2
+    assert len(fee_fulfillments[0].considerationComponents) == order_count
+
+
+def test_unmet_considerations_are_rejected():
+    random = Random(0)
+    orders_details = create_sweep(random, 3)
+    buyer_order = orders_details[-1].order
+    orders_details[-1] = orders_details[-1].copy(
+        update={
+            "order": buyer_order.copy(
+                update={
+                    "parameters": buyer_order.parameters.copy(
+                        update={"offer": buyer_order.parameters.offer[:1]}
+                    )
+                }
+            )
+        }
+    )
+
+    with pytest.raises(ValueError):
+        generate_match_orders_fulfillments(orders_details)
+
+
+def test_criteria_items_are_matched_by_their_resolved_identifier():
+    listing = create_order(
+        fee_recipient,
+        [
+            OfferItem(
+                itemType=ItemType.ERC721,
+                token=erc721,
+                identifierOrCriteria=7,
+                startAmount=1,
+                endAmount=1,
+            )
+        ],
+        [],
+    )
+    collection_offer = create_order(
+        buyer,
+        [],
+        [
+            ConsiderationItem(
+                itemType=ItemType.ERC721_WITH_CRITERIA,
+                token=erc721,
+                identifierOrCriteria=0,
+                startAmount=1,
+                endAmount=1,
+                recipient=buyer,
+            )
+        ],
+    ).copy(update={"consideration_criteria": [InputCriteria(identifier=7)]})
+
+    assert generate_match_orders_fulfillments([listing, collection_offer]) == [
+        Fulfillment(
+            offerComponents=[{"orderIndex": 0, "itemIndex": 0}],
+            considerationComponents=[{"orderIndex": 1, "itemIndex": 0}],
+        )
+    ]
+
+    (criteria_resolver,) = get_match_orders_criteria_resolvers(
+        [listing, collection_offer]
+    )
+
+    assert (criteria_resolver.orderIndex, criteria_resolver.index) == (1, 0)
+    assert criteria_resolver.side == Side.CONSIDERATION
+    assert (criteria_resolver.identifier, criteria_resolver.criteriaProof) == (7, [])
+
+    with pytest.raises(ValueError):
+        get_match_orders_criteria_resolvers(
+            [listing, collection_offer.copy(update={"consideration_criteria": []})]
+        )
@@ -0,0 +1,63 @@
+import mmap
+import pickle
+import stat
+
+import pytest
+
+from seaport.utils.merkle_proof_index import MerkleProofIndex, write_merkle_tree
+from seaport.utils.merkletree import MerkleTree
+
+
+@pytest.mark.parametrize("identifier_count", [1, 2, 7, 100])
+def test_proofs_match_the_in_memory_tree(tmp_path, identifier_count):
+    identifiers = list(range(0, identifier_count * 3, 3))
+    tree = MerkleTree(identifiers)
+    write_merkle_tree(tree, tmp_path)
+
+    with MerkleProofIndex.open(tmp_path, tree.get_root_as_int()) as index:
+        assert index.get_root() == tree.get_root()
+        assert index.get_proofs(identifiers + [1]) == tree.get_proofs(identifiers + [1])
+
+
+def test_indexes_are_keyed_by_root_and_pickle_by_path(tmp_path):
+    first_tree = MerkleTree([1, 2, 3])
+    second_tree = MerkleTree([4, 5])
+
+    for tree in (first_tree, second_tree):
+        write_merkle_tree(tree, tmp_path)
+
+    with MerkleProofIndex.open(tmp_path, second_tree.get_root()) as index:
+        unpickled_index = pickle.loads(pickle.dumps(index))
+
+        assert unpickled_index.path == index.path
+        assert unpickled_index.get_proof(5) == second_tree.get_proof(5)
+
+        unpickled_index.close()
+
+
+def test_rejects_files_that_are_not_stored_trees(tmp_path, monkeypatch):
+    tree = MerkleTree([1, 2, 3])
+    path = write_merkle_tree(tree, tmp_path)
+    path.write_bytes(path.read_bytes()[:-1])
+    buffers = []
+
+    class RecordingMmap(mmap.mmap):
+        def __init__(self, *args, **kwargs):
+            buffers.append(self)
+
+    monkeypatch.setattr(mmap, "mmap", RecordingMmap)
+
+    with pytest.raises(ValueError):
+        MerkleProofIndex(path)
+
+    # The mapping is released even though the index was never returned
+    assert buffers[0].closed
+
+    with pytest.raises(ValueError):
+        write_merkle_tree(MerkleTree([]), tmp_path)
+
+
+def test_stored_trees_are_readable_by_everyone(tmp_path):
+    path = write_merkle_tree(MerkleTree([1, 2, 3]), tmp_path)
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
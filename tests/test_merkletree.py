@@ -0,0 +1,109 @@
+from concurrent.futures import ThreadPoolExecutor
+from random import Random
+
+import pytest
+from eth_hash.auto import keccak
+
+from seaport.utils.merkletree import MerkleTree
+
+identifiers = [5, 1, 42, 7, 1, 1000, 3]
+
+
+def verify_proof(root: bytes, identifier: int, proof: list[bytes]) -> bool:
+    # Same as the contract, hashing every pair in sorted order up to the root
+    node = keccak(identifier.to_bytes(32, "big"))
+
+    for proof_element in proof:
+        node = keccak(b"".join(sorted([node, proof_element])))
+
+    return node == root
+
+
+def test_proofs_verify_against_the_root():
+    tree = MerkleTree(identifiers)
+    root = tree.get_root()
+
+    for identifier in identifiers:
+        assert verify_proof(root, identifier, tree.get_proof_bytes(identifier))
+
+
+def test_batch_proofs_match_single_proofs():
+    tree = MerkleTree(identifiers)
+    missing_identifier = 9
+
+    proofs = tree.get_proofs(identifiers + [missing_identifier])
+
+    assert proofs == [tree.get_proof(identifier) for identifier in identifiers] + [[]]
+    assert tree.get_proofs_bytes(identifiers) == [
+        [bytes.fromhex(proof_element[2:]) for proof_element in proof]
+        for proof in proofs[:-1]
+    ]
+
+
+def test_layers_are_built_once():
+    tree = MerkleTree(identifiers)
+    layers = tree.get_layers()
+
+    tree.get_root()
+    tree.get_proofs(identifiers)
+
+    assert tree.get_layers() is layers
+    assert layers[0] == tree.elements
+    assert layers[-1] == [tree.get_root()]
+
+
+def test_leaves_hashed_in_chunks_match_serial_hashing():
+    tree = MerkleTree(identifiers)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        chunked_tree = MerkleTree(identifiers, executor=executor, chunk_size=2)
+
+    assert chunked_tree.elements == tree.elements
+    assert chunked_tree.get_root() == tree.get_root()
+
+
+def assert_same_tree(tree: MerkleTree, fresh_tree: MerkleTree):
+    assert tree.elements == fresh_tree.elements
+    assert tree.element_to_index == fresh_tree.element_to_index
+    assert tree.get_layers() == fresh_tree.get_layers()
+    assert tree.get_proofs(fresh_tree.identifiers) == fresh_tree.get_proofs(
+        fresh_tree.identifiers
+    )
+
+
+@pytest.mark.parametrize("rebuild_threshold", [0, 0.5, 1])
+def test_updates_match_fresh_builds(rebuild_threshold):
+    random = Random(rebuild_threshold)
+    current_identifiers = set(random.sample(range(1000), 50))
+    tree = MerkleTree(list(current_identifiers))
+    tree.get_layers()
+
+    for _ in range(50):
+        inserted = random.sample(range(1000), random.randint(0, 3))
+        removed = random.sample(sorted(current_identifiers), random.randint(0, 3))
+        current_identifiers = (current_identifiers - set(removed)) | set(inserted)
+
+        tree.update(
+            insert=inserted, remove=removed, rebuild_threshold=rebuild_threshold
+        )
+
+        assert set(tree.get_identifiers()) == current_identifiers
+        assert_same_tree(tree, MerkleTree(list(current_identifiers)))
+
+
+def test_updates_down_to_an_empty_tree_and_back():
+    tree = MerkleTree([1, 2, 3])
+    tree.get_layers()
+
+    tree.remove([3, 1])
+    assert_same_tree(tree, MerkleTree([2]))
+
+    tree.remove([2])
+    assert tree.get_root() == MerkleTree([]).get_root()
+
+    tree.insert([4, 5, 6])
+    assert_same_tree(tree, MerkleTree([4, 5, 6]))
+
+    # Identifiers both removed and inserted stay in the tree
+    tree.update(insert=[4], remove=[4, 5])
+    assert_same_tree(tree, MerkleTree([4, 6]))
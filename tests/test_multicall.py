@@ -0,0 +1,184 @@
+from web3 import Web3
+from web3.constants import ADDRESS_ZERO
+
+from seaport.constants import ItemType
+from seaport.seaport import Seaport
+from seaport.types import (
+    ConsiderationCurrencyItem,
+    ConsiderationItem,
+    InputCriteria,
+    OfferErc721Item,
+    OfferItem,
+)
+from seaport.utils.balance_and_approval_check import get_balances_and_approvals
+
+nft_id = 1
+nft_id2 = 2
+erc1155_amount = 3
+
+
+def test_multicall_balances_and_approvals_match_individual_reads(
+    seaport: Seaport,
+    multicall,
+    erc20,
+    erc721,
+    erc1155,
+    offerer,
+    zone,
+):
+    erc721.mint(offerer, nft_id)
+    erc721.mint(zone, nft_id2)
+    erc1155.mint(offerer, nft_id, erc1155_amount)
+    erc20.mint(offerer, Web3.toWei(5, "ether"))
+    erc721.setApprovalForAll(seaport.contract.address, True, {"from": offerer})
+    erc20.approve(seaport.contract.address, Web3.toWei(2, "ether"), {"from": offerer})
+
+    items = [
+        OfferItem(
+            itemType=ItemType.ERC721,
+            token=erc721.address,
+            identifierOrCriteria=nft_id,
+            startAmount=1,
+            endAmount=1,
+        ),
+        OfferItem(
+            itemType=ItemType.ERC721,
+            token=erc721.address,
+            identifierOrCriteria=nft_id2,
+            startAmount=1,
+            endAmount=1,
+        ),
+        OfferItem(
+            itemType=ItemType.ERC1155,
+            token=erc1155.address,
+            identifierOrCriteria=nft_id,
+            startAmount=erc1155_amount,
+            endAmount=erc1155_amount,
+        ),
+        OfferItem(
+            itemType=ItemType.ERC721_WITH_CRITERIA,
+            token=erc721.address,
+            identifierOrCriteria=0,
+            startAmount=1,
+            endAmount=1,
+        ),
+        OfferItem(
+            itemType=ItemType.ERC1155_WITH_CRITERIA,
+            token=erc1155.address,
+            identifierOrCriteria=0,
+            startAmount=1,
+            endAmount=1,
+        ),
+        ConsiderationItem(
+            itemType=ItemType.ERC20,
+            token=erc20.address,
+            identifierOrCriteria=0,
+            startAmount=Web3.toWei(5, "ether"),
+            endAmount=Web3.toWei(5, "ether"),
+            recipient=zone.address,
+        ),
+        ConsiderationItem(
+            itemType=ItemType.NATIVE,
+            token=ADDRESS_ZERO,
+            identifierOrCriteria=0,
+            startAmount=Web3.toWei(1, "ether"),
+            endAmount=Web3.toWei(1, "ether"),
+            recipient=zone.address,
+        ),
+    ]
+    criterias = [InputCriteria(identifier=nft_id, proof=[])]
+
+    balances_and_approvals = get_balances_and_approvals(
+        owner=offerer.address,
+        items=items,
+        criterias=criterias,
+        operator=seaport.contract.address,
+        web3=seaport.web3,
+    )
+
+    multicall_balances_and_approvals = get_balances_and_approvals(
+        owner=offerer.address,
+        items=items,
+        criterias=criterias,
+        operator=seaport.contract.address,
+        web3=seaport.web3,
+        multicall_address=multicall.address,
+    )
+
+    assert multicall_balances_and_approvals == balances_and_approvals
+    assert [
+        balance_and_approval.balance
+        for balance_and_approval in multicall_balances_and_approvals
+    ] == [
+        1,
+        0,
+        erc1155_amount,
+        1,
+        1,
+        Web3.toWei(5, "ether"),
+        seaport.web3.eth.get_balance(offerer.address),
+    ]
+
+
+def test_multicall_tolerates_failed_reads(seaport: Seaport, multicall, erc721, offerer):
+    # ownerOf reverts for tokens that haven't been minted
+    balances_and_approvals = get_balances_and_approvals(
+        owner=offerer.address,
+        items=[
+            OfferItem(
+                itemType=ItemType.ERC721,
+                token=erc721.address,
+                identifierOrCriteria=nft_id,
+                startAmount=1,
+                endAmount=1,
+            )
+        ],
+        criterias=[],
+        operator=seaport.contract.address,
+        web3=seaport.web3,
+        multicall_address=multicall.address,
+    )
+
+    assert balances_and_approvals[0].balance == 0
+    assert balances_and_approvals[0].approved_amount == 0
+
+
+def test_erc721_buy_now_with_multicall(
+    multicall_seaport: Seaport, erc721, offerer, zone, fulfiller
+):
+    erc721.mint(offerer, nft_id)
+
+    use_case = multicall_seaport.create_order(
+        account_address=offerer.address,
+        offer=[OfferErc721Item(token=erc721.address, identifier=nft_id)],
+        consideration=[
+            ConsiderationCurrencyItem(
+                amount=Web3.toWei(10, "ether"), recipient=offerer.address
+            ),
+            ConsiderationCurrencyItem(
+                amount=Web3.toWei(1, "ether"), recipient=zone.address
+            ),
+        ],
+    )
+
+    approval_action, create_order_action = use_case.actions
+
+    assert approval_action.dict() == {
+        "type": "approval",
+        "token": erc721.address,
+        "identifier_or_criteria": nft_id,
+        "item_type": ItemType.ERC721.value,
+        "transaction_methods": approval_action.transaction_methods,
+        "operator": multicall_seaport.contract.address,
+    }
+
+    order = use_case.execute_all_actions()
+
+    fulfill_order_use_case = multicall_seaport.fulfill_order(
+        order=order, account_address=fulfiller.address
+    )
+
+    fulfill_action = fulfill_order_use_case.actions[0]
+    fulfill_action.transaction_methods.transact()
+
+    assert erc721.ownerOf(nft_id) == fulfiller
@@ -0,0 +1,158 @@
+from web3 import Web3
+from web3.constants import ADDRESS_ZERO
+
+from seaport.constants import (
+    CROSS_CHAIN_SEAPORT_ADDRESS,
+    MAX_INT,
+    NO_CONDUIT_KEY,
+    ItemType,
+    OrderType,
+)
+from seaport.seaport import Seaport
+from seaport.types import ConsiderationItem, OfferItem, OrderComponents
+from seaport.utils.hex_utils import bytes_to_hex
+from seaport.utils.order import generate_random_salt
+from seaport.utils.order_hash import (
+    CONSIDERATION_ITEM_TYPE_HASH,
+    OFFER_ITEM_TYPE_HASH,
+    ORDER_TYPE_HASH,
+    get_domain_separator,
+    get_order_hash,
+    get_order_hashes,
+)
+
+KNOWN_ORDER_COMPONENTS = OrderComponents(
+    offerer="0x8ba1f109551bD432803012645Ac136ddd64DBA72",
+    zone=ADDRESS_ZERO,
+    orderType=OrderType.FULL_OPEN,
+    startTime=1650000000,
+    endTime=MAX_INT,
+    salt=0x1234567890ABCDEF,
+    offer=[
+        OfferItem(
+            itemType=ItemType.ERC721,
+            token="0x5FbDB2315678afecb367f032d93F642f64180aa3",
+            identifierOrCriteria=1,
+            startAmount=1,
+            endAmount=1,
+        )
+    ],
+    consideration=[
+        ConsiderationItem(
+            itemType=ItemType.NATIVE,
+            token=ADDRESS_ZERO,
+            identifierOrCriteria=0,
+            startAmount=Web3.toWei(10, "ether"),
+            endAmount=Web3.toWei(10, "ether"),
+            recipient="0x8ba1f109551bD432803012645Ac136ddd64DBA72",
+        ),
+        ConsiderationItem(
+            itemType=ItemType.NATIVE,
+            token=ADDRESS_ZERO,
+            identifierOrCriteria=0,
+            startAmount=Web3.toWei(1, "ether"),
+            endAmount=Web3.toWei(1, "ether"),
+            recipient="0x70997970C51812dc3A010C7d01b50e0d17dc79C8",
+        ),
+    ],
+    zoneHash="0x0000000000000000000000000000000000000000000000000000000000000001",
+    totalOriginalConsiderationItems=2,
+    conduitKey="0x0000007b02230091a7ed01230072f7006a004d60a8d4e71d599b8104250f0000",
+    counter=3,
+)
+
+
+def test_type_hashes():
+    # Type hashes as defined in the Seaport contracts
+    assert (
+        OFFER_ITEM_TYPE_HASH.hex()
+        == "a66999307ad1bb4fde44d13a5d710bd7718e0c87c1eef68a571629fbf5b93d02"
+    )
+    assert (
+        CONSIDERATION_ITEM_TYPE_HASH.hex()
+        == "42d81c6929ffdc4eb27a0808e40e82516ad42296c166065de7f812492304ff6e"
+    )
+    assert (
+        ORDER_TYPE_HASH.hex()
+        == "fa445660b7e21515a59617fcd68910b487aa5808b8abda3d78bc85df364b2c2f"
+    )
+
+
+def test_known_order_hash():
+    assert (
+        get_order_hash(KNOWN_ORDER_COMPONENTS)
+        == "0x9308d3019a72907f52803acbd50120af63b88e32bb47cf24fabb095720e77044"
+    )
+
+
+def test_mainnet_domain_separator():
+    assert (
+        get_domain_separator(
+            chain_id=1,
+            verifying_contract=CROSS_CHAIN_SEAPORT_ADDRESS,
+        ).hex()
+        == "b50c8913581289bd2e066aeef89fceb9615d490d673131fd1a7047436706834e"
+    )
+
+
+def test_get_order_hashes():
+    orders = [KNOWN_ORDER_COMPONENTS.copy(update={"salt": salt}) for salt in range(25)]
+    expected_order_hashes = [get_order_hash(order) for order in orders]
+
+    assert get_order_hashes(orders) == expected_order_hashes
+    assert get_order_hashes(iter(orders)) == expected_order_hashes
+    assert (
+        get_order_hashes(orders, max_workers=2, chunk_size=4) == expected_order_hashes
+    )
+
+
+def test_order_hash_matches_contract(
+    seaport: Seaport, erc721, erc20, offerer, zone, fulfiller
+):
+    counter = seaport.get_counter(offerer.address)
+
+    order_components = OrderComponents(
+        offerer=offerer.address,
+        zone=zone.address,
+        orderType=OrderType.PARTIAL_RESTRICTED,
+        startTime=0,
+        endTime=MAX_INT,
+        salt=generate_random_salt(),
+        offer=[
+            OfferItem(
+                itemType=ItemType.ERC721,
+                token=erc721.address,
+                identifierOrCriteria=1,
+                startAmount=1,
+                endAmount=1,
+            ),
+        ],
+        consideration=[
+            ConsiderationItem(
+                itemType=ItemType.ERC20,
+                token=erc20.address,
+                identifierOrCriteria=0,
+                startAmount=Web3.toWei(10, "ether"),
+                endAmount=Web3.toWei(5, "ether"),
+                recipient=offerer.address,
+            ),
+            ConsiderationItem(
+                itemType=ItemType.ERC20,
+                token=erc20.address,
+                identifierOrCriteria=0,
+                startAmount=Web3.toWei(1, "ether"),
+                endAmount=Web3.toWei(1, "ether"),
+                recipient=fulfiller.address,
+            ),
+        ],
+        zoneHash=bytes_to_hex((12345).to_bytes(32, "big")),
+        totalOriginalConsiderationItems=2,
+        conduitKey=NO_CONDUIT_KEY,
+        counter=counter,
+    )
+
+    contract_order_hash = seaport.contract.functions.getOrderHash(
+        order_components.dict()
+    ).call()
+
+    assert seaport.get_order_hash(order_components) == bytes_to_hex(contract_order_hash)
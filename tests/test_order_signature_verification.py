@@ -0,0 +1,131 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from eth_account import Account
+
+from seaport.types import OrderComponents, OrderWithCounter
+from seaport.utils.merkletree import BulkOrderTree
+from seaport.utils.order_hash import get_domain_separator
+from seaport.utils.signature import to_compact_signature, verify_order_signatures
+from seaport.utils.signer import LocalAccountOrderSigner
+from tests.helpers import create_order_components
+
+offerer = Account.from_key("0x" + "11" * 32)
+other_account = Account.from_key("0x" + "22" * 32)
+domain_separator = get_domain_separator(
+    chain_id=1, verifying_contract="0x00000000006c3852cbEf3e08E8dF289169EdE581"
+)
+signer = LocalAccountOrderSigner(offerer.key.hex(), other_account.key.hex())
+
+
+def sign_orders(
+    orders_components: list[OrderComponents], account_address: str
+) -> list[OrderWithCounter]:
+    signatures = signer.sign_orders(
+        orders_components=orders_components,
+        account_address=account_address,
+        get_domain_separator=lambda: domain_separator,
+        get_messages_to_sign=lambda: [],
+    )
+
+    return [
+        OrderWithCounter(parameters=order_components, signature=signature)
+        for order_components, signature in zip(orders_components, signatures)
+    ]
+
+
+def test_verifies_full_and_compact_signatures():
+    orders = sign_orders(
+        [
+            create_order_components(offerer.address, nft_id=nft_id, salt=nft_id)
+            for nft_id in range(3)
+        ],
+        offerer.address,
+    )
+    compact_orders = [
+        order.copy(update={"signature": to_compact_signature(order.signature)})
+        for order in orders
+    ]
+
+    assert (
+        verify_order_signatures(orders + compact_orders, domain_separator) == [True] * 6
+    )
+
+
+def test_rejects_bad_signatures():
+    (order,) = sign_orders([create_order_components(offerer.address)], offerer.address)
+    (signed_by_other_account,) = sign_orders(
+        [create_order_components(offerer.address)], other_account.address
+    )
+    signature = bytes.fromhex(order.signature[2:])
+
+    bad_orders = [
+        # Tampered order
+        order.copy(
+            update={
+                "parameters": create_order_components(offerer.address, nft_id=1, salt=1)
+            }
+        ),
+        signed_by_other_account,
+        # v has to be 27 or 28
+        order.copy(update={"signature": "0x" + (signature[:64] + bytes([0])).hex()}),
+        # Neither a full, compact nor bulk order signature
+        order.copy(update={"signature": order.signature[:-4]}),
+    ]
+
+    assert verify_order_signatures(bad_orders, domain_separator) == [False] * 4
+    assert verify_order_signatures(
+        [order],
+        get_domain_separator(
+            chain_id=5, verifying_contract="0x00000000006c3852cbEf3e08E8dF289169EdE581"
+        ),
+    ) == [False]
+
+
+def test_verifies_bulk_order_signatures():
+    bulk_order_tree = BulkOrderTree(
+        [
+            create_order_components(offerer.address, nft_id=nft_id, salt=nft_id)
+            for nft_id in range(5)
+        ]
+    )
+    bulk_signature = signer.sign_bulk_order(
+        bulk_order_tree=bulk_order_tree,
+        account_address=offerer.address,
+        get_domain_separator=lambda: domain_separator,
+        get_message_to_sign=lambda: "",
+    )
+    orders = [
+        OrderWithCounter(parameters=order_components, signature=signature)
+        for order_components, signature in zip(
+            bulk_order_tree.orders_components,
+            bulk_order_tree.get_signatures(bulk_signature),
+        )
+    ]
+
+    assert verify_order_signatures(orders, domain_separator) == [True] * 5
+    assert (
+        verify_order_signatures(orders, domain_separator, bulk_signatures=False)
+        == [False] * 5
+    )
+
+    # Proof of another order in the tree
+    assert verify_order_signatures(
+        [orders[0].copy(update={"signature": orders[1].signature})],
+        domain_separator,
+    ) == [False]
+
+
+def test_executor_results_match_serial_verification():
+    orders = sign_orders(
+        [
+            create_order_components(offerer.address, nft_id=nft_id, salt=nft_id)
+            for nft_id in range(5)
+        ],
+        offerer.address,
+    )
+    orders[2] = orders[2].copy(update={"signature": orders[3].signature})
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert verify_order_signatures(
+            orders, domain_separator, executor=executor, chunk_size=2
+        ) == verify_order_signatures(orders, domain_separator)
@@ -0,0 +1,69 @@
+from web3 import Web3
+
+from seaport.seaport import Seaport
+from seaport.types import ContractOverrides, OrderComponents, SeaportConfig
+from seaport.utils.order import generate_random_salt
+from tests.helpers import create_order_components
+
+
+def create_listings(
+    seaport: Seaport, offerer: str, token: str
+) -> list[OrderComponents]:
+    counter = seaport.get_counter(offerer)
+
+    return [
+        create_order_components(
+            offerer,
+            token=token,
+            nft_id=nft_id,
+            price=Web3.toWei(10, "ether"),
+            salt=generate_random_salt(),
+            counter=counter,
+        )
+        for nft_id in range(5)
+    ]
+
+
+def test_get_order_statuses_matches_get_order_status(
+    seaport_contract, seaport: Seaport, erc721, offerer
+):
+    orders = create_listings(seaport, offerer.address, erc721.address)
+    seaport.cancel_orders(orders[1:3]).transact({"from": offerer.address})
+
+    order_hashes = [seaport.get_order_hash(order) for order in orders]
+    expected_order_statuses = [
+        seaport.get_order_status(order_hash) for order_hash in order_hashes
+    ]
+
+    # A batch size smaller than the number of orders forces multiple batch requests
+    chunked_seaport = Seaport(
+        provider=Web3.HTTPProvider("http://127.0.0.1:8545"),
+        config=SeaportConfig(
+            overrides=ContractOverrides(contract_address=seaport_contract.address),
+            json_rpc_batch_size=2,
+        ),
+    )
+
+    assert seaport.get_order_statuses(order_hashes) == expected_order_statuses
+    assert chunked_seaport.get_order_statuses(order_hashes) == expected_order_statuses
+    assert [status.is_cancelled for status in expected_order_statuses] == [
+        False,
+        True,
+        True,
+        False,
+        False,
+    ]
+
+
+def test_get_order_statuses_with_multicall(
+    seaport: Seaport, multicall_seaport: Seaport, erc721, offerer
+):
+    orders = create_listings(seaport, offerer.address, erc721.address)
+    seaport.cancel_orders(orders[:1]).transact({"from": offerer.address})
+
+    order_hashes = [seaport.get_order_hash(order) for order in orders]
+
+    assert multicall_seaport.get_order_statuses(order_hashes) == [
+        seaport.get_order_status(order_hash) for order_hash in order_hashes
+    ]
+    assert multicall_seaport.get_order_statuses([]) == []
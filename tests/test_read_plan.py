@@ -0,0 +1,88 @@
+import pytest
+from web3 import Web3
+from web3.constants import ADDRESS_ZERO
+
+from seaport.constants import ItemType
+from seaport.seaport import Seaport
+from seaport.types import ConsiderationItem, OfferItem
+from seaport.utils.balance_and_approval_check import (
+    BalancesAndApprovalsReadPlan,
+    get_balances_and_approvals,
+)
+from seaport.utils.snapshot import ChainSnapshot
+
+
+@pytest.mark.parametrize("use_multicall", [False, True])
+def test_read_plan_deduplicates_reads_across_owners_and_items(
+    seaport: Seaport, erc20, erc721, multicall, offerer, fulfiller, use_multicall
+):
+    for nft_id in range(3):
+        erc721.mint(offerer, nft_id)
+
+    erc20.mint(fulfiller, Web3.toWei(3, "ether"))
+    erc721.setApprovalForAll(seaport.contract.address, True, {"from": offerer})
+    erc20.approve(seaport.contract.address, Web3.toWei(3, "ether"), {"from": fulfiller})
+
+    offer = [
+        OfferItem(
+            itemType=ItemType.ERC721,
+            token=erc721.address,
+            identifierOrCriteria=nft_id,
+            startAmount=1,
+            endAmount=1,
+        )
+        for nft_id in range(3)
+    ]
+    consideration = [
+        ConsiderationItem(
+            itemType=ItemType.ERC20,
+            token=erc20.address,
+            identifierOrCriteria=0,
+            startAmount=Web3.toWei(1, "ether"),
+            endAmount=Web3.toWei(1, "ether"),
+            recipient=offerer.address,
+        )
+        for _ in range(3)
+    ] + [
+        ConsiderationItem(
+            itemType=ItemType.NATIVE,
+            token=ADDRESS_ZERO,
+            identifierOrCriteria=0,
+            startAmount=1,
+            endAmount=1,
+            recipient=offerer.address,
+        )
+    ]
+
+    read_plan = BalancesAndApprovalsReadPlan(
+        ChainSnapshot(
+            seaport.web3,
+            multicall_address=multicall.address if use_multicall else None,
+        )
+    )
+    requests = [
+        (offerer.address, offer),
+        (fulfiller.address, offer + consideration),
+    ]
+
+    for owner, items in requests:
+        read_plan.add(
+            owner=owner,
+            items=items,
+            criterias=[],
+            operator=seaport.contract.address,
+        )
+
+    # 3 ownerOf reads shared by both owners, 1 isApprovedForAll per owner,
+    # the fulfiller's erc20 balanceOf and allowance, and its native balance if it is read through Multicall3
+    assert len(read_plan.reads) == 3 + 2 + 2 + (1 if use_multicall else 0)
+    assert read_plan.execute() == [
+        get_balances_and_approvals(
+            owner=owner,
+            items=items,
+            criterias=[],
+            operator=seaport.contract.address,
+            web3=seaport.web3,
+        )
+        for owner, items in requests
+    ]
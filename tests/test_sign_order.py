@@ -1,12 +1,35 @@
+import json
+
 from brownie.network.account import Accounts
+from eth_account import Account
 from web3 import Web3
 from web3.constants import ADDRESS_ZERO
+from web3.providers.base import BaseProvider
 
-from seaport.constants import MAX_INT, NO_CONDUIT_KEY, ItemType, OrderType
+from seaport.constants import (
+    CROSS_CHAIN_SEAPORT_ADDRESS,
+    MAX_INT,
+    NO_CONDUIT_KEY,
+    ItemType,
+    OrderType,
+)
 from seaport.seaport import Seaport
-from seaport.types import ConsiderationItem, OfferItem, OrderParameters
+from seaport.types import (
+    ConsiderationItem,
+    ContractOverrides,
+    OfferItem,
+    OrderParameters,
+    SeaportConfig,
+)
 from seaport.utils.hex_utils import bytes_to_hex
 from seaport.utils.order import generate_random_salt
+from seaport.utils.order_hash import (
+    get_digest,
+    get_domain_separator,
+    hash_order_components,
+)
+from seaport.utils.signer import LocalAccountOrderSigner
+from tests.helpers import create_order_components, create_order_parameters
 
 
 def test_valid_order(
@@ -84,3 +107,110 @@ def test_valid_order(
     )
 
     assert is_valid == True
+
+
+def test_local_account_signer_recovers_to_offerer():
+    local_account = Account.create()
+    signer = LocalAccountOrderSigner(local_account.key.hex())
+    domain_separator = get_domain_separator(1, ADDRESS_ZERO)
+    order_components = create_order_components(
+        local_account.address, token=ADDRESS_ZERO, salt=generate_random_salt()
+    )
+
+    signature = signer.sign_order(
+        order_components=order_components,
+        account_address=local_account.address.lower(),
+        get_domain_separator=lambda: domain_separator,
+        get_message_to_sign=lambda: "",
+    )
+
+    digest = get_digest(domain_separator, hash_order_components(order_components))
+
+    assert len(bytes.fromhex(signature[2:])) == 65
+    assert Account.recoverHash(digest, signature=signature) == local_account.address
+
+
+def test_valid_order_signed_locally(
+    seaport_contract,
+    erc721,
+    accounts: Accounts,
+):
+    # A fresh account that the provider doesn't know about, so the signature can't come from RPC
+    local_account = accounts.add()
+    random_signer = accounts[2]
+
+    seaport = Seaport(
+        provider=Web3.HTTPProvider("http://127.0.0.1:8545"),
+        config=SeaportConfig(
+            overrides=ContractOverrides(contract_address=seaport_contract.address)
+        ),
+        signer=LocalAccountOrderSigner(local_account.private_key),
+    )
+
+    order_parameters = create_order_parameters(
+        local_account.address, token=erc721.address, salt=generate_random_salt()
+    )
+
+    signature = seaport.sign_order(
+        order_parameters=order_parameters,
+        counter=seaport.get_counter(local_account.address),
+        account_address=local_account.address,
+    )
+
+    is_valid = seaport.contract.functions.validate(
+        [{"parameters": order_parameters.dict(), "signature": signature}]
+    ).call({"from": random_signer.address})
+
+    assert is_valid == True
+
+
+class ChainIdProvider(BaseProvider):
+    def __init__(self, chain_id: int):
+        self.chain_id = chain_id
+        self.requested_methods: list[str] = []
+
+    def make_request(self, method, params):
+        self.requested_methods.append(method)
+        return {"jsonrpc": "2.0", "id": 1, "result": hex(self.chain_id)}
+
+
+def test_domain_is_cached_until_provider_is_swapped():
+    provider = ChainIdProvider(chain_id=1)
+    seaport = Seaport(
+        provider=provider,
+        config=SeaportConfig(
+            overrides=ContractOverrides(
+                contract_address=Web3.toChecksumAddress(CROSS_CHAIN_SEAPORT_ADDRESS)
+            )
+        ),
+    )
+    order_parameters = create_order_parameters(
+        ADDRESS_ZERO, token=ADDRESS_ZERO, salt=generate_random_salt()
+    )
+
+    messages = [
+        json.loads(
+            seaport._get_message_to_sign(order_parameters=order_parameters, counter=0)
+        )
+        for _ in range(3)
+    ]
+    domain_separator = seaport._get_domain_separator()
+
+    assert provider.requested_methods == ["eth_chainId"]
+    assert all(message["domain"]["chainId"] == 1 for message in messages)
+    assert messages[0]["primaryType"] == "OrderComponents"
+    assert messages[0]["message"]["salt"] == str(order_parameters.salt)
+    assert domain_separator == get_domain_separator(1, CROSS_CHAIN_SEAPORT_ADDRESS)
+
+    new_provider = ChainIdProvider(chain_id=5)
+    seaport.set_provider(new_provider)
+
+    message = json.loads(
+        seaport._get_message_to_sign(order_parameters=order_parameters, counter=0)
+    )
+
+    assert new_provider.requested_methods == ["eth_chainId"]
+    assert message["domain"]["chainId"] == 5
+    assert seaport._get_domain_separator() == get_domain_separator(
+        5, CROSS_CHAIN_SEAPORT_ADDRESS
+    )
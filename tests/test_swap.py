@@ -6,6 +6,7 @@ from seaport.types import (
     ConsiderationCurrencyItem,
     ConsiderationErc721Item,
     ConsiderationErc1155Item,
+    MatchOrderDetails,
     OfferCurrencyItem,
     OfferErc721Item,
     OfferErc1155Item,
@@ -188,3 +189,50 @@ def test_swap_erc721_and_erc20_for_erc721_and_erc20(
     assert second_erc721.ownerOf(nft_id) == offerer
     assert erc20.balanceOf(offerer) == Web3.toWei("10", "ether")
     assert erc20.balanceOf(fulfiller) == Web3.toWei("5", "ether")
+
+
+def test_match_erc721_order_with_counter_order(
+    seaport: Seaport, erc721, offerer, fulfiller, erc20
+):
+    erc721.mint(offerer, nft_id)
+    erc20.mint(fulfiller, Web3.toWei("10", "ether"))
+
+    order = seaport.create_order(
+        account_address=offerer.address,
+        offer=[OfferErc721Item(token=erc721.address, identifier=nft_id)],
+        consideration=[
+            ConsiderationCurrencyItem(
+                token=erc20.address, amount=Web3.toWei("10", "ether")
+            ),
+        ],
+    ).execute_all_actions()
+
+    # The counter order isn't approved yet, so only its signing action is executed
+    counter_order = (
+        seaport.create_order(
+            account_address=fulfiller.address,
+            offer=[
+                OfferCurrencyItem(token=erc20.address, amount=Web3.toWei("10", "ether"))
+            ],
+            consideration=[
+                ConsiderationErc721Item(token=erc721.address, identifier=nft_id),
+            ],
+        )
+        .actions[-1]
+        .create_order()
+    )
+
+    match_orders_use_case = seaport.match_orders(
+        [MatchOrderDetails(order=order), MatchOrderDetails(order=counter_order)],
+        account_address=fulfiller.address,
+    )
+
+    approval_action, match_action = match_orders_use_case.actions
+
+    assert approval_action.token == erc20.address
+
+    match_orders_use_case.execute_all_actions()
+
+    assert erc721.ownerOf(nft_id) == fulfiller
+    assert erc20.balanceOf(offerer) == Web3.toWei("10", "ether")
+    assert erc20.balanceOf(fulfiller) == 0